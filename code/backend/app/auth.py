@@ -6,16 +6,22 @@ Human code: 10%
 Framework-generated code: 0%
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Annotated, Any
 
+import httpx
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jwt import PyJWKClient
-from jwt.exceptions import InvalidTokenError, PyJWKClientError
+from jwt import PyJWK, PyJWKSet
+from jwt.exceptions import InvalidTokenError, PyJWKClientError, PyJWKSetError
 
 from app.config import settings
 
@@ -41,21 +47,148 @@ class ClerkTokenPayload:
         self.iat: int = payload.get("iat", 0)
 
 
+class JwksCache:
+    """
+    Clerk's signing keys, shared by every request in the process.
+
+    Keys are fetched once, with a non-blocking HTTP client, and refreshed in the
+    background every CLERK_JWKS_REFRESH_SECONDS. A token signed with a key id the cache
+    has not seen (Clerk rotated its keys since the last refresh) triggers one refetch, at
+    most every CLERK_JWKS_MIN_REFETCH_SECONDS so a flood of bogus key ids cannot hammer
+    Clerk. Concurrent requests needing a refetch share it.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._refetch_lock = asyncio.Lock()
+
+    def clear(self) -> None:
+        self._keys = {}
+        self._fetched_at = None
+
+    async def refresh(self) -> None:
+        try:
+            async with httpx.AsyncClient(
+                timeout=settings.CLERK_JWKS_TIMEOUT_SECONDS
+            ) as client:
+                response = await client.get(settings.CLERK_JWKS_URL)
+                response.raise_for_status()
+            jwk_set = PyJWKSet.from_dict(response.json())
+        except (httpx.HTTPError, ValueError, PyJWKSetError) as e:
+            raise PyJWKClientError(f"Fetch of the JWKS failed: {str(e)}") from e
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        self._fetched_at = time.monotonic()
+
+    def _may_refetch(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= settings.CLERK_JWKS_MIN_REFETCH_SECONDS
+        )
+
+    async def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            raise InvalidTokenError("Token has no key id")
+
+        key = self._keys.get(kid)
+        if key is None and self._may_refetch():
+            async with self._refetch_lock:
+                # Another request may have refetched while this one waited
+                key = self._keys.get(kid)
+                if key is None and self._may_refetch():
+                    await self.refresh()
+                    key = self._keys.get(kid)
+        if key is None:
+            raise InvalidTokenError(f"No signing key matches key id {kid}")
+        return key
+
+
+class VerifiedTokenCache:
+    """
+    Tokens that already passed verification, kept until they expire.
+
+    Keyed by the token's SHA-256 so raw bearer tokens are not held in memory. The least
+    recently used entry is evicted once CLERK_TOKEN_CACHE_SIZE tokens are cached.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[bytes, ClerkTokenPayload] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, token: str) -> ClerkTokenPayload | None:
+        key = self._key(token)
+        payload = self._entries.get(key)
+        if payload is None:
+            return None
+        if payload.exp <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def put(self, token: str, payload: ClerkTokenPayload) -> None:
+        key = self._key(token)
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.CLERK_TOKEN_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+
+jwks_cache = JwksCache()
+verified_tokens = VerifiedTokenCache()
+
+# Signature checks run here, off the event loop; bounded so a burst of new tokens
+# queues for CPU instead of spawning a thread each
+_verify_pool = ThreadPoolExecutor(
+    max_workers=settings.CLERK_VERIFY_THREADS, thread_name_prefix="jwt-verify"
+)
+
+
+async def refresh_jwks_periodically() -> None:
+    """Keep the JWKS cache warm every CLERK_JWKS_REFRESH_SECONDS until cancelled."""
+    if not settings.CLERK_AUTH_ENABLED or not settings.CLERK_JWKS_URL:
+        return
+    while True:
+        try:
+            await jwks_cache.refresh()
+        except Exception as e:
+            # Keep serving with the keys we have; unknown key ids still trigger a refetch
+            logger.warning(f"Failed to refresh Clerk JWKs: {str(e)}")
+        await asyncio.sleep(settings.CLERK_JWKS_REFRESH_SECONDS)
+
+
 async def verify_clerk_token(token: str) -> ClerkTokenPayload:
     """
     Verify a Clerk-issued JWT and return user info.
+
+    A token verified before is served from the verified-token cache until it expires,
+    with no key lookup or signature check. Otherwise the RS256 check runs on a small
+    thread pool so a burst of new tokens does not stall the event loop.
     """
+    cached = verified_tokens.get(token)
+    if cached is not None:
+        return cached
+
     try:
-        # Use Clerk's JWK client for signature verification
-        jwk_client = PyJWKClient(settings.CLERK_JWKS_URL)
-        signing_key = jwk_client.get_signing_key_from_jwt(token)
-
-        payload = jwt.decode(
-            token,
-            signing_key.key,
-            algorithms=["RS256"],
-            issuer=settings.CLERK_ISSUER,
-            options={"verify_exp": True, "verify_aud": False, "verify_iss": True},
+        signing_key = await jwks_cache.get_signing_key_from_jwt(token)
+
+        payload = await asyncio.get_running_loop().run_in_executor(
+            _verify_pool,
+            partial(
+                jwt.decode,
+                token,
+                signing_key.key,
+                algorithms=["RS256"],
+                issuer=settings.CLERK_ISSUER,
+                options={"verify_exp": True, "verify_aud": False, "verify_iss": True},
+            ),
         )
 
         audience_claim = payload.get("aud") or payload.get("azp")
@@ -84,7 +217,9 @@ async def verify_clerk_token(token: str) -> ClerkTokenPayload:
                     detail="Invalid token audience",
                 )
 
-        return ClerkTokenPayload(payload)
+        verified = ClerkTokenPayload(payload)
+        verified_tokens.put(token, verified)
+        return verified
 
     except jwt.ExpiredSignatureError as exc:
         logger.error("Clerk token expired")
@@ -30,6 +30,89 @@ class Settings(BaseSettings):
         default="event_manager", min_length=1, description="PostgreSQL database name"
     )
 
+    # Read replica settings
+    DATABASE_REPLICA_URLS: str = Field(
+        default="",
+        description=(
+            "Comma-separated SQLAlchemy URLs of read replicas. Empty sends every read to "
+            "the primary."
+        ),
+    )
+    REPLICA_MAX_LAG_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        description="Replicas lagging further behind the primary than this are not read.",
+    )
+    REPLICA_LAG_POLL_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="How often replica lag is measured.",
+    )
+    READ_YOUR_WRITES_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "How long a session reads from the primary after writing. Keep it at least "
+            "REPLICA_MAX_LAG_SECONDS so the session sees its own writes."
+        ),
+    )
+
+    # List endpoint settings
+    COUNT_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="How long count=estimate list totals are cached per filter signature.",
+    )
+
+    # Bulk create settings
+    BULK_CREATE_MAX_ITEMS: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of items accepted by one bulk create request.",
+    )
+
+    # Registration admission control settings
+    ADMISSION_MAX_CONCURRENT_PER_EVENT: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Registrations (RSVPs and checkouts) one event may run at once per process. "
+            "Keeps a ticket drop from holding the whole connection pool."
+        ),
+    )
+    ADMISSION_MAX_QUEUE_PER_EVENT: int = Field(
+        default=50,
+        ge=0,
+        description="Registrations per event that wait for a slot before new ones get 429.",
+    )
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="How long a queued registration waits for a slot before getting 429.",
+    )
+    ADMISSION_TOKEN_TTL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How long a rejected client's admission token keeps its queue place.",
+    )
+
+    # Paid checkout seat hold settings
+    SEAT_HOLD_MINUTES: int = Field(
+        default=30,
+        ge=30,
+        le=1440,
+        description=(
+            "How long a Stripe checkout stays open, holding a seat. Stripe sessions last "
+            "between 30 minutes and 24 hours, so the shortest is stretched by a minute "
+            "of margin, and the hold lasts a few minutes longer than the session."
+        ),
+    )
+    SEAT_HOLD_SWEEP_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="How often expired seat holds are released.",
+    )
+
     # Clerk authentication settings
     CLERK_JWKS_URL: str = Field(
         default="",
@@ -43,11 +126,99 @@ class Settings(BaseSettings):
         default="",
         description="Expected Clerk audience (aud/azp) claim when validating tokens.",
     )
+    CLERK_JWKS_REFRESH_SECONDS: float = Field(
+        default=600.0,
+        gt=0,
+        description="How often the cached Clerk signing keys are refreshed in the background.",
+    )
+    CLERK_JWKS_MIN_REFETCH_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "Minimum time between JWKS refetches triggered by tokens with an unknown key id."
+        ),
+    )
+    CLERK_JWKS_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Timeout for fetching the Clerk JWKS.",
+    )
+    CLERK_VERIFY_THREADS: int = Field(
+        default=4,
+        ge=1,
+        description="Worker threads that check token signatures off the event loop.",
+    )
+    CLERK_TOKEN_CACHE_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="Verified tokens cached until they expire, least recently used evicted.",
+    )
     CLERK_AUTH_ENABLED: bool = Field(
         default=False,
         description="Toggle Clerk authentication. Set True to enforce token validation.",
     )
 
+    # Current user cache settings
+    CURRENT_USER_CACHE_SIZE: int = Field(
+        default=10000,
+        ge=1,
+        description="Signed-in accounts whose Users row is cached for GET /me.",
+    )
+    CURRENT_USER_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How long a cached Users row for a signed-in account is served.",
+    )
+
+    # Category catalog settings
+    CATEGORY_CATALOG_REFRESH_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often the in-memory category catalog is reloaded.",
+    )
+
+    # Picker lookup settings
+    PICKER_MAX_RESULTS: int = Field(
+        default=20,
+        ge=1,
+        description="Most matches a people or event picker lookup may return.",
+    )
+    PICKER_LATENCY_BUDGET_MS: int = Field(
+        default=200,
+        ge=1,
+        description="statement_timeout for picker lookups; slower lookups return nothing.",
+    )
+    PICKER_SIMILARITY_THRESHOLD: float = Field(
+        default=0.3,
+        ge=0,
+        le=1,
+        description="Lowest pg_trgm word similarity a picker match may have.",
+    )
+
+    # Event map rollup settings
+    MAP_TILE_MAX_ZOOM: int = Field(
+        default=14,
+        ge=0,
+        le=20,
+        description="Deepest zoom level with event map rollups; zoom in further with bbox.",
+    )
+    MAP_TILE_CELL_BITS: int = Field(
+        default=3,
+        ge=0,
+        le=6,
+        description="Each map tile is split into 2^bits x 2^bits cells, one cluster each.",
+    )
+    MAP_ROLLUP_WINDOW_DAYS: int = Field(
+        default=90,
+        gt=0,
+        description="Events starting within this many days appear on the event map.",
+    )
+    MAP_ROLLUP_REFRESH_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often the event map rollups are rebuilt.",
+    )
+
     # Frontend settings
     FRONTEND_URL: str = Field(
         default="http://localhost:3000",
@@ -121,6 +292,11 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def REPLICA_DATABASE_URLS(self) -> list[str]:
+        """Read replica URLs parsed from DATABASE_REPLICA_URLS."""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
     model_config = SettingsConfigDict(
         # Look for .env file in the project root
         env_file=str(Path(__file__).parent.parent.parent.parent / ".env"),
@@ -7,20 +7,54 @@ Framework-generated code: 0%
 """
 
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, MetaData, Table, and_, func, select
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    MetaData,
+    Row,
+    Table,
+    Update,
+    and_,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy import cast as type_cast
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.db import engine
+from app.db.batch import batch_update_rows
+from app.db.counts import count_rows
+from app.db.db import begin, engine, read_only
+from app.db.events import events
+from app.db.filter_compiler import OrderSignature, compile_list_query
 from app.db.filters import FilterOperation
+from app.db.pagination import decode_cursor
+from app.db.users import users
 from app.models.attendees import AttendeeCreate, AttendeeRead, AttendeeStatus
-from app.models.exceptions import InvalidColumnError, NotFoundError
+from app.models.exceptions import (
+    DuplicateResourceError,
+    InvalidColumnError,
+    InvalidCursorError,
+    NotFoundError,
+    RsvpRejectedError,
+)
+from app.models.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +65,7 @@ attendee_status = PG_ENUM(
     "RSVPed",
     "Maybe",
     "Not Going",
+    "Waitlisted",
     name="attendee_status",
     create_type=False,  # Type already exists in DB from init script
 )
@@ -44,53 +79,53 @@ eventattendees = Table(
     Column("status", cast(Any, attendee_status), nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True), nullable=False),
+    Index("idx_eventattendees_event_user_unique", "event_id", "user_id", unique=True),
+    Index(
+        "idx_eventattendees_waitlist",
+        "event_id",
+        "created_at",
+        "attendee_id",
+        postgresql_where=text("status = 'Waitlisted'"),
+    ),
 )
 
+# Seats reserved while a Stripe checkout is open. A hold counts towards
+# events.attendee_count until it becomes an attendee or is released.
+seat_holds = Table(
+    "seatholds",
+    metadata,
+    Column("payment_id", SQLAlchemyUUID(as_uuid=True), primary_key=True),
+    Column("event_id", SQLAlchemyUUID(as_uuid=True), nullable=False),
+    Column("user_id", SQLAlchemyUUID(as_uuid=True), nullable=False),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("idx_seat_holds_event_user_unique", "event_id", "user_id", unique=True),
+    # The sweeper reads the oldest expiries first
+    Index("idx_seat_holds_expires_at", "expires_at"),
+)
+
+# Sort key for list pages; cursors encode the last row's values of these columns
+ATTENDEES_KEYSET: OrderSignature = ("attendee_id",)
+
 
 async def get_attendees_db(
     filters: list[FilterOperation] | None = None,
     offset: int = 0,
     limit: int = 100,
-) -> tuple[list[AttendeeRead], int]:
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+) -> tuple[list[AttendeeRead], int | None]:
     try:
-        query = select(eventattendees)
-        count_query = select(func.count()).select_from(eventattendees)
-
-        if filters:
-            conditions: list[ColumnElement[Any]] = []
-            for f in filters:
-                column = getattr(eventattendees.c, f.field, None)
-                if column is None:
-                    logger.error(f"Invalid filter_expression field: {f.field}")
-                    raise InvalidColumnError(f"Invalid column name: {f.field}")
-
-                if f.op == "=":
-                    conditions.append(column == f.value)
-                elif f.op == "!=":
-                    conditions.append(column != f.value)
-                elif f.op == ">":
-                    conditions.append(column > f.value)
-                elif f.op == ">=":
-                    conditions.append(column >= f.value)
-                elif f.op == "<":
-                    conditions.append(column < f.value)
-                elif f.op == "<=":
-                    conditions.append(column <= f.value)
-                elif f.op == "LIKE":
-                    conditions.append(column.like(f.value))
-                elif f.op == "ILIKE":
-                    conditions.append(column.ilike(f.value))
-
-            if conditions:
-                where_clause = and_(*conditions)
-                query = query.where(where_clause)
-                count_query = count_query.where(where_clause)
-
         # Stable paging
-        query = query.order_by(eventattendees.c.attendee_id).offset(offset).limit(limit)
+        after = decode_cursor(cursor, eventattendees, ATTENDEES_KEYSET) if cursor else None
+        statements, params = compile_list_query(
+            eventattendees, filters, order_by=ATTENDEES_KEYSET, after=after
+        )
 
-        async with engine.begin() as conn:
-            result = await conn.execute(query)
+        async with read_only(engine) as conn:
+            result = await conn.execute(
+                statements.query, {**params, "offset": offset, "limit": limit}
+            )
             rows = result.mappings().all()
             items = [
                 AttendeeRead.model_validate(
@@ -105,12 +140,11 @@ async def get_attendees_db(
                 for row in rows
             ]
 
-            total_val = await conn.scalar(count_query)
-            total = 0 if total_val is None else int(total_val)
+            total = await count_rows(conn, eventattendees, statements, params, filters, count)
 
             return items, total
 
-    except InvalidColumnError:
+    except (InvalidColumnError, InvalidCursorError):
         raise
     except SQLAlchemyError as e:
         logger.error(f"Database error while getting attendees: {str(e)}")
@@ -120,103 +154,384 @@ async def get_attendees_db(
         raise ValueError(f"Unexpected error while getting attendees: {str(e)}") from e
 
 
-async def get_attendee_counts_for_events_db(
-    event_ids: list[UUID],
-) -> dict[UUID, int]:
-    """
-    Return a mapping from event_id -> attendee count for the given list of event_ids.
-    This is used to avoid N+1 queries when listing events.
+def _attendee_values(
+    att: AttendeeCreate, now: datetime, status: AttendeeStatus | None = None
+) -> dict[str, Any]:
+    status = status or att.status
+    return {
+        "attendee_id": uuid4(),
+        "event_id": att.event_id,
+        "user_id": att.user_id,
+        "status": status.value if status else None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _attendee_from_row(row: Any) -> AttendeeRead:
+    data = dict(row)
+    data["status"] = AttendeeStatus(data["status"]) if data["status"] is not None else None
+    return AttendeeRead.model_validate(data)
+
+
+def _holds_seat(status: str | None) -> bool:
+    return status is None or AttendeeStatus(status).holds_seat
+
+
+# Rows counted by events.attendee_count; Not Going and Waitlisted attendees hold no seat
+seat_holders = or_(
+    eventattendees.c.status.is_(None),
+    eventattendees.c.status.notin_(
+        [AttendeeStatus.NOT_GOING.value, AttendeeStatus.WAITLISTED.value]
+    ),
+)
+
+
+async def _adjust_attendee_counts(conn: AsyncConnection, deltas: dict[UUID, int]) -> None:
+    """Apply attendee_count deltas, one UPDATE per distinct delta."""
+    by_delta: dict[int, list[UUID]] = {}
+    for event_id, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(event_id)
+
+    for delta, event_ids in by_delta.items():
+        await conn.execute(
+            events.update()
+            .where(events.c.event_id.in_(event_ids))
+            .values(attendee_count=events.c.attendee_count + delta)
+        )
+
+
+async def _promote_waitlisted(conn: AsyncConnection, event_ids: Iterable[UUID]) -> None:
     """
-    if not event_ids:
-        return {}
+    Fill the free seats of each event from its waitlist, oldest RSVP first.
 
-    try:
-        async with engine.begin() as conn:
-            query = (
-                select(
-                    eventattendees.c.event_id,
-                    func.count().label("attendee_count"),
-                )
-                .where(eventattendees.c.event_id.in_(event_ids))
-                .group_by(eventattendees.c.event_id)
+    Each event row is locked before its seats are counted, so promotion is serialized
+    with RSVPs and other promotions for the same event. Promoted attendees become RSVPed.
+    """
+    now = datetime.now(UTC)
+    for event_id in sorted(set(event_ids)):
+        event = (
+            await conn.execute(
+                select(events.c.capacity, events.c.attendee_count)
+                .where(events.c.event_id == event_id)
+                .with_for_update()
+            )
+        ).first()
+        if event is None:
+            continue
+
+        next_in_line = (
+            select(eventattendees.c.attendee_id)
+            .where(
+                eventattendees.c.event_id == event_id,
+                eventattendees.c.status == AttendeeStatus.WAITLISTED.value,
+            )
+            .order_by(eventattendees.c.created_at, eventattendees.c.attendee_id)
+        )
+        if event.capacity is not None:
+            free_seats = event.capacity - event.attendee_count
+            if free_seats <= 0:
+                continue
+            next_in_line = next_in_line.limit(free_seats)
+
+        promoted = (
+            await conn.execute(
+                eventattendees.update()
+                .where(eventattendees.c.attendee_id.in_(next_in_line))
+                .values(status=AttendeeStatus.RSVPED.value, updated_at=now)
+                .returning(eventattendees.c.attendee_id)
             )
+        ).all()
+        if promoted:
+            logger.info(
+                f"Promoted {len(promoted)} waitlisted attendee(s) for event {event_id}"
+            )
+            await _adjust_attendee_counts(conn, {event_id: len(promoted)})
+
+
+async def _waitlist_position(conn: AsyncConnection, row: Any) -> int:
+    ahead = await conn.scalar(
+        select(func.count()).where(
+            eventattendees.c.event_id == row["event_id"],
+            eventattendees.c.status == AttendeeStatus.WAITLISTED.value,
+            tuple_(eventattendees.c.created_at, eventattendees.c.attendee_id)
+            < tuple_(
+                literal(row["created_at"], DateTime(timezone=True)),
+                literal(row["attendee_id"], SQLAlchemyUUID(as_uuid=True)),
+            ),
+        )
+    )
+    return int(ahead or 0) + 1
+
+
+def _claim_seat(att: AttendeeCreate, now: datetime) -> Update:
+    """Take a seat on a future event with room left; matches no row otherwise."""
+    return (
+        events.update()
+        .where(
+            events.c.event_id == att.event_id,
+            events.c.event_datetime >= now,
+            or_(events.c.capacity.is_(None), events.c.attendee_count < events.c.capacity),
+        )
+        .values(attendee_count=events.c.attendee_count + 1)
+        .returning(events.c.event_id)
+    )
 
-            result = await conn.execute(query)
-            rows = result.mappings().all()
 
-            counts: dict[UUID, int] = {}
-            for row in rows:
-                counts[row["event_id"]] = int(row["attendee_count"])
+def _insert_rsvp(
+    att: AttendeeCreate, now: datetime, dialect: str, status: AttendeeStatus | None = None
+) -> Any:
+    """
+    INSERT ... SELECT that adds the row only if the event is upcoming, the user exists
+    and the user is not registered yet.
+    """
+    values = _attendee_values(att, now, status)
+
+    # PostgreSQL types a bare parameter in a select list as text and will not assign
+    # text to the attendee_status enum, so that one is cast explicitly
+    selected = [
+        type_cast(literal(value), attendee_status)
+        if name == "status"
+        else literal(value, eventattendees.c[name].type)
+        for name, value in values.items()
+    ]
+    row = select(
+        *(column.label(name) for column, name in zip(selected, values, strict=True))
+    ).where(
+        exists().where(events.c.event_id == att.event_id, events.c.event_datetime >= now),
+        exists().where(users.c.user_id == att.user_id),
+    )
+
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    return (
+        insert(eventattendees)
+        .from_select(list(values), row)
+        .on_conflict_do_nothing(index_elements=["event_id", "user_id"])
+        .returning(eventattendees)
+    )
+
+
+async def _rsvp_refusal(
+    conn: AsyncConnection, att: AttendeeCreate, now: datetime
+) -> Exception | None:
+    """
+    Work out why an RSVP was not recorded, checking in the order the API reports.
 
-            return counts
+    Returns None when the only obstacle is that the event is full.
+    """
+    event_datetime, user_exists, registered = (
+        await conn.execute(
+            select(
+                select(events.c.event_datetime)
+                .where(events.c.event_id == att.event_id)
+                .scalar_subquery(),
+                exists().where(users.c.user_id == att.user_id),
+                exists().where(
+                    eventattendees.c.event_id == att.event_id,
+                    eventattendees.c.user_id == att.user_id,
+                ),
+            )
+        )
+    ).one()
+
+    if event_datetime is None:
+        return NotFoundError("No such event exists")
+    if event_datetime.tzinfo is None:
+        event_datetime = event_datetime.replace(tzinfo=UTC)
+    if event_datetime < now:
+        return RsvpRejectedError("Cannot RSVP: The event date and time has already passed")
+    if not user_exists:
+        return NotFoundError("No such user exists")
+    if registered:
+        return DuplicateResourceError("User already registered for this event")
+    return None
+
+
+async def rsvp_attendee_db(att: AttendeeCreate) -> AttendeeRead:
+    """
+    Register a user for an event, waitlisting them when it is full.
+
+    A seat is claimed by incrementing events.attendee_count in a single conditional
+    UPDATE, which row-locks the event so concurrent RSVPs queue and each sees the count
+    the previous one committed. The attendee is then added by an INSERT ... SELECT that
+    requires the user to exist, and the unique (event_id, user_id) index turns a
+    duplicate into a no-op. The happy path is those two statements. When no seat is
+    left the attendee is stored as Waitlisted instead, with their place in the queue;
+    other refusals are only diagnosed when a statement matched nothing, and raising
+    rolls a claimed seat back with the transaction. "Not Going" RSVPs take no seat.
+
+    Raises:
+        NotFoundError: If the event or the user does not exist
+        RsvpRejectedError: If the event has already started
+        DuplicateResourceError: If the user is already registered for the event
+    """
+    try:
+        now = datetime.now(UTC)
 
+        async with begin(engine) as conn:
+            seated = _holds_seat(att.status)
+            if not seated or (await conn.execute(_claim_seat(att, now))).first() is not None:
+                statement = _insert_rsvp(att, now, conn.dialect.name)
+                row = (await conn.execute(statement)).mappings().first()
+                if row is not None:
+                    return _attendee_from_row(row)
+
+            refusal = await _rsvp_refusal(conn, att, now)
+            if refusal is not None:
+                raise refusal
+
+            # Full: queue the RSVP instead of refusing it
+            statement = _insert_rsvp(att, now, conn.dialect.name, AttendeeStatus.WAITLISTED)
+            row = (await conn.execute(statement)).mappings().first()
+            if row is None:
+                # Registered concurrently between the diagnosis and the insert
+                raise DuplicateResourceError("User already registered for this event")
+
+            waitlisted = _attendee_from_row(row)
+            waitlisted.waitlist_position = await _waitlist_position(conn, row)
+            return waitlisted
+
+    except (NotFoundError, DuplicateResourceError, RsvpRejectedError):
+        raise
     except SQLAlchemyError as e:
-        logger.error("Database error while getting attendee counts for events: %s", str(e))
-        raise ValueError(
-            f"Database error while getting attendee counts for events: {str(e)}"
-        ) from e
+        logger.error(f"Database error while creating RSVP: {str(e)}")
+        raise ValueError(f"Database error while creating RSVP: {str(e)}") from e
     except Exception as e:
-        logger.error("Unexpected error while getting attendee counts for events: %s", str(e))
-        raise ValueError(
-            f"Unexpected error while getting attendee counts for events: {str(e)}"
-        ) from e
+        logger.error(f"Unexpected error while creating RSVP: {str(e)}")
+        raise ValueError(f"Unexpected error while creating RSVP: {str(e)}") from e
 
 
-async def create_attendee_db(att: AttendeeCreate) -> AttendeeRead:
+async def create_attendees_db(new_attendees: list[AttendeeCreate]) -> list[AttendeeRead]:
+    """Create several attendees with one multi-row INSERT ... RETURNING, in input order."""
+    if not new_attendees:
+        return []
+
     try:
         now = datetime.now(UTC)
-        values: dict[str, Any] = {
-            "attendee_id": uuid4(),
-            "event_id": att.event_id,
-            "user_id": att.user_id,
-            "status": att.status.value if att.status else None,
-            "created_at": now,
-            "updated_at": now,
-        }
-
-        insert_stmt = eventattendees.insert().values(values).returning(eventattendees)
-
-        async with engine.begin() as conn:
-            result = await conn.execute(insert_stmt)
-            row = result.mappings().first()
-
-            if not row:
-                logger.error("Failed to create attendee: No row returned")
-                raise ValueError("Failed to create attendee: Database error")
-
-            data = dict(row)
-            data["status"] = (
-                AttendeeStatus(data["status"]) if data["status"] is not None else None
-            )
-            return AttendeeRead.model_validate(data)
+        rows = [_attendee_values(att, now) for att in new_attendees]
+
+        insert_stmt = eventattendees.insert().returning(
+            eventattendees, sort_by_parameter_order=True
+        )
+
+        async with begin(engine) as conn:
+            result = await conn.execute(insert_stmt, rows)
+            created = [_attendee_from_row(row) for row in result.mappings()]
+            seats = Counter(att.event_id for att in new_attendees if _holds_seat(att.status))
+            await _adjust_attendee_counts(conn, seats)
+            return created
 
     except SQLAlchemyError as e:
-        logger.error(f"Database error while creating attendee: {str(e)}")
-        raise ValueError(f"Database error while creating attendee: {str(e)}") from e
+        logger.error(f"Database error while bulk creating attendees: {str(e)}")
+        raise ValueError(f"Database error while bulk creating attendees: {str(e)}") from e
     except Exception as e:
-        logger.error(f"Unexpected error while creating attendee: {str(e)}")
-        raise ValueError(f"Unexpected error while creating attendee: {str(e)}") from e
+        logger.error(f"Unexpected error while bulk creating attendees: {str(e)}")
+        raise ValueError(f"Unexpected error while bulk creating attendees: {str(e)}") from e
+
+
+def _is_waitlisted(status: str | None) -> bool:
+    return status == AttendeeStatus.WAITLISTED.value
+
+
+async def _seat_changes(
+    conn: AsyncConnection, updates: dict[UUID, dict[str, Any]], *, lock: bool = False
+) -> tuple[Counter[UUID], dict[UUID, UUID]]:
+    """
+    Net seats each event gains from updates that move attendees or change status.
+
+    Also returns the attendees that join a waitlist, moved to another event while
+    Waitlisted or newly set to Waitlisted, mapped to the event whose queue they join.
+    With lock, the attendee rows are locked in attendee_id order as they are read.
+    """
+    affected = [
+        attendee_id
+        for attendee_id, data in updates.items()
+        if "event_id" in data or "status" in data
+    ]
+    deltas: Counter[UUID] = Counter()
+    queued: dict[UUID, UUID] = {}
+    if not affected:
+        return deltas, queued
+
+    query = select(
+        eventattendees.c.attendee_id, eventattendees.c.event_id, eventattendees.c.status
+    ).where(eventattendees.c.attendee_id.in_(affected))
+    if lock:
+        query = query.order_by(eventattendees.c.attendee_id).with_for_update()
+    for row in await conn.execute(query):
+        data = updates[row.attendee_id]
+        new_event_id = data.get("event_id", row.event_id)
+        new_status = data["status"] if "status" in data else row.status
+        if _holds_seat(row.status):
+            deltas[row.event_id] -= 1
+        if _holds_seat(new_status):
+            deltas[new_event_id] += 1
+        if _is_waitlisted(new_status) and (
+            new_event_id != row.event_id or not _is_waitlisted(row.status)
+        ):
+            queued[row.attendee_id] = new_event_id
+    return deltas, queued
 
 
 async def batch_update_attendees_db(
     updates: dict[UUID, dict[str, Any]],
 ) -> dict[UUID, AttendeeRead]:
+    """
+    Apply attendee patches, moving seats with them.
+
+    An attendee who moves to another event, or whose status starts or stops holding a
+    seat, changes attendee_count on both sides. Every event involved is locked up front,
+    in event_id order so concurrent patches cannot deadlock, and before the attendee
+    rows, as promotion does. The seat changes are then recomputed from the locked
+    attendee rows, so a concurrent patch of the same attendee is not counted twice.
+    Events gaining seats are checked against capacity, and events that lose seats
+    promote from their waitlist. Attendees joining a waitlist go to the back of its
+    queue and are promoted straight away if their event has a free seat.
+
+    Raises:
+        NotFoundError: If an attendee does not exist
+        RsvpRejectedError: If a patch would take a seat on a full event
+    """
     try:
         now = datetime.now(UTC)
         result: dict[UUID, AttendeeRead] = {}
 
-        async with engine.begin() as conn:
-            for attendee_id, update_data in updates.items():
-                update_data_with_timestamp: dict[str, Any] = {**update_data, "updated_at": now}
-
-                update_stmt = (
-                    eventattendees.update()
-                    .where(eventattendees.c.attendee_id == attendee_id)
-                    .values(**update_data_with_timestamp)
-                    .returning(eventattendees)
+        async with begin(engine) as conn:
+            deltas, queued = await _seat_changes(conn, updates)
+            locked: dict[UUID, Row[Any] | None] = {}
+            # Until an event is locked, a concurrent patch may still move seats on it
+            while involved := sorted({*deltas, *queued.values()} - locked.keys()):
+                fetched = await conn.execute(
+                    select(events.c.event_id, events.c.capacity, events.c.attendee_count)
+                    .where(events.c.event_id.in_(involved))
+                    .order_by(events.c.event_id)
+                    .with_for_update()
                 )
-
-                row = (await conn.execute(update_stmt)).fetchone()
+                locked.update(dict.fromkeys(involved))
+                locked.update({event.event_id: event for event in fetched})
+                deltas, queued = await _seat_changes(conn, updates, lock=True)
+
+            for event_id, delta in deltas.items():
+                event = locked.get(event_id)
+                if (
+                    delta > 0
+                    and event is not None
+                    and event.capacity is not None
+                    and event.attendee_count + delta > event.capacity
+                ):
+                    raise RsvpRejectedError("Event is full")
+
+            # The queue is ordered by created_at, so joining it restarts the clock
+            updates = {
+                attendee_id: {**data, "created_at": now} if attendee_id in queued else data
+                for attendee_id, data in updates.items()
+            }
+
+            rows = await batch_update_rows(conn, eventattendees, "attendee_id", updates, now)
+
+            for attendee_id in updates:
+                row = rows.get(attendee_id)
 
                 if not row:
                     logger.error(f"No attendee found with ID: {attendee_id}")
@@ -231,9 +546,28 @@ async def batch_update_attendees_db(
                     updated_at=row.updated_at,
                 )
 
+            await _adjust_attendee_counts(conn, deltas)
+            await _promote_waitlisted(
+                conn,
+                [
+                    *(event_id for event_id, delta in deltas.items() if delta < 0),
+                    *queued.values(),
+                ],
+            )
+
+            # Promotion may have changed the status of attendees in this batch
+            for attendee_id, attendee in result.items():
+                if attendee.status is AttendeeStatus.WAITLISTED:
+                    status = await conn.scalar(
+                        select(eventattendees.c.status).where(
+                            eventattendees.c.attendee_id == attendee_id
+                        )
+                    )
+                    attendee.status = AttendeeStatus(status)
+
         return result
 
-    except NotFoundError:
+    except (NotFoundError, RsvpRejectedError):
         raise
     except SQLAlchemyError as e:
         logger.error(f"Database error while batch updating attendees: {str(e)}")
@@ -244,22 +578,30 @@ async def batch_update_attendees_db(
 
 
 async def delete_attendee_db(attendee_id: UUID) -> None:
+    """Delete an attendee; a freed seat goes to the first attendee on the waitlist."""
     try:
-        delete_stmt = eventattendees.delete().where(
-            eventattendees.c.attendee_id == attendee_id
+        delete_stmt = (
+            eventattendees.delete()
+            .where(eventattendees.c.attendee_id == attendee_id)
+            .returning(eventattendees.c.event_id, eventattendees.c.status)
         )
 
-        async with engine.begin() as conn:
-            result = await conn.execute(delete_stmt)
+        async with begin(engine) as conn:
+            deleted = (await conn.execute(delete_stmt)).all()
 
-            if result.rowcount == 0:
+            if len(deleted) == 0:
                 logger.error(f"No attendee found with ID: {attendee_id}")
                 raise NotFoundError(f"No attendee found with ID: {attendee_id}")
-            elif result.rowcount > 1:
+            elif len(deleted) > 1:
                 # Should never happen (PK)
                 logger.error(f"Multiple attendees deleted with ID: {attendee_id}")
                 raise ValueError("Database integrity error: Multiple attendees deleted")
 
+            event_id, status = deleted[0]
+            if _holds_seat(status):
+                await _adjust_attendee_counts(conn, {event_id: -1})
+                await _promote_waitlisted(conn, [event_id])
+
     except NotFoundError:
         raise
     except SQLAlchemyError as e:
@@ -268,3 +610,323 @@ async def delete_attendee_db(attendee_id: UUID) -> None:
     except Exception as e:
         logger.error(f"Unexpected error while deleting attendee: {str(e)}")
         raise ValueError(f"Unexpected error while deleting attendee: {str(e)}") from e
+
+
+async def release_user_seats_db(user_id: UUID) -> None:
+    """
+    Give back the seats a user holds before the user is deleted.
+
+    Deleting a user cascades to their attendee rows and seat holds in the database,
+    which would leave every event they attended counting a seat nobody holds. The freed
+    seats are offered to each event's waitlist.
+    """
+    try:
+        seats = select(eventattendees.c.event_id).where(
+            eventattendees.c.user_id == user_id, seat_holders
+        )
+
+        async with begin(engine) as conn:
+            held = (await conn.execute(seats)).scalars().all()
+            await _adjust_attendee_counts(conn, Counter({event_id: -1 for event_id in held}))
+            # The user's own rows must be gone before their seats are handed on
+            await conn.execute(
+                eventattendees.delete().where(eventattendees.c.user_id == user_id)
+            )
+            await _promote_waitlisted(conn, held)
+            # Seats held for the user's open checkouts go back too
+            await _release_holds(conn, seat_holds.c.user_id == user_id)
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while releasing user seats: {str(e)}")
+        raise ValueError(f"Database error while releasing user seats: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while releasing user seats: {str(e)}")
+        raise ValueError(f"Unexpected error while releasing user seats: {str(e)}") from e
+
+
+async def promote_waitlisted_db(event_ids: list[UUID]) -> None:
+    """Offer any free seats on these events to their waitlists, e.g. after capacity grows."""
+    try:
+        async with begin(engine) as conn:
+            await _promote_waitlisted(conn, event_ids)
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while promoting waitlisted attendees: {str(e)}")
+        raise ValueError(
+            f"Database error while promoting waitlisted attendees: {str(e)}"
+        ) from e
+    except Exception as e:
+        logger.error(f"Unexpected error while promoting waitlisted attendees: {str(e)}")
+        raise ValueError(
+            f"Unexpected error while promoting waitlisted attendees: {str(e)}"
+        ) from e
+
+
+async def repair_attendee_counts_db() -> dict[UUID, int]:
+    """
+    Recompute events.attendee_count wherever it disagrees with the seated attendees
+    and open seat holds.
+
+    Drifted events are found with one scan, then each is fixed in its own short
+    transaction that locks the event row before counting, the same lock RSVPs take, so
+    a repair never overwrites a seat claimed while it runs. Returns the corrected counts
+    keyed by event_id.
+    """
+    try:
+        actual = (
+            select(func.count())
+            .where(eventattendees.c.event_id == events.c.event_id, seat_holders)
+            .scalar_subquery()
+        ) + (
+            select(func.count())
+            .where(seat_holds.c.event_id == events.c.event_id)
+            .scalar_subquery()
+        )
+        async with read_only(engine) as conn:
+            drifted = (
+                (
+                    await conn.execute(
+                        select(events.c.event_id).where(events.c.attendee_count != actual)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+
+        repaired: dict[UUID, int] = {}
+        for event_id in drifted:
+            async with begin(engine) as conn:
+                await conn.execute(
+                    select(events.c.event_id)
+                    .where(events.c.event_id == event_id)
+                    .with_for_update()
+                )
+                count = await conn.scalar(
+                    select(
+                        select(func.count())
+                        .where(eventattendees.c.event_id == event_id, seat_holders)
+                        .scalar_subquery()
+                        + select(func.count())
+                        .where(seat_holds.c.event_id == event_id)
+                        .scalar_subquery()
+                    )
+                )
+                await conn.execute(
+                    events.update()
+                    .where(events.c.event_id == event_id)
+                    .values(attendee_count=count)
+                )
+                repaired[event_id] = int(count or 0)
+
+        return repaired
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while repairing attendee counts: {str(e)}")
+        raise ValueError(f"Database error while repairing attendee counts: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while repairing attendee counts: {str(e)}")
+        raise ValueError(f"Unexpected error while repairing attendee counts: {str(e)}") from e
+
+
+def _insert_hold(
+    payment_id: UUID, event_id: UUID, user_id: UUID, expires_at: datetime, now: datetime
+) -> Any:
+    """INSERT ... SELECT that adds the hold only if the user exists and is not registered."""
+    values = {
+        "payment_id": payment_id,
+        "event_id": event_id,
+        "user_id": user_id,
+        "expires_at": expires_at,
+        "created_at": now,
+    }
+    row = select(
+        *(
+            literal(value, seat_holds.c[name].type).label(name)
+            for name, value in values.items()
+        )
+    ).where(
+        exists().where(users.c.user_id == user_id),
+        ~exists().where(
+            eventattendees.c.event_id == event_id, eventattendees.c.user_id == user_id
+        ),
+    )
+    return (
+        seat_holds.insert().from_select(list(values), row).returning(seat_holds.c.payment_id)
+    )
+
+
+async def hold_seat_db(
+    payment_id: UUID, event_id: UUID, user_id: UUID, expires_at: datetime
+) -> None:
+    """
+    Reserve a seat for a checkout until expires_at.
+
+    The seat is claimed with the same conditional UPDATE an RSVP uses, so holds and
+    RSVPs share the event's capacity and cannot oversell it. A user starting a new
+    checkout for an event they already hold a seat on moves that hold to the new payment.
+
+    Raises:
+        NotFoundError: If the event or the user does not exist
+        RsvpRejectedError: If the event has already started or is full
+        DuplicateResourceError: If the user is already registered for the event
+    """
+    try:
+        now = datetime.now(UTC)
+
+        async with begin(engine) as conn:
+            moved = await conn.execute(
+                seat_holds.update()
+                .where(seat_holds.c.event_id == event_id, seat_holds.c.user_id == user_id)
+                .values(payment_id=payment_id, expires_at=expires_at)
+                .returning(seat_holds.c.payment_id)
+            )
+            if moved.first() is not None:
+                return
+
+            att = AttendeeCreate(event_id=event_id, user_id=user_id)
+            if (await conn.execute(_claim_seat(att, now))).first() is not None:
+                statement = _insert_hold(payment_id, event_id, user_id, expires_at, now)
+                if (await conn.execute(statement)).first() is not None:
+                    return
+
+            # Raising rolls a claimed seat back with the transaction
+            raise await _rsvp_refusal(conn, att, now) or RsvpRejectedError("Event is full")
+
+    except (NotFoundError, DuplicateResourceError, RsvpRejectedError):
+        raise
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while holding seat: {str(e)}")
+        raise ValueError(f"Database error while holding seat: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while holding seat: {str(e)}")
+        raise ValueError(f"Unexpected error while holding seat: {str(e)}") from e
+
+
+async def convert_hold_db(
+    payment_id: UUID, event_id: UUID, user_id: UUID
+) -> AttendeeRead | None:
+    """
+    Turn a paid checkout's seat hold into an RSVPed attendee, keeping the seat.
+
+    The hold is matched by payment, or by event and user when a newer checkout took it
+    over. Returns None when no hold is left, e.g. it expired before the payment
+    completed; the caller then has to find the attendee a seat the ordinary way.
+    """
+    try:
+        now = datetime.now(UTC)
+
+        async with begin(engine) as conn:
+            held = (
+                await conn.execute(
+                    seat_holds.delete()
+                    .where(
+                        or_(
+                            seat_holds.c.payment_id == payment_id,
+                            and_(
+                                seat_holds.c.event_id == event_id,
+                                seat_holds.c.user_id == user_id,
+                            ),
+                        )
+                    )
+                    .returning(seat_holds.c.payment_id)
+                )
+            ).all()
+            if not held:
+                return None
+
+            att = AttendeeCreate(
+                event_id=event_id, user_id=user_id, status=AttendeeStatus.RSVPED
+            )
+            insert = pg_insert if conn.dialect.name == "postgresql" else sqlite_insert
+            row = (
+                (
+                    await conn.execute(
+                        insert(eventattendees)
+                        .values(_attendee_values(att, now))
+                        .on_conflict_do_nothing(index_elements=["event_id", "user_id"])
+                        .returning(eventattendees)
+                    )
+                )
+                .mappings()
+                .first()
+            )
+            if row is not None:
+                return _attendee_from_row(row)
+
+            # Registered meanwhile: the held seat is not needed
+            await _adjust_attendee_counts(conn, {event_id: -1})
+            await _promote_waitlisted(conn, [event_id])
+            existing = await conn.execute(
+                select(eventattendees).where(
+                    eventattendees.c.event_id == event_id, eventattendees.c.user_id == user_id
+                )
+            )
+            return _attendee_from_row(existing.mappings().one())
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while converting seat hold: {str(e)}")
+        raise ValueError(f"Database error while converting seat hold: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while converting seat hold: {str(e)}")
+        raise ValueError(f"Unexpected error while converting seat hold: {str(e)}") from e
+
+
+async def _release_holds(conn: AsyncConnection, condition: Any) -> int:
+    released = (
+        (
+            await conn.execute(
+                seat_holds.delete().where(condition).returning(seat_holds.c.event_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    seats = Counter(released)
+    await _adjust_attendee_counts(conn, {event_id: -n for event_id, n in seats.items()})
+    await _promote_waitlisted(conn, seats)
+    return len(released)
+
+
+async def release_hold_db(payment_id: UUID) -> bool:
+    """Give a checkout's held seat back, e.g. when the session expired or failed to open."""
+    try:
+        async with begin(engine) as conn:
+            return await _release_holds(conn, seat_holds.c.payment_id == payment_id) > 0
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while releasing seat hold: {str(e)}")
+        raise ValueError(f"Database error while releasing seat hold: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while releasing seat hold: {str(e)}")
+        raise ValueError(f"Unexpected error while releasing seat hold: {str(e)}") from e
+
+
+async def release_expired_holds_db(now: datetime, limit: int = 500) -> int:
+    """
+    Release up to `limit` holds that expired by `now`, oldest first. Returns how many.
+
+    The scan walks idx_seat_holds_expires_at from its start, so it only reads expired
+    rows. SKIP LOCKED leaves holds being converted right now to their webhook.
+    """
+    try:
+        async with begin(engine) as conn:
+            expired = (
+                select(seat_holds.c.payment_id)
+                .where(seat_holds.c.expires_at <= now)
+                .order_by(seat_holds.c.expires_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            payment_ids = (await conn.execute(expired)).scalars().all()
+            if not payment_ids:
+                return 0
+            return await _release_holds(conn, seat_holds.c.payment_id.in_(payment_ids))
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while releasing expired seat holds: {str(e)}")
+        raise ValueError(f"Database error while releasing expired seat holds: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while releasing expired seat holds: {str(e)}")
+        raise ValueError(
+            f"Unexpected error while releasing expired seat holds: {str(e)}"
+        ) from e
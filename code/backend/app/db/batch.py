@@ -0,0 +1,105 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, Table, Update, column, literal, select, union_all, values
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.expression import FromClause
+
+
+def _group_by_columns(
+    updates: dict[Any, dict[str, Any]],
+) -> dict[tuple[str, ...], list[Any]]:
+    groups: dict[tuple[str, ...], list[Any]] = {}
+    for row_id, update_data in updates.items():
+        groups.setdefault(tuple(sorted(update_data)), []).append(row_id)
+    return groups
+
+
+def _values_source(
+    table: Table,
+    names: tuple[str, ...],
+    rows: list[tuple[Any, ...]],
+    dialect: str,
+) -> FromClause:
+    if dialect != "sqlite":
+        return values(
+            *(column(name, table.c[name].type) for name in names), name="batch_values"
+        ).data(rows)
+
+    # SQLite cannot name VALUES columns, and pysqlite only opens a transaction for
+    # statements starting with UPDATE, so select the rows inline instead of using a CTE
+    selects = [
+        select(
+            *(
+                literal(value, table.c[name].type).label(name)
+                for name, value in zip(names, row, strict=True)
+            )
+        )
+        for row in rows
+    ]
+    return union_all(*selects).subquery("batch_values")
+
+
+def _batch_update_statement(
+    table: Table,
+    key: str,
+    columns: tuple[str, ...],
+    rows: list[tuple[Any, ...]],
+    constants: dict[str, Any],
+    dialect: str,
+) -> Update:
+    source = _values_source(table, (key, *columns), rows, dialect)
+
+    return (
+        table.update()
+        .values(**{name: source.c[name] for name in columns}, **constants)
+        .where(table.c[key] == source.c[key])
+        .returning(table)
+    )
+
+
+async def batch_update_rows(
+    conn: AsyncConnection,
+    table: Table,
+    key: str,
+    updates: dict[Any, dict[str, Any]],
+    now: datetime,
+) -> dict[Any, Row[Any]]:
+    """
+    Apply per-row updates with one `UPDATE ... FROM (VALUES ...)` per set of changed columns.
+
+    Rows changing the same columns share a statement, so a batch costs one round trip per
+    distinct column set instead of one per row. `updated_at` is set to `now` on every row.
+    Returns the updated rows keyed by `key`; ids with no matching row are absent, and the
+    caller decides how to report them.
+    """
+    updated: dict[Any, Row[Any]] = {}
+
+    for columns, row_ids in _group_by_columns(updates).items():
+        # A column that is NULL on every row is set directly: PostgreSQL would type an
+        # all-NULL VALUES column as text and reject assigning it to a typed column
+        nulls = {
+            name
+            for name in columns
+            if all(updates[row_id][name] is None for row_id in row_ids)
+        }
+        varying = tuple(name for name in columns if name not in nulls)
+        constants: dict[str, Any] = {name: None for name in nulls}
+        constants["updated_at"] = now
+
+        rows = [(row_id, *(updates[row_id][name] for name in varying)) for row_id in row_ids]
+        statement = _batch_update_statement(
+            table, key, varying, rows, constants, conn.dialect.name
+        )
+        for row in await conn.execute(statement):
+            updated[row._mapping[key]] = row
+
+    return updated
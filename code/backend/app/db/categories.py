@@ -6,16 +6,20 @@ Human code: 10%
 Framework-generated code: 0%
 """
 
+import asyncio
 import logging
+import operator
+import re
+from collections.abc import Callable, Iterable
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, MetaData, String, Table, Text, and_, func, select
+from sqlalchemy import Column, MetaData, String, Table, Text, select
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import ColumnElement
 
-from app.db.db import engine
+from app.config import settings
+from app.db.db import after_commit, begin, engine, read_only
 from app.db.filters import FilterOperation
 from app.models.categories import CategoryRead
 from app.models.exceptions import InvalidColumnError
@@ -33,66 +37,160 @@ categories = Table(
 )
 
 
+def _like_pattern(pattern: str, case_sensitive: bool) -> re.Pattern[str]:
+    """Translate a SQL LIKE pattern (`%`, `_`, backslash escapes) to a regex."""
+    parts: list[str] = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == "\\":
+            parts.append(re.escape(next(chars, "\\")))
+        elif char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.DOTALL if case_sensitive else re.DOTALL | re.I)
+
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def _matcher(f: FilterOperation) -> Callable[[CategoryRead], bool]:
+    """Evaluate one filter the way the database would, NULLs matching nothing."""
+    if f.field not in categories.c:
+        logger.error(f"Invalid filter_expression field: {f.field}")
+        raise InvalidColumnError(f"Invalid column name: {f.field}")
+
+    if f.op in ("LIKE", "ILIKE"):
+        regex = _like_pattern(str(f.value), case_sensitive=f.op == "LIKE")
+
+        def test(value: Any) -> bool:
+            return regex.fullmatch(str(value)) is not None
+
+    elif f.op == "IN":
+        wanted = set(f.value)
+
+        def test(value: Any) -> bool:
+            return value in wanted
+
+    else:
+        compare = _COMPARISONS[f.op]
+
+        def test(value: Any) -> bool:
+            return compare(value, f.value)
+
+    def matches(category: CategoryRead) -> bool:
+        value = getattr(category, f.field)
+        return value is not None and test(value)
+
+    return matches
+
+
+class CategoryCatalog:
+    """
+    Every category, held in memory.
+
+    The table is tiny and almost never written, so existence checks and listings are
+    answered from here instead of the database. The catalog is loaded at startup (or on
+    first use), updated by create_category_db, and reloaded every
+    CATEGORY_CATALOG_REFRESH_SECONDS to pick up rows written by other processes. Ids it
+    does not hold are looked up in the database before being reported missing, since
+    another process may have created them since the last reload.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[UUID, CategoryRead] | None = None
+        self._load_lock = asyncio.Lock()
+
+    def clear(self) -> None:
+        """Forget the loaded rows; the next read loads them again."""
+        self._by_id = None
+
+    async def _select(self, category_ids: set[UUID] | None = None) -> list[CategoryRead]:
+        query = select(categories)
+        if category_ids is not None:
+            query = query.where(categories.c.category_id.in_(category_ids))
+        try:
+            async with read_only(engine) as conn:
+                result = await conn.execute(query)
+                return [CategoryRead.model_validate(dict(row)) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while loading categories: {str(e)}")
+            raise ValueError(f"Database error while loading categories: {str(e)}") from e
+
+    async def load(self) -> dict[UUID, CategoryRead]:
+        rows = await self._select()
+        # Ordered by id so listings page deterministically
+        self._by_id = {row.category_id: row for row in sorted(rows, key=_by_category_id)}
+        return self._by_id
+
+    async def _rows(self) -> dict[UUID, CategoryRead]:
+        if self._by_id is not None:
+            return self._by_id
+        async with self._load_lock:
+            # Concurrent first reads share one load
+            return self._by_id if self._by_id is not None else await self.load()
+
+    async def all(self) -> list[CategoryRead]:
+        return list((await self._rows()).values())
+
+    async def existing_ids(self, category_ids: Iterable[UUID]) -> set[UUID]:
+        rows = await self._rows()
+        wanted = set(category_ids)
+        found = {category_id for category_id in wanted if category_id in rows}
+        if missing := wanted - found:
+            for category in await self._select(missing):
+                self.add(category)
+                found.add(category.category_id)
+        return found
+
+    def add(self, category: CategoryRead) -> None:
+        # Not loaded yet: the first read will pick the row up from the database
+        if self._by_id is None:
+            return
+        rows = [*self._by_id.values(), category]
+        self._by_id = {row.category_id: row for row in sorted(rows, key=_by_category_id)}
+
+
+def _by_category_id(category: CategoryRead) -> UUID:
+    return category.category_id
+
+
+catalog = CategoryCatalog()
+
+
+async def refresh_catalog_periodically() -> None:
+    """Reload the category catalog every CATEGORY_CATALOG_REFRESH_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(settings.CATEGORY_CATALOG_REFRESH_SECONDS)
+        try:
+            await catalog.load()
+        except ValueError as e:
+            # Keep serving the catalog we have
+            logger.warning(f"Failed to refresh the category catalog: {str(e)}")
+
+
 async def get_categories_db(
     filters: list[FilterOperation] | None = None,
     offset: int = 0,
     limit: int = 100,
 ) -> tuple[list[CategoryRead], int]:
-    try:
-        query = select(categories)
-        count_query = select(func.count()).select_from(categories)
-
-        if filters:
-            conditions: list[ColumnElement[Any]] = []
-            for f in filters:
-                column = getattr(categories.c, f.field, None)
-                if column is None:
-                    logger.error(f"Invalid filter_expression field: {f.field}")
-                    raise InvalidColumnError(f"Invalid column name: {f.field}")
-
-                if f.op == "=":
-                    conditions.append(column == f.value)
-                elif f.op == "!=":
-                    conditions.append(column != f.value)
-                elif f.op == ">":
-                    conditions.append(column > f.value)
-                elif f.op == ">=":
-                    conditions.append(column >= f.value)
-                elif f.op == "<":
-                    conditions.append(column < f.value)
-                elif f.op == "<=":
-                    conditions.append(column <= f.value)
-                elif f.op == "LIKE":
-                    conditions.append(column.like(f.value))
-                elif f.op == "ILIKE":
-                    conditions.append(column.ilike(f.value))
-
-            if conditions:
-                where_clause = and_(*conditions)
-                query = query.where(where_clause)
-                count_query = count_query.where(where_clause)
-
-        # Add a stable ORDER BY to ensure deterministic paging
-        query = query.order_by(categories.c.category_id).offset(offset).limit(limit)
-
-        async with engine.begin() as conn:
-            result = await conn.execute(query)
-            rows = result.mappings().all()
-            categories_list = [CategoryRead.model_validate(dict(row)) for row in rows]
-
-            count_result = await conn.scalar(count_query)
-            total_count = 0 if count_result is None else int(count_result)
-
-            return categories_list, total_count
-
-    except InvalidColumnError:
-        raise
-    except SQLAlchemyError as e:
-        logger.error(f"Database error while getting categories: {str(e)}")
-        raise ValueError(f"Database error while getting categories: {str(e)}") from e
-    except Exception as e:
-        logger.error(f"Unexpected error while getting categories: {str(e)}")
-        raise ValueError(f"Unexpected error while getting categories: {str(e)}") from e
+    """List categories from the in-memory catalog, filtered and paged like the table."""
+    matchers = [_matcher(f) for f in filters or []]
+    matching = [
+        category
+        for category in await catalog.all()
+        if all(matches(category) for matches in matchers)
+    ]
+    return matching[offset : offset + limit], len(matching)
 
 
 async def create_category_db(category_name: str, description: str | None = None) -> UUID:
@@ -107,9 +205,15 @@ async def create_category_db(category_name: str, description: str | None = None)
 
         insert_stmt = categories.insert().values(values)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             await conn.execute(insert_stmt)
-            return category_id
+
+        # Inside a unit of work the insert is not committed yet and may still roll back
+        category = CategoryRead(
+            category_id=category_id, category_name=category_name, description=description
+        )
+        after_commit(lambda: catalog.add(category))
+        return category_id
 
     except SQLAlchemyError as e:
         logger.error(f"Database error while creating category: {str(e)}")
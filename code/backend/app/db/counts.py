@@ -0,0 +1,87 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.db.filter_compiler import ListStatements, filter_signature
+from app.db.filters import FilterOperation
+from app.models.pagination import CountMode
+
+# (table, filter signature, filter values) -> (expires_at, count)
+_count_cache: dict[tuple[Any, ...], tuple[float, int]] = {}
+_COUNT_CACHE_MAX_ENTRIES = 1024
+
+
+def _cache_key(table: Table, filters: list[FilterOperation] | None) -> tuple[Any, ...]:
+    values = tuple(
+        tuple(f.value) if isinstance(f.value, list) else f.value for f in filters or []
+    )
+    return (table.name, filter_signature(filters), values)
+
+
+async def _planner_estimate(conn: AsyncConnection, table: Table) -> int | None:
+    if conn.dialect.name != "postgresql":
+        return None
+    reltuples = await conn.scalar(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table.name},
+    )
+    # reltuples is -1 until the table has been vacuumed or analyzed
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+async def count_rows(
+    conn: AsyncConnection,
+    table: Table,
+    statements: ListStatements,
+    params: dict[str, Any],
+    filters: list[FilterOperation] | None,
+    mode: CountMode,
+) -> int | None:
+    """
+    Count the rows matching a compiled list query according to the requested mode.
+
+    EXACT always runs the count query. ESTIMATE uses planner statistics for unfiltered
+    Postgres tables and otherwise serves a count cached for COUNT_CACHE_TTL_SECONDS.
+    NONE skips counting and returns None.
+    """
+    if mode is CountMode.NONE:
+        return None
+
+    if mode is CountMode.ESTIMATE:
+        if not filters:
+            estimate = await _planner_estimate(conn, table)
+            if estimate is not None:
+                return estimate
+
+        key = _cache_key(table, filters)
+        cached = _count_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+    count_result = await conn.scalar(statements.count_query, params)
+    total = 0 if count_result is None else int(count_result)
+
+    if mode is CountMode.ESTIMATE:
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[key] = (time.monotonic() + settings.COUNT_CACHE_TTL_SECONDS, total)
+
+    return total
+
+
+def clear_count_cache() -> None:
+    """Drop every cached estimate."""
+    _count_cache.clear()
@@ -6,12 +6,23 @@ Human code: 90%
 Framework-generated code: 0%
 """
 
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy import MetaData, text
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from app.config import settings
+from app.db.metrics import REPLICA_LAG
+
+logger = logging.getLogger(__name__)
 
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -21,6 +32,234 @@ engine = create_async_engine(
 )
 metadata = MetaData()
 
+# Connection of the unit of work active in the current task, if any
+_current_connection: ContextVar[AsyncConnection | None] = ContextVar(
+    "current_connection", default=None
+)
+
+# Callbacks to run once the unit of work active in the current task commits
+_after_commit: ContextVar[list[Callable[[], None]] | None] = ContextVar(
+    "after_commit", default=None
+)
+
+# Identifies the client session (the authenticated user) served by the current task
+_session_key: ContextVar[str | None] = ContextVar("session_key", default=None)
+
+# Monotonic deadline until which reads in the current task stay on the primary
+_pinned_until: ContextVar[float] = ContextVar("pinned_until", default=0.0)
+
+# session key -> monotonic deadline until which that session reads from the primary
+_primary_pins: dict[str, float] = {}
+_PRIMARY_PINS_MAX_ENTRIES = 10_000
+
+# Replica lag measured by the monitor on replicas that expose it
+_REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+@dataclass
+class Replica:
+    """A read replica pool and its last measured lag (None until first measured)."""
+
+    name: str
+    engine: AsyncEngine
+    lag: float | None = None
+
+
+_replicas: list[Replica] = []
+_replica_turn = itertools.count()
+
+
+def configure_replicas(urls: list[str]) -> None:
+    """Replace the replica pools that pure reads are routed to; [] reads from the primary."""
+    global _replicas
+    replica_engines = [create_async_engine(url, pool_size=15, pool_timeout=30) for url in urls]
+    _replicas = [
+        Replica(
+            name=f"{bind.url.host or bind.url.database}:{bind.url.port or ''}", engine=bind
+        )
+        for bind in replica_engines
+    ]
+
+
+configure_replicas(settings.REPLICA_DATABASE_URLS)
+
+
+def set_session_key(key: str | None) -> None:
+    """Associate the current task with a client session for read-your-writes pinning."""
+    _session_key.set(key or None)
+
+
+def _pin_primary() -> None:
+    """Keep the current session on the primary until replicas have caught up."""
+    if not _replicas:
+        return
+    deadline = time.monotonic() + settings.READ_YOUR_WRITES_SECONDS
+    _pinned_until.set(deadline)
+
+    key = _session_key.get()
+    if key is None:
+        return
+    if len(_primary_pins) >= _PRIMARY_PINS_MAX_ENTRIES:
+        now = time.monotonic()
+        for pinned_key, until in list(_primary_pins.items()):
+            if until <= now:
+                del _primary_pins[pinned_key]
+    _primary_pins[key] = deadline
+
+
+def _pinned_to_primary() -> bool:
+    now = time.monotonic()
+    if _pinned_until.get() > now:
+        return True
+    key = _session_key.get()
+    return key is not None and _primary_pins.get(key, 0.0) > now
+
+
+def _read_bind(bind: AsyncEngine) -> AsyncEngine:
+    """Pick the pool for a pure read: a caught-up replica unless the session is pinned."""
+    if not _replicas or _pinned_to_primary():
+        return bind
+
+    healthy = [
+        replica
+        for replica in _replicas
+        if replica.lag is None or replica.lag <= settings.REPLICA_MAX_LAG_SECONDS
+    ]
+    if not healthy:
+        return bind
+    return healthy[next(_replica_turn) % len(healthy)].engine
+
+
+async def refresh_replica_lag() -> None:
+    """Measure every replica's replay lag and publish it as db_replica_lag_seconds."""
+    for replica in _replicas:
+        try:
+            async with replica.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = await conn.scalar(_REPLICA_LAG_QUERY)
+                    replica.lag = float(lag or 0.0)
+                else:
+                    replica.lag = 0.0
+        except Exception as e:
+            # An unreachable replica is skipped until it answers again
+            logger.warning(f"Could not measure lag of replica {replica.name}: {str(e)}")
+            replica.lag = float("inf")
+        REPLICA_LAG.labels(replica=replica.name).set(replica.lag)
+
+
+async def monitor_replica_lag() -> None:
+    """Refresh replica lag every REPLICA_LAG_POLL_SECONDS until cancelled."""
+    if not _replicas:
+        return
+    while True:
+        await refresh_replica_lag()
+        await asyncio.sleep(settings.REPLICA_LAG_POLL_SECONDS)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncConnection]:
+    """
+    Run everything inside on one pooled connection and one transaction.
+
+    The app.db functions pick the connection up through `begin`, so a service wrapped in
+    a unit of work checks out a single connection and commits once at the end; any
+    exception rolls the whole unit back. Nested units reuse the outer one. Also usable
+    as a decorator: `@unit_of_work()`. Units always run on the primary.
+    """
+    current = _current_connection.get()
+    if current is not None:
+        yield current
+        return
+
+    callbacks: list[Callable[[], None]] = []
+    async with engine.begin() as conn:
+        token = _current_connection.set(conn)
+        callbacks_token = _after_commit.set(callbacks)
+        try:
+            yield conn
+        finally:
+            _after_commit.reset(callbacks_token)
+            _current_connection.reset(token)
+    _pin_primary()
+    for callback in callbacks:
+        callback()
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the active unit of work has committed, or right away outside one.
+
+    For in-process state, such as caches, that must not change before other connections
+    can see the write. Callbacks of a unit that rolls back are dropped.
+    """
+    callbacks = _after_commit.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+@asynccontextmanager
+async def begin(bind: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """
+    Yield the active unit of work's connection, or a new transaction on `bind`.
+
+    Inside a unit of work the caller's statements join its transaction and the commit
+    happens when the unit ends; otherwise this behaves like `bind.begin()`. A committed
+    write pins the session's reads to the primary for READ_YOUR_WRITES_SECONDS.
+    """
+    current = _current_connection.get()
+    if current is not None:
+        yield current
+        return
+
+    async with bind.begin() as conn:
+        yield conn
+    _pin_primary()
+
+
+@asynccontextmanager
+async def read_only(bind: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """
+    Yield a connection for pure reads, without wrapping them in a transaction.
+
+    Outside a unit of work the connection runs in autocommit, so a lookup costs only its
+    own statements instead of BEGIN, the statements and COMMIT. Each statement sees its
+    own snapshot; a read that needs several statements to agree must use a unit of work.
+    Inside a unit of work the reads join its transaction.
+
+    When replicas are configured the read goes to one that is within
+    REPLICA_MAX_LAG_SECONDS, unless the session wrote recently and is pinned to `bind`.
+    """
+    current = _current_connection.get()
+    if current is not None:
+        yield current
+        return
+
+    async with _read_bind(bind).connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        yield conn
+
+
+@asynccontextmanager
+async def read_transaction(bind: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """
+    Like read_only, but inside a transaction, for reads that need transaction-local
+    settings (`set_config(..., true)`). Costs BEGIN and COMMIT on top of the statements
+    and goes to a replica the same way. Inside a unit of work the reads join it, and
+    settings they make last until the unit ends.
+    """
+    current = _current_connection.get()
+    if current is not None:
+        yield current
+        return
+
+    async with _read_bind(bind).connect() as conn, conn.begin():
+        yield conn
+
 
 async def init_db() -> None:
     async with engine.begin() as conn:
@@ -30,7 +269,7 @@ async def init_db() -> None:
 async def check_connection() -> dict[str, Any]:
     """Test database connection and return version info."""
     try:
-        async with engine.connect() as conn:
+        async with read_only(engine) as conn:
             result = await conn.execute(text("SELECT version();"))
             version = result.scalar()
             return {"status": "healthy", "version": version}
@@ -0,0 +1,210 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Per-zoom rollups of upcoming events for GET /events/map-tiles.
+
+The map is cut into Web Mercator tiles, 2^z x 2^z of them at zoom z, and each tile
+into 2^MAP_TILE_CELL_BITS x 2^MAP_TILE_CELL_BITS cells. event_map_cells holds, for every
+zoom up to MAP_TILE_MAX_ZOOM and every non-empty cell, how many upcoming events lie in
+it and their mean position. Serving a tile is then a primary-key range scan over a
+bounded number of rows, however many events the tile covers.
+
+refresh_event_map_db rebuilds the rollups from the events with coordinates that have
+not ended and start within MAP_ROLLUP_WINDOW_DAYS. The rebuild runs in one transaction,
+so readers keep seeing the previous rollups until it commits.
+"""
+
+import logging
+import math
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Insert,
+    Integer,
+    MetaData,
+    SmallInteger,
+    Table,
+    bindparam,
+    cast,
+    func,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.db.db import begin, engine, read_only
+from app.db.events import events
+from app.models.events import MapCluster
+
+logger = logging.getLogger(__name__)
+
+# Web Mercator is cut off at the latitude that makes the world square
+MAX_MERCATOR_LATITUDE = 85.05112878
+
+# Arbitrary key of the advisory lock that keeps API workers from rebuilding at once
+_REFRESH_LOCK_KEY = 1_785_220_024
+
+metadata = MetaData()
+event_map_cells = Table(
+    "event_map_cells",
+    metadata,
+    Column("zoom", SmallInteger, primary_key=True),
+    Column("cell_x", Integer, primary_key=True),
+    Column("cell_y", Integer, primary_key=True),
+    Column("event_count", Integer, nullable=False),
+    Column("latitude", Float, nullable=False),
+    Column("longitude", Float, nullable=False),
+    Column("refreshed_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def _cell_bounds(zoom: int, cell_x: int, cell_y: int) -> tuple[float, float, float, float]:
+    """The cell as (west, south, east, north) in degrees."""
+    cells = 2 ** (zoom + settings.MAP_TILE_CELL_BITS)
+
+    def latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / cells))))
+
+    west = cell_x / cells * 360 - 180
+    east = (cell_x + 1) / cells * 360 - 180
+    return (
+        round(west, 6),
+        round(latitude(cell_y + 1), 6),
+        round(east, 6),
+        round(latitude(cell_y), 6),
+    )
+
+
+def _rollup_statement(zoom: int, now: datetime) -> Insert:
+    # Cells per side of the world at this zoom; the mercator x and y of an event are
+    # in [0, 1) and scaled by it to pick the cell
+    cells = bindparam("cells", 2 ** (zoom + settings.MAP_TILE_CELL_BITS), type_=Float)
+    latitude = func.radians(events.c.latitude, type_=Float)
+    secant = 1.0 / func.cos(latitude, type_=Float)
+    mercator_x = (events.c.longitude + 180.0) / 360.0
+    mercator_y = (
+        1.0
+        - func.ln(func.tan(latitude, type_=Float) + secant, type_=Float) / func.pi(type_=Float)
+    ) / 2.0
+    cell_x = cast(func.floor(mercator_x * cells), Integer)
+    cell_y = cast(func.floor(mercator_y * cells), Integer)
+
+    upcoming = (
+        select(
+            literal(zoom, SmallInteger).label("zoom"),
+            cell_x.label("cell_x"),
+            cell_y.label("cell_y"),
+            func.count().label("event_count"),
+            func.avg(events.c.latitude).label("latitude"),
+            func.avg(events.c.longitude).label("longitude"),
+            literal(now, DateTime(timezone=True)).label("refreshed_at"),
+        )
+        .where(
+            events.c.event_endtime >= now,
+            events.c.event_datetime < now + timedelta(days=settings.MAP_ROLLUP_WINDOW_DAYS),
+            events.c.latitude.between(-MAX_MERCATOR_LATITUDE, MAX_MERCATOR_LATITUDE),
+            # 180 is the antimeridian again, which the tiles start at -180
+            events.c.longitude >= -180,
+            events.c.longitude < 180,
+        )
+        .group_by(
+            # By output column, so the cell expressions and their parameters are not repeated
+            text("cell_x"),
+            text("cell_y"),
+        )
+    )
+    return event_map_cells.insert().from_select(
+        [
+            "zoom",
+            "cell_x",
+            "cell_y",
+            "event_count",
+            "latitude",
+            "longitude",
+            "refreshed_at",
+        ],
+        upcoming,
+    )
+
+
+async def refresh_event_map_db(max_age_seconds: float = 0) -> bool:
+    """
+    Rebuild the rollups for every zoom level in one transaction.
+
+    Skips the rebuild, returning False, when the rollups are younger than
+    `max_age_seconds` or another connection is rebuilding them right now.
+    """
+    try:
+        now = datetime.now(UTC)
+        async with begin(engine) as conn:
+            if conn.dialect.name == "postgresql":
+                locked = await conn.scalar(
+                    select(func.pg_try_advisory_xact_lock(_REFRESH_LOCK_KEY))
+                )
+                if not locked:
+                    return False
+
+            if max_age_seconds > 0:
+                refreshed_at = await conn.scalar(
+                    select(event_map_cells.c.refreshed_at).limit(1)
+                )
+                if refreshed_at is not None:
+                    if refreshed_at.tzinfo is None:
+                        refreshed_at = refreshed_at.replace(tzinfo=UTC)
+                    if (now - refreshed_at).total_seconds() < max_age_seconds:
+                        return False
+
+            await conn.execute(event_map_cells.delete())
+            for zoom in range(settings.MAP_TILE_MAX_ZOOM + 1):
+                await conn.execute(_rollup_statement(zoom, now))
+            return True
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while refreshing the event map: {str(e)}")
+        raise ValueError(f"Database error while refreshing the event map: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while refreshing the event map: {str(e)}")
+        raise ValueError(f"Unexpected error while refreshing the event map: {str(e)}") from e
+
+
+async def get_map_tile_db(zoom: int, x: int, y: int) -> list[MapCluster]:
+    """The clusters of one tile, read from the rollups of its zoom level."""
+    try:
+        bits = settings.MAP_TILE_CELL_BITS
+        query = (
+            select(event_map_cells)
+            .where(
+                event_map_cells.c.zoom == zoom,
+                event_map_cells.c.cell_x.between(x << bits, ((x + 1) << bits) - 1),
+                event_map_cells.c.cell_y.between(y << bits, ((y + 1) << bits) - 1),
+            )
+            .order_by(event_map_cells.c.cell_x, event_map_cells.c.cell_y)
+        )
+        async with read_only(engine) as conn:
+            rows = (await conn.execute(query)).mappings().all()
+
+        return [
+            MapCluster(
+                latitude=round(row["latitude"], 6),
+                longitude=round(row["longitude"], 6),
+                count=row["event_count"],
+                bbox=_cell_bounds(zoom, row["cell_x"], row["cell_y"]),
+            )
+            for row in rows
+        ]
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while getting map tile: {str(e)}")
+        raise ValueError(f"Database error while getting map tile: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while getting map tile: {str(e)}")
+        raise ValueError(f"Unexpected error while getting map tile: {str(e)}") from e
@@ -14,23 +14,50 @@ from uuid import UUID, uuid4
 from sqlalchemy import (
     Column,
     DateTime,
+    Float,
     Integer,
     MetaData,
     String,
     Table,
     Text,
     and_,
+    bindparam,
+    case,
     func,
+    literal_column,
+    or_,
     select,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.elements import ColumnElement
 
-from app.db.db import engine
+from app.db.batch import batch_update_rows
+from app.db.counts import count_rows
+from app.db.db import begin, engine, read_only
+from app.db.filter_compiler import (
+    ListStatements,
+    OrderSignature,
+    compile_list_query,
+    compile_where,
+    order_columns,
+)
 from app.db.filters import FilterOperation
-from app.models.events import EventCreate, EventRead
-from app.models.exceptions import InvalidColumnError, NotFoundError
+from app.db.geo import (
+    BoundingBox,
+    Near,
+    area_condition,
+    distance_km,
+    distance_order,
+    location_values,
+)
+from app.db.pagination import decode_cursor
+from app.db.picker import pick_rows
+from app.models.events import EventCreate, EventOrder, EventRead
+from app.models.exceptions import InvalidColumnError, InvalidCursorError, NotFoundError
+from app.models.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -50,63 +77,65 @@ events = Table(
     Column("price_field", Integer),
     Column("user_id", SQLAlchemyUUID(as_uuid=True), nullable=False),
     Column("category_id", SQLAlchemyUUID(as_uuid=True), nullable=False),
-    Column("created_at", DateTime(timezone=True)),
+    Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True)),
+    # Maintained by the attendee writes in app.db.attendees; repaired by app.jobs
+    Column("attendee_count", Integer, nullable=False, server_default=text("0")),
+    # Copied from the geo:: payload of event_location by the event writes (app.db.geo)
+    Column("latitude", Float),
+    Column("longitude", Float),
+    # The address of a geo:: event_location, or the location as written; searched
+    Column("location_text", Text),
 )
 
 
+# Sort key for list pages; cursors encode the last row's values of these columns
+EVENTS_KEYSET: OrderSignature = ("event_datetime", "event_id")
+
+# Sort key of each GET /events order_by. event_id breaks ties so pages never overlap,
+# and each key is the leading columns of an index from db/init/04 or 12, which serves
+# the descending orders by scanning backwards. Distance is ordered in the area query.
+EVENT_SORTS: dict[EventOrder, OrderSignature] = {
+    EventOrder.EVENT_DATETIME: EVENTS_KEYSET,
+    EventOrder.EVENT_DATETIME_DESC: ("-event_datetime", "-event_id"),
+    EventOrder.PRICE: ("price_field", "event_id"),
+    EventOrder.PRICE_DESC: ("-price_field", "-event_id"),
+    EventOrder.CREATED_AT: ("created_at", "event_id"),
+    EventOrder.CREATED_AT_DESC: ("-created_at", "-event_id"),
+}
+
+
+def seekable(keyset: OrderSignature) -> bool:
+    """Whether cursors can page on `keyset`; a row comparison never seeks past a NULL."""
+    return all(not events.c[name.lstrip("-")].nullable for name in keyset)
+
+
 async def get_events_db(
     filters: list[FilterOperation] | None = None,
     offset: int = 0,
     limit: int = 100,
-) -> tuple[list[EventRead], int]:
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+    order_by: OrderSignature = EVENTS_KEYSET,
+) -> tuple[list[EventRead], int | None]:
     try:
-        query = select(events)
-        count_query = select(func.count()).select_from(events)
-
-        if filters:
-            conditions: list[ColumnElement[Any]] = []
-            for f in filters:
-                column = getattr(events.c, f.field, None)
-                if column is None:
-                    logger.error(f"Invalid filter_expression field: {f.field}")
-                    raise InvalidColumnError(f"Invalid column name: {f.field}")
-
-                if f.op == "=":
-                    conditions.append(column == f.value)
-                elif f.op == "!=":
-                    conditions.append(column != f.value)
-                elif f.op == ">":
-                    conditions.append(column > f.value)
-                elif f.op == ">=":
-                    conditions.append(column >= f.value)
-                elif f.op == "<":
-                    conditions.append(column < f.value)
-                elif f.op == "<=":
-                    conditions.append(column <= f.value)
-                elif f.op == "LIKE":
-                    conditions.append(column.like(f.value))
-                elif f.op == "ILIKE":
-                    conditions.append(column.ilike(f.value))
-
-            if conditions:
-                where_clause = and_(*conditions)
-                query = query.where(where_clause)
-                count_query = count_query.where(where_clause)
-
-        # Add a stable ORDER BY to ensure deterministic paging
-        query = query.order_by(events.c.event_id).offset(offset).limit(limit)
-
-        async with engine.begin() as conn:
-            result = await conn.execute(query)
+        # Order by the keyset in both modes so offset pages and cursor pages agree
+        after = decode_cursor(cursor, events, order_by) if cursor else None
+        statements, params = compile_list_query(
+            events, filters, order_by=order_by, after=after
+        )
+
+        async with read_only(engine) as conn:
+            result = await conn.execute(
+                statements.query, {**params, "offset": offset, "limit": limit}
+            )
             rows = result.mappings().all()
             events_list = [EventRead.model_validate(dict(row)) for row in rows]
 
-            count_result = await conn.scalar(count_query)
-            total_count = 0 if count_result is None else int(count_result)
+            total_count = await count_rows(conn, events, statements, params, filters, count)
 
             return events_list, total_count
-    except InvalidColumnError:
+    except (InvalidColumnError, InvalidCursorError):
         raise
     except SQLAlchemyError as e:
         logger.error(f"Database error while getting events: {str(e)}")
@@ -116,29 +145,221 @@ async def get_events_db(
         raise ValueError(f"Unexpected error while getting events: {str(e)}") from e
 
 
+# Text search configuration of the events.search_vector column (db/init/08, 13)
+SEARCH_CONFIG = "english"
+
+# Maintained by Postgres as a generated column and indexed with GIN; not part of the
+# `events` Table so it is never selected, inserted or sent back to clients
+_search_vector = literal_column("events.search_vector", type_=TSVECTOR)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_statements(
+    dialect: str, where_clause: ColumnElement[Any] | None, words: int
+) -> ListStatements:
+    """
+    Build the ranked search and count statements.
+
+    Postgres matches the GIN-indexed tsvector against websearch_to_tsquery (quoted
+    phrases, `or`, `-word`) and orders by ts_rank_cd. Other dialects, used in tests,
+    require every word to appear in the name, description or location and put name
+    matches first.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, bindparam("search"))
+        condition: ColumnElement[bool] = _search_vector.op("@@")(tsquery)
+        rank: ColumnElement[Any] = func.ts_rank_cd(_search_vector, tsquery).desc()
+    else:
+        searched = (events.c.event_name, events.c.description, events.c.location_text)
+        condition = and_(
+            *(
+                or_(*(col.ilike(bindparam(f"w{i}"), escape="\\") for col in searched))
+                for i in range(words)
+            )
+        )
+        rank = case((events.c.event_name.ilike(bindparam("w0"), escape="\\"), 0), else_=1)
+
+    if where_clause is not None:
+        condition = and_(condition, where_clause)
+
+    query = (
+        select(events)
+        .where(condition)
+        .order_by(rank, *(events.c[name] for name in EVENTS_KEYSET))
+        .offset(bindparam("offset", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
+    count_query = select(func.count()).select_from(events).where(condition)
+    return ListStatements(query=query, count_query=count_query)
+
+
+async def search_events_db(
+    search: str,
+    filters: list[FilterOperation] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    count: CountMode = CountMode.EXACT,
+    bbox: BoundingBox | None = None,
+) -> tuple[list[EventRead], int | None]:
+    """Full-text search over event name, description and location, best matches first."""
+    try:
+        words = search.split()
+        where_clause, params = compile_where(events, filters)
+        counted = [*(filters or []), FilterOperation("search", "eq", search)]
+        if bbox is not None:
+            counted.append(FilterOperation("bbox", "eq", bbox))
+        params = {
+            **params,
+            "search": search,
+            **{f"w{i}": f"%{_escape_like(word)}%" for i, word in enumerate(words)},
+            "offset": offset,
+            "limit": limit,
+        }
+
+        async with read_only(engine) as conn:
+            area = area_condition(conn.dialect.name, events, None, bbox)
+            if area is not None:
+                where_clause = area if where_clause is None else and_(where_clause, area)
+            statements = _search_statements(conn.dialect.name, where_clause, len(words))
+            rows = (await conn.execute(statements.query, params)).mappings().all()
+            events_list = [EventRead.model_validate(dict(row)) for row in rows]
+
+            # The search term and area are part of what is counted, so they key the
+            # count cache too
+            total_count = await count_rows(conn, events, statements, params, counted, count)
+
+            return events_list, total_count
+    except InvalidColumnError:
+        raise
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while searching events: {str(e)}")
+        raise ValueError(f"Database error while searching events: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while searching events: {str(e)}")
+        raise ValueError(f"Unexpected error while searching events: {str(e)}") from e
+
+
+async def get_events_in_area_db(
+    filters: list[FilterOperation] | None = None,
+    near: Near | None = None,
+    bbox: BoundingBox | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    count: CountMode = CountMode.EXACT,
+    order_by: OrderSignature | None = None,
+) -> tuple[list[EventRead], int | None]:
+    """
+    Events with coordinates inside the area, in `order_by` order. Without it they come
+    nearest first when `near` is given and in list order otherwise. Each event carries
+    its distance_km from the `near` point.
+    """
+    try:
+        where_clause, params = compile_where(events, filters)
+        params = {**params, "offset": offset, "limit": limit}
+        counted = [*(filters or [])]
+        if near is not None:
+            counted.append(FilterOperation("near", "eq", near))
+        if bbox is not None:
+            counted.append(FilterOperation("bbox", "eq", bbox))
+
+        async with read_only(engine) as conn:
+            dialect = conn.dialect.name
+            condition = area_condition(dialect, events, near, bbox)
+            if where_clause is not None:
+                condition = and_(condition, where_clause)
+
+            columns: list[Any] = [events]
+            order = order_columns(events, order_by or EVENTS_KEYSET)
+            if near is not None:
+                columns.append(distance_km(dialect, events, near).label("distance_km"))
+                if order_by is None:
+                    order.insert(0, distance_order(dialect, events, near))
+
+            query = (
+                select(*columns)
+                .where(condition)
+                .order_by(*order)
+                .offset(bindparam("offset", type_=Integer))
+                .limit(bindparam("limit", type_=Integer))
+            )
+            count_query = select(func.count()).select_from(events).where(condition)
+            statements = ListStatements(query=query, count_query=count_query)
+
+            rows = (await conn.execute(statements.query, params)).mappings().all()
+            events_list = [EventRead.model_validate(dict(row)) for row in rows]
+
+            total_count = await count_rows(conn, events, statements, params, counted, count)
+
+            return events_list, total_count
+    except InvalidColumnError:
+        raise
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while getting events in area: {str(e)}")
+        raise ValueError(f"Database error while getting events in area: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while getting events in area: {str(e)}")
+        raise ValueError(f"Unexpected error while getting events in area: {str(e)}") from e
+
+
+async def lock_events_db(event_ids: list[UUID]) -> dict[UUID, EventRead]:
+    """
+    Load events with SELECT ... FOR UPDATE, in event_id order to avoid lock-order deadlocks.
+
+    Callers hold the locks until their transaction ends, so attendee_count cannot change
+    under a capacity check made against the returned rows.
+    """
+    if not event_ids:
+        return {}
+
+    try:
+        query = (
+            select(events)
+            .where(events.c.event_id.in_(event_ids))
+            .order_by(events.c.event_id)
+            .with_for_update()
+        )
+        async with begin(engine) as conn:
+            rows = (await conn.execute(query)).mappings().all()
+            return {row["event_id"]: EventRead.model_validate(dict(row)) for row in rows}
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while locking events: {str(e)}")
+        raise ValueError(f"Database error while locking events: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while locking events: {str(e)}")
+        raise ValueError(f"Unexpected error while locking events: {str(e)}") from e
+
+
+def _event_values(event: EventCreate, now: datetime) -> dict[str, Any]:
+    return {
+        "event_id": uuid4(),
+        "event_name": event.event_name,
+        "event_datetime": event.event_datetime,
+        "event_endtime": event.event_endtime,
+        "event_location": event.event_location,
+        "description": event.description,
+        "picture_url": event.picture_url,
+        "capacity": event.capacity,
+        "price_field": event.price_field,
+        "user_id": event.user_id,
+        "category_id": event.category_id,
+        "created_at": now,
+        "updated_at": now,
+        **location_values(event.event_location),
+    }
+
+
 async def create_event_db(event: EventCreate) -> EventRead:
     """Create a new event in the database."""
     try:
-        now = datetime.now(UTC)
-        values: dict[str, str | int | datetime | UUID | None] = {
-            "event_id": uuid4(),
-            "event_name": event.event_name,
-            "event_datetime": event.event_datetime,
-            "event_endtime": event.event_endtime,
-            "event_location": event.event_location,
-            "description": event.description,
-            "picture_url": event.picture_url,
-            "capacity": event.capacity,
-            "price_field": event.price_field,
-            "user_id": event.user_id,
-            "category_id": event.category_id,
-            "created_at": now,
-            "updated_at": now,
-        }
+        values = _event_values(event, datetime.now(UTC))
 
         insert_stmt = events.insert().values(values).returning(events)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             result = await conn.execute(insert_stmt)
             row = result.mappings().first()
 
@@ -156,23 +377,49 @@ async def create_event_db(event: EventCreate) -> EventRead:
         raise ValueError(f"Unexpected error while creating event: {str(e)}") from e
 
 
+async def create_events_db(new_events: list[EventCreate]) -> list[EventRead]:
+    """Create several events with one multi-row INSERT ... RETURNING, in input order."""
+    if not new_events:
+        return []
+
+    try:
+        now = datetime.now(UTC)
+        rows = [_event_values(event, now) for event in new_events]
+
+        insert_stmt = events.insert().returning(events, sort_by_parameter_order=True)
+
+        async with begin(engine) as conn:
+            result = await conn.execute(insert_stmt, rows)
+            return [EventRead.model_validate(dict(row)) for row in result.mappings()]
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while bulk creating events: {str(e)}")
+        raise ValueError(f"Database error while bulk creating events: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while bulk creating events: {str(e)}")
+        raise ValueError(f"Unexpected error while bulk creating events: {str(e)}") from e
+
+
 async def batch_update_events_db(updates: dict[UUID, dict[str, Any]]) -> dict[UUID, EventRead]:
     try:
         now = datetime.now(UTC)
         result: dict[UUID, EventRead] = {}
 
-        async with engine.begin() as conn:
-            for event_id, update_data in updates.items():
-                update_data_with_timestamp: dict[str, Any] = {**update_data, "updated_at": now}
+        # Keep the coordinates and location text in step with every event_location change
+        updates = {
+            event_id: (
+                {**fields, **location_values(fields["event_location"])}
+                if "event_location" in fields
+                else fields
+            )
+            for event_id, fields in updates.items()
+        }
 
-                update_stmt = (
-                    events.update()
-                    .where(events.c.event_id == event_id)
-                    .values(**update_data_with_timestamp)
-                    .returning(events)
-                )
+        async with begin(engine) as conn:
+            rows = await batch_update_rows(conn, events, "event_id", updates, now)
 
-                row = (await conn.execute(update_stmt)).fetchone()
+            for event_id in updates:
+                row = rows.get(event_id)
 
                 if not row:
                     logger.error(f"No event found with ID: {event_id}")
@@ -192,6 +439,9 @@ async def batch_update_events_db(updates: dict[UUID, dict[str, Any]]) -> dict[UU
                     category_id=row.category_id,
                     created_at=row.created_at,
                     updated_at=row.updated_at,
+                    attendee_count=row.attendee_count,
+                    latitude=row.latitude,
+                    longitude=row.longitude,
                 )
 
         return result
@@ -210,7 +460,7 @@ async def delete_event_db(event_id: UUID) -> None:
     try:
         delete_stmt = events.delete().where(events.c.event_id == event_id)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             result = await conn.execute(delete_stmt)
 
             if result.rowcount == 0:
@@ -228,3 +478,99 @@ async def delete_event_db(event_id: UUID) -> None:
     except Exception as e:
         logger.error(f"Unexpected error while deleting event: {str(e)}")
         raise ValueError(f"Unexpected error while deleting event: {str(e)}") from e
+
+
+async def pick_events_db(query: str, limit: int) -> tuple[list[tuple[EventRead, float]], bool]:
+    """Events whose name best matches `query`, tolerating typos and partial words."""
+    try:
+        rows, budget_exceeded = await pick_rows(
+            engine, events, (events.c.event_name,), events.c.event_id, query, limit
+        )
+        picked = [(EventRead.model_validate(dict(row)), score) for row, score in rows]
+        return picked, budget_exceeded
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while picking events: {str(e)}")
+        raise ValueError(f"Database error while picking events: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while picking events: {str(e)}")
+        raise ValueError(f"Unexpected error while picking events: {str(e)}") from e
+
+
+async def backfill_event_coordinates_db(batch_size: int = 500) -> int:
+    """
+    Fill latitude, longitude and location_text for events written before those columns
+    existed.
+
+    Walks the events missing them in event_id order, one short transaction per batch,
+    and returns how many were filled. Coordinates stay null for locations without a
+    `geo::` payload. A row is only filled if its event_location is still the one that
+    was parsed, so a concurrent patch is never overwritten with stale values.
+    """
+    try:
+        scan = (
+            select(
+                events.c.event_id,
+                events.c.event_location,
+                events.c.latitude,
+                events.c.location_text,
+            )
+            .where(
+                or_(events.c.latitude.is_(None), events.c.location_text.is_(None)),
+                events.c.event_location.is_not(None),
+            )
+            .order_by(events.c.event_id)
+            .limit(batch_size)
+        )
+        fill = (
+            events.update()
+            .where(
+                events.c.event_id == bindparam("b_event_id"),
+                events.c.event_location == bindparam("b_event_location"),
+            )
+            .values(
+                latitude=bindparam("b_latitude"),
+                longitude=bindparam("b_longitude"),
+                location_text=bindparam("b_location_text"),
+            )
+        )
+
+        filled = 0
+        last_id: UUID | None = None
+        while True:
+            query = scan if last_id is None else scan.where(events.c.event_id > last_id)
+            async with begin(engine) as conn:
+                rows = (await conn.execute(query)).all()
+                if not rows:
+                    return filled
+                last_id = rows[-1].event_id
+
+                found = []
+                for row in rows:
+                    values = location_values(row.event_location)
+                    # Locations without a geo:: payload never get coordinates; skip
+                    # them once their text is filled
+                    missing = (row.latitude is None and values["latitude"] is not None) or (
+                        row.location_text is None and values["location_text"] is not None
+                    )
+                    if missing:
+                        found.append(
+                            {
+                                "b_event_id": row.event_id,
+                                "b_event_location": row.event_location,
+                                **{f"b_{name}": value for name, value in values.items()},
+                            }
+                        )
+                if found:
+                    await conn.execute(fill, found)
+                    filled += len(found)
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while backfilling event coordinates: {str(e)}")
+        raise ValueError(
+            f"Database error while backfilling event coordinates: {str(e)}"
+        ) from e
+    except Exception as e:
+        logger.error(f"Unexpected error while backfilling event coordinates: {str(e)}")
+        raise ValueError(
+            f"Unexpected error while backfilling event coordinates: {str(e)}"
+        ) from e
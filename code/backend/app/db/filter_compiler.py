@@ -0,0 +1,232 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import (
+    Integer,
+    Select,
+    Table,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.sqltypes import NULLTYPE
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.db.filters import FilterOperation
+from app.models.exceptions import InvalidColumnError, InvalidFilterFormatError
+
+logger = logging.getLogger(__name__)
+
+# (field, operator) pairs; the filter values are never part of the signature
+FilterSignature = tuple[tuple[str, str], ...]
+
+# Column names to order by; a leading "-" means descending
+OrderSignature = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ListStatements:
+    """Parameterized list and count statements shared by every call with one signature."""
+
+    query: Select[Any]
+    count_query: Select[Any]
+
+
+class MemberOf(ColumnElement[bool]):
+    """
+    `column IN (values)` bound to a single parameter holding the list of values.
+
+    PostgreSQL renders `column = ANY(:name)` with one array parameter, so the statement
+    text is the same however many values are passed. Other dialects fall back to an
+    expanding IN parameter.
+    """
+
+    inherit_cache = True
+    type = NULLTYPE
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("name", InternalTraversal.dp_string),
+    ]
+
+    def __init__(self, column: ColumnElement[Any], name: str):
+        self.column = column
+        self.name = name
+
+
+@compiles(MemberOf)
+def _compile_member_of(element: MemberOf, compiler: Any, **kw: Any) -> str:
+    param = bindparam(element.name, type_=element.column.type, expanding=True)
+    return compiler.process(element.column.in_(param), **kw)
+
+
+@compiles(MemberOf, "postgresql")
+def _compile_member_of_postgresql(element: MemberOf, compiler: Any, **kw: Any) -> str:
+    param = bindparam(element.name, type_=ARRAY(element.column.type))
+    return compiler.process(element.column == any_(param), **kw)
+
+
+def filter_signature(filters: list[FilterOperation] | None) -> FilterSignature:
+    """Normalize filters into a hashable signature of (field, operator) pairs."""
+    return tuple((f.field, f.op) for f in filters or [])
+
+
+def filter_params(filters: list[FilterOperation] | None) -> dict[str, Any]:
+    """Return the bind parameter values matching the compiled filter signature."""
+    return {f"f{i}": f.value for i, f in enumerate(filters or [])}
+
+
+def _get_column(table: Table, field: str) -> ColumnElement[Any]:
+    column = table.c.get(field)
+    if column is None:
+        logger.error(f"Invalid filter_expression field: {field}")
+        raise InvalidColumnError(f"Invalid column name: {field}")
+    return column
+
+
+def _build_condition(column: ColumnElement[Any], op: str, name: str) -> ColumnElement[Any]:
+    if op == "IN":
+        return MemberOf(column, name)
+
+    param = bindparam(name, type_=column.type)
+
+    if op == "=":
+        return column == param
+    elif op == "!=":
+        return column != param
+    elif op == ">":
+        return column > param
+    elif op == ">=":
+        return column >= param
+    elif op == "<":
+        return column < param
+    elif op == "<=":
+        return column <= param
+    elif op in ("LIKE", "ILIKE") and column.info.get("citext"):
+        # CITEXT matches case-insensitively either way; comparing as text lets the
+        # gin_trgm_ops index on (column::text) serve the pattern
+        return cast(column, Text).ilike(param)
+    elif op == "LIKE":
+        return column.like(param)
+    elif op == "ILIKE":
+        return column.ilike(param)
+
+    raise InvalidFilterFormatError(f"Unsupported operator: {op}")
+
+
+@lru_cache(maxsize=512)
+def _compile_where(table: Table, signature: FilterSignature) -> ColumnElement[Any] | None:
+    conditions = [
+        _build_condition(_get_column(table, field), op, f"f{i}")
+        for i, (field, op) in enumerate(signature)
+    ]
+    if not conditions:
+        return None
+    return and_(*conditions)
+
+
+def _compile_seek(table: Table, order_by: OrderSignature) -> ColumnElement[Any]:
+    descending = {name.startswith("-") for name in order_by}
+    if len(descending) != 1:
+        raise InvalidFilterFormatError("Cursor pagination requires a single sort direction")
+
+    columns = [_get_column(table, name.lstrip("-")) for name in order_by]
+    key = tuple_(*columns)
+    after = tuple_(
+        *(bindparam(f"k{i}", type_=column.type) for i, column in enumerate(columns))
+    )
+    return key < after if descending.pop() else key > after
+
+
+def order_columns(table: Table, order_by: OrderSignature) -> list[ColumnElement[Any]]:
+    """
+    Turn an order signature into ORDER BY columns, descending where prefixed with "-".
+
+    Raises:
+        InvalidColumnError: If an order column is not present on the table
+    """
+    return [
+        _get_column(table, name[1:]).desc()
+        if name.startswith("-")
+        else _get_column(table, name)
+        for name in order_by
+    ]
+
+
+@lru_cache(maxsize=512)
+def _compile_list(
+    table: Table, signature: FilterSignature, order_by: OrderSignature, seek: bool
+) -> ListStatements:
+    query = select(table)
+    count_query = select(func.count()).select_from(table)
+
+    where_clause = _compile_where(table, signature)
+    if where_clause is not None:
+        query = query.where(where_clause)
+        count_query = count_query.where(where_clause)
+
+    query = query.order_by(*order_columns(table, order_by)).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+    if seek:
+        # Keyset page: seek past the last key instead of scanning and discarding rows
+        query = query.where(_compile_seek(table, order_by))
+    else:
+        query = query.offset(bindparam("offset", type_=Integer))
+
+    return ListStatements(query=query, count_query=count_query)
+
+
+def compile_where(
+    table: Table, filters: list[FilterOperation] | None
+) -> tuple[ColumnElement[Any] | None, dict[str, Any]]:
+    """
+    Compile filters into a cached WHERE clause and its bind parameters.
+
+    Raises:
+        InvalidColumnError: If a filter references a column not present on the table
+    """
+    return _compile_where(table, filter_signature(filters)), filter_params(filters)
+
+
+def compile_list_query(
+    table: Table,
+    filters: list[FilterOperation] | None,
+    order_by: OrderSignature,
+    after: tuple[Any, ...] | None = None,
+) -> tuple[ListStatements, dict[str, Any]]:
+    """
+    Compile a paged list query for a table into cached, parameterized statements.
+
+    Statements are cached on (table, filter signature, order), so repeated list requests
+    reuse the same statement objects and hit SQLAlchemy's compiled cache. The returned
+    params hold the filter values; callers add "limit", plus "offset" unless `after` is
+    given. With `after`, the list query seeks past that sort key instead of using OFFSET.
+
+    Raises:
+        InvalidColumnError: If a filter or order column is not present on the table
+    """
+    params = filter_params(filters)
+    if after is not None:
+        params.update({f"k{i}": value for i, value in enumerate(after)})
+
+    statements = _compile_list(table, filter_signature(filters), order_by, after is not None)
+    return statements, params
@@ -19,6 +19,7 @@ FILTER_OPERATORS = {
     "lte": "<=",  # Less than or equal
     "like": "LIKE",  # Pattern matching
     "ilike": "ILIKE",  # Case-insensitive pattern matching
+    "in": "IN",  # Set membership, comma-separated values
 }
 
 
@@ -0,0 +1,215 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Event coordinates and the area conditions of GET /events.
+
+Clients store a picked place inside event_location as `geo::` followed by URL-encoded
+JSON such as {"v": 1, "address": "...", "longitude": -71.06, "latitude": 42.36}
+(frontend helpers/locationCodec.ts). The event writes copy the coordinates into the
+latitude and longitude columns so the database can filter and order by them, and the
+address into location_text so full-text search indexes words rather than the encoding.
+
+On Postgres, `near` uses the earthdistance GiST index on ll_to_earth(latitude,
+longitude) from db/init/10: earth_box narrows a radius search to the index and `<->`
+walks it in distance order. `bbox` uses the btree index on (latitude, longitude).
+Other dialects, used in tests, use an equirectangular approximation instead.
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote
+
+from sqlalchemy import Float, Table, and_, bindparam, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+GEO_PREFIX = "geo::"
+
+# The frontend codec undoes at most this many rounds of URL encoding
+_MAX_DECODES = 3
+
+# Radius of earthdistance's earth(); the fallback uses it too so distances agree
+EARTH_RADIUS_KM = 6378.168
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+@dataclass(frozen=True)
+class Near:
+    """Order by distance from a point, optionally keeping only events within a radius."""
+
+    latitude: float
+    longitude: float
+    radius_km: float | None = None
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Edges in degrees; west > east describes a box crossing the antimeridian."""
+
+    west: float
+    south: float
+    east: float
+    north: float
+
+
+def _resolve_prefixed(value: str) -> str | None:
+    current = value
+    for _ in range(_MAX_DECODES):
+        if current.startswith(GEO_PREFIX):
+            return current
+        current = unquote(current)
+    return current if current.startswith(GEO_PREFIX) else None
+
+
+def _parse_payload(encoded: str) -> dict[str, Any] | None:
+    candidates = [encoded]
+    for _ in range(_MAX_DECODES):
+        candidates.append(unquote(candidates[-1]))
+
+    for candidate in dict.fromkeys(candidates):
+        try:
+            payload = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            return payload
+    return None
+
+
+def _coordinate(value: Any, bound: float) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(number) or not -bound <= number <= bound:
+        return None
+    return number
+
+
+def _geo_payload(location: str) -> dict[str, Any] | None:
+    resolved = _resolve_prefixed(location)
+    if resolved is None:
+        return None
+    return _parse_payload(resolved.removeprefix(GEO_PREFIX))
+
+
+def decode_coordinates(location: str | None) -> tuple[float, float] | None:
+    """Return (latitude, longitude) from a `geo::` event_location, or None without one."""
+    if not location:
+        return None
+    payload = _geo_payload(location)
+    if payload is None:
+        return None
+
+    latitude = _coordinate(payload.get("latitude"), 90)
+    longitude = _coordinate(payload.get("longitude"), 180)
+    if latitude is None or longitude is None:
+        return None
+    return latitude, longitude
+
+
+def decode_location_text(location: str | None) -> str | None:
+    """The address of a `geo::` event_location, or any other location as it is."""
+    if not location:
+        return None
+    if _resolve_prefixed(location) is None:
+        return location
+    payload = _geo_payload(location)
+    address = payload.get("address") if payload is not None else None
+    if not isinstance(address, str):
+        return None
+    return address.strip() or None
+
+
+def location_values(location: str | None) -> dict[str, float | str | None]:
+    """The latitude, longitude and location_text column values to store with `location`."""
+    coordinates = decode_coordinates(location)
+    latitude, longitude = coordinates if coordinates is not None else (None, None)
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "location_text": decode_location_text(location),
+    }
+
+
+def _near_params(near: Near) -> tuple[ColumnElement[float], ColumnElement[float]]:
+    return (
+        bindparam("near_lat", near.latitude, type_=Float),
+        bindparam("near_lon", near.longitude, type_=Float),
+    )
+
+
+def _planar_distance_sq(table: Table, near: Near) -> ColumnElement[float]:
+    # Squared distance in degrees of latitude, with longitude shrunk towards the poles
+    near_lat, near_lon = _near_params(near)
+    scale = bindparam("near_lon_scale", math.cos(math.radians(near.latitude)), type_=Float)
+    dlat = table.c.latitude - near_lat
+    dlon = (table.c.longitude - near_lon) * scale
+    return dlat * dlat + dlon * dlon
+
+
+def _earth_points(table: Table, near: Near) -> tuple[ColumnElement[Any], ColumnElement[Any]]:
+    # Spelled like the idx_events_earth expression so the planner can use the index
+    near_lat, near_lon = _near_params(near)
+    return func.ll_to_earth(table.c.latitude, table.c.longitude), func.ll_to_earth(
+        near_lat, near_lon
+    )
+
+
+def distance_km(dialect: str, table: Table, near: Near) -> ColumnElement[float]:
+    """Distance from the `near` point to each row, in kilometres."""
+    if dialect == "postgresql":
+        point, origin = _earth_points(table, near)
+        return func.earth_distance(origin, point, type_=Float) / 1000.0
+    return func.sqrt(_planar_distance_sq(table, near)) * _KM_PER_DEGREE
+
+
+def distance_order(dialect: str, table: Table, near: Near) -> ColumnElement[Any]:
+    """Sort key putting the rows nearest the `near` point first."""
+    if dialect == "postgresql":
+        # Chord distance between the points: same order as earth_distance, but the
+        # GiST index can return rows in this order without sorting them
+        point, origin = _earth_points(table, near)
+        return point.op("<->")(origin)
+    return _planar_distance_sq(table, near)
+
+
+def area_condition(
+    dialect: str, table: Table, near: Near | None, bbox: BoundingBox | None
+) -> ColumnElement[bool] | None:
+    """Keep rows with coordinates inside the radius of `near` and within `bbox`."""
+    if near is None and bbox is None:
+        return None
+
+    conditions: list[ColumnElement[bool]] = [
+        table.c.latitude.is_not(None),
+        table.c.longitude.is_not(None),
+    ]
+
+    if near is not None and near.radius_km is not None:
+        if dialect == "postgresql":
+            point, origin = _earth_points(table, near)
+            radius_m = bindparam("near_radius_m", near.radius_km * 1000, type_=Float)
+            conditions.append(func.earth_box(origin, radius_m).op("@>")(point))
+            conditions.append(func.earth_distance(origin, point) <= radius_m)
+        else:
+            radius = bindparam("near_radius_deg", near.radius_km / _KM_PER_DEGREE, type_=Float)
+            conditions.append(_planar_distance_sq(table, near) <= radius * radius)
+
+    if bbox is not None:
+        conditions.append(table.c.latitude.between(bbox.south, bbox.north))
+        if bbox.west <= bbox.east:
+            conditions.append(table.c.longitude.between(bbox.west, bbox.east))
+        else:
+            conditions.append(
+                or_(table.c.longitude >= bbox.west, table.c.longitude <= bbox.east)
+            )
+
+    return and_(*conditions)
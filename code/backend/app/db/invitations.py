@@ -7,20 +7,24 @@ Framework-generated code: 0%
 """
 
 import logging
-from datetime import UTC, date, datetime
+from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, String, Table, and_, func, select
+from sqlalchemy import Column, DateTime, String, Table
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import ColumnElement
 
-from app.db.db import engine, metadata
+from app.db.batch import batch_update_rows
+from app.db.counts import count_rows
+from app.db.db import begin, engine, metadata, read_only
+from app.db.filter_compiler import OrderSignature, compile_list_query
 from app.db.filters import FilterOperation
-from app.models.exceptions import InvalidColumnError, NotFoundError
+from app.db.pagination import decode_cursor
+from app.models.exceptions import InvalidColumnError, InvalidCursorError, NotFoundError
 from app.models.invitations import InvitationsCreate, InvitationsReadDB, InvitationStatus
+from app.models.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -47,25 +51,34 @@ invitations = Table(
 )
 
 
+# Sort key for list pages; cursors encode the last row's values of these columns
+INVITATIONS_KEYSET: OrderSignature = ("invitation_id",)
+
+
+def _invitation_values(
+    invitation: InvitationsCreate, token_hash: str, now: datetime
+) -> dict[str, Any]:
+    return {
+        "invitation_id": uuid4(),
+        "event_id": invitation.event_id,
+        "user_id": invitation.user_id,
+        "expires_at": invitation.expires_at,
+        "token_hash": token_hash,
+        "status": InvitationStatus.ACTIVE.value,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 async def create_invitation_db(
     invitation: InvitationsCreate, token_hash: str
 ) -> InvitationsReadDB:
     try:
-        now = datetime.now(UTC)
-        values: dict[str, str | date | UUID | datetime | None] = {
-            "invitation_id": uuid4(),
-            "event_id": invitation.event_id,
-            "user_id": invitation.user_id,
-            "expires_at": invitation.expires_at,
-            "token_hash": token_hash,
-            "status": InvitationStatus.ACTIVE.value,
-            "created_at": now,
-            "updated_at": now,
-        }
+        values = _invitation_values(invitation, token_hash, datetime.now(UTC))
 
         insert_stmt = invitations.insert().values(values).returning(invitations)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             result = await conn.execute(insert_stmt)
             row = result.mappings().first()
 
@@ -83,11 +96,44 @@ async def create_invitation_db(
         raise ValueError(f"Unexpected error while creating invitation: {str(e)}") from e
 
 
+async def create_invitations_db(
+    new_invitations: list[tuple[InvitationsCreate, str]],
+) -> list[InvitationsReadDB]:
+    """
+    Create several invitations with one multi-row INSERT ... RETURNING, in input order.
+    Each item pairs the invitation with the hash of its token.
+    """
+    if not new_invitations:
+        return []
+
+    try:
+        now = datetime.now(UTC)
+        rows = [
+            _invitation_values(invitation, token_hash, now)
+            for invitation, token_hash in new_invitations
+        ]
+
+        insert_stmt = invitations.insert().returning(invitations, sort_by_parameter_order=True)
+
+        async with begin(engine) as conn:
+            result = await conn.execute(insert_stmt, rows)
+            return [InvitationsReadDB.model_validate(dict(row)) for row in result.mappings()]
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while bulk creating invitations: {str(e)}")
+        raise ValueError(f"Database error while bulk creating invitations: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while bulk creating invitations: {str(e)}")
+        raise ValueError(f"Unexpected error while bulk creating invitations: {str(e)}") from e
+
+
 async def get_invitations_db(
     filters: list[FilterOperation] | None = None,
     offset: int = 0,
     limit: int = 100,
-) -> tuple[list[InvitationsReadDB], int]:
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+) -> tuple[list[InvitationsReadDB], int | None]:
     """
     Get invitations from the database with optional filtering and pagination.
 
@@ -95,57 +141,32 @@ async def get_invitations_db(
         filters: List of filter operations to apply
         offset: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Opaque cursor from a previous page; when given, offset is ignored
+        count: How to compute the total (exact, estimate, or none)
 
     Returns:
-        Tuple of (list of invitations, total count)
+        Tuple of (list of invitations, total count or None when count is none)
     """
     try:
-        query = select(invitations)
-        count_query = select(func.count()).select_from(invitations)
-
-        if filters:
-            conditions: list[ColumnElement[Any]] = []
-            for f in filters:
-                column = getattr(invitations.c, f.field, None)
-                if column is None:
-                    logger.error(f"Invalid filter_expression field: {f.field}")
-                    raise InvalidColumnError(f"Invalid column name: {f.field}")
-
-                if f.op == "=":
-                    conditions.append(column == f.value)
-                elif f.op == "!=":
-                    conditions.append(column != f.value)
-                elif f.op == ">":
-                    conditions.append(column > f.value)
-                elif f.op == ">=":
-                    conditions.append(column >= f.value)
-                elif f.op == "<":
-                    conditions.append(column < f.value)
-                elif f.op == "<=":
-                    conditions.append(column <= f.value)
-                elif f.op == "LIKE":
-                    conditions.append(column.like(f.value))
-                elif f.op == "ILIKE":
-                    conditions.append(column.ilike(f.value))
-
-            if conditions:
-                where_clause = and_(*conditions)
-                query = query.where(where_clause)
-                count_query = count_query.where(where_clause)
-
         # Add a stable ORDER BY to ensure deterministic paging
-        query = query.order_by(invitations.c.invitation_id).offset(offset).limit(limit)
-
-        async with engine.begin() as conn:
-            result = await conn.execute(query)
+        after = decode_cursor(cursor, invitations, INVITATIONS_KEYSET) if cursor else None
+        statements, params = compile_list_query(
+            invitations, filters, order_by=INVITATIONS_KEYSET, after=after
+        )
+
+        async with read_only(engine) as conn:
+            result = await conn.execute(
+                statements.query, {**params, "offset": offset, "limit": limit}
+            )
             rows = result.mappings().all()
             invitations_list = [InvitationsReadDB.model_validate(dict(row)) for row in rows]
 
-            count_result = await conn.scalar(count_query)
-            total_count = 0 if count_result is None else int(count_result)
+            total_count = await count_rows(
+                conn, invitations, statements, params, filters, count
+            )
 
             return invitations_list, total_count
-    except InvalidColumnError:
+    except (InvalidColumnError, InvalidCursorError):
         raise
     except SQLAlchemyError as e:
         logger.error(f"Database error while getting invitations: {str(e)}")
@@ -162,27 +183,17 @@ async def batch_update_invitations_db(
         now = datetime.now(UTC)
         result: dict[UUID, InvitationsReadDB] = {}
 
-        async with engine.begin() as conn:
-            for invitation_id, update_data in updates.items():
-                update_data_with_timestamp: dict[str, Any] = {
-                    **update_data,
-                    "updated_at": now,
-                }
-
-                update_stmt = (
-                    invitations.update()
-                    .where(invitations.c.invitation_id == invitation_id)
-                    .values(**update_data_with_timestamp)
-                    .returning(invitations)
-                )
+        async with begin(engine) as conn:
+            rows = await batch_update_rows(conn, invitations, "invitation_id", updates, now)
 
-                row = (await conn.execute(update_stmt)).mappings().first()
+            for invitation_id in updates:
+                row = rows.get(invitation_id)
 
                 if not row:
                     logger.error(f"No invitation found with ID: {invitation_id}")
                     raise NotFoundError(f"No invitation found with ID: {invitation_id}")
 
-                result[invitation_id] = InvitationsReadDB.model_validate(dict(row))
+                result[invitation_id] = InvitationsReadDB.model_validate(dict(row._mapping))
 
             return result
 
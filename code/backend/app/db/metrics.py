@@ -0,0 +1,93 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+DB_ROUND_TRIPS = Counter(
+    "db_round_trips_total",
+    "Database round trips, by kind (statement, begin, commit, rollback)",
+    ["kind"],
+)
+DB_ROUND_TRIPS_PER_REQUEST = Histogram(
+    "db_round_trips_per_request",
+    "Database round trips made while serving one HTTP request",
+    ["method", "handler"],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64),
+)
+REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replay lag of each read replica, as last measured (+Inf when unreachable)",
+    ["replica"],
+)
+
+# Counters of the track_round_trips blocks the current task is inside, outermost first
+_round_trip_counters: ContextVar[tuple[list[int], ...]] = ContextVar(
+    "round_trip_counters", default=()
+)
+
+
+def _record(kind: str) -> None:
+    DB_ROUND_TRIPS.labels(kind=kind).inc()
+    for counter in _round_trip_counters.get():
+        counter[0] += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _on_statement(*args: Any) -> None:
+    _record("statement")
+
+
+def _transactional(conn: Connection) -> bool:
+    # Autocommit connections still fire begin/commit/rollback, but nothing is sent
+    return conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT"
+
+
+@event.listens_for(Engine, "begin")
+def _on_begin(conn: Connection) -> None:
+    if _transactional(conn):
+        _record("begin")
+
+
+@event.listens_for(Engine, "commit")
+def _on_commit(conn: Connection) -> None:
+    if _transactional(conn):
+        _record("commit")
+
+
+@event.listens_for(Engine, "rollback")
+def _on_rollback(conn: Connection) -> None:
+    if _transactional(conn):
+        _record("rollback")
+
+
+@contextmanager
+def track_round_trips() -> Iterator[list[int]]:
+    """
+    Count the database round trips made inside the block.
+
+    Yields a one-element list holding the running count. Blocks nest, and each counts
+    everything inside it. Listeners are registered on every Engine, so this also sees
+    engines created after import (tests swap engines).
+    """
+    counter = [0]
+    token = _round_trip_counters.set((*_round_trip_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _round_trip_counters.reset(token)
+
+
+def observe_request(method: str, handler: str, round_trips: int) -> None:
+    DB_ROUND_TRIPS_PER_REQUEST.labels(method=method, handler=handler).observe(round_trips)
@@ -0,0 +1,87 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import Table
+
+from app.db.filter_compiler import OrderSignature
+from app.models.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    payload = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, table: Table, keyset: OrderSignature) -> tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor back into typed sort key values.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the keyset
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(keyset):
+            raise ValueError("cursor does not match the sort key")
+
+        return tuple(
+            _from_json(value, table.c[name.lstrip("-")].type.python_type)
+            for value, name in zip(values, keyset, strict=True)
+        )
+    except (ValueError, TypeError, binascii.Error, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def split_page(rows: Sequence[T], limit: int) -> tuple[list[T], bool]:
+    """
+    Trim rows fetched with limit + 1 back to one page.
+
+    Returns the page and whether at least one more row exists after it.
+    """
+    return list(rows[:limit]), len(rows) > limit
+
+
+def next_cursor(
+    items: Sequence[BaseModel], has_more: bool, keyset: OrderSignature
+) -> str | None:
+    """Return the cursor for the page after `items`, or None if this was the last page."""
+    if not items or not has_more:
+        return None
+    last = items[-1]
+    return encode_cursor([getattr(last, name.lstrip("-")) for name in keyset])
@@ -19,8 +19,6 @@ from sqlalchemy import (
     Numeric,
     String,
     Table,
-    and_,
-    func,
     insert,
     select,
     update,
@@ -28,9 +26,9 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import UUID as SQLUUID
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import ColumnElement
 
-from app.db.db import engine
+from app.db.db import begin, engine, read_only
+from app.db.filter_compiler import compile_list_query
 from app.db.filters import FilterOperation
 from app.models.payments import PaymentCreate, PaymentRead, PaymentStatus
 
@@ -66,40 +64,6 @@ payments = Table(
 )
 
 
-def _apply_filters(q, cq, filters: list[FilterOperation] | None):
-    if not filters:
-        return q, cq
-    conds: list[ColumnElement[Any]] = []
-    for f in filters:
-        col = getattr(payments.c, f.field, None)
-        if col is None:
-            raise ValueError(f"Invalid column: {f.field}")
-        op = f.op.lower()
-        if op in ("eq", "="):
-            conds.append(col == f.value)
-        elif op in ("neq", "!="):
-            conds.append(col != f.value)
-        elif op == "gt":
-            conds.append(col > f.value)
-        elif op == "gte":
-            conds.append(col >= f.value)
-        elif op == "lt":
-            conds.append(col < f.value)
-        elif op == "lte":
-            conds.append(col <= f.value)
-        elif op == "like":
-            conds.append(col.like(f.value))
-        elif op == "ilike":
-            conds.append(col.ilike(f.value))
-        else:
-            raise ValueError(f"Unsupported op: {f.op}")
-    if conds:
-        wc = and_(*conds)
-        q = q.where(wc)
-        cq = cq.where(wc)
-    return q, cq
-
-
 async def create_payment_db(p: PaymentCreate) -> PaymentRead:
     try:
         now = datetime.now(UTC)
@@ -116,7 +80,7 @@ async def create_payment_db(p: PaymentCreate) -> PaymentRead:
             "updated_at": now,
         }
         stmt = insert(payments).values(vals).returning(payments)
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             row = (await conn.execute(stmt)).mappings().first()
             return PaymentRead.model_validate(dict(row))
     except SQLAlchemyError as e:
@@ -134,7 +98,7 @@ async def set_checkout_id(payment_id: UUID, checkout_id: str) -> None:
                 updated_at=datetime.now(UTC),
             )
         )
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             await conn.execute(stmt)
     except SQLAlchemyError as e:
         raise ValueError(str(e)) from e
@@ -142,7 +106,8 @@ async def set_checkout_id(payment_id: UUID, checkout_id: str) -> None:
 
 async def set_status_by_checkout_session(
     checkout_id: str, *, status: PaymentStatus, payment_intent_id: str | None = None
-) -> None:
+) -> PaymentRead | None:
+    """Update the payment of a checkout session and return it, or None if there is none."""
     try:
         vals: dict[str, Any] = {"status": status.value, "updated_at": datetime.now(UTC)}
         if payment_intent_id:
@@ -151,9 +116,11 @@ async def set_status_by_checkout_session(
             update(payments)
             .where(payments.c.stripe_checkout_session_id == checkout_id)
             .values(**vals)
+            .returning(payments)
         )
-        async with engine.begin() as conn:
-            await conn.execute(stmt)
+        async with begin(engine) as conn:
+            row = (await conn.execute(stmt)).mappings().first()
+            return PaymentRead.model_validate(dict(row)) if row else None
     except SQLAlchemyError as e:
         raise ValueError(str(e)) from e
 
@@ -169,7 +136,7 @@ async def set_status_by_payment_id(
             "updated_at": datetime.now(UTC),
         }
         stmt = update(payments).where(payments.c.payment_id == payment_id).values(**vals)
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             await conn.execute(stmt)
     except SQLAlchemyError as e:
         raise ValueError(str(e)) from e
@@ -187,7 +154,7 @@ async def get_latest_payment_for_event_user(
         if statuses:
             q = q.where(payments.c.status.in_([s.value for s in statuses]))
         q = q.order_by(payments.c.created_at.desc()).limit(1)
-        async with engine.begin() as conn:
+        async with read_only(engine) as conn:
             row = (await conn.execute(q)).mappings().first()
             return PaymentRead.model_validate(dict(row)) if row else None
     except SQLAlchemyError as e:
@@ -196,14 +163,12 @@ async def get_latest_payment_for_event_user(
 
 async def get_payments_db(filters: list[FilterOperation] | None, offset: int, limit: int):
     try:
-        q = select(payments)
-        cq = select(func.count()).select_from(payments)
-        q, cq = _apply_filters(q, cq, filters)
-        q = q.order_by(payments.c.created_at.desc()).offset(offset).limit(limit)
-        async with engine.begin() as conn:
-            rows = (await conn.execute(q)).mappings().all()
+        statements, params = compile_list_query(payments, filters, order_by=("-created_at",))
+        async with read_only(engine) as conn:
+            page_params = {**params, "offset": offset, "limit": limit}
+            rows = (await conn.execute(statements.query, page_params)).mappings().all()
             items = [PaymentRead.model_validate(dict(r)) for r in rows]
-            total = int((await conn.scalar(cq)) or 0)
+            total = int((await conn.scalar(statements.count_query, params)) or 0)
             return items, total
     except SQLAlchemyError as e:
         raise ValueError(str(e)) from e
@@ -0,0 +1,103 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Typo-tolerant top-K lookups for people and event pickers.
+
+On Postgres the candidates come from the pg_trgm GIN indexes in
+db/init/09_add_trigram_indexes.sql: `:q <% expr` keeps rows whose word similarity to
+the query reaches PICKER_SIMILARITY_THRESHOLD, and the best scores are returned first.
+The lookup runs under a statement_timeout of PICKER_LATENCY_BUDGET_MS so a slow query
+gives up instead of holding the picker open. Other dialects, used in tests, fall back
+to substring matches with prefix matches first.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Float, RowMapping, String, Table, bindparam, case, func, or_, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import settings
+from app.db.db import read_transaction
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE of "canceling statement due to statement timeout"
+_QUERY_CANCELED = "57014"
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _match_and_score(
+    dialect: str, matched: Sequence[ColumnElement[Any]]
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    query = bindparam("q", type_=String)
+    if dialect == "postgresql":
+        condition = or_(*(query.op("<%")(expr) for expr in matched))
+        score = func.greatest(*(func.word_similarity(query, expr) for expr in matched))
+        return condition, score
+
+    contains = bindparam("contains", type_=String)
+    prefix = bindparam("prefix", type_=String)
+    condition = or_(*(expr.ilike(contains, escape="\\") for expr in matched))
+    starts = or_(*(expr.ilike(prefix, escape="\\") for expr in matched))
+    return condition, case((starts, 1.0), else_=0.5)
+
+
+async def pick_rows(
+    bind: AsyncEngine,
+    table: Table,
+    matched: Sequence[ColumnElement[Any]],
+    tiebreak: ColumnElement[Any],
+    query: str,
+    limit: int,
+) -> tuple[list[tuple[RowMapping, float]], bool]:
+    """
+    Return up to `limit` rows of `table` most similar to `query` on any of the `matched`
+    expressions, with their scores, and whether the latency budget cut the lookup off.
+    """
+    escaped = _escape_like(query)
+    params = {"q": query, "contains": f"%{escaped}%", "prefix": f"{escaped}%"}
+
+    try:
+        async with read_transaction(bind) as conn:
+            condition, score = _match_and_score(conn.dialect.name, matched)
+            if conn.dialect.name == "postgresql":
+                await conn.execute(
+                    select(
+                        func.set_config(
+                            "statement_timeout", str(settings.PICKER_LATENCY_BUDGET_MS), True
+                        ),
+                        func.set_config(
+                            "pg_trgm.word_similarity_threshold",
+                            str(settings.PICKER_SIMILARITY_THRESHOLD),
+                            True,
+                        ),
+                    )
+                )
+            labeled = score.cast(Float).label("score")
+            stmt = (
+                select(table, labeled)
+                .where(condition)
+                .order_by(labeled.desc(), tiebreak)
+                .limit(limit)
+            )
+            rows = (await conn.execute(stmt, params)).mappings().all()
+            return [(row, float(row["score"])) for row in rows], False
+    except DBAPIError as e:
+        if getattr(e.orig, "sqlstate", None) != _QUERY_CANCELED:
+            raise
+        logger.warning(
+            f"Picker lookup on {table.name} exceeded "
+            f"{settings.PICKER_LATENCY_BUDGET_MS}ms for query '{query}'"
+        )
+        return [], True
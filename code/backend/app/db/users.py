@@ -7,18 +7,23 @@ Framework-generated code: 0%
 """
 
 import logging
-from datetime import UTC, date, datetime
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, Date, DateTime, String, Table, and_, func, select
+from sqlalchemy import Column, Date, DateTime, String, Table, Text, cast, literal_column
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.sql.elements import ColumnElement
 
-from app.db.db import engine, metadata
+from app.db.batch import batch_update_rows
+from app.db.counts import count_rows
+from app.db.db import begin, engine, metadata, read_only
+from app.db.filter_compiler import OrderSignature, compile_list_query
 from app.db.filters import FilterOperation
-from app.models.exceptions import InvalidColumnError, NotFoundError
+from app.db.pagination import decode_cursor
+from app.db.picker import pick_rows
+from app.models.exceptions import InvalidColumnError, InvalidCursorError, NotFoundError
+from app.models.pagination import CountMode
 from app.models.users import UserCreate, UserRead
 
 logger = logging.getLogger(__name__)
@@ -31,65 +36,50 @@ users = Table(
     Column("first_name", String),
     Column("last_name", String),
     Column("date_of_birth", Date),
-    Column("email", String, unique=True),
+    # CITEXT in Postgres: matches case-insensitively, see the filter compiler
+    Column("email", String, unique=True, info={"citext": True}),
     Column("color", String),
     Column("created_at", DateTime(timezone=True)),
     Column("updated_at", DateTime(timezone=True)),
 )
 
 
+# Sort key for list pages; cursors encode the last row's values of these columns
+USERS_KEYSET: OrderSignature = ("user_id",)
+
+# The expressions the people picker matches; each has a gin_trgm_ops index (db/init/09)
+# and must be spelled exactly like it for the planner to use it
+USER_PICKER_EXPRESSIONS = (
+    users.c.first_name + literal_column("' '") + users.c.last_name,
+    cast(users.c.email, Text),
+)
+
+
 async def get_users_db(
     filters: list[FilterOperation] | None = None,
     offset: int = 0,
     limit: int = 100,
-) -> tuple[list[UserRead], int]:
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+) -> tuple[list[UserRead], int | None]:
     try:
-        query = select(users)
-        count_query = select(func.count()).select_from(users)
-
-        if filters:
-            conditions: list[ColumnElement[Any]] = []
-            for f in filters:
-                column = getattr(users.c, f.field, None)
-                if column is None:
-                    logger.error(f"Invalid filter_expression field: {f.field}")
-                    raise InvalidColumnError(f"Invalid column name: {f.field}")
-
-                if f.op == "=":
-                    conditions.append(column == f.value)
-                elif f.op == "!=":
-                    conditions.append(column != f.value)
-                elif f.op == ">":
-                    conditions.append(column > f.value)
-                elif f.op == ">=":
-                    conditions.append(column >= f.value)
-                elif f.op == "<":
-                    conditions.append(column < f.value)
-                elif f.op == "<=":
-                    conditions.append(column <= f.value)
-                elif f.op == "LIKE":
-                    conditions.append(column.like(f.value))
-                elif f.op == "ILIKE":
-                    conditions.append(column.ilike(f.value))
-
-            if conditions:
-                where_clause = and_(*conditions)
-                query = query.where(where_clause)
-                count_query = count_query.where(where_clause)
-
         # Add a stable ORDER BY to ensure deterministic paging
-        query = query.order_by(users.c.user_id).offset(offset).limit(limit)
-
-        async with engine.begin() as conn:
-            result = await conn.execute(query)
+        after = decode_cursor(cursor, users, USERS_KEYSET) if cursor else None
+        statements, params = compile_list_query(
+            users, filters, order_by=USERS_KEYSET, after=after
+        )
+
+        async with read_only(engine) as conn:
+            result = await conn.execute(
+                statements.query, {**params, "offset": offset, "limit": limit}
+            )
             rows = result.mappings().all()
             users_list = [UserRead.model_validate(dict(row)) for row in rows]
 
-            count_result = await conn.scalar(count_query)
-            total_count = 0 if count_result is None else int(count_result)
+            total_count = await count_rows(conn, users, statements, params, filters, count)
 
             return users_list, total_count
-    except InvalidColumnError:
+    except (InvalidColumnError, InvalidCursorError):
         raise
     except SQLAlchemyError as e:
         logger.error(f"Database error while getting users: {str(e)}")
@@ -99,23 +89,26 @@ async def get_users_db(
         raise ValueError(f"Unexpected error while getting users: {str(e)}") from e
 
 
+def _user_values(user: UserCreate, now: datetime) -> dict[str, Any]:
+    return {
+        "user_id": uuid4(),
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "date_of_birth": user.date_of_birth,
+        "email": user.email,
+        "color": user.color,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 async def create_user_db(user: UserCreate) -> UserRead:
     try:
-        now = datetime.now(UTC)
-        values: dict[str, str | date | UUID | datetime | None] = {
-            "user_id": uuid4(),
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "date_of_birth": user.date_of_birth,
-            "email": user.email,
-            "color": user.color,
-            "created_at": now,
-            "updated_at": now,
-        }
+        values = _user_values(user, datetime.now(UTC))
 
         insert_stmt = users.insert().values(values).returning(users)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             result = await conn.execute(insert_stmt)
             row = result.mappings().first()
 
@@ -133,23 +126,39 @@ async def create_user_db(user: UserCreate) -> UserRead:
         raise ValueError(f"Unexpected error while creating user: {str(e)}") from e
 
 
+async def create_users_db(new_users: list[UserCreate]) -> list[UserRead]:
+    """Create several users with one multi-row INSERT ... RETURNING, in input order."""
+    if not new_users:
+        return []
+
+    try:
+        now = datetime.now(UTC)
+        rows = [_user_values(user, now) for user in new_users]
+
+        insert_stmt = users.insert().returning(users, sort_by_parameter_order=True)
+
+        async with begin(engine) as conn:
+            result = await conn.execute(insert_stmt, rows)
+            return [UserRead.model_validate(dict(row)) for row in result.mappings()]
+
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while bulk creating users: {str(e)}")
+        raise ValueError(f"Database error while bulk creating users: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while bulk creating users: {str(e)}")
+        raise ValueError(f"Unexpected error while bulk creating users: {str(e)}") from e
+
+
 async def batch_update_users_db(updates: dict[UUID, dict[str, Any]]) -> dict[UUID, UserRead]:
     try:
         now = datetime.now(UTC)
         result: dict[UUID, UserRead] = {}
 
-        async with engine.begin() as conn:
-            for user_id, update_data in updates.items():
-                update_data_with_timestamp: dict[str, Any] = {**update_data, "updated_at": now}
+        async with begin(engine) as conn:
+            rows = await batch_update_rows(conn, users, "user_id", updates, now)
 
-                update_stmt = (
-                    users.update()
-                    .where(users.c.user_id == user_id)
-                    .values(**update_data_with_timestamp)
-                    .returning(users)
-                )
-
-                row = (await conn.execute(update_stmt)).fetchone()
+            for user_id in updates:
+                row = rows.get(user_id)
 
                 if not row:
                     logger.error(f"No user found with ID: {user_id}")
@@ -182,7 +191,7 @@ async def delete_user_db(user_id: UUID) -> None:
     try:
         delete_stmt = users.delete().where(users.c.user_id == user_id)
 
-        async with engine.begin() as conn:
+        async with begin(engine) as conn:
             result = await conn.execute(delete_stmt)
 
             if result.rowcount == 0:
@@ -200,3 +209,19 @@ async def delete_user_db(user_id: UUID) -> None:
     except Exception as e:
         logger.error(f"Unexpected error while deleting user: {str(e)}")
         raise ValueError(f"Unexpected error while deleting user: {str(e)}") from e
+
+
+async def pick_users_db(query: str, limit: int) -> tuple[list[tuple[UserRead, float]], bool]:
+    """Users whose name or email best matches `query`, tolerating typos and partial words."""
+    try:
+        rows, budget_exceeded = await pick_rows(
+            engine, users, USER_PICKER_EXPRESSIONS, users.c.user_id, query, limit
+        )
+        picked = [(UserRead.model_validate(dict(row)), score) for row, score in rows]
+        return picked, budget_exceeded
+    except SQLAlchemyError as e:
+        logger.error(f"Database error while picking users: {str(e)}")
+        raise ValueError(f"Database error while picking users: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while picking users: {str(e)}")
+        raise ValueError(f"Unexpected error while picking users: {str(e)}") from e
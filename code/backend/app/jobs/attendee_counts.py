@@ -0,0 +1,49 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Repair drift in events.attendee_count.
+
+The counter is kept in step by the attendee writes in app.db.attendees, but rows changed
+outside the API (manual SQL, restores from backup) can leave it wrong. Run periodically,
+e.g. from cron:
+
+    uv run python -m app.jobs.attendee_counts
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+import app.db.attendees as attendees_db
+from app.db.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def repair_attendee_counts() -> dict[UUID, int]:
+    """Recompute drifted attendee counts and log every event that was corrected."""
+    repaired = await attendees_db.repair_attendee_counts_db()
+    for event_id, count in repaired.items():
+        logger.warning(f"Repaired attendee_count drift for event_id='{event_id}': now {count}")
+    logger.info(f"Attendee count repair finished: {len(repaired)} event(s) corrected")
+    return repaired
+
+
+async def _run() -> None:
+    try:
+        await repair_attendee_counts()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
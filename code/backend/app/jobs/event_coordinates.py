@@ -0,0 +1,47 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Backfill events.latitude, events.longitude and events.location_text.
+
+New and patched events get their coordinates and searchable address from the geo::
+payload of event_location as they are written (app.db.geo). This fills the events
+stored before the columns existed. It is safe to run while the API is serving
+traffic, and again later:
+
+    uv run python -m app.jobs.event_coordinates
+"""
+
+import asyncio
+import logging
+
+import app.db.events as events_db
+from app.db.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_event_coordinates() -> int:
+    """Fill missing event coordinates and log how many events were updated."""
+    filled = await events_db.backfill_event_coordinates_db()
+    logger.info(f"Event coordinate backfill finished: {filled} event(s) updated")
+    return filled
+
+
+async def _run() -> None:
+    try:
+        await backfill_event_coordinates()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Rebuild the event map rollups served by GET /events/map-tiles.
+
+The API rebuilds them in the background every MAP_ROLLUP_REFRESH_SECONDS; whichever
+worker gets there first does the work for all of them. This runs one rebuild, e.g.
+after importing events:
+
+    uv run python -m app.jobs.event_map
+"""
+
+import asyncio
+import logging
+
+from app.config import settings
+from app.db import event_map as event_map_db
+from app.db.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_event_map_periodically() -> None:
+    """Rebuild the rollups once they are MAP_ROLLUP_REFRESH_SECONDS old, until cancelled."""
+    while True:
+        try:
+            if await event_map_db.refresh_event_map_db(settings.MAP_ROLLUP_REFRESH_SECONDS):
+                logger.info("Event map rollups refreshed")
+        except ValueError as e:
+            # Logged by the database layer; keep serving the rollups we have
+            logger.warning(f"Event map refresh failed: {str(e)}")
+        await asyncio.sleep(settings.MAP_ROLLUP_REFRESH_SECONDS)
+
+
+async def _run() -> None:
+    try:
+        await event_map_db.refresh_event_map_db()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Release seat holds whose checkout was never completed.
+
+The API runs this sweep in the background every SEAT_HOLD_SWEEP_SECONDS. It can also be
+run once by hand, e.g. after downtime:
+
+    uv run python -m app.jobs.seat_holds
+"""
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+import app.db.attendees as attendees_db
+from app.config import settings
+from app.db.db import engine
+
+logger = logging.getLogger(__name__)
+
+# Holds released per transaction, so one sweep never locks a large backlog at once
+_SWEEP_BATCH = 500
+
+
+async def release_expired_holds() -> int:
+    """Release every hold that has expired, in batches. Returns how many were released."""
+    now = datetime.now(UTC)
+    released = 0
+    while True:
+        batch = await attendees_db.release_expired_holds_db(now, _SWEEP_BATCH)
+        released += batch
+        if batch < _SWEEP_BATCH:
+            break
+    if released:
+        logger.info(f"Released {released} expired seat hold(s)")
+    return released
+
+
+async def sweep_seat_holds() -> None:
+    """Release expired holds every SEAT_HOLD_SWEEP_SECONDS until cancelled."""
+    while True:
+        try:
+            await release_expired_holds()
+        except ValueError as e:
+            # Logged by the database layer; try again on the next sweep
+            logger.warning(f"Seat hold sweep failed: {str(e)}")
+        await asyncio.sleep(settings.SEAT_HOLD_SWEEP_SECONDS)
+
+
+async def _run() -> None:
+    try:
+        await release_expired_holds()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,22 @@ Human code: 90%
 Framework-generated code: 0%
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from app.auth import get_current_user
+from app.auth import CurrentUser, get_current_user, refresh_jwks_periodically
+from app.db import categories as categories_db
 from app.db import db
-from app.models.exceptions import ValidateFieldError
+from app.db.metrics import observe_request, track_round_trips
+from app.jobs.event_map import refresh_event_map_periodically
+from app.jobs.seat_holds import sweep_seat_holds
+from app.metrics import monitor_event_loop_lag
+from app.models.exceptions import AdmissionRejectedError, ValidateFieldError
 from app.routes import attendees as route_attendees
 from app.routes import categories as route_categories
 from app.routes import db as route_db
@@ -30,9 +36,26 @@ instrumentator = Instrumentator()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db.init_db()
+    await categories_db.catalog.load()
+    background = [
+        asyncio.create_task(categories_db.refresh_catalog_periodically()),
+        asyncio.create_task(db.monitor_replica_lag()),
+        asyncio.create_task(sweep_seat_holds()),
+        asyncio.create_task(refresh_event_map_periodically()),
+        asyncio.create_task(refresh_jwks_periodically()),
+        asyncio.create_task(monitor_event_loop_lag()),
+    ]
     yield
     # Shutdown: Clean up resources if needed
-    pass
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def bind_db_session(user: CurrentUser) -> None:
+    """Key read-your-writes replica routing on the authenticated user."""
+    db.set_session_key(user.sub)
 
 
 event_manager_app = FastAPI(
@@ -42,7 +65,7 @@ event_manager_app = FastAPI(
     lifespan=lifespan,
     # Apply authentication globally to all routes
     # This ensures every endpoint requires a valid Google OAuth token
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(bind_db_session)],
 )
 
 
@@ -55,6 +78,32 @@ async def validate_field_error_handler(request: Request, exc: ValidateFieldError
     )
 
 
+@event_manager_app.exception_handler(AdmissionRejectedError)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejectedError):
+    """Turn away registrations for a busy event with 429 and where they stand in line."""
+    return JSONResponse(
+        status_code=429,
+        content={
+            "detail": str(exc),
+            "queue_position": exc.queue_position,
+            "retry_after": exc.retry_after,
+            "admission_token": exc.token,
+        },
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@event_manager_app.middleware("http")
+async def count_db_round_trips(request: Request, call_next):
+    """Record how many database round trips each request makes."""
+    with track_round_trips() as round_trips:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    if route is not None:
+        observe_request(request.method, route.path, round_trips[0])
+    return response
+
+
 event_manager_app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -0,0 +1,34 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Process-wide metrics that are not tied to a single layer.
+"""
+
+import asyncio
+import time
+
+from prometheus_client import Histogram
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke a timer, i.e. how long it was blocked",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+# How often the lag probe wakes up
+_LAG_PROBE_SECONDS = 0.25
+
+
+async def monitor_event_loop_lag(interval: float = _LAG_PROBE_SECONDS) -> None:
+    """
+    Sleep for a fixed interval in a loop and record how much later than asked each
+    wake-up came. Anything blocking the loop (CPU work, sync I/O) shows up as lag.
+    """
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, time.perf_counter() - started - interval))
@@ -19,23 +19,36 @@ from app.models.exceptions import (
     InvalidPathError,
     NotFoundError,
     UnsupportedPatchOperationError,
+    ValidateFieldError,
 )
+from app.models.pagination import CountMode
 from app.models.users import UserBase
 
 logger = logging.getLogger(__name__)
 
+WAITLIST_ASSIGNED_BY_SERVER = (
+    "Status 'Waitlisted' is assigned automatically when an event is full"
+)
+
 
 class AttendeeStatus(str, Enum):
     RSVPED = "RSVPed"
     MAYBE = "Maybe"
     NOT_GOING = "Not Going"
+    # Assigned by the server when an RSVP arrives for a full event
+    WAITLISTED = "Waitlisted"
+
+    @property
+    def holds_seat(self) -> bool:
+        """Whether an attendee with this status takes up one of the event's seats."""
+        return self not in (AttendeeStatus.NOT_GOING, AttendeeStatus.WAITLISTED)
 
 
 class AttendeeBase(BaseModel):
     event_id: UUID = Field(..., description="ID of the event being attended")
     user_id: UUID = Field(..., description="ID of the user attending the event")
     status: AttendeeStatus | None = Field(
-        default=None, description="Attendance status (RSVPed/Maybe/Not Going)"
+        default=None, description="Attendance status (RSVPed/Maybe/Not Going/Waitlisted)"
     )
 
     @field_validator("status")
@@ -45,71 +58,86 @@ class AttendeeBase(BaseModel):
         return v
 
     @classmethod
-    async def validate_patch_field(
+    def validate_patch_fields(
         cls,
-        field_name: str,
-        field_value: Any,
+        fields: dict[str, Any],
         attendee_id: UUID,
         current_attendee_data: dict[str, Any],
-    ) -> Any:
-        if field_name not in cls.model_fields:
-            logger.error(f"Invalid field path '{field_name}' for attendee {attendee_id}")
-            raise InvalidPathError(
-                f"Invalid path: /{field_name}. "
-                f"Allowed fields: {', '.join(cls.model_fields.keys())}"
-            )
-
-        temp_data = current_attendee_data.copy()
-        temp_data[field_name] = field_value
-
-        validated_instance = cls(**temp_data)
-        validated_field_value = getattr(validated_instance, field_name)
-
-        # Validate foreign key references
-        if field_name == "user_id":
-            await UserBase.validate_user_exists(validated_field_value)
-        elif field_name == "event_id":
-            await EventBase.validate_event_exists(validated_field_value)
+    ) -> dict[str, Any]:
+        """Apply all changed fields to the current attendee and validate the result once."""
+        for field_name in fields:
+            if field_name not in cls.model_fields:
+                logger.error(f"Invalid field path '{field_name}' for attendee {attendee_id}")
+                raise InvalidPathError(
+                    f"Invalid path: /{field_name}. "
+                    f"Allowed fields: {', '.join(cls.model_fields.keys())}"
+                )
 
-        return validated_field_value
+        validated_instance = cls(**{**current_attendee_data, **fields})
+        if "status" in fields and validated_instance.status is AttendeeStatus.WAITLISTED:
+            raise ValidateFieldError(WAITLIST_ASSIGNED_BY_SERVER)
+        return {field_name: getattr(validated_instance, field_name) for field_name in fields}
 
     @classmethod
     async def validate_patch_operations(
-        cls, patch_operations: dict[UUID, Any]
+        cls, patch_operations: dict[UUID, list[Any]]
     ) -> dict[UUID, dict[str, Any]]:
         import app.db.attendees as attendees_db
         from app.db.filters import FilterOperation
 
-        validated_updates: dict[UUID, dict[str, Any]] = {}
+        for attendee_id, operations in patch_operations.items():
+            for operation in operations:
+                if operation.op != "replace":
+                    logger.error(
+                        f"Unsupported operation '{operation.op}' for attendee {attendee_id}"
+                    )
+                    raise UnsupportedPatchOperationError(
+                        f"Invalid operation: {operation.op}. "
+                        "Only 'replace' operation is supported"
+                    )
+
+        if not patch_operations:
+            return {}
+
+        # Load every target row in one query, then validate in memory
+        current_attendees, _ = await attendees_db.get_attendees_db(
+            [FilterOperation("attendee_id", "in", list(patch_operations))],
+            limit=len(patch_operations),
+            count=CountMode.NONE,
+        )
+        current_by_id = {attendee.attendee_id: attendee for attendee in current_attendees}
 
-        for attendee_id, operation in patch_operations.items():
-            if operation.op != "replace":
-                logger.error(
-                    f"Unsupported operation '{operation.op}' for attendee {attendee_id}"
-                )
-                raise UnsupportedPatchOperationError(
-                    f"Invalid operation: {operation.op}. Only 'replace' operation is supported"
-                )
+        validated_updates: dict[UUID, dict[str, Any]] = {}
+        referenced_users: set[UUID] = set()
+        referenced_events: set[UUID] = set()
 
-            field_path = operation.path.lstrip("/")
-            current_attendees, _ = await attendees_db.get_attendees_db(
-                [FilterOperation("attendee_id", "eq", attendee_id)], limit=1
-            )
-            if not current_attendees:
+        for attendee_id, operations in patch_operations.items():
+            current_attendee = current_by_id.get(attendee_id)
+            if current_attendee is None:
                 raise NotFoundError(f"Attendee {attendee_id} not found")
 
-            current_attendee = current_attendees[0]
+            # Operations apply in order, so a later replace of the same path wins
+            fields = {operation.path.lstrip("/"): operation.value for operation in operations}
             current_attendee_data: dict[str, Any] = {
                 "event_id": current_attendee.event_id,
                 "user_id": current_attendee.user_id,
                 "status": current_attendee.status,
             }
 
-            validated_field_value = await cls.validate_patch_field(
-                field_path, operation.value, attendee_id, current_attendee_data
+            validated_fields = cls.validate_patch_fields(
+                fields, attendee_id, current_attendee_data
             )
 
-            validated_updates[attendee_id] = {field_path: validated_field_value}
+            # Validate foreign key references once per batch below
+            if "user_id" in validated_fields:
+                referenced_users.add(validated_fields["user_id"])
+            if "event_id" in validated_fields:
+                referenced_events.add(validated_fields["event_id"])
+
+            validated_updates[attendee_id] = validated_fields
+
+        await UserBase.validate_users_exist(referenced_users)
+        await EventBase.validate_events_exist(referenced_events)
 
         return validated_updates
 
@@ -117,7 +145,25 @@ class AttendeeBase(BaseModel):
 class AttendeeCreate(AttendeeBase):
     """Model for creating a new attendee."""
 
-    pass
+    @field_validator("status")
+    @classmethod
+    def validate_requested_status(cls, v: AttendeeStatus | None) -> AttendeeStatus | None:
+        """Clients cannot ask to be waitlisted; a full event waitlists them."""
+        if v is AttendeeStatus.WAITLISTED:
+            raise ValidateFieldError(WAITLIST_ASSIGNED_BY_SERVER)
+        return v
+
+
+class AttendeeRegistration(AttendeeCreate):
+    """Body of POST /attendees; `user_id` defaults to the signed-in user."""
+
+    user_id: UUID | None = Field(
+        default=None,
+        description="ID of the user attending the event; defaults to the signed-in user",
+    )
+
+    def for_user(self, user_id: UUID) -> AttendeeCreate:
+        return AttendeeCreate(event_id=self.event_id, user_id=user_id, status=self.status)
 
 
 class AttendeeRead(AttendeeBase):
@@ -126,12 +172,18 @@ class AttendeeRead(AttendeeBase):
     attendee_id: UUID = Field(..., description="Unique ID for the attendee")
     created_at: datetime = Field(..., description="Timestamp of creation")
     updated_at: datetime = Field(..., description="Timestamp of last update")
+    waitlist_position: int | None = Field(
+        None,
+        description="1-based place in the event's waitlist, set when an RSVP is waitlisted",
+    )
 
 
 class PaginatedAttendees(BaseModel):
     """Paginated response for attendee listings."""
 
     items: list[AttendeeRead]
-    total: int
+    total: int | None
     offset: int
     limit: int
+    has_more: bool = False
+    next_cursor: str | None = None
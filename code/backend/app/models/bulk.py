@@ -0,0 +1,37 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class BulkCreateRequest(BaseModel):
+    items: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_CREATE_MAX_ITEMS,
+        description="Resources to create; each item has the same shape as a single create",
+    )
+
+
+class BulkItemResult(BaseModel, Generic[T]):
+    index: int = Field(..., description="Position of the item in the request")
+    status_code: int = Field(..., description="HTTP status the item would get on its own")
+    item: T | None = Field(None, description="The created resource, when it was created")
+    detail: str | None = Field(None, description="Why the item was rejected")
+
+
+class BulkCreateResponse(BaseModel, Generic[T]):
+    created: int = Field(..., description="Number of items created")
+    failed: int = Field(..., description="Number of items rejected")
+    results: list[BulkItemResult[T]] = Field(..., description="One result per item, in order")
@@ -6,6 +6,7 @@ Human code: 100%
 Framework-generated code: 0%
 """
 
+from collections.abc import Iterable
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -21,14 +22,23 @@ class CategoryRead(BaseModel):
     @classmethod
     async def validate_category_exists(cls, category_id: UUID) -> None:
         """Business logic validation - check if category exists."""
+        await cls.validate_categories_exist([category_id])
+
+    @classmethod
+    async def find_existing_category_ids(cls, category_ids: Iterable[UUID]) -> set[UUID]:
+        """Return which of the given categories exist, from the in-memory catalog."""
         import app.db.categories as categories_db
-        from app.db.filters import FilterOperation
 
-        categories, _ = await categories_db.get_categories_db(
-            [FilterOperation("category_id", "eq", category_id)], limit=1
-        )
-        if not categories:
-            raise NotFoundError(f"Category {category_id} does not exist")
+        return await categories_db.catalog.existing_ids(category_ids)
+
+    @classmethod
+    async def validate_categories_exist(cls, category_ids: Iterable[UUID]) -> None:
+        """Business logic validation - check that every category exists."""
+        wanted = list(dict.fromkeys(category_ids))
+        found = await cls.find_existing_category_ids(wanted)
+        for category_id in wanted:
+            if category_id not in found:
+                raise NotFoundError(f"Category {category_id} does not exist")
 
 
 class PaginatedCategories(BaseModel):
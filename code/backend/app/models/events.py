@@ -7,7 +7,9 @@ Framework-generated code: 0%
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from enum import Enum
 from typing import Any
 from uuid import UUID
 
@@ -20,6 +22,7 @@ from app.models.exceptions import (
     UnsupportedPatchOperationError,
     ValidateFieldError,
 )
+from app.models.pagination import CountMode
 from app.models.users import UserBase
 
 logger = logging.getLogger(__name__)
@@ -94,67 +97,93 @@ class EventBase(BaseModel):
     @classmethod
     async def validate_event_exists(cls, event_id: UUID) -> None:
         """Business logic validation - check if event exists."""
+        await cls.validate_events_exist([event_id])
+
+    @classmethod
+    async def find_existing_event_ids(cls, event_ids: Iterable[UUID]) -> set[UUID]:
+        """Return which of the given events exist, in one query."""
         import app.db.events as events_db
         from app.db.filters import FilterOperation
 
+        wanted = list(dict.fromkeys(event_ids))
+        if not wanted:
+            return set()
+
         events, _ = await events_db.get_events_db(
-            [FilterOperation("event_id", "eq", event_id)], limit=1
+            [FilterOperation("event_id", "in", wanted)],
+            limit=len(wanted),
+            count=CountMode.NONE,
         )
-        if not events:
-            raise NotFoundError(f"Event {event_id} does not exist")
+        return {event.event_id for event in events}
 
     @classmethod
-    async def validate_patch_field(
+    async def validate_events_exist(cls, event_ids: Iterable[UUID]) -> None:
+        """Business logic validation - check that every event exists, in one query."""
+        wanted = list(dict.fromkeys(event_ids))
+        found = await cls.find_existing_event_ids(wanted)
+        for event_id in wanted:
+            if event_id not in found:
+                raise NotFoundError(f"Event {event_id} does not exist")
+
+    @classmethod
+    def validate_patch_fields(
         cls,
-        field_name: str,
-        field_value: Any,
+        fields: dict[str, Any],
         event_id: UUID,
         current_event_data: dict[str, Any],
-    ) -> Any:
-        if field_name not in cls.model_fields:
-            logger.error(f"Invalid field path '{field_name}' for event {event_id}")
-            raise InvalidPathError(
-                f"Invalid path: /{field_name}. "
-                f"Allowed fields: {', '.join(cls.model_fields.keys())}"
-            )
-
-        temp_data = current_event_data.copy()
-        temp_data[field_name] = field_value
-
-        validated_instance = cls(**temp_data)
-        validated_field_value = getattr(validated_instance, field_name)
-
-        if field_name == "user_id":
-            await UserBase.validate_user_exists(validated_field_value)
-        elif field_name == "category_id":
-            await CategoryRead.validate_category_exists(validated_field_value)
+    ) -> dict[str, Any]:
+        """Apply all changed fields to the current event and validate the result once."""
+        for field_name in fields:
+            if field_name not in cls.model_fields:
+                logger.error(f"Invalid field path '{field_name}' for event {event_id}")
+                raise InvalidPathError(
+                    f"Invalid path: /{field_name}. "
+                    f"Allowed fields: {', '.join(cls.model_fields.keys())}"
+                )
 
-        return validated_field_value
+        validated_instance = cls(**{**current_event_data, **fields})
+        return {field_name: getattr(validated_instance, field_name) for field_name in fields}
 
     @classmethod
     async def validate_patch_operations(
-        cls, patch_operations: dict[UUID, Any]
+        cls, patch_operations: dict[UUID, list[Any]]
     ) -> dict[UUID, dict[str, Any]]:
         import app.db.events as events_db
         from app.db.filters import FilterOperation
 
-        validated_updates: dict[UUID, dict[str, Any]] = {}
+        for event_id, operations in patch_operations.items():
+            for operation in operations:
+                if operation.op != "replace":
+                    logger.error(
+                        f"Unsupported operation '{operation.op}' for event {event_id}"
+                    )
+                    raise UnsupportedPatchOperationError(
+                        f"Invalid operation: {operation.op}. "
+                        "Only 'replace' operation is supported"
+                    )
+
+        if not patch_operations:
+            return {}
+
+        # Load every target row in one query, then validate in memory
+        current_events, _ = await events_db.get_events_db(
+            [FilterOperation("event_id", "in", list(patch_operations))],
+            limit=len(patch_operations),
+            count=CountMode.NONE,
+        )
+        current_by_id = {event.event_id: event for event in current_events}
 
-        for event_id, operation in patch_operations.items():
-            if operation.op != "replace":
-                logger.error(f"Unsupported operation '{operation.op}' for event {event_id}")
-                raise UnsupportedPatchOperationError(
-                    f"Invalid operation: {operation.op}. Only 'replace' operation is supported"
-                )
+        validated_updates: dict[UUID, dict[str, Any]] = {}
+        referenced_users: set[UUID] = set()
+        referenced_categories: set[UUID] = set()
 
-            field_path = operation.path.lstrip("/")
-            current_events, _ = await events_db.get_events_db(
-                [FilterOperation("event_id", "eq", event_id)], limit=1
-            )
-            if not current_events:
+        for event_id, operations in patch_operations.items():
+            current_event = current_by_id.get(event_id)
+            if current_event is None:
                 raise NotFoundError(f"Event {event_id} not found")
 
-            current_event = current_events[0]
+            # Operations apply in order, so a later replace of the same path wins
+            fields = {operation.path.lstrip("/"): operation.value for operation in operations}
             current_event_data: dict[str, Any] = {
                 "event_name": current_event.event_name,
                 "event_datetime": current_event.event_datetime,
@@ -168,11 +197,18 @@ class EventBase(BaseModel):
                 "category_id": current_event.category_id,
             }
 
-            validated_field_value = await cls.validate_patch_field(
-                field_path, operation.value, event_id, current_event_data
-            )
+            validated_fields = cls.validate_patch_fields(fields, event_id, current_event_data)
+
+            if "user_id" in validated_fields:
+                referenced_users.add(validated_fields["user_id"])
+            if "category_id" in validated_fields:
+                referenced_categories.add(validated_fields["category_id"])
 
-            validated_updates[event_id] = {field_path: validated_field_value}
+            validated_updates[event_id] = validated_fields
+
+        # Foreign keys are checked once per batch rather than once per operation
+        await UserBase.validate_users_exist(referenced_users)
+        await CategoryRead.validate_categories_exist(referenced_categories)
 
         return validated_updates
 
@@ -186,10 +222,55 @@ class EventRead(EventBase):
     created_at: datetime = Field(..., description="Event creation timestamp")
     updated_at: datetime = Field(..., description="Event last update timestamp")
     attendee_count: int | None = Field(None, description="Number of attendees for this event")
+    latitude: float | None = Field(
+        None, description="Latitude from the geo:: payload of event_location, if any"
+    )
+    longitude: float | None = Field(
+        None, description="Longitude from the geo:: payload of event_location, if any"
+    )
+    distance_km: float | None = Field(
+        None, description="Distance from the `near` point of the query, when one was given"
+    )
+
+
+class EventOrder(str, Enum):
+    """Sort orders accepted by GET /events; a leading "-" sorts descending."""
+
+    EVENT_DATETIME = "event_datetime"
+    EVENT_DATETIME_DESC = "-event_datetime"
+    PRICE = "price_field"
+    PRICE_DESC = "-price_field"
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+    DISTANCE = "distance"  # Nearest to `near` first
 
 
 class PaginatedEvents(BaseModel):
     items: list[EventRead] = Field(..., description="List of events in the current page")
-    total: int = Field(..., description="Total number of events")
+    total: int | None = Field(
+        ..., description="Total number of events, or null when count=none"
+    )
     offset: int = Field(..., description="Offset for pagination")
     limit: int = Field(..., description="Limit for pagination")
+    has_more: bool = Field(False, description="Whether another page exists after this one")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
+
+
+class MapCluster(BaseModel):
+    latitude: float = Field(..., description="Mean latitude of the events in the cell")
+    longitude: float = Field(..., description="Mean longitude of the events in the cell")
+    count: int = Field(..., description="Number of upcoming events in the cell")
+    bbox: tuple[float, float, float, float] = Field(
+        ...,
+        description="The cell as west,south,east,north; pass it to GET /events?bbox= "
+        "to list its events",
+    )
+
+
+class MapTile(BaseModel):
+    z: int = Field(..., description="Zoom level of the tile")
+    x: int = Field(..., description="Column of the tile, from the west")
+    y: int = Field(..., description="Row of the tile, from the north")
+    clusters: list[MapCluster] = Field(..., description="Non-empty cells of the tile")
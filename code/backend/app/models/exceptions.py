@@ -7,6 +7,16 @@ Framework-generated code: 0%
 """
 
 
+class AdmissionRejectedError(Exception):
+    """Exception raised when an event's registration queue cannot take another request."""
+
+    def __init__(self, queue_position: int, retry_after: int, token: str) -> None:
+        super().__init__("Registration for this event is busy, please retry")
+        self.queue_position = queue_position
+        self.retry_after = retry_after
+        self.token = token
+
+
 class DuplicateResourceError(Exception):
     """Exception raised when attempting to create a resource that already exists."""
 
@@ -19,6 +29,12 @@ class InvalidColumnError(Exception):
     pass
 
 
+class InvalidCursorError(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
 class InvalidFilterFormatError(Exception):
     """Exception raised when a filter expression is malformed."""
 
@@ -37,6 +53,12 @@ class NotFoundError(Exception):
     pass
 
 
+class RsvpRejectedError(Exception):
+    """Exception raised when an RSVP is refused because the event has passed or is full."""
+
+    pass
+
+
 class UnsupportedPatchOperationError(Exception):
     """Exception raised when an unsupported patch operation is attempted."""
 
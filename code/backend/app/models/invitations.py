@@ -21,6 +21,7 @@ from app.models.exceptions import (
     UnsupportedPatchOperationError,
     ValidateFieldError,
 )
+from app.models.pagination import CountMode
 from app.models.users import UserRead
 
 logger = logging.getLogger(__name__)
@@ -95,37 +96,51 @@ class InvitationsBase(BaseModel):
 
     @classmethod
     async def validate_patch_operations(
-        cls, patch_operations: dict[UUID, Any]
+        cls, patch_operations: dict[UUID, list[Any]]
     ) -> dict[UUID, dict[str, Any]]:
         """Validate all patch operations for invitations."""
         import app.db.invitations as invitations_db
         from app.db.filters import FilterOperation
 
-        validated_updates: dict[UUID, dict[str, Any]] = {}
+        for invitation_id, operations in patch_operations.items():
+            for operation in operations:
+                if operation.op != "replace":
+                    logger.error(
+                        f"Unsupported operation '{operation.op}' "
+                        f"for invitation {invitation_id}"
+                    )
+                    raise UnsupportedPatchOperationError(
+                        f"Invalid operation: {operation.op}. "
+                        "Only 'replace' operation is supported"
+                    )
+
+        if not patch_operations:
+            return {}
+
+        # Check every target exists with one query
+        current_invitations, _ = await invitations_db.get_invitations_db(
+            [FilterOperation("invitation_id", "in", list(patch_operations))],
+            limit=len(patch_operations),
+            count=CountMode.NONE,
+        )
+        found = {invitation.invitation_id for invitation in current_invitations}
 
-        for invitation_id, operation in patch_operations.items():
-            if operation.op != "replace":
-                logger.error(
-                    f"Unsupported operation '{operation.op}' for invitation {invitation_id}"
-                )
-                raise UnsupportedPatchOperationError(
-                    f"Invalid operation: {operation.op}. Only 'replace' operation is supported"
-                )
+        validated_updates: dict[UUID, dict[str, Any]] = {}
 
-            field_path = operation.path.lstrip("/")
-            current_invitations, _ = await invitations_db.get_invitations_db(
-                [FilterOperation("invitation_id", "eq", invitation_id)], limit=1
-            )
-            if not current_invitations:
+        for invitation_id, operations in patch_operations.items():
+            if invitation_id not in found:
                 raise NotFoundError(f"Invitation {invitation_id} not found")
 
-            validated_field_value = await cls.validate_patch_field(
-                field_path,
-                operation.value,
-                invitation_id,
-            )
+            validated_fields: dict[str, Any] = {}
+            for operation in operations:
+                field_path = operation.path.lstrip("/")
+                validated_fields[field_path] = await cls.validate_patch_field(
+                    field_path,
+                    operation.value,
+                    invitation_id,
+                )
 
-            validated_updates[invitation_id] = {field_path: validated_field_value}
+            validated_updates[invitation_id] = validated_fields
 
         return validated_updates
 
@@ -157,6 +172,12 @@ class PaginatedInvitations(BaseModel):
     items: list[InvitationsReadDB] = Field(
         ..., description="List of invitations in the current page"
     )
-    total: int = Field(..., description="Total number of invitations")
+    total: int | None = Field(
+        ..., description="Total number of invitations, or null when count=none"
+    )
     offset: int = Field(..., description="Offset for pagination")
     limit: int = Field(..., description="Limit for pagination")
+    has_more: bool = Field(False, description="Whether another page exists after this one")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
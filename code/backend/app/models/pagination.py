@@ -0,0 +1,17 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from enum import Enum
+
+
+class CountMode(str, Enum):
+    """How list endpoints compute the total number of matching rows."""
+
+    EXACT = "exact"  # SELECT count(*) with the same filters
+    ESTIMATE = "estimate"  # Planner statistics or a short-lived cached count
+    NONE = "none"  # Skip counting; rely on has_more
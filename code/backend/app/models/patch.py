@@ -6,10 +6,10 @@ Human code: 100%
 Framework-generated code: 0%
 """
 
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class JSONPatchOperation(BaseModel):
@@ -19,6 +19,18 @@ class JSONPatchOperation(BaseModel):
 
 
 class PatchRequest(BaseModel):
-    patch: dict[UUID, JSONPatchOperation] = Field(
-        ..., description="A dictionary of patch operations"
+    patch: dict[UUID, Annotated[list[JSONPatchOperation], Field(min_length=1)]] = Field(
+        ...,
+        description=(
+            "A dictionary of RFC 6902 operation lists keyed by id. "
+            "A single operation object is accepted as a one-item list."
+        ),
     )
+
+    @field_validator("patch", mode="before")
+    @classmethod
+    def wrap_single_operations(cls, v: Any) -> Any:
+        """Accept the original one-operation-per-id form alongside operation lists."""
+        if not isinstance(v, dict):
+            return v
+        return {key: ops if isinstance(ops, list) else [ops] for key, ops in v.items()}
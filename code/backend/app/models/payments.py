@@ -45,6 +45,15 @@ class CheckoutRequest(BaseModel):
     email: str | None = None
 
 
+class CheckoutRegistration(CheckoutRequest):
+    """Body of POST /payments/checkout-session; `user_id` defaults to the signed-in user."""
+
+    user_id: UUID | None = None
+
+    def for_user(self, user_id: UUID) -> CheckoutRequest:
+        return CheckoutRequest(**{**self.model_dump(), "user_id": user_id})
+
+
 class CheckoutResponse(BaseModel):
     checkout_url: str | None = None
     already_paid: bool = False
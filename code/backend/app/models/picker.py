@@ -0,0 +1,27 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class PickedItem(BaseModel, Generic[T]):
+    item: T = Field(..., description="The matching resource")
+    score: float = Field(..., description="Similarity to the query, from 0 to 1")
+
+
+class PickerResponse(BaseModel, Generic[T]):
+    items: list[PickedItem[T]] = Field(..., description="Best matches first")
+    budget_exceeded: bool = Field(
+        False,
+        description="The lookup ran past PICKER_LATENCY_BUDGET_MS and was cut off; "
+        "items is empty and the client may retry with a longer query",
+    )
@@ -7,6 +7,7 @@ Framework-generated code: 0%
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any
 from uuid import UUID
@@ -20,6 +21,7 @@ from app.models.exceptions import (
     UnsupportedPatchOperationError,
     ValidateFieldError,
 )
+from app.models.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -84,68 +86,123 @@ class UserBase(BaseModel):
         if existing_users:
             raise DuplicateResourceError(f"Email {email} is already in use by another user")
 
+    @classmethod
+    async def validate_emails_unique(cls, emails: dict[UUID, str]) -> None:
+        """
+        Business logic validation - check that new emails for several users are unused.
+        Looks every email up in one query; two users in the batch taking the same email
+        is also a conflict.
+        """
+        import app.db.users as users_db
+        from app.db.filters import FilterOperation
+
+        if not emails:
+            return
+
+        claimed: dict[str, UUID] = {}
+        for user_id, email in emails.items():
+            normalized_email = email.strip().lower()
+            if claimed.setdefault(normalized_email, user_id) != user_id:
+                raise DuplicateResourceError(
+                    f"Email {email} is already in use by another user"
+                )
+
+        existing_users, _ = await users_db.get_users_db(
+            [FilterOperation("email", "in", list(claimed))],
+            limit=len(claimed),
+            count=CountMode.NONE,
+        )
+        for user in existing_users:
+            if claimed.get(user.email, user.user_id) != user.user_id:
+                raise DuplicateResourceError(
+                    f"Email {user.email} is already in use by another user"
+                )
+
     @classmethod
     async def validate_user_exists(cls, user_id: UUID) -> None:
         """Business logic validation - check if user exists."""
+        await cls.validate_users_exist([user_id])
+
+    @classmethod
+    async def find_existing_user_ids(cls, user_ids: Iterable[UUID]) -> set[UUID]:
+        """Return which of the given users exist, in one query."""
         import app.db.users as users_db
         from app.db.filters import FilterOperation
 
+        wanted = list(dict.fromkeys(user_ids))
+        if not wanted:
+            return set()
+
         users, _ = await users_db.get_users_db(
-            [FilterOperation("user_id", "eq", user_id)], limit=1
+            [FilterOperation("user_id", "in", wanted)], limit=len(wanted), count=CountMode.NONE
         )
-        if not users:
-            raise NotFoundError(f"User {user_id} does not exist")
+        return {user.user_id for user in users}
+
+    @classmethod
+    async def validate_users_exist(cls, user_ids: Iterable[UUID]) -> None:
+        """Business logic validation - check that every user exists, in one query."""
+        wanted = list(dict.fromkeys(user_ids))
+        found = await cls.find_existing_user_ids(wanted)
+        for user_id in wanted:
+            if user_id not in found:
+                raise NotFoundError(f"User {user_id} does not exist")
 
     @classmethod
-    async def validate_patch_field(
+    def validate_patch_fields(
         cls,
-        field_name: str,
-        field_value: Any,
+        fields: dict[str, Any],
         user_id: UUID,
         current_user_data: dict[str, Any],
-    ) -> Any:
-        if field_name not in cls.model_fields:
-            logger.error(f"Invalid field path '{field_name}' for user {user_id}")
-            raise InvalidPathError(
-                f"Invalid path: /{field_name}. "
-                f"Allowed fields: {', '.join(cls.model_fields.keys())}"
-            )
-
-        temp_data = current_user_data.copy()
-        temp_data[field_name] = field_value
-
-        validated_instance = cls(**temp_data)
-        validated_field_value = getattr(validated_instance, field_name)
-
-        if field_name == "email":
-            await cls.validate_email_uniqueness(validated_field_value, user_id)
+    ) -> dict[str, Any]:
+        """Apply all changed fields to the current user and validate the result once."""
+        for field_name in fields:
+            if field_name not in cls.model_fields:
+                logger.error(f"Invalid field path '{field_name}' for user {user_id}")
+                raise InvalidPathError(
+                    f"Invalid path: /{field_name}. "
+                    f"Allowed fields: {', '.join(cls.model_fields.keys())}"
+                )
 
-        return validated_field_value
+        validated_instance = cls(**{**current_user_data, **fields})
+        return {field_name: getattr(validated_instance, field_name) for field_name in fields}
 
     @classmethod
     async def validate_patch_operations(
-        cls, patch_operations: dict[UUID, Any]
+        cls, patch_operations: dict[UUID, list[Any]]
     ) -> dict[UUID, dict[str, Any]]:
         import app.db.users as users_db
         from app.db.filters import FilterOperation
 
-        validated_updates: dict[UUID, dict[str, Any]] = {}
+        for user_id, operations in patch_operations.items():
+            for operation in operations:
+                if operation.op != "replace":
+                    logger.error(f"Unsupported operation '{operation.op}' for user {user_id}")
+                    raise UnsupportedPatchOperationError(
+                        f"Invalid operation: {operation.op}. "
+                        "Only 'replace' operation is supported"
+                    )
+
+        if not patch_operations:
+            return {}
+
+        # Load every target row in one query, then validate in memory
+        current_users, _ = await users_db.get_users_db(
+            [FilterOperation("user_id", "in", list(patch_operations))],
+            limit=len(patch_operations),
+            count=CountMode.NONE,
+        )
+        current_by_id = {user.user_id: user for user in current_users}
 
-        for user_id, operation in patch_operations.items():
-            if operation.op != "replace":
-                logger.error(f"Unsupported operation '{operation.op}' for user {user_id}")
-                raise UnsupportedPatchOperationError(
-                    f"Invalid operation: {operation.op}. Only 'replace' operation is supported"
-                )
+        validated_updates: dict[UUID, dict[str, Any]] = {}
+        new_emails: dict[UUID, str] = {}
 
-            field_path = operation.path.lstrip("/")
-            current_users, _ = await users_db.get_users_db(
-                [FilterOperation("user_id", "eq", user_id)], limit=1
-            )
-            if not current_users:
+        for user_id, operations in patch_operations.items():
+            current_user = current_by_id.get(user_id)
+            if current_user is None:
                 raise NotFoundError(f"User {user_id} not found")
 
-            current_user = current_users[0]
+            # Operations apply in order, so a later replace of the same path wins
+            fields = {operation.path.lstrip("/"): operation.value for operation in operations}
             current_user_data: dict[str, Any] = {
                 "first_name": current_user.first_name,
                 "last_name": current_user.last_name,
@@ -154,11 +211,14 @@ class UserBase(BaseModel):
                 "color": current_user.color,
             }
 
-            validated_field_value = await cls.validate_patch_field(
-                field_path, operation.value, user_id, current_user_data
-            )
+            validated_fields = cls.validate_patch_fields(fields, user_id, current_user_data)
+
+            if "email" in validated_fields:
+                new_emails[user_id] = validated_fields["email"]
+
+            validated_updates[user_id] = validated_fields
 
-            validated_updates[user_id] = {field_path: validated_field_value}
+        await cls.validate_emails_unique(new_emails)
 
         return validated_updates
 
@@ -175,6 +235,12 @@ class UserRead(UserBase):
 
 class PaginatedUsers(BaseModel):
     items: list[UserRead] = Field(..., description="List of users in the current page")
-    total: int = Field(..., description="Total number of users")
+    total: int | None = Field(
+        ..., description="Total number of users, or null when count=none"
+    )
     offset: int = Field(..., description="Offset for pagination")
     limit: int = Field(..., description="Limit for pagination")
+    has_more: bool = Field(False, description="Whether another page exists after this one")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
@@ -8,17 +8,23 @@ Framework-generated code: 0%
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Header, Query, status
 
+from app.auth import CurrentUser
 from app.models import attendees as models_attendees
+from app.models import bulk as models_bulk
 from app.models import patch as models_patch
+from app.models.pagination import CountMode
 from app.routes.shared_responses import (
-    RESPONSES_CREATE,
+    RESPONSES_BULK_CREATE,
     RESPONSES_DELETE,
     RESPONSES_LIST,
     RESPONSES_PATCH,
+    RESPONSES_REGISTRATION,
 )
 from app.service import attendees as attendees_service
+from app.service import users as users_service
+from app.service.admission import event_admission
 
 router = APIRouter()
 
@@ -34,6 +40,20 @@ FILTER_QUERY = Query(
 )
 OFFSET_QUERY = Query(0, ge=0, description="Number of records to skip")
 LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of attendees to return")
+CURSOR_QUERY = Query(
+    None,
+    description="Opaque cursor from `next_cursor` of the previous page. Overrides offset.",
+)
+ADMISSION_TOKEN_HEADER = Header(
+    None, description="Token from a previous 429 response, to keep the queue place."
+)
+COUNT_QUERY = Query(
+    CountMode.EXACT,
+    description=(
+        "How to compute `total`: `exact` counts every match, `estimate` may use planner "
+        "statistics or a briefly cached count, `none` skips counting (use `has_more`)."
+    ),
+)
 
 
 @router.get(
@@ -43,7 +63,8 @@ LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of attendees
     description=(
         "Get attendees with optional filters using the format `field:operator:value`. "
         "Multiple filters can be combined using multiple `filter_expression` params.\n\n"
-        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike\n\n"
+        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike, "
+        "in (comma-separated values)\n\n"
         "Examples:\n"
         "- `/attendees?filter_expression=event_id:eq:<uuid>`\n"
         "- `/attendees?filter_expression=user_id:eq:<uuid>&filter_expression=status:eq:RSVPed`"
@@ -55,23 +76,57 @@ async def list_attendees(
     filter_expression: list[str] | None = FILTER_QUERY,
     offset: int = OFFSET_QUERY,
     limit: int = LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
+    count: CountMode = COUNT_QUERY,
 ) -> models_attendees.PaginatedAttendees:
-    return await attendees_service.get_attendees_service(filter_expression, offset, limit)
+    return await attendees_service.get_attendees_service(
+        filter_expression, offset, limit, cursor, count
+    )
 
 
 @router.post(
     "/attendees",
     response_model=models_attendees.AttendeeRead,
     summary="Register a user for an event",
-    description="Creates an attendee row for (event_id, user_id). Prevents duplicates.",
+    description=(
+        "Creates an attendee row for (event_id, user_id). Prevents duplicates. "
+        "`user_id` defaults to the signed-in user (see `GET /me`).\n\n"
+        "Registrations are admitted a few at a time per event. When an event's queue is "
+        "full the response is 429 with a queue position and an admission token; send the "
+        "token back as `X-Admission-Token` to keep that place."
+    ),
     tags=["Attendees"],
     status_code=status.HTTP_201_CREATED,
-    responses=RESPONSES_CREATE,
+    responses=RESPONSES_REGISTRATION,
 )
 async def create_attendee(
-    attendee: models_attendees.AttendeeCreate,
+    attendee: models_attendees.AttendeeRegistration,
+    account: CurrentUser,
+    x_admission_token: str | None = ADMISSION_TOKEN_HEADER,
 ) -> models_attendees.AttendeeRead:
-    return await attendees_service.create_attendee_service(attendee)
+    user_id = await users_service.resolve_user_id(attendee.user_id, account)
+    async with event_admission.admit(attendee.event_id, x_admission_token):
+        return await attendees_service.create_attendee_service(attendee.for_user(user_id))
+
+
+@router.post(
+    "/attendees:bulk",
+    response_model=models_bulk.BulkCreateResponse[models_attendees.AttendeeRead],
+    summary="Create many attendees in one request",
+    description=(
+        "Create up to BULK_CREATE_MAX_ITEMS attendees at once. Items are validated as a "
+        "batch, referenced rows are checked with one query per table and accepted items "
+        "are written with a single multi-row insert. Invalid items do not fail the "
+        "batch: each result carries the status code and detail the item would get on "
+        "its own."
+    ),
+    tags=["Attendees"],
+    responses=RESPONSES_BULK_CREATE,
+)
+async def create_attendees_bulk(
+    request: models_bulk.BulkCreateRequest,
+) -> models_bulk.BulkCreateResponse[models_attendees.AttendeeRead]:
+    return await attendees_service.create_attendees_bulk_service(request)
 
 
 @router.patch(
@@ -82,6 +137,8 @@ async def create_attendee(
         "Apply JSON Patch operations to multiple attendees. Each operation is applied to a "
         "specific attendee identified by UUID. Returns a dictionary mapping attendee IDs to "
         "their updated Attendee models.\n\n"
+        "Each attendee takes one operation or a list of operations; a list is applied "
+        "in order, validated together and saved in a single update.\n\n"
         "JSON Patch operations supported:\n"
         "- `replace`: Replace a field value\n"
         "Example request body:\n"
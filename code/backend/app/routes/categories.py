@@ -6,7 +6,9 @@ Human code: 30%
 Framework-generated code: 0%
 """
 
-from fastapi import APIRouter, Query
+import hashlib
+
+from fastapi import APIRouter, Header, Query, Response, status
 
 from app.models import categories as models_categories
 from app.routes.shared_responses import RESPONSES_LIST
@@ -22,6 +24,20 @@ FILTER_QUERY = Query(
 )
 OFFSET_QUERY = Query(0, ge=0, description="Number of records to skip")
 LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of categories to return")
+IF_NONE_MATCH_HEADER = Header(
+    None, description="ETag of a previous response; unchanged pages return 304."
+)
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get(
@@ -31,18 +47,28 @@ LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of categorie
     description=(
         "Get categories with optional filters using the format `field:operator:value`. "
         "Multiple filters can be combined using multiple filter_expression parameters.\n\n"
-        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike\n\n"
+        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike, "
+        "in (comma-separated values)\n\n"
         "Pagination is supported via offset and limit parameters.\n\n"
+        "Categories are served from memory. Responses carry a strong `ETag`; send it "
+        "back as `If-None-Match` to get 304 Not Modified while the page is unchanged.\n\n"
         "Examples:\n"
         "- `/categories?filter_expression=category_name:ilike:Party%`\n"
         "- `/categories?offset=20&limit=10` (get third page of 10 categories)"
     ),
     tags=["Categories"],
-    responses=RESPONSES_LIST,
+    responses={**RESPONSES_LIST, 304: {"description": "The page matches `If-None-Match`"}},
 )
 async def list_categories(
     filter_expression: list[str] | None = FILTER_QUERY,
     offset: int = OFFSET_QUERY,
     limit: int = LIMIT_QUERY,
-) -> models_categories.PaginatedCategories:
-    return await categories_service.get_categories_service(filter_expression, offset, limit)
+    if_none_match: str | None = IF_NONE_MATCH_HEADER,
+) -> Response:
+    page = await categories_service.get_categories_service(filter_expression, offset, limit)
+    # Hash the exact bytes sent so equal tags mean byte-identical bodies
+    body = page.model_dump_json().encode()
+    headers = {"ETag": _etag(body), "Cache-Control": "no-cache"}
+    if _etag_matches(headers["ETag"], if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
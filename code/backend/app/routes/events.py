@@ -8,11 +8,16 @@ Framework-generated code: 0%
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
+from app.config import settings
+from app.models import bulk as models_bulk
 from app.models import events as models_events
 from app.models import patch as models_patch
+from app.models import picker as models_picker
+from app.models.pagination import CountMode
 from app.routes.shared_responses import (
+    RESPONSES_BULK_CREATE,
     RESPONSES_CREATE,
     RESPONSES_DELETE,
     RESPONSES_LIST,
@@ -30,6 +35,64 @@ FILTER_QUERY = Query(
 )
 OFFSET_QUERY = Query(0, ge=0, description="Number of records to skip")
 LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of events to return")
+CURSOR_QUERY = Query(
+    None,
+    description=(
+        "Opaque cursor from `next_cursor` of the previous page, sent with the same "
+        "`order_by`. Overrides offset."
+    ),
+)
+ORDER_BY_QUERY = Query(
+    None,
+    description=(
+        "Sort order; prefix `-` for descending. Defaults to `event_datetime`, or "
+        "`distance` with `near`."
+    ),
+)
+SEARCH_QUERY = Query(
+    None,
+    max_length=200,
+    description="Full-text search over event name, description and location, ranked.",
+    examples=["jazz brunch", '"open mic" -karaoke'],
+)
+PICK_QUERY = Query(
+    ...,
+    min_length=1,
+    max_length=100,
+    description="What the user has typed so far; typos and partial words are tolerated.",
+    examples=["jaz brunch", "open mi"],
+)
+PICK_LIMIT_QUERY = Query(
+    10, ge=1, le=settings.PICKER_MAX_RESULTS, description="Maximum number of matches"
+)
+NEAR_QUERY = Query(
+    None,
+    description="`lat,lon` point; results come back nearest first with `distance_km`.",
+    examples=["42.3601,-71.0589"],
+)
+RADIUS_QUERY = Query(
+    None, gt=0, le=20000, description="With `near`, only events within this many km."
+)
+BBOX_QUERY = Query(
+    None,
+    description="`west,south,east,north` in degrees; only events inside the box.",
+    examples=["-71.2,42.2,-70.9,42.5"],
+)
+TILE_ZOOM_QUERY = Query(
+    ...,
+    ge=0,
+    le=settings.MAP_TILE_MAX_ZOOM,
+    description="Zoom level; beyond the maximum, list the viewport with `bbox`.",
+)
+TILE_X_QUERY = Query(..., ge=0, description="Tile column, 0 at the antimeridian")
+TILE_Y_QUERY = Query(..., ge=0, description="Tile row, 0 at the north edge")
+COUNT_QUERY = Query(
+    CountMode.EXACT,
+    description=(
+        "How to compute `total`: `exact` counts every match, `estimate` may use planner "
+        "statistics or a briefly cached count, `none` skips counting (use `has_more`)."
+    ),
+)
 
 
 @router.get(
@@ -39,10 +102,27 @@ LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of events to
     description=(
         "Get events with optional filters using the format `field:operator:value`. "
         "Multiple filters can be combined using multiple filter_expression parameters.\n\n"
-        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike\n\n"
-        "Pagination is supported via offset and limit parameters.\n\n"
+        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike, "
+        "in (comma-separated values)\n\n"
+        "Pagination is supported via offset and limit parameters. For deep paging, pass "
+        "the `next_cursor` of the previous page as `cursor` to seek instead of skipping.\n\n"
+        "`search` runs an indexed full-text search over the name, description and "
+        "location and returns the best matches first. It accepts web-search syntax "
+        '(`"exact phrase"`, `or`, `-exclude`), combines with filters and pages by '
+        "offset only.\n\n"
+        "`near`, `radius_km` and `bbox` keep events whose `geo::` location lies in an "
+        "area; events without coordinates are left out. `near` orders the results by "
+        "distance and fills in `distance_km`. `bbox` also combines with `search`. Area "
+        "queries page by offset only.\n\n"
+        "`order_by` sorts the whole result before paging, with ties broken by "
+        "`event_id`. Sorting by `price_field` pages by offset only, and `search` "
+        "always orders by relevance.\n\n"
         "Examples:\n"
+        "- `/events?search=jazz brunch`\n"
+        "- `/events?near=42.3601,-71.0589&radius_km=10`\n"
+        "- `/events?order_by=-created_at` (newest first)\n"
         "- `/events?filter_expression=event_name:ilike:Party%`\n"
+        "- `/events?filter_expression=event_id:in:<id1>,<id2>` (fetch several events by id)\n"
         "- `/events?offset=20&limit=10` (get third page of 10 events)"
     ),
     tags=["Events"],
@@ -52,8 +132,77 @@ async def list_events(
     filter_expression: list[str] | None = FILTER_QUERY,
     offset: int = OFFSET_QUERY,
     limit: int = LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
+    count: CountMode = COUNT_QUERY,
+    search: str | None = SEARCH_QUERY,
+    near: str | None = NEAR_QUERY,
+    radius_km: float | None = RADIUS_QUERY,
+    bbox: str | None = BBOX_QUERY,
+    order_by: models_events.EventOrder | None = ORDER_BY_QUERY,
 ) -> models_events.PaginatedEvents:
-    return await events_service.get_events_service(filter_expression, offset, limit)
+    return await events_service.get_events_service(
+        filter_expression,
+        offset,
+        limit,
+        cursor,
+        count,
+        search,
+        near,
+        radius_km,
+        bbox,
+        order_by,
+    )
+
+
+@router.get(
+    "/events/map-tiles",
+    response_model=models_events.MapTile,
+    summary="Get clustered upcoming events for one map tile",
+    description=(
+        "Return the upcoming events of one Web Mercator tile (`z`/`x`/`y`, as used by "
+        "Mapbox and other slippy maps) as clusters: one per non-empty cell of a "
+        "fixed grid over the tile, with its event count, mean position and `bbox`. "
+        "Pass a cluster's `bbox` to `GET /events?bbox=` to list its events.\n\n"
+        "Tiles are read from rollups rebuilt every MAP_ROLLUP_REFRESH_SECONDS and "
+        "cover events starting within MAP_ROLLUP_WINDOW_DAYS that have not ended, so "
+        "new events can take that long to appear. Responses may be cached for the "
+        "same time."
+    ),
+    tags=["Events"],
+    responses=RESPONSES_LIST,
+)
+async def get_map_tile(
+    response: Response,
+    z: int = TILE_ZOOM_QUERY,
+    x: int = TILE_X_QUERY,
+    y: int = TILE_Y_QUERY,
+) -> models_events.MapTile:
+    response.headers["Cache-Control"] = (
+        f"private, max-age={int(settings.MAP_ROLLUP_REFRESH_SECONDS)}"
+    )
+    return await events_service.get_map_tile_service(z, x, y)
+
+
+@router.get(
+    "/events:pick",
+    response_model=models_picker.PickerResponse[models_events.EventRead],
+    summary="Find events for a picker as the user types",
+    description=(
+        "Return the events whose name best matches `q`, best first, for "
+        "autocomplete-style pickers. Matching is trigram based, so misspellings and "
+        "partial words still match, and each item carries its similarity score.\n\n"
+        "The lookup has a latency budget of PICKER_LATENCY_BUDGET_MS. When a query "
+        "runs past it the response is empty with `budget_exceeded` set, and the client "
+        "should wait for more input rather than retry the same query."
+    ),
+    tags=["Events"],
+    responses=RESPONSES_LIST,
+)
+async def pick_events(
+    q: str = PICK_QUERY,
+    limit: int = PICK_LIMIT_QUERY,
+) -> models_picker.PickerResponse[models_events.EventRead]:
+    return await events_service.pick_events_service(q, limit)
 
 
 @router.post(
@@ -69,6 +218,26 @@ async def create_event(event: models_events.EventCreate) -> models_events.EventR
     return await events_service.create_event_service(event)
 
 
+@router.post(
+    "/events:bulk",
+    response_model=models_bulk.BulkCreateResponse[models_events.EventRead],
+    summary="Create many events in one request",
+    description=(
+        "Create up to BULK_CREATE_MAX_ITEMS events at once. Items are validated as a "
+        "batch, referenced rows are checked with one query per table and accepted items "
+        "are written with a single multi-row insert. Invalid items do not fail the "
+        "batch: each result carries the status code and detail the item would get on "
+        "its own."
+    ),
+    tags=["Events"],
+    responses=RESPONSES_BULK_CREATE,
+)
+async def create_events_bulk(
+    request: models_bulk.BulkCreateRequest,
+) -> models_bulk.BulkCreateResponse[models_events.EventRead]:
+    return await events_service.create_events_bulk_service(request)
+
+
 @router.patch(
     "/events",
     response_model=dict[UUID, models_events.EventRead],
@@ -77,17 +246,18 @@ async def create_event(event: models_events.EventCreate) -> models_events.EventR
         "Apply JSON Patch operations to multiple events. Each operation is applied to a "
         "specific event identified by UUID. Returns a dictionary mapping event IDs to their "
         "updated Event models.\n\n"
+        "Each event takes one operation or a list of operations; a list is applied "
+        "in order, validated together and saved in a single update.\n\n"
         "JSON Patch operations supported:\n"
         "- `replace`: Replace a field value\n"
         "Example request body:\n"
         "```json\n"
         "{\n"
         '  "patch": {\n'
-        '    "550e8400-e29b-41d4-a716-446655440001": {\n'
-        '      "op": "replace",\n'
-        '      "path": "/event_name",\n'
-        '      "value": "Updated Event Name"\n'
-        "    }\n"
+        '    "550e8400-e29b-41d4-a716-446655440001": [\n'
+        '      {"op": "replace", "path": "/event_name", "value": "Updated Event Name"},\n'
+        '      {"op": "replace", "path": "/capacity", "value": 80}\n'
+        "    ]\n"
         "  }\n"
         "}\n"
         "```"
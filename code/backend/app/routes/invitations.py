@@ -10,9 +10,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query
 
+from app.models import bulk as models_bulk
 from app.models import invitations as models_invitations
 from app.models import patch as models_patch
+from app.models.pagination import CountMode
 from app.routes.shared_responses import (
+    RESPONSES_BULK_CREATE,
     RESPONSES_CREATE,
     RESPONSES_GET_BY_ID,
     RESPONSES_LIST,
@@ -34,6 +37,17 @@ FILTER_QUERY = Query(
 )
 OFFSET_QUERY = Query(0, ge=0, description="Number of records to skip")
 LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of invitations to return")
+CURSOR_QUERY = Query(
+    None,
+    description="Opaque cursor from `next_cursor` of the previous page. Overrides offset.",
+)
+COUNT_QUERY = Query(
+    CountMode.EXACT,
+    description=(
+        "How to compute `total`: `exact` counts every match, `estimate` may use planner "
+        "statistics or a briefly cached count, `none` skips counting (use `has_more`)."
+    ),
+)
 
 
 @router.get(
@@ -43,8 +57,10 @@ LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of invitatio
     description=(
         "Get invitations with optional filters using the format `field:operator:value`. "
         "Multiple filters can be combined using multiple filter_expression parameters.\n\n"
-        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike\n\n"
-        "Pagination is supported via offset and limit parameters.\n\n"
+        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike, "
+        "in (comma-separated values)\n\n"
+        "Pagination is supported via offset and limit parameters. For deep paging, pass "
+        "the `next_cursor` of the previous page as `cursor` to seek instead of skipping.\n\n"
         "Examples:\n"
         "- `/invitations?filter_expression=status:eq:Active`\n"
         "- `/invitations?filter_expression=event_id:eq:550e8400-e29b-41d4-a716-446655440000`\n"
@@ -57,8 +73,12 @@ async def list_invitations(
     filter_expression: list[str] | None = FILTER_QUERY,
     offset: int = OFFSET_QUERY,
     limit: int = LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
+    count: CountMode = COUNT_QUERY,
 ) -> models_invitations.PaginatedInvitations:
-    return await service_invitations.get_invitations_service(filter_expression, offset, limit)
+    return await service_invitations.get_invitations_service(
+        filter_expression, offset, limit, cursor, count
+    )
 
 
 @router.post(
@@ -89,6 +109,26 @@ async def get_invitation_by_token(
     return await service_invitations.get_invitation_by_token(token)
 
 
+@router.post(
+    "/invitations:bulk",
+    response_model=models_bulk.BulkCreateResponse[models_invitations.InvitationsRead],
+    summary="Create many invitations in one request",
+    description=(
+        "Create up to BULK_CREATE_MAX_ITEMS invitations at once. Items are validated as a "
+        "batch, referenced rows are checked with one query per table and accepted items "
+        "are written with a single multi-row insert. Invalid items do not fail the "
+        "batch: each result carries the status code and detail the item would get on "
+        "its own."
+    ),
+    tags=["Invitations"],
+    responses=RESPONSES_BULK_CREATE,
+)
+async def create_invitations_bulk(
+    request: models_bulk.BulkCreateRequest,
+) -> models_bulk.BulkCreateResponse[models_invitations.InvitationsRead]:
+    return await service_invitations.create_invitations_bulk_service(request)
+
+
 @router.patch(
     "/invitations",
     response_model=dict[UUID, models_invitations.InvitationsReadDB],
@@ -97,6 +137,8 @@ async def get_invitation_by_token(
         "Apply JSON Patch operations to multiple invitations. Each operation is applied to a "
         "specific invitation identified by UUID. Returns a dictionary mapping invitation IDs "
         "to their updated Invitation models.\n\n"
+        "Each invitation takes one operation or a list of operations; a list is applied "
+        "in order, validated together and saved in a single update.\n\n"
         "JSON Patch operations supported:\n"
         "- `replace`: Replace a field value\n\n"
         "Patchable fields:\n"
@@ -6,10 +6,14 @@ Human code: 20%
 Framework-generated code: 0%
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, Request
 from starlette.responses import JSONResponse
 
-from app.models.payments import CheckoutRequest, CheckoutResponse
+from app.auth import CurrentUser
+from app.models.payments import CheckoutRegistration, CheckoutResponse
+from app.routes.shared_responses import ERROR_429_ADMISSION
+from app.service import users as users_service
+from app.service.admission import event_admission
 from app.service.stripe_service import (
     create_checkout_session_for_payment,
     process_webhook_event,
@@ -24,7 +28,8 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
     response_model=CheckoutResponse,
     summary="Create Stripe Checkout session (USD)",
     description=(
-        "Creates a Stripe Checkout Session for an event payment.\n\n"
+        "Creates a Stripe Checkout Session for an event payment. `user_id` defaults to "
+        "the signed-in user (see `GET /me`).\n\n"
         "Flow:\n"
         "1. A new payment record is created in the database with status 'created'.\n"
         "2. A Stripe Checkout Session is generated for the given event and user.\n"
@@ -44,18 +49,29 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
         404: {
             "description": "Event or user not found.",
         },
+        429: ERROR_429_ADMISSION,
         500: {
             "description": "Unexpected internal server error.",
         },
     },
 )
-async def create_session(data: CheckoutRequest) -> CheckoutResponse:
+async def create_session(
+    data: CheckoutRegistration,
+    account: CurrentUser,
+    x_admission_token: str | None = Header(
+        None, description="Token from a previous 429 response, to keep the queue place."
+    ),
+) -> CheckoutResponse:
     """
     Thin HTTP wrapper for the payment flow:
+    - defaults user_id to the signed-in user
+    - admits the request through the event's registration queue
     - delegates to stripe_service.create_checkout_session_for_payment
     - lets the service raise HTTPException on Stripe / internal errors
     """
-    return await create_checkout_session_for_payment(data)
+    user_id = await users_service.resolve_user_id(data.user_id, account)
+    async with event_admission.admit(data.event_id, x_admission_token):
+        return await create_checkout_session_for_payment(data.for_user(user_id))
 
 
 @router.post(
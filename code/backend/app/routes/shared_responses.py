@@ -83,6 +83,24 @@ ERROR_422_VALIDATION: dict[str, Any] = {
     "content": {"application/json": {"example": {"detail": "Validation error"}}},
 }
 
+ERROR_429_ADMISSION: dict[str, Any] = {
+    "description": (
+        "The event's registration queue is full. Retry after `Retry-After` seconds, "
+        "sending `admission_token` as the `X-Admission-Token` header to keep the place "
+        "in line."
+    ),
+    "content": {
+        "application/json": {
+            "example": {
+                "detail": "Registration for this event is busy, please retry",
+                "queue_position": 12,
+                "retry_after": 3,
+                "admission_token": "kq3Vn1o0Xb5w2yJm8cQx9A",
+            }
+        }
+    },
+}
+
 ERROR_500_INTERNAL: dict[str, Any] = {
     "description": "Internal server error",
     "content": {"application/json": {"example": {"detail": "Internal server error"}}},
@@ -108,6 +126,19 @@ RESPONSES_CREATE: dict[int | str, dict[str, Any]] = {
     500: ERROR_500_INTERNAL,
 }
 
+# Registration endpoints, gated per event by the admission controller
+RESPONSES_REGISTRATION: dict[int | str, dict[str, Any]] = {
+    **RESPONSES_CREATE,
+    429: ERROR_429_ADMISSION,
+}
+
+# Bulk create endpoints (POST /...:bulk)
+RESPONSES_BULK_CREATE: dict[int | str, dict[str, Any]] = {
+    200: {"description": "Batch processed; per-item status codes are in the results"},
+    422: ERROR_422_VALIDATION,
+    500: ERROR_500_INTERNAL,
+}
+
 # Get by ID endpoints (GET /{id})
 RESPONSES_GET_BY_ID: dict[int | str, dict[str, Any]] = {
     200: {"description": "Resource retrieved successfully"},
@@ -10,11 +10,18 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query
 
+from app.auth import CurrentUser
+from app.config import settings
+from app.models import bulk as models_bulk
 from app.models import patch as models_patch
+from app.models import picker as models_picker
 from app.models import users as models_users
+from app.models.pagination import CountMode
 from app.routes.shared_responses import (
+    RESPONSES_BULK_CREATE,
     RESPONSES_CREATE,
     RESPONSES_DELETE,
+    RESPONSES_GET_BY_ID,
     RESPONSES_LIST,
     RESPONSES_PATCH,
 )
@@ -30,6 +37,27 @@ FILTER_QUERY = Query(
 )
 OFFSET_QUERY = Query(0, ge=0, description="Number of records to skip")
 LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of users to return")
+CURSOR_QUERY = Query(
+    None,
+    description="Opaque cursor from `next_cursor` of the previous page. Overrides offset.",
+)
+PICK_QUERY = Query(
+    ...,
+    min_length=1,
+    max_length=100,
+    description="What the user has typed so far; typos and partial words are tolerated.",
+    examples=["jon smth", "ana@exa"],
+)
+PICK_LIMIT_QUERY = Query(
+    10, ge=1, le=settings.PICKER_MAX_RESULTS, description="Maximum number of matches"
+)
+COUNT_QUERY = Query(
+    CountMode.EXACT,
+    description=(
+        "How to compute `total`: `exact` counts every match, `estimate` may use planner "
+        "statistics or a briefly cached count, `none` skips counting (use `has_more`)."
+    ),
+)
 
 
 @router.get(
@@ -39,8 +67,10 @@ LIMIT_QUERY = Query(100, ge=1, le=1000, description="Maximum number of users to
     description=(
         "Get users with optional filters using the format `field:operator:value`. "
         "Multiple filters can be combined using multiple filter_expression parameters.\n\n"
-        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike\n\n"
-        "Pagination is supported via offset and limit parameters.\n\n"
+        "Available operators: eq, neq, gt, gte, lt, lte, like, ilike, "
+        "in (comma-separated values)\n\n"
+        "Pagination is supported via offset and limit parameters. For deep paging, pass "
+        "the `next_cursor` of the previous page as `cursor` to seek instead of skipping.\n\n"
         "Examples:\n"
         "- `/users?filter_expression=email:eq:john@example.com`\n"
         "- `/users?offset=20&limit=10` (get third page of 10 users)"
@@ -52,8 +82,50 @@ async def list_users(
     filter_expression: list[str] | None = FILTER_QUERY,
     offset: int = OFFSET_QUERY,
     limit: int = LIMIT_QUERY,
+    cursor: str | None = CURSOR_QUERY,
+    count: CountMode = COUNT_QUERY,
 ) -> models_users.PaginatedUsers:
-    return await users_service.get_users_service(filter_expression, offset, limit)
+    return await users_service.get_users_service(
+        filter_expression, offset, limit, cursor, count
+    )
+
+
+@router.get(
+    "/users:pick",
+    response_model=models_picker.PickerResponse[models_users.UserRead],
+    summary="Find users for a picker as the user types",
+    description=(
+        "Return the users whose name or email best match `q`, best first, for "
+        "autocomplete-style pickers. Matching is trigram based, so misspellings and "
+        "partial words still match, and each item carries its similarity score.\n\n"
+        "The lookup has a latency budget of PICKER_LATENCY_BUDGET_MS. When a query "
+        "runs past it the response is empty with `budget_exceeded` set, and the client "
+        "should wait for more input rather than retry the same query."
+    ),
+    tags=["Users"],
+    responses=RESPONSES_LIST,
+)
+async def pick_users(
+    q: str = PICK_QUERY,
+    limit: int = PICK_LIMIT_QUERY,
+) -> models_picker.PickerResponse[models_users.UserRead]:
+    return await users_service.pick_users_service(q, limit)
+
+
+@router.get(
+    "/me",
+    response_model=models_users.UserRead,
+    summary="Get the signed-in user",
+    description=(
+        "Resolve the bearer token's Clerk account to its user. The lookup is cached per "
+        "account, so this is cheap to call on every page. Endpoints that take a "
+        "`user_id` in the body default it to this user when it is left out."
+    ),
+    tags=["Users"],
+    responses=RESPONSES_GET_BY_ID,
+)
+async def get_me(account: CurrentUser) -> models_users.UserRead:
+    return await users_service.get_current_user_service(account)
 
 
 @router.post(
@@ -69,6 +141,26 @@ async def create_user(user: models_users.UserCreate) -> models_users.UserRead:
     return await users_service.create_user_service(user)
 
 
+@router.post(
+    "/users:bulk",
+    response_model=models_bulk.BulkCreateResponse[models_users.UserRead],
+    summary="Create many users in one request",
+    description=(
+        "Create up to BULK_CREATE_MAX_ITEMS users at once. Items are validated as a "
+        "batch, referenced rows are checked with one query per table and accepted items "
+        "are written with a single multi-row insert. Invalid items do not fail the "
+        "batch: each result carries the status code and detail the item would get on "
+        "its own."
+    ),
+    tags=["Users"],
+    responses=RESPONSES_BULK_CREATE,
+)
+async def create_users_bulk(
+    request: models_bulk.BulkCreateRequest,
+) -> models_bulk.BulkCreateResponse[models_users.UserRead]:
+    return await users_service.create_users_bulk_service(request)
+
+
 @router.patch(
     "/users",
     response_model=dict[UUID, models_users.UserRead],
@@ -77,6 +169,8 @@ async def create_user(user: models_users.UserCreate) -> models_users.UserRead:
         "Apply JSON Patch operations to multiple users. Each operation is applied to a "
         "specific user identified by UUID. Returns a dictionary mapping user IDs to their "
         "updated User models.\n\n"
+        "Each user takes one operation or a list of operations; a list is applied "
+        "in order, validated together and saved in a single update.\n\n"
         "JSON Patch operations supported:\n"
         "- `replace`: Replace a field value\n"
         "Example request body:\n"
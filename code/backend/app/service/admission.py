@@ -0,0 +1,180 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Per-event admission control for registration traffic.
+
+A ticket drop sends every registration for one event at once. Without a gate they all
+check out a database connection and the whole pool, shared by every other event, is
+held by one hot event. The controller lets at most ADMISSION_MAX_CONCURRENT_PER_EVENT
+registrations per event run, queues up to ADMISSION_MAX_QUEUE_PER_EVENT more in
+arrival order, and turns the rest away with their queue position, a Retry-After
+estimate and an admission token. Presenting the token on retry keeps the client's
+original place in line, ahead of anyone who arrived later.
+
+State lives in this process: each API worker admits its own share of the traffic.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import secrets
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from app.config import settings
+from app.models.exceptions import AdmissionRejectedError
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the per-event moving average of registration time
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+class LocalTicketStore:
+    """Admission tokens issued to rejected clients, kept in memory until they expire."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl = ttl_seconds
+        # token -> (event_id, arrival sequence, expires_at). Every ticket lives for the
+        # same TTL, so insertion order is expiry order.
+        self._tickets: dict[str, tuple[UUID, int, float]] = {}
+
+    def issue(self, event_id: UUID, seq: int) -> str:
+        now = time.monotonic()
+        # Expired tickets sit at the front; stop at the first one still live
+        while self._tickets:
+            oldest = next(iter(self._tickets))
+            if self._tickets[oldest][2] > now:
+                break
+            del self._tickets[oldest]
+        token = secrets.token_urlsafe(16)
+        self._tickets[token] = (event_id, seq, now + self._ttl)
+        return token
+
+    def redeem(self, token: str, event_id: UUID) -> int | None:
+        """Return the arrival sequence a token holds for this event, once."""
+        ticket = self._tickets.pop(token, None)
+        if ticket is None or ticket[0] != event_id or ticket[2] <= time.monotonic():
+            return None
+        return ticket[1]
+
+
+@dataclass
+class _EventGate:
+    active: int = 0
+    # (arrival sequence, future resolved when admitted); the earliest arrival goes first
+    waiters: list[tuple[int, asyncio.Future[None]]] = field(default_factory=list)
+    service_time: float = 0.0
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        store: LocalTicketStore,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.store = store
+        self._gates: dict[UUID, _EventGate] = {}
+        # Shared by all events so a token's place survives its event's gate going idle
+        self._arrivals = itertools.count()
+
+    @asynccontextmanager
+    async def admit(self, event_id: UUID, token: str | None = None) -> AsyncIterator[None]:
+        """
+        Hold one of the event's registration slots for the duration of the block.
+
+        Raises:
+            AdmissionRejectedError: If the event's queue is full, or the wait for a slot
+                exceeded the queue timeout
+        """
+        seq = self.store.redeem(token, event_id) if token else None
+        if seq is None:
+            seq = next(self._arrivals)
+        gate = self._gates.setdefault(event_id, _EventGate())
+
+        if gate.active < self.max_concurrent and not gate.waiters:
+            gate.active += 1
+        elif len(gate.waiters) < self.max_queue:
+            await self._wait_for_slot(event_id, gate, seq)
+        else:
+            self._reject(event_id, gate, seq)
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            gate.service_time += _SERVICE_TIME_SMOOTHING * (elapsed - gate.service_time)
+            self._release(event_id, gate)
+
+    async def _wait_for_slot(self, event_id: UUID, gate: _EventGate, seq: int) -> None:
+        admitted = asyncio.get_running_loop().create_future()
+        entry = (seq, admitted)
+        heapq.heappush(gate.waiters, entry)
+        try:
+            await asyncio.wait_for(admitted, self.queue_timeout)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if admitted.done() and not admitted.cancelled():
+                # The slot was handed over as the wait ended
+                if isinstance(e, TimeoutError):
+                    return
+                self._release(event_id, gate)
+                raise
+            # A release may already have skipped past the cancelled entry
+            if entry in gate.waiters:
+                gate.waiters.remove(entry)
+                heapq.heapify(gate.waiters)
+            if isinstance(e, asyncio.CancelledError):
+                self._drop_if_idle(event_id, gate)
+                raise
+            self._reject(event_id, gate, seq)
+
+    def _release(self, event_id: UUID, gate: _EventGate) -> None:
+        # Hand the slot straight to the earliest waiter so late arrivals cannot take it
+        while gate.waiters:
+            _, admitted = heapq.heappop(gate.waiters)
+            if not admitted.done():
+                admitted.set_result(None)
+                return
+        gate.active -= 1
+        self._drop_if_idle(event_id, gate)
+
+    def _drop_if_idle(self, event_id: UUID, gate: _EventGate) -> None:
+        if gate.active == 0 and not gate.waiters:
+            self._gates.pop(event_id, None)
+
+    def _reject(self, event_id: UUID, gate: _EventGate, seq: int) -> None:
+        position = 1 + sum(1 for waiting, _ in gate.waiters if waiting < seq)
+        # Time for the slots to work through everyone ahead, at the recent pace
+        retry_after = max(
+            1, math.ceil(position / self.max_concurrent * max(gate.service_time, 0.1))
+        )
+        token = self.store.issue(event_id, seq)
+        self._drop_if_idle(event_id, gate)
+        logger.info(
+            f"Admission rejected for event {event_id}: "
+            f"position {position}, retry after {retry_after}s"
+        )
+        raise AdmissionRejectedError(position, retry_after, token)
+
+
+event_admission = AdmissionController(
+    max_concurrent=settings.ADMISSION_MAX_CONCURRENT_PER_EVENT,
+    max_queue=settings.ADMISSION_MAX_QUEUE_PER_EVENT,
+    queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    store=LocalTicketStore(settings.ADMISSION_TOKEN_TTL_SECONDS),
+)
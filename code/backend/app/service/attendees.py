@@ -14,10 +14,22 @@ from fastapi import HTTPException
 
 import app.db.attendees as attendees_db
 import app.db.events as events_db
-import app.db.users as users_db
+from app.db.db import unit_of_work
 from app.db.filters import FilterOperation
-from app.models.attendees import AttendeeBase, AttendeeCreate, AttendeeRead, PaginatedAttendees
+from app.db.pagination import next_cursor, split_page
+from app.models.attendees import (
+    AttendeeBase,
+    AttendeeCreate,
+    AttendeeRead,
+    AttendeeStatus,
+    PaginatedAttendees,
+)
+from app.models.bulk import BulkCreateRequest, BulkCreateResponse
+from app.models.events import EventRead
+from app.models.pagination import CountMode
 from app.models.patch import PatchRequest
+from app.models.users import UserBase
+from app.service.bulk import bulk_response, parse_bulk_items
 from app.service.exception_handler import handle_service_exceptions
 from app.service.filter_helper import parse_filter
 
@@ -26,84 +38,116 @@ logger = logging.getLogger(__name__)
 
 @handle_service_exceptions
 async def get_attendees_service(
-    filter_expression: list[str] | None = None, offset: int = 0, limit: int = 100
+    filter_expression: list[str] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
 ) -> PaginatedAttendees:
     filters = [parse_filter(f) for f in (filter_expression or [])]
 
-    attendees, total = await attendees_db.get_attendees_db(filters, offset, limit)
-    return PaginatedAttendees(items=attendees, total=total, offset=offset, limit=limit)
+    rows, total = await attendees_db.get_attendees_db(
+        filters, offset, limit + 1, cursor, count
+    )
+    attendees, has_more = split_page(rows, limit)
+    return PaginatedAttendees(
+        items=attendees,
+        total=total,
+        offset=offset,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor(attendees, has_more, attendees_db.ATTENDEES_KEYSET),
+    )
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def create_attendee_service(att: AttendeeCreate) -> AttendeeRead:
-    existing_events, _ = await events_db.get_events_db(
-        [FilterOperation("event_id", "eq", att.event_id)], limit=1
+    # Existence, start time, duplicate and capacity checks happen under the event's row
+    # lock in the insert itself, so concurrent RSVPs cannot oversell the event; an RSVP
+    # to a full event is waitlisted
+    # DB will default status to NULL if not provided (meaning no response yet)
+    sanitized = AttendeeCreate(
+        event_id=att.event_id,
+        user_id=att.user_id,
+        status=att.status,
     )
-    if not existing_events:
-        logger.warning(f"Event with event_id '{att.event_id}' does not exist.")
-        raise HTTPException(status_code=404, detail="No such event exists")
+    return await attendees_db.rsvp_attendee_db(sanitized)
 
-    event = existing_events[0]
 
-    event_dt = event.event_datetime
-    if event_dt.tzinfo is None:
-        event_dt = event_dt.replace(tzinfo=UTC)
+@handle_service_exceptions
+@unit_of_work()
+async def create_attendees_bulk_service(
+    request: BulkCreateRequest,
+) -> BulkCreateResponse[AttendeeRead]:
+    valid, errors = parse_bulk_items(request.items, AttendeeCreate)
+
+    event_ids = list(dict.fromkeys(att.event_id for att in valid.values()))
+    user_ids = list(dict.fromkeys(att.user_id for att in valid.values()))
+
+    # Load everything the per-item checks need in a fixed number of queries
+    events_by_id: dict[UUID, EventRead] = {}
+    registered: set[tuple[UUID, UUID]] = set()
+    if event_ids:
+        # Locked until the batch commits, so concurrent RSVPs cannot take the same seats
+        events_by_id = await events_db.lock_events_db(event_ids)
+
+        existing_attendees, _ = await attendees_db.get_attendees_db(
+            [
+                FilterOperation("event_id", "in", event_ids),
+                FilterOperation("user_id", "in", user_ids),
+            ],
+            limit=len(event_ids) * len(user_ids),
+            count=CountMode.NONE,
+        )
+        registered = {(att.event_id, att.user_id) for att in existing_attendees}
 
+    existing_users = await UserBase.find_existing_user_ids(user_ids)
+    # Seats taken so far; items past capacity are waitlisted rather than refused
+    attendee_counts = {
+        event_id: event.attendee_count or 0 for event_id, event in events_by_id.items()
+    }
     now = datetime.now(UTC)
 
-    # Check full date + time
-    if event_dt < now:
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot RSVP: The event date and time has already passed",
-        )
+    accepted: dict[int, AttendeeCreate] = {}
+    for index, att in valid.items():
+        event = events_by_id.get(att.event_id)
+        if event is None:
+            errors[index] = (404, "No such event exists")
+            continue
 
-    existing_users, _ = await users_db.get_users_db(
-        [FilterOperation("user_id", "eq", att.user_id)], limit=1
-    )
-    if not existing_users:
-        logger.warning(f"User with user_id '{att.user_id}' does not exist.")
-        raise HTTPException(status_code=404, detail="No such user exists")
-
-    existing_attendees, _ = await attendees_db.get_attendees_db(
-        [
-            FilterOperation("event_id", "eq", att.event_id),
-            FilterOperation("user_id", "eq", att.user_id),
-        ],
-        limit=1,
-    )
-    if existing_attendees:
-        logger.info(
-            "Duplicate registration blocked for "
-            f"user_id='{att.user_id}' on event_id='{att.event_id}'"
-        )
-        raise HTTPException(status_code=409, detail="User already registered for this event")
+        event_dt = event.event_datetime
+        if event_dt.tzinfo is None:
+            event_dt = event_dt.replace(tzinfo=UTC)
 
-    event = existing_events[0]
-    if event.capacity is not None:
-        _, attendee_total = await attendees_db.get_attendees_db(
-            [FilterOperation("event_id", "eq", att.event_id)],
-            limit=1,
-        )
-        if attendee_total >= event.capacity:
-            logger.info(
-                "Capacity reached for event_id='%s' (capacity=%s, current=%s)",
-                att.event_id,
-                event.capacity,
-                attendee_total,
+        if event_dt < now:
+            errors[index] = (400, "Cannot RSVP: The event date and time has already passed")
+        elif att.user_id not in existing_users:
+            errors[index] = (404, "No such user exists")
+        elif (att.event_id, att.user_id) in registered:
+            errors[index] = (409, "User already registered for this event")
+        else:
+            # Earlier items in the batch count towards duplicates and capacity
+            registered.add((att.event_id, att.user_id))
+            status = att.status
+            if status is None or status.holds_seat:
+                if event.capacity is not None and attendee_counts[att.event_id] >= (
+                    event.capacity
+                ):
+                    status = AttendeeStatus.WAITLISTED
+                else:
+                    attendee_counts[att.event_id] += 1
+            # model_construct: Waitlisted is assigned here, clients cannot request it
+            accepted[index] = AttendeeCreate.model_construct(
+                event_id=att.event_id, user_id=att.user_id, status=status
             )
-            raise HTTPException(status_code=400, detail="Event is full")
-    # DB will default status to NULL if not provided (meaning no response yet)
-    sanitized = AttendeeCreate(
-        event_id=att.event_id,
-        user_id=att.user_id,
-        status=att.status,
-    )
-    created = await attendees_db.create_attendee_db(sanitized)
-    return created
+
+    created = await attendees_db.create_attendees_db(list(accepted.values()))
+    return bulk_response(len(request.items), dict(zip(accepted, created, strict=True)), errors)
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def delete_attendee_service(attendee_id: UUID) -> AttendeeRead:
     to_delete, _ = await attendees_db.get_attendees_db(
         [FilterOperation("attendee_id", "eq", attendee_id)], limit=1
@@ -117,6 +161,7 @@ async def delete_attendee_service(attendee_id: UUID) -> AttendeeRead:
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def patch_attendees_service(request: PatchRequest) -> dict[UUID, AttendeeRead]:
     updates = await AttendeeBase.validate_patch_operations(request.patch)
 
@@ -0,0 +1,51 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from app.models.bulk import BulkCreateResponse, BulkItemResult
+from app.models.exceptions import ValidateFieldError
+
+M = TypeVar("M", bound=BaseModel)
+T = TypeVar("T", bound=BaseModel)
+
+# Item index -> (status code, detail) for items rejected from a bulk request
+BulkErrors = dict[int, tuple[int, str]]
+
+
+def parse_bulk_items(
+    items: list[dict[str, Any]], model: type[M]
+) -> tuple[dict[int, M], BulkErrors]:
+    """Validate each raw item against the create model, collecting failures by index."""
+    valid: dict[int, M] = {}
+    errors: BulkErrors = {}
+    for index, item in enumerate(items):
+        try:
+            valid[index] = model.model_validate(item)
+        except (ValidationError, ValidateFieldError) as e:
+            errors[index] = (422, str(e))
+    return valid, errors
+
+
+def bulk_response(
+    total: int, created: dict[int, T], errors: BulkErrors
+) -> BulkCreateResponse[T]:
+    """Build the per-item bulk response in request order."""
+    results: list[BulkItemResult[T]] = []
+    for index in range(total):
+        if index in created:
+            results.append(BulkItemResult(index=index, status_code=201, item=created[index]))
+        else:
+            status_code, detail = errors[index]
+            results.append(BulkItemResult(index=index, status_code=status_code, detail=detail))
+
+    return BulkCreateResponse(
+        created=len(created), failed=total - len(created), results=results
+    )
@@ -12,14 +12,34 @@ from uuid import UUID
 from fastapi import HTTPException
 
 import app.db.attendees as attendees_db
-import app.db.categories as categories_db
+import app.db.event_map as event_map_db
 import app.db.events as events_db
 import app.db.users as users_db
+from app.db.db import unit_of_work
 from app.db.filters import FilterOperation
-from app.models.events import EventBase, EventCreate, EventRead, PaginatedEvents
+from app.db.pagination import next_cursor, split_page
+from app.models.bulk import BulkCreateRequest, BulkCreateResponse
+from app.models.categories import CategoryRead
+from app.models.events import (
+    EventBase,
+    EventCreate,
+    EventOrder,
+    EventRead,
+    MapTile,
+    PaginatedEvents,
+)
+from app.models.exceptions import (
+    InvalidCursorError,
+    InvalidFilterFormatError,
+    ValidateFieldError,
+)
+from app.models.pagination import CountMode
 from app.models.patch import PatchRequest
+from app.models.picker import PickedItem, PickerResponse
+from app.models.users import UserBase
+from app.service.bulk import bulk_response, parse_bulk_items
 from app.service.exception_handler import handle_service_exceptions
-from app.service.filter_helper import parse_filter
+from app.service.filter_helper import parse_bbox, parse_filter, parse_near
 
 logger = logging.getLogger(__name__)
 
@@ -29,47 +49,94 @@ async def get_events_service(
     filter_expression: list[str] | None = None,
     offset: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
+    search: str | None = None,
+    near: str | None = None,
+    radius_km: float | None = None,
+    bbox: str | None = None,
+    order_by: EventOrder | None = None,
 ) -> PaginatedEvents:
     filters = [parse_filter(f) for f in (filter_expression or [])]
-    events, total = await events_db.get_events_db(filters, offset, limit)
-
-    if not events:
-        return PaginatedEvents(items=[], total=total, offset=offset, limit=limit)
-
-    event_ids = [event.event_id for event in events]
-    attendee_counts = await attendees_db.get_attendee_counts_for_events_db(event_ids)
-
-    events_with_counts: list[EventRead] = []
-    for event in events:
-        count = attendee_counts.get(event.event_id, 0)
-        event_with_count = event.model_copy(update={"attendee_count": count})
-        events_with_counts.append(event_with_count)
-
+    search = search.strip() if search else None
+    if radius_km is not None and not near:
+        raise InvalidFilterFormatError("radius_km requires near")
+    point = parse_near(near, radius_km) if near else None
+    box = parse_bbox(bbox) if bbox else None
+    if order_by is EventOrder.DISTANCE and not point:
+        raise InvalidFilterFormatError("order_by=distance requires near")
+    # Without one, each query keeps its own order: relevance, distance or event_datetime
+    keyset = events_db.EVENT_SORTS.get(order_by) if order_by else None
+    seek = False
+
+    # Fetch one extra row to learn whether another page exists without counting
+    if search:
+        # Ranked results have no keyset to seek on; they page by offset only
+        if cursor:
+            raise InvalidCursorError("Cursor pagination is not available with search")
+        if order_by:
+            raise InvalidFilterFormatError(
+                "order_by cannot be combined with search, which orders by relevance"
+            )
+        if point:
+            raise InvalidFilterFormatError(
+                "near cannot be combined with search, which orders by relevance; "
+                "use bbox to limit a search to an area"
+            )
+        rows, total = await events_db.search_events_db(
+            search, filters, offset, limit + 1, count, box
+        )
+    elif point or box:
+        if cursor:
+            raise InvalidCursorError("Cursor pagination is not available with near or bbox")
+        rows, total = await events_db.get_events_in_area_db(
+            filters, point, box, offset, limit + 1, count, keyset
+        )
+    else:
+        keyset = keyset or events_db.EVENTS_KEYSET
+        # Events without a price have a NULL sort key that a cursor cannot seek past
+        seek = events_db.seekable(keyset)
+        if cursor and not seek:
+            raise InvalidCursorError("Cursor pagination is not available with this order_by")
+        rows, total = await events_db.get_events_db(
+            filters, offset, limit + 1, cursor, count, keyset
+        )
+    events, has_more = split_page(rows, limit)
+
+    # attendee_count is maintained on the events rows, so no aggregation is needed
     return PaginatedEvents(
-        items=events_with_counts,
+        items=events,
         total=total,
         offset=offset,
         limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor(events, has_more, keyset) if seek and keyset else None,
     )
 
 
 @handle_service_exceptions
-async def create_event_service(event: EventCreate) -> EventRead:
-    existing_users, _ = await users_db.get_users_db(
-        [FilterOperation("user_id", "eq", event.user_id)], limit=1
-    )
-    if not existing_users:
-        logger.warning(f"User with user_id '{event.user_id}' does not exist.")
-        raise HTTPException(status_code=404, detail="No such user exists")
+async def get_map_tile_service(z: int, x: int, y: int) -> MapTile:
+    tiles = 2**z
+    if not (0 <= x < tiles and 0 <= y < tiles):
+        raise ValidateFieldError(f"Tile x and y must be between 0 and {tiles - 1} at zoom {z}")
+    clusters = await event_map_db.get_map_tile_db(z, x, y)
+    return MapTile(z=z, x=x, y=y, clusters=clusters)
+
 
-    existing_categories, _ = await categories_db.get_categories_db(
-        [FilterOperation("category_id", "eq", event.category_id)], limit=1
+@handle_service_exceptions
+async def pick_events_service(q: str, limit: int = 10) -> PickerResponse[EventRead]:
+    query = q.strip()
+    if not query:
+        raise HTTPException(status_code=400, detail="Query must not be blank")
+    picked, budget_exceeded = await events_db.pick_events_db(query, limit)
+    return PickerResponse[EventRead](
+        items=[PickedItem[EventRead](item=item, score=score) for item, score in picked],
+        budget_exceeded=budget_exceeded,
     )
-    if not existing_categories:
-        logger.warning(f"Category with category_id '{event.category_id}' does not exist.")
-        raise HTTPException(status_code=404, detail="No such category exists")
 
-    sanitized_event = EventCreate(
+
+def _sanitize_event(event: EventCreate) -> EventCreate:
+    return EventCreate(
         event_name=event.event_name.strip(),
         event_datetime=event.event_datetime,
         event_endtime=event.event_endtime,
@@ -82,10 +149,52 @@ async def create_event_service(event: EventCreate) -> EventRead:
         category_id=event.category_id,
     )
 
-    return await events_db.create_event_db(sanitized_event)
+
+@handle_service_exceptions
+@unit_of_work()
+async def create_event_service(event: EventCreate) -> EventRead:
+    existing_users, _ = await users_db.get_users_db(
+        [FilterOperation("user_id", "eq", event.user_id)], limit=1
+    )
+    if not existing_users:
+        logger.warning(f"User with user_id '{event.user_id}' does not exist.")
+        raise HTTPException(status_code=404, detail="No such user exists")
+
+    if not await CategoryRead.find_existing_category_ids([event.category_id]):
+        logger.warning(f"Category with category_id '{event.category_id}' does not exist.")
+        raise HTTPException(status_code=404, detail="No such category exists")
+
+    return await events_db.create_event_db(_sanitize_event(event))
+
+
+@handle_service_exceptions
+@unit_of_work()
+async def create_events_bulk_service(
+    request: BulkCreateRequest,
+) -> BulkCreateResponse[EventRead]:
+    valid, errors = parse_bulk_items(request.items, EventCreate)
+
+    # One existence query per referenced table for the whole batch
+    existing_users = await UserBase.find_existing_user_ids(e.user_id for e in valid.values())
+    existing_categories = await CategoryRead.find_existing_category_ids(
+        e.category_id for e in valid.values()
+    )
+
+    accepted: dict[int, EventCreate] = {}
+    for index, event in valid.items():
+        if event.user_id not in existing_users:
+            errors[index] = (404, "No such user exists")
+        elif event.category_id not in existing_categories:
+            errors[index] = (404, "No such category exists")
+        else:
+            accepted[index] = _sanitize_event(event)
+
+    created = await events_db.create_events_db(list(accepted.values()))
+    return bulk_response(len(request.items), dict(zip(accepted, created, strict=True)), errors)
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def delete_event_service(event_id: UUID) -> EventRead:
     delete_event, _ = await events_db.get_events_db(
         [FilterOperation("event_id", "eq", event_id)], limit=1
@@ -99,10 +208,20 @@ async def delete_event_service(event_id: UUID) -> EventRead:
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def patch_events_service(request: PatchRequest) -> dict[UUID, EventRead]:
     validated_updates = await EventBase.validate_patch_operations(request.patch)
 
     result = await events_db.batch_update_events_db(validated_updates)
 
+    # Seats added by a capacity increase go to the waitlist straight away
+    grown = [event_id for event_id, data in validated_updates.items() if "capacity" in data]
+    if grown:
+        await attendees_db.promote_waitlisted_db(grown)
+        refreshed, _ = await events_db.get_events_db(
+            [FilterOperation("event_id", "in", grown)], limit=len(grown), count=CountMode.NONE
+        )
+        result.update({event.event_id: event for event in refreshed})
+
     logger.info(f"Successfully updated {len(result)} events in batch operation")
     return result
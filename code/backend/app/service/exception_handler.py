@@ -17,9 +17,11 @@ from pydantic import ValidationError
 from app.models.exceptions import (
     DuplicateResourceError,
     InvalidColumnError,
+    InvalidCursorError,
     InvalidFilterFormatError,
     InvalidPathError,
     NotFoundError,
+    RsvpRejectedError,
     UnsupportedPatchOperationError,
     ValidateFieldError,
 )
@@ -40,8 +42,9 @@ def handle_service_exceptions(
     unexpected exceptions.
 
     Exception Mapping:
-    - InvalidFilterFormatError, InvalidColumnError -> 400 Bad Request
+    - InvalidFilterFormatError, InvalidColumnError, InvalidCursorError -> 400 Bad Request
     - UnsupportedPatchOperationError, InvalidPathError -> 400 Bad Request
+    - RsvpRejectedError -> 400 Bad Request
     - NotFoundError -> 404 Not Found
     - DuplicateResourceError -> 409 Conflict
     - ValidateFieldError, ValidationError -> 422 Unprocessable Entity
@@ -69,12 +72,18 @@ def handle_service_exceptions(
         except InvalidColumnError as e:
             logger.error(f"Invalid column name in {func.__name__}: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e)) from e
+        except InvalidCursorError as e:
+            logger.error(f"Invalid pagination cursor in {func.__name__}: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e)) from e
         except UnsupportedPatchOperationError as e:
             logger.error(f"Unsupported patch operation in {func.__name__}: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e)) from e
         except InvalidPathError as e:
             logger.error(f"Invalid path in patch operation in {func.__name__}: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e)) from e
+        except RsvpRejectedError as e:
+            logger.info(f"RSVP rejected in {func.__name__}: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e)) from e
         except NotFoundError as e:
             logger.error(f"Resource not found in {func.__name__}: {str(e)}")
             raise HTTPException(status_code=404, detail=str(e)) from e
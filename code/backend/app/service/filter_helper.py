@@ -6,12 +6,17 @@ Human code: 10%
 Framework-generated code: 0%
 """
 
+import math
 from uuid import UUID
 
 from app.db.filters import FilterOperation
+from app.db.geo import BoundingBox, Near
 from app.models.exceptions import InvalidFilterFormatError
 
-ID_FIELDS = {"user_id", "event_id", "category_id", "attendee_id"}
+ID_FIELDS = {"user_id", "event_id", "category_id", "attendee_id", "invitation_id"}
+
+# Upper bound on values in one "in" filter, so a single request cannot bind unbounded arrays
+MAX_IN_VALUES = 500
 
 
 def parse_filter(filter_str: str) -> FilterOperation:
@@ -24,11 +29,67 @@ def parse_filter(filter_str: str) -> FilterOperation:
 
     field, op, value = parts
 
+    if op == "in":
+        values = [item.strip() for item in value.split(",") if item.strip()]
+        if not values:
+            raise InvalidFilterFormatError(
+                f"Filter 'in' requires at least one value for {field}"
+            )
+        if len(values) > MAX_IN_VALUES:
+            raise InvalidFilterFormatError(
+                f"Filter 'in' accepts at most {MAX_IN_VALUES} values for {field}"
+            )
+        return FilterOperation(
+            field=field, op=op, value=[_convert_value(field, v) for v in values]
+        )
+
+    return FilterOperation(field=field, op=op, value=_convert_value(field, value))
+
+
+def _convert_value(field: str, value: str) -> str | UUID:
     # Convert value to appropriate type if needed (e.g., UUID for user_id)
     if field in ID_FIELDS:
         try:
-            value = UUID(value)
+            return UUID(value)
         except ValueError as e:
             raise InvalidFilterFormatError(f"Invalid UUID format for {field}: {value}") from e
+    return value
+
+
+def _parse_degrees(name: str, value: str, count: int) -> list[float]:
+    parts = value.split(",")
+    if len(parts) != count:
+        raise InvalidFilterFormatError(
+            f"Invalid {name}: expected {count} comma-separated numbers"
+        )
+    try:
+        numbers = [float(part) for part in parts]
+    except ValueError as e:
+        raise InvalidFilterFormatError(f"Invalid {name}: {value}") from e
+    if not all(math.isfinite(number) for number in numbers):
+        raise InvalidFilterFormatError(f"Invalid {name}: {value}")
+    return numbers
+
+
+def _check_range(name: str, latitude: float, longitude: float) -> None:
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise InvalidFilterFormatError(
+            f"Invalid {name}: latitude must be within ±90 and longitude within ±180"
+        )
+
+
+def parse_near(near: str, radius_km: float | None = None) -> Near:
+    """Parse a 'lat,lon' point into a Near."""
+    latitude, longitude = _parse_degrees("near", near, 2)
+    _check_range("near", latitude, longitude)
+    return Near(latitude=latitude, longitude=longitude, radius_km=radius_km)
+
 
-    return FilterOperation(field=field, op=op, value=value)
+def parse_bbox(bbox: str) -> BoundingBox:
+    """Parse a 'west,south,east,north' box, in degrees, into a BoundingBox."""
+    west, south, east, north = _parse_degrees("bbox", bbox, 4)
+    _check_range("bbox", south, west)
+    _check_range("bbox", north, east)
+    if south > north:
+        raise InvalidFilterFormatError("Invalid bbox: south must not be above north")
+    return BoundingBox(west=west, south=south, east=east, north=north)
@@ -16,7 +16,10 @@ import app.db.events as events_db
 import app.db.invitations as db_invitations
 import app.db.users as users_db
 from app.config import settings
+from app.db.db import unit_of_work
 from app.db.filters import FilterOperation
+from app.db.pagination import next_cursor, split_page
+from app.models.bulk import BulkCreateRequest, BulkCreateResponse
 from app.models.events import EventBase
 from app.models.invitations import (
     InvitationsBase,
@@ -27,9 +30,11 @@ from app.models.invitations import (
     InvitationStatus,
     PaginatedInvitations,
 )
+from app.models.pagination import CountMode
 from app.models.patch import PatchRequest
 from app.models.users import UserBase
 from app.service import token_helpers
+from app.service.bulk import bulk_response, parse_bulk_items
 from app.service.exception_handler import handle_service_exceptions
 from app.service.filter_helper import parse_filter
 
@@ -61,11 +66,18 @@ async def check_and_expire_invitation(invitation: InvitationsReadDB) -> Invitati
 
 @handle_service_exceptions
 async def get_invitations_service(
-    filter_expression: list[str] | None = None, offset: int = 0, limit: int = 100
+    filter_expression: list[str] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
 ) -> PaginatedInvitations:
     filters = [parse_filter(f) for f in (filter_expression or [])]
 
-    invitations, total = await db_invitations.get_invitations_db(filters, offset, limit)
+    rows, total = await db_invitations.get_invitations_db(
+        filters, offset, limit + 1, cursor, count
+    )
+    invitations, has_more = split_page(rows, limit)
 
     updated_invitations: list[InvitationsReadDB] = []
     for invitation in invitations:
@@ -73,11 +85,17 @@ async def get_invitations_service(
         updated_invitations.append(updated_invitation)
 
     return PaginatedInvitations(
-        items=updated_invitations, total=total, offset=offset, limit=limit
+        items=updated_invitations,
+        total=total,
+        offset=offset,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor(invitations, has_more, db_invitations.INVITATIONS_KEYSET),
     )
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def create_invitation(invitation: InvitationsCreate) -> InvitationsRead:
     await UserBase.validate_user_exists(invitation.user_id)
     await EventBase.validate_event_exists(invitation.event_id)
@@ -111,6 +129,66 @@ async def create_invitation(invitation: InvitationsCreate) -> InvitationsRead:
     return InvitationsRead.model_validate(invitation_dict)
 
 
+@handle_service_exceptions
+@unit_of_work()
+async def create_invitations_bulk_service(
+    request: BulkCreateRequest,
+) -> BulkCreateResponse[InvitationsRead]:
+    valid, errors = parse_bulk_items(request.items, InvitationsCreate)
+
+    event_ids = list(dict.fromkeys(invitation.event_id for invitation in valid.values()))
+    user_ids = list(dict.fromkeys(invitation.user_id for invitation in valid.values()))
+
+    existing_users = await UserBase.find_existing_user_ids(user_ids)
+    existing_events = await EventBase.find_existing_event_ids(event_ids)
+
+    active: set[tuple[UUID, UUID]] = set()
+    if event_ids:
+        active_invitations, _ = await db_invitations.get_invitations_db(
+            [
+                FilterOperation("event_id", "in", event_ids),
+                FilterOperation("user_id", "in", user_ids),
+                FilterOperation("status", "eq", InvitationStatus.ACTIVE.value),
+            ],
+            limit=len(event_ids) * len(user_ids),
+            count=CountMode.NONE,
+        )
+        active = {
+            (invitation.event_id, invitation.user_id) for invitation in active_invitations
+        }
+
+    accepted: dict[int, InvitationsCreate] = {}
+    tokens: dict[int, str] = {}
+    for index, invitation in valid.items():
+        key = (invitation.event_id, invitation.user_id)
+        if invitation.user_id not in existing_users:
+            errors[index] = (404, f"User {invitation.user_id} does not exist")
+        elif invitation.event_id not in existing_events:
+            errors[index] = (404, f"Event {invitation.event_id} does not exist")
+        elif key in active:
+            errors[index] = (409, "An active invitation already exists for this event")
+        else:
+            active.add(key)
+            accepted[index] = invitation
+            tokens[index] = token_helpers.generate_token()
+
+    created = await db_invitations.create_invitations_db(
+        [
+            (invitation, token_helpers.hash_token(tokens[index]))
+            for index, invitation in accepted.items()
+        ]
+    )
+
+    results: dict[int, InvitationsRead] = {}
+    for index, new_invitation in zip(accepted, created, strict=True):
+        invitation_dict = new_invitation.model_dump()
+        invitation_dict["token"] = tokens[index]
+        invitation_dict["invitation_link"] = f"{settings.FRONTEND_URL}/invite/{tokens[index]}"
+        results[index] = InvitationsRead.model_validate(invitation_dict)
+
+    return bulk_response(len(request.items), results, errors)
+
+
 @handle_service_exceptions
 async def get_invitation_by_token(token: str) -> InvitationsDetailResponse:
     token_hash = token_helpers.hash_token(token)
@@ -154,6 +232,7 @@ async def get_invitation_by_token(token: str) -> InvitationsDetailResponse:
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def patch_invitations_service(
     request: PatchRequest,
 ) -> dict[UUID, InvitationsReadDB]:
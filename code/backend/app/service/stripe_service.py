@@ -7,19 +7,38 @@ Framework-generated code: 0%
 """
 
 import logging
+import math
 import os
+from datetime import UTC, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 
 import stripe
 from fastapi import HTTPException
 
+import app.db.attendees as attendees_db
 import app.db.payments as payments_db
 from app.config import settings
-from app.models.payments import CheckoutRequest, CheckoutResponse, PaymentCreate, PaymentStatus
+from app.models.attendees import AttendeeCreate, AttendeeStatus
+from app.models.exceptions import DuplicateResourceError, NotFoundError, RsvpRejectedError
+from app.models.payments import (
+    CheckoutRequest,
+    CheckoutResponse,
+    PaymentCreate,
+    PaymentRead,
+    PaymentStatus,
+)
 
 logger = logging.getLogger(__name__)
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+# Stripe rejects sessions that expire less than 30 minutes after it creates them; the
+# margin covers the time between computing expires_at and Stripe receiving the request
+_STRIPE_MIN_SESSION_LIFETIME = timedelta(minutes=30)
+_SESSION_EXPIRY_MARGIN = timedelta(seconds=60)
+# The hold outlives the session, so a payment completed as the session closes still
+# finds its seat held
+_HOLD_GRACE = timedelta(minutes=5)
+
 
 # ---- helpers ----
 # Stripe expects amounts in the smallest currency unit (e.g. cents).
@@ -39,6 +58,8 @@ def create_checkout_session(
     success_url: str,
     cancel_url: str,
     customer_email: str | None = None,
+    payment_id: str | None = None,
+    expires_at: int | None = None,
 ) -> stripe.checkout.Session:
     try:
         session = stripe.checkout.Session.create(
@@ -57,7 +78,14 @@ def create_checkout_session(
             success_url=success_url,
             cancel_url=cancel_url,
             customer_email=customer_email,
-            metadata={"event_id": str(event_id), "user_id": str(user_id)},
+            metadata={
+                "event_id": str(event_id),
+                "user_id": str(user_id),
+                "payment_id": str(payment_id),
+            },
+            # The session closes when the seat hold lapses, so nobody pays for a seat
+            # that was already given away
+            expires_at=expires_at,
         )
         logger.info("Stripe checkout session created: %s", session.id)
         return session
@@ -66,6 +94,47 @@ def create_checkout_session(
         raise
 
 
+async def _release_failed_checkout(pending: PaymentRead) -> None:
+    # No session to pay through, so the held seat goes back
+    await attendees_db.release_hold_db(pending.payment_id)
+    await payments_db.set_status_by_payment_id(pending.payment_id, status=PaymentStatus.failed)
+
+
+async def _seat_paid_attendee(payment: PaymentRead) -> None:
+    """Register the payer, using the seat held for their checkout when it is still there."""
+    attendee = await attendees_db.convert_hold_db(
+        payment.payment_id, payment.event_id, payment.user_id
+    )
+    if attendee is not None:
+        return
+
+    # The hold lapsed before the payment completed: take a seat like any RSVP would
+    try:
+        attendee = await attendees_db.rsvp_attendee_db(
+            AttendeeCreate(
+                event_id=payment.event_id,
+                user_id=payment.user_id,
+                status=AttendeeStatus.RSVPED,
+            )
+        )
+        logger.warning(
+            "Seat hold for payment %s had lapsed; attendee registered as %s",
+            payment.payment_id,
+            attendee.status.value if attendee.status else None,
+        )
+    except DuplicateResourceError:
+        pass
+    except (NotFoundError, RsvpRejectedError) as err:
+        logger.error("Paid payment %s could not be seated: %s", payment.payment_id, err)
+
+
+def _session_lifetime() -> timedelta:
+    return max(
+        timedelta(minutes=settings.SEAT_HOLD_MINUTES),
+        _STRIPE_MIN_SESSION_LIFETIME + _SESSION_EXPIRY_MARGIN,
+    )
+
+
 # high-level: our app's payment flow, main "service" API
 async def create_checkout_session_for_payment(data: CheckoutRequest) -> CheckoutResponse:
     dummy_mode = not settings.STRIPE_SECRET_KEY and os.getenv("ENABLE_DUMMY_STRIPE") == "1"
@@ -97,13 +166,26 @@ async def create_checkout_session_for_payment(data: CheckoutRequest) -> Checkout
         )
     )
 
-    # 2) Build redirect URLs using the payment_id
+    # 2) Hold a seat for as long as the checkout session stays open
+    hold_expires_at = datetime.now(UTC) + _session_lifetime() + _HOLD_GRACE
+    try:
+        await attendees_db.hold_seat_db(
+            pending.payment_id, data.event_id, data.user_id, hold_expires_at
+        )
+    except (NotFoundError, RsvpRejectedError, DuplicateResourceError) as err:
+        await payments_db.set_status_by_payment_id(
+            pending.payment_id, status=PaymentStatus.canceled
+        )
+        status_code = {NotFoundError: 404, RsvpRejectedError: 400}.get(type(err), 409)
+        raise HTTPException(status_code=status_code, detail=str(err)) from err
+
+    # 3) Build redirect URLs using the payment_id
     success_url = (
         f"{settings.FRONTEND_BASE_URL}/payment/success?payment_id={pending.payment_id}"
     )
     cancel_url = f"{settings.FRONTEND_BASE_URL}/payment/cancel?payment_id={pending.payment_id}"
 
-    # 3) Create Stripe Checkout Session (convert dollars -> cents)
+    # 4) Create Stripe Checkout Session (convert dollars -> cents)
     try:
         session = create_checkout_session(
             amount_cents=usd_to_cents(data.amount_usd),
@@ -112,15 +194,19 @@ async def create_checkout_session_for_payment(data: CheckoutRequest) -> Checkout
             success_url=success_url,
             cancel_url=cancel_url,
             customer_email=data.email,
+            payment_id=str(pending.payment_id),
+            # Measured from now, after the hold round trip, and rounded up
+            expires_at=math.ceil((datetime.now(UTC) + _session_lifetime()).timestamp()),
         )
 
-        # 4) Save the Stripe checkout session ID on our payment record
+        # 5) Save the Stripe checkout session ID on our payment record
         await payments_db.set_checkout_id(pending.payment_id, session.id)
 
         # Return a model instance or dict; both work with response_model
         return CheckoutResponse(checkout_url=session.url)
 
     except stripe.error.InvalidRequestError as err:
+        await _release_failed_checkout(pending)
         # Bad parameters sent to Stripe (amount, currency, etc.)
         raise HTTPException(
             status_code=400,
@@ -128,6 +214,7 @@ async def create_checkout_session_for_payment(data: CheckoutRequest) -> Checkout
         ) from err
 
     except stripe.error.AuthenticationError as err:
+        await _release_failed_checkout(pending)
         # Misconfigured API key / Stripe account
         raise HTTPException(
             status_code=500,
@@ -135,6 +222,7 @@ async def create_checkout_session_for_payment(data: CheckoutRequest) -> Checkout
         ) from err
 
     except stripe.error.StripeError as err:
+        await _release_failed_checkout(pending)
         # Generic Stripe error (network, rate limit, etc.)
         raise HTTPException(
             status_code=400,
@@ -142,6 +230,7 @@ async def create_checkout_session_for_payment(data: CheckoutRequest) -> Checkout
         ) from err
 
     except Exception as err:
+        await _release_failed_checkout(pending)
         # Any unexpected error in the code
         raise HTTPException(
             status_code=500,
@@ -174,19 +263,29 @@ async def process_webhook_event(payload: bytes, sig_header: str | None) -> dict:
 
     # 2) Handle successful checkout session
     if event_type == "checkout.session.completed":
-        await payments_db.set_status_by_checkout_session(
+        payment = await payments_db.set_status_by_checkout_session(
             checkout_id=obj["id"],
             status=PaymentStatus.succeeded,
             payment_intent_id=obj.get("payment_intent"),
         )
-        # (optional) auto-register attendee using obj["metadata"] (event_id, user_id)
+        # Turn the seat held during checkout into an attendee
+        if payment is not None:
+            await _seat_paid_attendee(payment)
+
+    # 3) Expired session: the seat held for it goes back to the event
+    elif event_type == "checkout.session.expired":
+        payment = await payments_db.set_status_by_checkout_session(
+            checkout_id=obj["id"], status=PaymentStatus.canceled
+        )
+        if payment is not None:
+            await attendees_db.release_hold_db(payment.payment_id)
 
-    # 3) Optional: handle failed/expired cases
-    elif event_type in ("payment_intent.payment_failed", "checkout.session.expired"):
+    # 4) Optional: handle failed cases
+    elif event_type == "payment_intent.payment_failed":
+        # The customer can retry within the same session, so its seat hold is kept
         _pi_id = obj.get("id") or obj.get("payment_intent")  # placeholder for future extension
-        # Currently we only save by checkout_id; extend DB updates here if needed.
 
-    # 4) Acknowledge event so Stripe doesn't retry
+    # 5) Acknowledge event so Stripe doesn't retry
     return {"received": True}
 
 
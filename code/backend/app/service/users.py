@@ -7,35 +7,146 @@ Framework-generated code: 0%
 """
 
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from uuid import UUID
 
 from fastapi import HTTPException
 
+import app.db.attendees as attendees_db
 import app.db.users as users_db
+from app.auth import ClerkTokenPayload
+from app.config import settings
+from app.db.db import after_commit, unit_of_work
 from app.db.filters import FilterOperation
+from app.db.pagination import next_cursor, split_page
+from app.models.bulk import BulkCreateRequest, BulkCreateResponse
+from app.models.pagination import CountMode
 from app.models.patch import PatchRequest
+from app.models.picker import PickedItem, PickerResponse
 from app.models.users import PaginatedUsers, UserBase, UserCreate, UserRead
+from app.service.bulk import bulk_response, parse_bulk_items
 from app.service.exception_handler import handle_service_exceptions
 from app.service.filter_helper import parse_filter
 
 logger = logging.getLogger(__name__)
 
 
+class CurrentUserCache:
+    """
+    Users rows resolved for signed-in Clerk accounts, keyed by the token's `sub`.
+
+    Patching or deleting a user drops its entries in this process; entries also expire
+    after CURRENT_USER_CACHE_TTL_SECONDS, which bounds how long another API worker can
+    serve a stale copy. The least recently used entry is evicted once
+    CURRENT_USER_CACHE_SIZE accounts are cached.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[UserRead, float]] = OrderedDict()
+        # Bumped by every invalidation so a lookup that raced one does not cache its row
+        self.generation = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+
+    def get(self, sub: str) -> UserRead | None:
+        entry = self._entries.get(sub)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[sub]
+            return None
+        self._entries.move_to_end(sub)
+        return user
+
+    def put(self, sub: str, user: UserRead, generation: int) -> None:
+        if generation != self.generation:
+            return
+        expires_at = time.monotonic() + settings.CURRENT_USER_CACHE_TTL_SECONDS
+        self._entries[sub] = (user, expires_at)
+        self._entries.move_to_end(sub)
+        while len(self._entries) > settings.CURRENT_USER_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        stale = set(user_ids)
+        self.generation += 1
+        for sub in [sub for sub, (user, _) in self._entries.items() if user.user_id in stale]:
+            del self._entries[sub]
+
+
+current_users = CurrentUserCache()
+
+
+@handle_service_exceptions
+async def get_current_user_service(account: ClerkTokenPayload) -> UserRead:
+    """Resolve the signed-in Clerk account to its Users row, by the token's email."""
+    cached = current_users.get(account.sub)
+    if cached is not None:
+        return cached
+
+    generation = current_users.generation
+    email = account.email.strip().lower()
+    found: list[UserRead] = []
+    if email:
+        found, _ = await users_db.get_users_db(
+            [FilterOperation("email", "eq", email)], limit=1, count=CountMode.NONE
+        )
+    if not found:
+        logger.warning(f"No user found for Clerk account sub='{account.sub}'")
+        raise HTTPException(status_code=404, detail="No user is linked to this account")
+
+    current_users.put(account.sub, found[0], generation)
+    return found[0]
+
+
+async def resolve_user_id(user_id: UUID | None, account: ClerkTokenPayload) -> UUID:
+    """Return `user_id`, or the signed-in user's id when the request left it out."""
+    if user_id is not None:
+        return user_id
+    return (await get_current_user_service(account)).user_id
+
+
 @handle_service_exceptions
 async def get_users_service(
-    filter_expression: list[str] | None = None, offset: int = 0, limit: int = 100
+    filter_expression: list[str] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
 ) -> PaginatedUsers:
     filters = [parse_filter(f) for f in (filter_expression or [])]
 
-    users, total = await users_db.get_users_db(filters, offset, limit)
-    return PaginatedUsers(items=users, total=total, offset=offset, limit=limit)
+    rows, total = await users_db.get_users_db(filters, offset, limit + 1, cursor, count)
+    users, has_more = split_page(rows, limit)
+    return PaginatedUsers(
+        items=users,
+        total=total,
+        offset=offset,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor(users, has_more, users_db.USERS_KEYSET),
+    )
 
 
 @handle_service_exceptions
-async def create_user_service(user: UserCreate) -> UserRead:
-    await UserBase.validate_email_uniqueness(user.email)
+async def pick_users_service(q: str, limit: int = 10) -> PickerResponse[UserRead]:
+    query = q.strip()
+    if not query:
+        raise HTTPException(status_code=400, detail="Query must not be blank")
+    picked, budget_exceeded = await users_db.pick_users_db(query, limit)
+    return PickerResponse[UserRead](
+        items=[PickedItem[UserRead](item=item, score=score) for item, score in picked],
+        budget_exceeded=budget_exceeded,
+    )
 
-    sanitized_user = UserCreate(
+
+def _sanitize_user(user: UserCreate) -> UserCreate:
+    return UserCreate(
         first_name=user.first_name.strip(),
         last_name=user.last_name.strip(),
         email=user.email.strip().lower(),
@@ -43,10 +154,46 @@ async def create_user_service(user: UserCreate) -> UserRead:
         color=user.color.strip().lower() if user.color and user.color.strip() else None,
     )
 
-    return await users_db.create_user_db(sanitized_user)
+
+@handle_service_exceptions
+@unit_of_work()
+async def create_user_service(user: UserCreate) -> UserRead:
+    await UserBase.validate_email_uniqueness(user.email)
+
+    return await users_db.create_user_db(_sanitize_user(user))
+
+
+@handle_service_exceptions
+@unit_of_work()
+async def create_users_bulk_service(
+    request: BulkCreateRequest,
+) -> BulkCreateResponse[UserRead]:
+    valid, errors = parse_bulk_items(request.items, UserCreate)
+
+    sanitized = {index: _sanitize_user(user) for index, user in valid.items()}
+    emails = list(dict.fromkeys(user.email for user in sanitized.values()))
+    taken: set[str] = set()
+    if emails:
+        existing_users, _ = await users_db.get_users_db(
+            [FilterOperation("email", "in", emails)], limit=len(emails), count=CountMode.NONE
+        )
+        taken = {user.email for user in existing_users}
+
+    accepted: dict[int, UserCreate] = {}
+    for index, user in sanitized.items():
+        if user.email in taken:
+            errors[index] = (409, f"Email {user.email} is already in use by another user")
+            continue
+        # Later items in the batch cannot reuse an email claimed by an earlier one
+        taken.add(user.email)
+        accepted[index] = user
+
+    created = await users_db.create_users_db(list(accepted.values()))
+    return bulk_response(len(request.items), dict(zip(accepted, created, strict=True)), errors)
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def delete_user_service(user_id: UUID) -> UserRead:
     delete_user, _ = await users_db.get_users_db(
         [FilterOperation("user_id", "eq", user_id)], limit=1
@@ -55,15 +202,21 @@ async def delete_user_service(user_id: UUID) -> UserRead:
         logger.warning(f"Attempted to delete non-existent user with ID: {user_id}")
         raise HTTPException(status_code=404, detail="User not found")
 
+    # The attendee rows go with the user; their events' counters must give the seats back
+    await attendees_db.release_user_seats_db(user_id)
     await users_db.delete_user_db(user_id)
+    # Another request could otherwise cache the row again before the delete commits
+    after_commit(lambda: current_users.invalidate([user_id]))
     return delete_user[0]
 
 
 @handle_service_exceptions
+@unit_of_work()
 async def patch_users_service(request: PatchRequest) -> dict[UUID, UserRead]:
     updates = await UserBase.validate_patch_operations(request.patch)
 
     result = await users_db.batch_update_users_db(updates)
+    after_commit(lambda: current_users.invalidate(result))
 
     logger.info(f"Successfully updated {len(result)} users in batch operation")
     return result
@@ -0,0 +1,153 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Event-loop lag under a burst of fresh Clerk tokens.
+
+Signs `--tokens` distinct RS256 tokens with a throwaway key served from a local JWKS
+endpoint, then verifies them all at once twice: first checking each signature inline
+on the event loop (how verify_clerk_token used to work), then through
+verify_clerk_token, which checks signatures on its thread pool. A probe task sleeps in
+a tight loop alongside and records how late each wake-up came. Needs no database.
+
+    uv run python -m benchmarks.auth_burst --tokens 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app import auth
+from app.config import settings
+
+_ISSUER = "https://clerk.benchmark.local"
+_AUDIENCE = "benchmark"
+_PROBE_SECONDS = 0.002
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _serve_jwks(key: rsa.RSAPrivateKey) -> ThreadingHTTPServer:
+    jwk = {**json.loads(RSAAlgorithm.to_jwk(key.public_key())), "kid": "bench", "use": "sig"}
+    body = json.dumps({"keys": [jwk]}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+async def _probe(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_PROBE_SECONDS)
+        samples.append(max(0.0, time.perf_counter() - started - _PROBE_SECONDS))
+
+
+async def _verify_inline(token: str) -> None:
+    signing_key = await auth.jwks_cache.get_signing_key_from_jwt(token)
+    jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=["RS256"],
+        issuer=settings.CLERK_ISSUER,
+        options={"verify_exp": True, "verify_aud": False, "verify_iss": True},
+    )
+
+
+async def _burst(label: str, verify: Any, tokens: list[str], concurrency: int) -> None:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(token: str) -> None:
+        async with gate:
+            await verify(token)
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(samples, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(one(token) for token in tokens))
+    wall = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    lag = [sample * 1000 for sample in samples] or [0.0]
+    print(
+        f"{label:<10} throughput={len(tokens) / wall:.0f} tokens/s "
+        f"loop lag ms: p50={statistics.median(lag):.2f} p99={_percentile(lag, 99):.2f} "
+        f"max={max(lag):.2f} probes={len(samples)}"
+    )
+
+
+async def run(count: int, concurrency: int) -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    httpd = _serve_jwks(key)
+    settings.CLERK_JWKS_URL = f"http://127.0.0.1:{httpd.server_port}/jwks.json"
+    settings.CLERK_ISSUER = _ISSUER
+    settings.CLERK_JWT_AUDIENCE = _AUDIENCE
+    now = int(time.time())
+    tokens = [
+        jwt.encode(
+            {
+                "sub": f"user_{i}",
+                "iss": _ISSUER,
+                "aud": _AUDIENCE,
+                "iat": now,
+                "exp": now + 3600,
+            },
+            key,
+            algorithm="RS256",
+            headers={"kid": "bench"},
+        )
+        for i in range(count)
+    ]
+
+    try:
+        await auth.jwks_cache.refresh()
+        print(
+            f"tokens={count} concurrency={concurrency} threads={settings.CLERK_VERIFY_THREADS}"
+        )
+        await _burst("inline", _verify_inline, tokens, concurrency)
+        # Every token is new to the verified-token cache, so each one is a full check
+        auth.verified_tokens.clear()
+        await _burst("offloaded", auth.verify_clerk_token, tokens, concurrency)
+    finally:
+        httpd.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Event-loop lag under a burst of new tokens")
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.tokens, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+
+Flash-load benchmark for POST /attendees.
+
+Seeds one future event with a fixed capacity and a pool of users, then fires concurrent
+RSVPs through create_attendee_service against the configured Postgres database. It checks
+that exactly `capacity` RSVPs are seated, that the rest are waitlisted, and reports
+latency percentiles. The seeded rows are deleted afterwards.
+
+    uv run python -m benchmarks.rsvp_flash_load --capacity 100 --requests 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import UTC, date, datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select
+
+import app.db.attendees as attendees_db
+import app.db.categories as categories_db
+import app.db.events as events_db
+import app.db.users as users_db
+from app.db.db import engine
+from app.models.attendees import AttendeeCreate, AttendeeStatus
+from app.models.events import EventCreate
+from app.models.users import UserCreate
+from app.service.attendees import create_attendee_service
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _rsvp(att: AttendeeCreate, gate: asyncio.Semaphore) -> tuple[float, str]:
+    async with gate:
+        started = time.perf_counter()
+        try:
+            created = await create_attendee_service(att)
+            outcome = "waitlisted" if created.status is AttendeeStatus.WAITLISTED else "seated"
+        except HTTPException as e:
+            outcome = str(e.status_code)
+        return time.perf_counter() - started, outcome
+
+
+async def run(capacity: int, requests: int, concurrency: int) -> bool:
+    run_id = f"{time.time_ns()}"
+    category_id = await categories_db.create_category_db(f"bench-{run_id}")
+    users = await users_db.create_users_db(
+        [
+            UserCreate(
+                first_name="Bench",
+                last_name=f"User{i}",
+                email=f"bench-{run_id}-{i}@example.com",
+                date_of_birth=date(1990, 1, 1),
+            )
+            for i in range(requests)
+        ]
+    )
+    start = datetime.now(UTC) + timedelta(days=1)
+    event = await events_db.create_event_db(
+        EventCreate(
+            event_name=f"Flash sale {run_id}",
+            event_datetime=start,
+            event_endtime=start + timedelta(hours=2),
+            event_location="Benchmark",
+            capacity=capacity,
+            price_field=0,
+            user_id=users[0].user_id,
+            category_id=category_id,
+        )
+    )
+
+    try:
+        gate = asyncio.Semaphore(concurrency)
+        wall_started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                _rsvp(
+                    AttendeeCreate(
+                        event_id=event.event_id,
+                        user_id=user.user_id,
+                        status=AttendeeStatus.RSVPED,
+                    ),
+                    gate,
+                )
+                for user in users
+            )
+        )
+        wall = time.perf_counter() - wall_started
+
+        async with engine.connect() as conn:
+            seated = await conn.scalar(
+                select(func.count()).where(
+                    attendees_db.eventattendees.c.event_id == event.event_id,
+                    attendees_db.seat_holders,
+                )
+            )
+
+        latencies = [latency * 1000 for latency, _ in results]
+        outcomes = [outcome for _, outcome in results]
+        created = outcomes.count("seated")
+        waitlisted = outcomes.count("waitlisted")
+
+        print(f"requests={requests} concurrency={concurrency} capacity={capacity}")
+        print(
+            f"seated={created} waitlisted={waitlisted} other={requests - created - waitlisted}"
+        )
+        print(f"seated rows={seated} throughput={requests / wall:.0f} req/s")
+        print(
+            f"latency ms: p50={statistics.median(latencies):.1f} "
+            f"p95={_percentile(latencies, 95):.1f} p99={_percentile(latencies, 99):.1f} "
+            f"max={max(latencies):.1f}"
+        )
+
+        expected = min(capacity, requests)
+        ok = seated == created == expected and waitlisted == requests - expected
+        print("no oversell" if ok else "OVERSOLD OR MISCOUNTED")
+        return ok
+    finally:
+        async with engine.begin() as conn:
+            # Deleting the event and users cascades to the attendee rows
+            await conn.execute(
+                delete(events_db.events).where(events_db.events.c.event_id == event.event_id)
+            )
+            await conn.execute(
+                delete(users_db.users).where(
+                    users_db.users.c.user_id.in_([user.user_id for user in users])
+                )
+            )
+            await conn.execute(
+                delete(categories_db.categories).where(
+                    categories_db.categories.c.category_id == category_id
+                )
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flash-load benchmark for POST /attendees")
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    ok = asyncio.run(run(args.capacity, args.requests, args.concurrency))
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
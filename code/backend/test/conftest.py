@@ -2,18 +2,30 @@
 AI-generated code: 100%
 """
 
+import json
 import os
 import sys
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+import jwt  # noqa: E402
 import pytest  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+from jwt.algorithms import RSAAlgorithm  # noqa: E402
 
+from app import auth  # noqa: E402
 from app.auth import ClerkTokenPayload, get_current_user  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.db import categories as categories_db  # noqa: E402
 from app.main import event_manager_app  # noqa: E402
+from app.service import users as users_service  # noqa: E402
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -41,3 +53,75 @@ def override_auth_dependency():
     event_manager_app.dependency_overrides[get_current_user] = _fake_user
     yield
     event_manager_app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture(autouse=True)
+def reset_in_process_caches() -> Generator[None, None, None]:
+    """Each test starts from a fresh database, so cached rows must not leak between tests."""
+    users_service.current_users.clear()
+    categories_db.catalog.clear()
+    yield
+    users_service.current_users.clear()
+    categories_db.catalog.clear()
+
+
+class JwksServer:
+    """Local stand-in for Clerk's JWKS endpoint, counting the fetches it serves."""
+
+    def __init__(self) -> None:
+        self.signing_keys: dict[str, rsa.RSAPrivateKey] = {}
+        self.fetches = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.fetches += 1
+                body = json.dumps(server.jwks()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/.well-known/jwks.json"
+        threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    def add_key(self, kid: str) -> None:
+        self.signing_keys[kid] = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def jwks(self) -> dict[str, Any]:
+        keys = []
+        for kid, key in self.signing_keys.items():
+            jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+            keys.append({**jwk, "kid": kid, "use": "sig", "alg": "RS256"})
+        return {"keys": keys}
+
+    def sign(self, payload: dict[str, Any], kid: str = "key-1") -> str:
+        return jwt.encode(
+            payload, self.signing_keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def jwks_server(monkeypatch: pytest.MonkeyPatch) -> Generator[JwksServer, None, None]:
+    server = JwksServer()
+    server.add_key("key-1")
+    monkeypatch.setattr(settings, "CLERK_JWKS_URL", server.url)
+    monkeypatch.setattr(settings, "CLERK_ISSUER", "https://clerk.example.com")
+    monkeypatch.setattr(settings, "CLERK_JWT_AUDIENCE", "test-audience")
+    auth.jwks_cache.clear()
+    auth.verified_tokens.clear()
+    yield server
+    auth.jwks_cache.clear()
+    auth.verified_tokens.clear()
+    server.close()
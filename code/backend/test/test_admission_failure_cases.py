@@ -0,0 +1,101 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import event_manager_app
+from app.models.exceptions import AdmissionRejectedError
+from app.routes import attendees as route_attendees
+from app.routes import payments as route_payments
+from app.service import admission
+from app.service.admission import AdmissionController, LocalTicketStore
+
+
+def _controller(max_queue: int = 0) -> AdmissionController:
+    return AdmissionController(
+        max_concurrent=1,
+        max_queue=max_queue,
+        queue_timeout=0.05,
+        store=LocalTicketStore(ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_when_queue_full():
+    controller = _controller(max_queue=0)
+    event_id = uuid4()
+
+    async with controller.admit(event_id):
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            async with controller.admit(event_id):
+                pass
+
+    assert exc_info.value.queue_position == 1
+    assert exc_info.value.retry_after >= 1
+    assert exc_info.value.token
+
+
+@pytest.mark.asyncio
+async def test_admission_token_is_single_use_and_bound_to_its_event():
+    store = LocalTicketStore(ttl_seconds=60)
+    event_id = uuid4()
+    token = store.issue(event_id, seq=7)
+
+    assert store.redeem(token, uuid4()) is None
+    token = store.issue(event_id, seq=7)
+    assert store.redeem(token, event_id) == 7
+    assert store.redeem(token, event_id) is None
+
+
+def test_expired_admission_tokens_are_dropped(monkeypatch: pytest.MonkeyPatch):
+    clock = iter([100.0, 130.0, 170.0, 170.0])
+    monkeypatch.setattr(admission.time, "monotonic", lambda: next(clock))
+    store = LocalTicketStore(ttl_seconds=60)
+    event_id = uuid4()
+
+    first = store.issue(event_id, seq=1)
+    second = store.issue(event_id, seq=2)
+    # Issuing at 170 purges the first ticket, which expired at 160, and keeps the second
+    store.issue(event_id, seq=3)
+    assert first not in store._tickets
+    assert second in store._tickets
+    assert store.redeem(first, event_id) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "module", "body"),
+    [
+        ("/attendees", route_attendees, {"user_id": str(uuid4())}),
+        (
+            "/payments/checkout-session",
+            route_payments,
+            {"user_id": str(uuid4()), "amount_usd": "10.00"},
+        ),
+    ],
+)
+async def test_registration_endpoints_return_429_when_event_busy(
+    monkeypatch: pytest.MonkeyPatch, path, module, body
+):
+    controller = _controller(max_queue=0)
+    monkeypatch.setattr(module, "event_admission", controller)
+    event_id = uuid4()
+
+    transport = ASGITransport(app=event_manager_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        # A registration in flight holds the event's only slot
+        async with controller.admit(event_id):
+            resp = await client.post(path, json={"event_id": str(event_id), **body})
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == str(resp.json()["retry_after"])
+    assert resp.json()["queue_position"] == 1
+    assert resp.json()["admission_token"]
@@ -0,0 +1,92 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.models.exceptions import AdmissionRejectedError
+from app.service.admission import AdmissionController, LocalTicketStore
+
+
+def _controller(max_concurrent: int = 1, max_queue: int = 10) -> AdmissionController:
+    return AdmissionController(
+        max_concurrent=max_concurrent,
+        max_queue=max_queue,
+        queue_timeout=1.0,
+        store=LocalTicketStore(ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_admission_caps_concurrency_per_event_and_admits_in_order():
+    controller = _controller(max_concurrent=2)
+    event_id = uuid4()
+    running = 0
+    peak = 0
+    admitted: list[int] = []
+
+    async def register(i: int) -> None:
+        nonlocal running, peak
+        async with controller.admit(event_id):
+            admitted.append(i)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(register(i) for i in range(6)))
+
+    assert peak == 2
+    assert admitted == list(range(6))
+    assert controller._gates == {}
+
+
+@pytest.mark.asyncio
+async def test_admission_keeps_other_events_unaffected():
+    controller = _controller(max_concurrent=1, max_queue=0)
+    hot, quiet = uuid4(), uuid4()
+
+    async with controller.admit(hot):
+        # The hot event's only slot is taken, yet another event still gets straight in
+        async with controller.admit(quiet):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_admission_token_keeps_place_ahead_of_later_arrivals():
+    controller = _controller(max_concurrent=1)
+    controller.queue_timeout = 0.05
+    event_id = uuid4()
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def register(name: str, token: str | None = None) -> None:
+        async with controller.admit(event_id, token):
+            order.append(name)
+            await release.wait()
+
+    holder = asyncio.create_task(register("holder"))
+    await asyncio.sleep(0)
+
+    # Waited too long behind the holder: turned away with a token
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        await register("early")
+    assert exc_info.value.queue_position == 1
+
+    controller.queue_timeout = 1.0
+    later = asyncio.create_task(register("later"))
+    await asyncio.sleep(0)
+    retried = asyncio.create_task(register("early", exc_info.value.token))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(holder, later, retried)
+
+    assert order == ["holder", "early", "later"]
@@ -128,6 +128,52 @@ async def test_post_attendee_missing_fields_422(test_client: AsyncClient):
     assert r.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_post_attendee_without_user_404_when_account_has_no_user(
+    test_client: AsyncClient,
+):
+    """Leaving out user_id needs the signed-in account to have a user."""
+    r = await test_client.post("/attendees", json={"event_id": str(uuid4())})
+    assert r.status_code == 404
+    assert r.json()["detail"] == "No user is linked to this account"
+
+
+@pytest.mark.asyncio
+async def test_create_attendee_404_missing_user_on_existing_event(test_client: AsyncClient):
+    """A missing user is reported even though the event exists and has seats."""
+    ur = await test_client.post(
+        "/users",
+        json={
+            "first_name": "Owner",
+            "last_name": "User",
+            "email": "owner@example.com",
+            "date_of_birth": "1990-01-01",
+        },
+    )
+    cat_id = await categories_db.create_category_db("General", "General")
+    er = await test_client.post(
+        "/events",
+        json={
+            "event_name": "Ghost RSVP",
+            "event_datetime": "2099-01-01T10:00:00Z",
+            "event_endtime": "2099-01-01T12:00:00Z",
+            "capacity": 5,
+            "user_id": ur.json()["user_id"],
+            "category_id": str(cat_id),
+        },
+    )
+    eid = er.json()["event_id"]
+
+    r = await test_client.post("/attendees", json={"event_id": eid, "user_id": str(uuid4())})
+    assert r.status_code == 404
+    assert r.json()["detail"] == "No such user exists"
+
+    listed = await test_client.get(
+        "/attendees", params={"filter_expression": f"event_id:eq:{eid}"}
+    )
+    assert listed.json()["total"] == 0
+
+
 @pytest.mark.asyncio
 async def test_post_attendee_duplicate_409(test_client: AsyncClient):
     """Same (event_id, user_id) twice → 409"""
@@ -480,8 +526,8 @@ async def test_patch_attendee_invalid_uuid_format(test_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_create_attendee_400_when_event_full(test_client: AsyncClient):
-    """When event capacity is reached, further RSVPs should be rejected with 400."""
+async def test_create_attendee_422_when_requesting_waitlisted(test_client: AsyncClient):
+    """Waitlisted is assigned by the server for full events; clients cannot ask for it."""
     user_resp = await test_client.post(
         "/users",
         json={
@@ -509,29 +555,30 @@ async def test_create_attendee_400_when_event_full(test_client: AsyncClient):
     )
     assert event_resp.status_code in (200, 201)
     event_id = event_resp.json()["event_id"]
-    first_attendee_resp = await test_client.post(
+
+    response = await test_client.post(
         "/attendees",
-        json={"event_id": event_id, "user_id": owner_id, "status": "RSVPed"},
+        json={"event_id": event_id, "user_id": owner_id, "status": "Waitlisted"},
     )
-    assert first_attendee_resp.status_code == 201
-    user2_resp = await test_client.post(
-        "/users",
-        json={
-            "first_name": "Cap",
-            "last_name": "User2",
-            "email": "capacity.user2@example.com",
-            "date_of_birth": "1990-01-01",
-        },
+    assert response.status_code == 422
+
+    created = await test_client.post(
+        "/attendees", json={"event_id": event_id, "user_id": owner_id}
     )
-    assert user2_resp.status_code in (200, 201)
-    user2_id = user2_resp.json()["user_id"]
-    second_attendee_resp = await test_client.post(
+    assert created.status_code == 201
+    patched = await test_client.patch(
         "/attendees",
-        json={"event_id": event_id, "user_id": user2_id, "status": "RSVPed"},
+        json={
+            "patch": {
+                created.json()["attendee_id"]: {
+                    "op": "replace",
+                    "path": "/status",
+                    "value": "Waitlisted",
+                }
+            }
+        },
     )
-    assert second_attendee_resp.status_code == 400
-    detail = second_attendee_resp.json().get("detail")
-    assert detail == "Event is full"
+    assert patched.status_code == 422
 
 
 @pytest.mark.asyncio
@@ -10,11 +10,13 @@ import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -26,7 +28,9 @@ from app.db import users as users_db
 from app.db.attendees import metadata as attendees_metadata
 from app.db.categories import metadata as categories_metadata
 from app.db.events import metadata as events_metadata
+from app.db.metrics import track_round_trips
 from app.db.users import metadata as users_metadata
+from app.jobs.attendee_counts import repair_attendee_counts
 from app.main import event_manager_app
 
 
@@ -154,6 +158,70 @@ async def test_post_attendee_minimal_defaults_status_null(test_client: AsyncClie
         assert body["status"] is None
 
 
+@pytest.mark.asyncio
+async def test_post_attendee_defaults_user_to_signed_in_user(test_client: AsyncClient):
+    cat_id = await _seed_category()
+    host_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, host_id, cat_id)
+    r = await test_client.post(
+        "/users",
+        json={
+            "first_name": "Test",
+            "last_name": "User",
+            "email": "test@example.com",
+            "date_of_birth": "1990-01-01",
+        },
+    )
+    r.raise_for_status()
+
+    resp = await test_client.post("/attendees", json={"event_id": str(event_id)})
+
+    assert resp.status_code == 201
+    assert resp.json()["user_id"] == r.json()["user_id"]
+
+
+@pytest.mark.asyncio
+async def test_post_attendee_runs_in_one_transaction(
+    test_client: AsyncClient, test_engine: AsyncEngine
+):
+    """Validation reads and the insert should share a single transaction."""
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, user_id, cat_id)
+
+    begins: list[object] = []
+
+    def count_begin(conn, *args) -> None:
+        begins.append(conn)
+
+    sqlalchemy_event.listen(test_engine.sync_engine, "begin", count_begin)
+    try:
+        resp = await test_client.post(
+            "/attendees", json={"event_id": str(event_id), "user_id": str(user_id)}
+        )
+    finally:
+        sqlalchemy_event.remove(test_engine.sync_engine, "begin", count_begin)
+
+    assert resp.status_code == 201
+    assert len(begins) == 1
+
+
+@pytest.mark.asyncio
+async def test_post_attendee_is_a_lock_and_an_insert(test_client: AsyncClient):
+    """An RSVP costs the event row lock and one conditional insert, plus BEGIN/COMMIT."""
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, user_id, cat_id)
+
+    with track_round_trips() as round_trips:
+        resp = await test_client.post(
+            "/attendees", json={"event_id": str(event_id), "user_id": str(user_id)}
+        )
+
+    assert resp.status_code == 201
+    assert round_trips[0] == 4
+
+
 @pytest.mark.asyncio
 async def test_post_attendee_with_explicit_status_rsvped(test_client: AsyncClient):
     """Create attendee WITH explicit status."""
@@ -540,3 +608,307 @@ async def test_post_attendee_respects_capacity_allows_until_full(test_client: As
         body = resp.json()
         assert body["event_id"] == str(event_id)
         assert body["user_id"] == uid
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_attendees_reports_per_item_errors(test_client: AsyncClient):
+    """Bulk RSVP creates valid rows and reports duplicates and unknown users per item."""
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, user_id, cat_id)
+
+    other = await test_client.post(
+        "/users",
+        json={
+            "first_name": "Bob",
+            "last_name": "Tester",
+            "email": "bob.attendee@example.com",
+            "date_of_birth": "1994-04-04",
+        },
+    )
+    other_id = other.json()["user_id"]
+
+    resp = await test_client.post(
+        "/attendees:bulk",
+        json={
+            "items": [
+                {"event_id": str(event_id), "user_id": str(user_id), "status": "RSVPed"},
+                {"event_id": str(event_id), "user_id": other_id},
+                {"event_id": str(event_id), "user_id": str(user_id)},
+                {"event_id": str(event_id), "user_id": "12345678-1234-4321-1234-123456789012"},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+
+    body = resp.json()
+    assert body["created"] == 2
+    assert body["failed"] == 2
+    assert [r["status_code"] for r in body["results"]] == [201, 201, 409, 404]
+    assert body["results"][0]["item"]["user_id"] == str(user_id)
+    assert body["results"][2]["detail"] == "User already registered for this event"
+
+    listed = await test_client.get(
+        "/attendees", params={"filter_expression": f"event_id:eq:{event_id}"}
+    )
+    assert listed.json()["total"] == 2
+
+
+async def _attendee_count(test_client: AsyncClient, event_id: UUID) -> int:
+    resp = await test_client.get(
+        "/events", params={"filter_expression": f"event_id:eq:{event_id}"}
+    )
+    return resp.json()["items"][0]["attendee_count"]
+
+
+@pytest.mark.asyncio
+async def test_attendee_count_follows_rsvps_moves_and_deletes(test_client: AsyncClient):
+    """The events counter tracks every attendee write, including moves between events."""
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    first = await _seed_event(test_client, user_id, cat_id)
+    second = await _seed_event(test_client, user_id, cat_id)
+
+    created = await test_client.post(
+        "/attendees", json={"event_id": str(first), "user_id": str(user_id)}
+    )
+    attendee_id = created.json()["attendee_id"]
+    assert await _attendee_count(test_client, first) == 1
+
+    moved = await test_client.patch(
+        "/attendees",
+        json={
+            "patch": {
+                attendee_id: {"op": "replace", "path": "/event_id", "value": str(second)}
+            }
+        },
+    )
+    assert moved.status_code == 200
+    assert await _attendee_count(test_client, first) == 0
+    assert await _attendee_count(test_client, second) == 1
+
+    deleted = await test_client.delete(f"/attendees/{attendee_id}")
+    assert deleted.status_code == 200
+    assert await _attendee_count(test_client, second) == 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_status_patch_moves_the_seat_once(test_client: AsyncClient):
+    """Applying the same status patch twice gives back one seat, not two."""
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, user_id, cat_id)
+    created = await test_client.post(
+        "/attendees", json={"event_id": str(event_id), "user_id": str(user_id)}
+    )
+    attendee_id = created.json()["attendee_id"]
+    assert await _attendee_count(test_client, event_id) == 1
+
+    patch = {
+        "patch": {attendee_id: {"op": "replace", "path": "/status", "value": "Not Going"}}
+    }
+    for _ in range(2):
+        resp = await test_client.patch("/attendees", json=patch)
+        assert resp.status_code == 200
+    assert await _attendee_count(test_client, event_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_user_releases_their_seats(test_client: AsyncClient):
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, user_id, cat_id)
+    guest = await test_client.post(
+        "/users",
+        json={
+            "first_name": "Guest",
+            "last_name": "Tester",
+            "email": "guest.attendee@example.com",
+            "date_of_birth": "1994-04-04",
+        },
+    )
+    guest_id = guest.json()["user_id"]
+    await test_client.post("/attendees", json={"event_id": str(event_id), "user_id": guest_id})
+    assert await _attendee_count(test_client, event_id) == 1
+
+    resp = await test_client.delete(f"/users/{guest_id}")
+    assert resp.status_code == 200
+    assert await _attendee_count(test_client, event_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_repair_attendee_counts_fixes_drift(
+    test_client: AsyncClient, test_engine: AsyncEngine
+):
+    cat_id = await _seed_category()
+    user_id = await _seed_user(test_client)
+    drifted = await _seed_event(test_client, user_id, cat_id)
+    accurate = await _seed_event(test_client, user_id, cat_id)
+    await test_client.post(
+        "/attendees", json={"event_id": str(drifted), "user_id": str(user_id)}
+    )
+
+    async with test_engine.begin() as conn:
+        await conn.execute(
+            events_db.events.update()
+            .where(events_db.events.c.event_id == drifted)
+            .values(attendee_count=7)
+        )
+
+    repaired = await repair_attendee_counts()
+
+    assert repaired == {drifted: 1}
+    assert await _attendee_count(test_client, drifted) == 1
+    assert await _attendee_count(test_client, accurate) == 0
+    assert await repair_attendee_counts() == {}
+
+
+async def _seed_full_event(test_client: AsyncClient, guests: int) -> tuple[UUID, list[str]]:
+    """
+    A one-seat event whose seat is taken by its owner, plus `guests` users who have not
+    RSVPed yet. Returns the event id and the user ids, owner first.
+    """
+    cat_id = await _seed_category()
+    owner_id = await _seed_user(test_client)
+    event_id = await _seed_event(test_client, owner_id, cat_id)
+    await test_client.patch(
+        "/events",
+        json={"patch": {str(event_id): {"op": "replace", "path": "/capacity", "value": 1}}},
+    )
+    await test_client.post(
+        "/attendees", json={"event_id": str(event_id), "user_id": str(owner_id)}
+    )
+
+    user_ids = [str(owner_id)]
+    for i in range(guests):
+        r = await test_client.post(
+            "/users",
+            json={
+                "first_name": "Guest",
+                "last_name": f"Number{i}",
+                "email": f"waitlist.guest{i}@example.com",
+                "date_of_birth": "1994-04-04",
+            },
+        )
+        user_ids.append(r.json()["user_id"])
+    return event_id, user_ids
+
+
+async def _statuses(test_client: AsyncClient, event_id: UUID) -> dict[str, str | None]:
+    resp = await test_client.get(
+        "/attendees", params={"filter_expression": f"event_id:eq:{event_id}"}
+    )
+    return {item["user_id"]: item["status"] for item in resp.json()["items"]}
+
+
+@pytest.mark.asyncio
+async def test_post_attendee_waitlists_when_event_full(test_client: AsyncClient):
+    event_id, (_, first, second, declining) = await _seed_full_event(test_client, 3)
+
+    waitlisted = []
+    for user_id in (first, second):
+        resp = await test_client.post(
+            "/attendees",
+            json={"event_id": str(event_id), "user_id": user_id, "status": "RSVPed"},
+        )
+        assert resp.status_code == 201
+        waitlisted.append(resp.json())
+
+    assert [a["status"] for a in waitlisted] == ["Waitlisted", "Waitlisted"]
+    assert [a["waitlist_position"] for a in waitlisted] == [1, 2]
+    assert await _attendee_count(test_client, event_id) == 1
+
+    # Not Going takes no seat, so it is recorded as asked even on a full event
+    declined = await test_client.post(
+        "/attendees",
+        json={"event_id": str(event_id), "user_id": declining, "status": "Not Going"},
+    )
+    assert declined.status_code == 201
+    assert declined.json()["status"] == "Not Going"
+    assert await _attendee_count(test_client, event_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_freed_seats_promote_the_waitlist_in_order(test_client: AsyncClient):
+    event_id, (owner, first, second, third) = await _seed_full_event(test_client, 3)
+    for user_id in (first, second, third):
+        await test_client.post(
+            "/attendees", json={"event_id": str(event_id), "user_id": user_id}
+        )
+
+    # Cancelling frees the owner's seat for the oldest waitlisted RSVP
+    listed = await test_client.get(
+        "/attendees", params={"filter_expression": f"user_id:eq:{owner}"}
+    )
+    await test_client.delete(f"/attendees/{listed.json()['items'][0]['attendee_id']}")
+    statuses = await _statuses(test_client, event_id)
+    assert statuses == {first: "RSVPed", second: "Waitlisted", third: "Waitlisted"}
+
+    # Switching to Not Going gives the seat up as well
+    listed = await test_client.get(
+        "/attendees", params={"filter_expression": f"user_id:eq:{first}"}
+    )
+    patched = await test_client.patch(
+        "/attendees",
+        json={
+            "patch": {
+                listed.json()["items"][0]["attendee_id"]: {
+                    "op": "replace",
+                    "path": "/status",
+                    "value": "Not Going",
+                }
+            }
+        },
+    )
+    assert patched.status_code == 200
+    statuses = await _statuses(test_client, event_id)
+    assert statuses == {first: "Not Going", second: "RSVPed", third: "Waitlisted"}
+
+    # Raising the capacity seats the rest of the waitlist
+    grown = await test_client.patch(
+        "/events",
+        json={"patch": {str(event_id): {"op": "replace", "path": "/capacity", "value": 5}}},
+    )
+    assert grown.json()[str(event_id)]["attendee_count"] == 2
+    assert (await _statuses(test_client, event_id))[third] == "RSVPed"
+
+
+@pytest.mark.asyncio
+async def test_moved_waitlisted_attendee_requeues_on_the_new_event(test_client: AsyncClient):
+    full, (owner, first, second, third) = await _seed_full_event(test_client, 3)
+    other = await _seed_event(test_client, UUID(owner), await _seed_category())
+
+    waitlisted = {}
+    for user_id in (first, second):
+        resp = await test_client.post(
+            "/attendees", json={"event_id": str(full), "user_id": user_id}
+        )
+        waitlisted[user_id] = resp.json()["attendee_id"]
+
+    async def move(attendee_id: str, event_id: UUID) -> dict[str, Any]:
+        resp = await test_client.patch(
+            "/attendees",
+            json={
+                "patch": {
+                    attendee_id: {"op": "replace", "path": "/event_id", "value": str(event_id)}
+                }
+            },
+        )
+        assert resp.status_code == 200
+        return resp.json()[attendee_id]
+
+    # The other event has room, so the move seats them straight away
+    assert (await move(waitlisted[second], other))["status"] == "RSVPed"
+    assert await _attendee_count(test_client, other) == 1
+
+    # Once it is full, a waitlisted attendee moved there queues behind its own waitlist
+    await test_client.patch(
+        "/events",
+        json={"patch": {str(other): {"op": "replace", "path": "/capacity", "value": 1}}},
+    )
+    await test_client.post("/attendees", json={"event_id": str(other), "user_id": third})
+    assert (await move(waitlisted[first], other))["status"] == "Waitlisted"
+
+    await test_client.delete(f"/attendees/{waitlisted[second]}")
+    statuses = await _statuses(test_client, other)
+    assert statuses == {third: "RSVPed", first: "Waitlisted"}
@@ -8,190 +8,140 @@ Framework-generated code: 0%
 
 import time
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from conftest import JwksServer
 from fastapi import HTTPException
-from jwt.exceptions import ExpiredSignatureError, InvalidTokenError, PyJWKClientError
 
+from app import auth
 from app.auth import verify_clerk_token
+from app.config import settings
 
 
-@pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "")
-async def test_verify_clerk_token_missing_audience():
-    payload_no_aud: dict[str, Any] = {
+def _payload(**claims: Any) -> dict[str, Any]:
+    return {
         "sub": "user_123456",
         "email": "test@example.com",
         "iss": "https://clerk.example.com",
         "exp": int(time.time()) + 3600,
         "iat": int(time.time()),
+        **claims,
     }
 
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
 
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.return_value = payload_no_aud
+@pytest.mark.asyncio
+async def test_verify_clerk_token_missing_audience(
+    jwks_server: JwksServer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "CLERK_JWT_AUDIENCE", "")
 
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("invalid-token")
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token(jwks_server.sign(_payload()))
 
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Authentication failed"
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Authentication failed"
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "expected-audience")
-async def test_verify_clerk_token_audience_mismatch():
-    payload_wrong_aud: dict[str, Any] = {
-        "sub": "user_123456",
-        "email": "test@example.com",
-        "iss": "https://clerk.example.com",
-        "aud": "wrong-audience",
-        "exp": int(time.time()) + 3600,
-        "iat": int(time.time()),
-    }
+async def test_verify_clerk_token_audience_mismatch(
+    jwks_server: JwksServer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "CLERK_JWT_AUDIENCE", "expected-audience")
 
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token(jwks_server.sign(_payload(aud="wrong-audience")))
 
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.return_value = payload_wrong_aud
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Authentication failed"
 
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("invalid-token")
 
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Authentication failed"
+@pytest.mark.asyncio
+async def test_verify_clerk_token_audience_list_mismatch(
+    jwks_server: JwksServer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "CLERK_JWT_AUDIENCE", "expected-audience")
+    token = jwks_server.sign(_payload(aud=["wrong-audience-1", "wrong-audience-2"]))
 
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token(token)
 
-@pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "expected-audience")
-async def test_verify_clerk_token_audience_list_mismatch():
-    payload_wrong_aud_list: dict[str, Any] = {
-        "sub": "user_123456",
-        "email": "test@example.com",
-        "iss": "https://clerk.example.com",
-        "aud": ["wrong-audience-1", "wrong-audience-2"],
-        "exp": int(time.time()) + 3600,
-        "iat": int(time.time()),
-    }
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Authentication failed"
 
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
 
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.return_value = payload_wrong_aud_list
+@pytest.mark.asyncio
+async def test_verify_clerk_token_expired(jwks_server: JwksServer):
+    token = jwks_server.sign(_payload(aud="test-audience", exp=int(time.time()) - 60))
 
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("invalid-token")
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token(token)
 
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Authentication failed"
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Token expired"
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_expired():
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
-
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.side_effect = ExpiredSignatureError("Token expired")
+async def test_verify_clerk_token_invalid(jwks_server: JwksServer):
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token("invalid-token")
 
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("expired-token")
-
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Token expired"
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Invalid token"
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_invalid():
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
-
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.side_effect = InvalidTokenError("Invalid token")
-
+async def test_verify_clerk_token_unknown_key_id(
+    jwks_server: JwksServer, monkeypatch: pytest.MonkeyPatch
+):
+    """A key id the JWKS does not list is refused; refetches for it are throttled."""
+    monkeypatch.setattr(settings, "CLERK_JWKS_MIN_REFETCH_SECONDS", 3600)
+    await verify_clerk_token(jwks_server.sign(_payload(aud="test-audience")))
+    jwks_server.add_key("key-2")
+    forged = jwks_server.sign(_payload(aud="test-audience"), kid="key-2")
+
+    for _ in range(3):
         with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("invalid-token")
-
+            await verify_clerk_token(forged)
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Invalid token"
 
+    assert jwks_server.fetches == 1
 
-@pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_jwks_fetch_error():
-    with patch("app.auth.PyJWKClient") as mock_jwk_client:
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.side_effect = PyJWKClientError(
-            "Failed to fetch JWKS"
-        )
-        mock_jwk_client.return_value = mock_client_instance
 
-        with pytest.raises(HTTPException) as exc_info:
-            await verify_clerk_token("token")
+@pytest.mark.asyncio
+async def test_verified_token_cache_does_not_serve_expired_tokens(
+    jwks_server: JwksServer,
+):
+    token = jwks_server.sign(_payload(aud="test-audience", exp=int(time.time()) + 60))
+    payload = await verify_clerk_token(token)
+    assert auth.verified_tokens.get(token) is payload
 
-        assert exc_info.value.status_code == 503
-        assert exc_info.value.detail == "Authentication service unavailable"
+    with patch("app.auth.time.time", return_value=time.time() + 120):
+        assert auth.verified_tokens.get(token) is None
+    # The expired entry was dropped rather than kept for later
+    assert auth.verified_tokens.get(token) is None
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_unexpected_error():
-    with patch("app.auth.PyJWKClient") as mock_jwk_client:
-        mock_jwk_client.side_effect = Exception("Unexpected error")
+async def test_verify_clerk_token_jwks_fetch_error(jwks_server: JwksServer):
+    token = jwks_server.sign(_payload(aud="test-audience"))
+    jwks_server.close()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_clerk_token(token)
 
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail == "Authentication service unavailable"
+
+
+@pytest.mark.asyncio
+async def test_verify_clerk_token_unexpected_error(jwks_server: JwksServer):
+    with patch.object(
+        auth.jwks_cache, "get_signing_key_from_jwt", side_effect=Exception("Unexpected")
+    ):
         with pytest.raises(HTTPException) as exc_info:
             await verify_clerk_token("token")
 
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.detail == "Authentication failed"
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Authentication failed"
@@ -6,14 +6,19 @@ Human code: 5%
 Framework-generated code: 0%
 """
 
+import asyncio
+import threading
 import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import jwt
 import pytest
+from conftest import JwksServer
 from fastapi.security import HTTPAuthorizationCredentials
 
 from app.auth import ClerkTokenPayload, get_current_user, verify_clerk_token
+from app.config import settings
 
 
 @pytest.fixture
@@ -89,57 +94,99 @@ async def test_clerk_token_payload_defaults():
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_success(valid_clerk_payload: dict[str, Any]):
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
-
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.return_value = valid_clerk_payload
-
-        result = await verify_clerk_token("valid-token")
-
-        assert isinstance(result, ClerkTokenPayload)
-        assert result.sub == "user_123456"
-        assert result.email == "test@example.com"
-        mock_jwk_client.assert_called_once_with(
-            "https://clerk.example.com/.well-known/jwks.json"
-        )
-        mock_jwt_decode.assert_called_once()
+async def test_verify_clerk_token_success(
+    jwks_server: JwksServer, valid_clerk_payload: dict[str, Any]
+):
+    result = await verify_clerk_token(jwks_server.sign(valid_clerk_payload))
+
+    assert isinstance(result, ClerkTokenPayload)
+    assert result.sub == "user_123456"
+    assert result.email == "test@example.com"
+    assert jwks_server.fetches == 1
 
 
 @pytest.mark.asyncio
-@patch("app.auth.settings.CLERK_JWKS_URL", "https://clerk.example.com/.well-known/jwks.json")
-@patch("app.auth.settings.CLERK_ISSUER", "https://clerk.example.com")
-@patch("app.auth.settings.CLERK_JWT_AUDIENCE", "test-audience")
-async def test_verify_clerk_token_with_audience_list(valid_clerk_payload: dict[str, Any]):
+async def test_verify_clerk_token_with_audience_list(
+    jwks_server: JwksServer, valid_clerk_payload: dict[str, Any]
+):
     payload_with_list_aud: dict[str, Any | list[str]] = valid_clerk_payload.copy()
     payload_with_list_aud["aud"] = ["test-audience", "another-audience"]
 
-    mock_signing_key = MagicMock()
-    mock_signing_key.key = "test-key"
+    result = await verify_clerk_token(jwks_server.sign(payload_with_list_aud))
+
+    assert isinstance(result, ClerkTokenPayload)
+    assert result.sub == "user_123456"
+
+
+@pytest.mark.asyncio
+async def test_verify_clerk_token_reuses_keys_and_verified_tokens(
+    jwks_server: JwksServer, valid_clerk_payload: dict[str, Any]
+):
+    first = jwks_server.sign(valid_clerk_payload)
+    second = jwks_server.sign({**valid_clerk_payload, "sub": "user_654321"})
+
+    with patch("app.auth.jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(3):
+            assert (await verify_clerk_token(first)).sub == "user_123456"
+        assert (await verify_clerk_token(second)).sub == "user_654321"
+
+    # One JWKS fetch for the process, one signature check per distinct token
+    assert jwks_server.fetches == 1
+    assert decode.call_count == 2
+
 
-    with (
-        patch("app.auth.PyJWKClient") as mock_jwk_client,
-        patch("app.auth.jwt.decode") as mock_jwt_decode,
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_instance.get_signing_key_from_jwt.return_value = mock_signing_key
-        mock_jwk_client.return_value = mock_client_instance
-        mock_jwt_decode.return_value = payload_with_list_aud
+@pytest.mark.asyncio
+async def test_verify_clerk_token_refetches_jwks_for_rotated_key(
+    jwks_server: JwksServer,
+    valid_clerk_payload: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "CLERK_JWKS_MIN_REFETCH_SECONDS", 0)
+    await verify_clerk_token(jwks_server.sign(valid_clerk_payload))
+    jwks_server.add_key("key-2")
+
+    result = await verify_clerk_token(jwks_server.sign(valid_clerk_payload, kid="key-2"))
+
+    assert result.sub == "user_123456"
+    assert jwks_server.fetches == 2
 
-        result = await verify_clerk_token("valid-token")
 
-        assert isinstance(result, ClerkTokenPayload)
-        assert result.sub == "user_123456"
+@pytest.mark.asyncio
+async def test_verify_clerk_token_checks_signature_off_the_event_loop(
+    jwks_server: JwksServer, valid_clerk_payload: dict[str, Any]
+):
+    threads: list[str] = []
+    real_decode = jwt.decode
+
+    def decode(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        threads.append(threading.current_thread().name)
+        return real_decode(*args, **kwargs)
+
+    with patch("app.auth.jwt.decode", side_effect=decode):
+        await verify_clerk_token(jwks_server.sign(valid_clerk_payload))
+
+    assert len(threads) == 1
+    assert threads[0].startswith("jwt-verify")
+
+
+@pytest.mark.asyncio
+async def test_verify_clerk_token_burst_on_rotated_key_shares_one_refetch(
+    jwks_server: JwksServer,
+    valid_clerk_payload: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "CLERK_JWKS_MIN_REFETCH_SECONDS", 0)
+    await verify_clerk_token(jwks_server.sign(valid_clerk_payload))
+    jwks_server.add_key("key-2")
+    tokens = [
+        jwks_server.sign({**valid_clerk_payload, "sub": f"user_{i}"}, kid="key-2")
+        for i in range(10)
+    ]
+
+    results = await asyncio.gather(*(verify_clerk_token(token) for token in tokens))
+
+    assert [result.sub for result in results] == [f"user_{i}" for i in range(10)]
+    assert jwks_server.fetches == 2
 
 
 @pytest.mark.asyncio
@@ -202,3 +202,15 @@ async def test_list_categories_invalid_limit_type(test_client: AsyncClient):
     """Test that non-integer limit is rejected."""
     response = await test_client.get("/categories", params={"limit": "xyz"})
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_categories_stale_etag_returns_full_page(test_client: AsyncClient):
+    """An If-None-Match that no longer matches gets the current page, not 304."""
+    await categories_db.create_category_db(category_name="Sports")
+
+    response = await test_client.get(
+        "/categories", headers={"If-None-Match": '"0123456789abcdef"'}
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
@@ -9,7 +9,7 @@ Framework-generated code: 0%
 import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
@@ -20,7 +20,9 @@ from sqlalchemy.pool import StaticPool
 from app.db import categories as categories_db
 from app.db import db
 from app.db.categories import metadata as categories_metadata
+from app.db.metrics import track_round_trips
 from app.main import event_manager_app
+from app.models.categories import CategoryRead
 
 
 @pytest.fixture(scope="session")
@@ -189,9 +191,9 @@ async def test_list_categories_with_filter_like(test_client: AsyncClient):
         category_name="Theater", description="Theater performances"
     )
 
-    # Search for categories containing "music" (case-sensitive)
+    # Search for categories containing "usic" (case-sensitive)
     response = await test_client.get(
-        "/categories", params={"filter_expression": "category_name:like:%music%"}
+        "/categories", params={"filter_expression": "category_name:like:%usic%"}
     )
     assert response.status_code == 200
 
@@ -279,3 +281,103 @@ async def test_list_categories_offset_beyond_total(test_client: AsyncClient):
     assert len(data["items"]) == 0
     assert data["total"] == 1
     assert data["offset"] == 10
+
+
+@pytest.mark.asyncio
+async def test_list_categories_revalidates_with_etag(test_client: AsyncClient):
+    """An unchanged page answers If-None-Match with 304; a new category changes the tag."""
+    await categories_db.create_category_db(category_name="Sports")
+
+    first = await test_client.get("/categories")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('"')
+
+    unchanged = await test_client.get("/categories", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert unchanged.content == b""
+
+    await categories_db.create_category_db(category_name="Music")
+    changed = await test_client.get("/categories", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_categories_are_served_without_queries(test_client: AsyncClient):
+    """Once the catalog is loaded, listing and existence checks never touch the database."""
+    category_id = await categories_db.create_category_db(category_name="Test Category")
+    await categories_db.catalog.load()
+
+    with track_round_trips() as round_trips:
+        response = await test_client.get(
+            "/categories", params={"filter_expression": "category_name:ilike:test%"}
+        )
+        found = await CategoryRead.find_existing_category_ids([category_id])
+
+    assert response.json()["items"][0]["category_id"] == str(category_id)
+    assert found == {category_id}
+    assert round_trips[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_category_created_by_another_process_is_found(test_client: AsyncClient):
+    """A miss is checked against the database before the category is reported missing."""
+    await categories_db.catalog.load()
+    # Written straight to the table, as another API worker would
+    category_id = uuid4()
+    async with db.engine.begin() as conn:
+        await conn.execute(
+            categories_db.categories.insert().values(
+                category_id=category_id, category_name="Elsewhere"
+            )
+        )
+
+    with track_round_trips() as round_trips:
+        found = await CategoryRead.find_existing_category_ids([category_id, uuid4()])
+        again = await CategoryRead.find_existing_category_ids([category_id])
+
+    assert found == again == {category_id}
+    # One lookup for the two misses; the row found is then served from the catalog
+    assert round_trips[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_category_joins_the_catalog_when_its_unit_commits(test_client: AsyncClient):
+    """A category created inside a unit of work that rolls back never reaches the catalog."""
+    await categories_db.catalog.load()
+
+    with pytest.raises(RuntimeError):
+        async with db.unit_of_work():
+            rolled_back = await categories_db.create_category_db(category_name="Phantom")
+            raise RuntimeError("abort the unit")
+    async with db.unit_of_work():
+        committed = await categories_db.create_category_db(category_name="Kept")
+
+    with track_round_trips() as round_trips:
+        assert await CategoryRead.find_existing_category_ids([committed]) == {committed}
+    assert round_trips[0] == 0
+    assert await CategoryRead.find_existing_category_ids([rolled_back]) == set()
+
+
+@pytest.mark.asyncio
+async def test_list_categories_filters_match_database_semantics(test_client: AsyncClient):
+    """LIKE is case-sensitive, `_` matches one character and NULLs match nothing."""
+    await categories_db.create_category_db(category_name="Music", description="Live")
+    await categories_db.create_category_db(category_name="music_hall")
+    await categories_db.create_category_db(category_name="Musical", description="Stage")
+
+    async def names(expression: str) -> list[str]:
+        response = await test_client.get(
+            "/categories", params={"filter_expression": expression}
+        )
+        return sorted(item["category_name"] for item in response.json()["items"])
+
+    assert await names("category_name:like:Music%") == ["Music", "Musical"]
+    assert await names("category_name:ilike:music%") == ["Music", "Musical", "music_hall"]
+    assert await names("category_name:like:Musi_") == ["Music"]
+    assert await names("category_name:like:music\\_%") == ["music_hall"]
+    assert await names("description:neq:Live") == ["Musical"]
+    assert await names("category_name:in:Music,Musical") == ["Music", "Musical"]
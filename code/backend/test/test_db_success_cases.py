@@ -6,17 +6,20 @@ Human code: 5%
 Framework-generated code: 0%
 """
 
+import asyncio
 import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
+from prometheus_client import REGISTRY
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.db import db
+from app.db.metrics import track_round_trips
 
 
 @pytest.fixture(scope="session")
@@ -54,3 +57,119 @@ async def test_init_db(test_engine: AsyncEngine):
     async with db.engine.connect() as conn:
         result = await conn.execute(text("SELECT 1"))
         assert result.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_connection_and_rolls_back(test_engine: AsyncEngine):
+    async with db.engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE IF NOT EXISTS uow_probe (value INTEGER)"))
+        await conn.execute(text("DELETE FROM uow_probe"))
+
+    with pytest.raises(RuntimeError):
+        async with db.unit_of_work() as outer:
+            async with db.unit_of_work() as inner, db.begin(db.engine) as joined:
+                assert inner is outer
+                assert joined is outer
+            await outer.execute(text("INSERT INTO uow_probe (value) VALUES (1)"))
+            raise RuntimeError("abort the unit")
+
+    async with db.engine.connect() as conn:
+        result = await conn.execute(text("SELECT COUNT(*) FROM uow_probe"))
+        assert result.scalar() == 0
+
+
+@pytest.mark.asyncio
+async def test_after_commit_waits_for_the_unit_to_commit(test_engine: AsyncEngine):
+    ran: list[str] = []
+
+    async with db.unit_of_work():
+        async with db.unit_of_work():
+            db.after_commit(lambda: ran.append("committed"))
+        assert ran == []
+    assert ran == ["committed"]
+
+    with pytest.raises(RuntimeError):
+        async with db.unit_of_work():
+            db.after_commit(lambda: ran.append("rolled back"))
+            raise RuntimeError("abort the unit")
+    assert ran == ["committed"]
+
+    db.after_commit(lambda: ran.append("no unit"))
+    assert ran == ["committed", "no unit"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_skips_transaction_round_trips(test_engine: AsyncEngine):
+    with track_round_trips() as read_trips:
+        async with db.read_only(db.engine) as conn:
+            await conn.execute(text("SELECT 1"))
+
+    with track_round_trips() as write_trips:
+        async with db.begin(db.engine) as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # The read is just its statement; begin() adds BEGIN and COMMIT around it
+    assert read_trips[0] == 1
+    assert write_trips[0] == 3
+
+
+@pytest_asyncio.fixture
+async def replica_url(test_engine: AsyncEngine) -> AsyncGenerator[str, None]:
+    """Route reads to a second SQLite file whose rows differ from the primary's."""
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    url = f"sqlite+aiosqlite:///{db_path}"
+    for bind, source in ((db.engine, "primary"), (create_async_engine(url), "replica")):
+        async with bind.begin() as conn:
+            await conn.execute(text("DROP TABLE IF EXISTS replica_probe"))
+            await conn.execute(text("CREATE TABLE replica_probe (source TEXT)"))
+            await conn.execute(text(f"INSERT INTO replica_probe VALUES ('{source}')"))
+
+    db.configure_replicas([url])
+    yield url
+
+    db.configure_replicas([])
+    db._primary_pins.clear()
+    os.close(db_fd)
+    os.remove(db_path)
+
+
+async def _read_source(session_key: str | None = None) -> str:
+    db.set_session_key(session_key)
+    async with db.read_only(db.engine) as conn:
+        return (await conn.execute(text("SELECT source FROM replica_probe"))).scalar()
+
+
+async def _write(session_key: str | None = None) -> None:
+    db.set_session_key(session_key)
+    async with db.begin(db.engine) as conn:
+        await conn.execute(text("UPDATE replica_probe SET source = 'primary'"))
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_the_session_writes(replica_url: str):
+    assert await asyncio.create_task(_read_source("alice")) == "replica"
+
+    await asyncio.create_task(_write("alice"))
+
+    # A later request from the same session reads its write from the primary
+    assert await asyncio.create_task(_read_source("alice")) == "primary"
+    # Other sessions keep reading from the replica
+    assert await asyncio.create_task(_read_source("bob")) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_write_pins_reads_in_the_same_task(replica_url: str):
+    assert await _read_source() == "replica"
+    await _write()
+    assert await _read_source() == "primary"
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_is_skipped(replica_url: str, monkeypatch: pytest.MonkeyPatch):
+    await db.refresh_replica_lag()
+    name = db._replicas[0].name
+    assert REGISTRY.get_sample_value("db_replica_lag_seconds", {"replica": name}) == 0.0
+    assert await asyncio.create_task(_read_source()) == "replica"
+
+    monkeypatch.setattr(db._replicas[0], "lag", 60.0)
+    assert await asyncio.create_task(_read_source()) == "primary"
@@ -28,6 +28,7 @@ from app.db.events import metadata as events_metadata
 from app.db.users import metadata as users_metadata
 from app.main import event_manager_app
 from app.models.events import EventCreate
+from app.models.exceptions import NotFoundError
 from app.models.users import UserCreate
 
 
@@ -289,6 +290,21 @@ async def test_list_events_limit_exceeds_maximum(test_client: AsyncClient):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_list_events_invalid_cursor(test_client: AsyncClient):
+    """Test that a cursor that cannot be decoded returns 400."""
+    response = await test_client.get("/events", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert "cursor" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_events_empty_items(test_client: AsyncClient):
+    """Test that a bulk create without items is rejected."""
+    response = await test_client.post("/events:bulk", json={"items": []})
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_patch_event_nonexistent_id(test_client: AsyncClient):
     """Test patching a non-existent event."""
@@ -301,6 +317,62 @@ async def test_patch_event_nonexistent_id(test_client: AsyncClient):
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_patch_event_empty_operation_list(test_client: AsyncClient):
+    """Test that an id with an empty operation list is rejected."""
+    patch_data: dict[str, Any] = {"patch": {"12345678-1234-4321-1234-123456789012": []}}
+
+    response = await test_client.patch("/events", json=patch_data)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_patch_event_operation_list_validated_together(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """Test that one invalid operation in a list rejects the whole list."""
+    response = await test_client.post("/events", json=valid_event_data.model_dump(mode="json"))
+    event_id = response.json()["event_id"]
+
+    patch_data: dict[str, Any] = {
+        "patch": {
+            event_id: [
+                {"op": "replace", "path": "/event_name", "value": "Renamed"},
+                {"op": "replace", "path": "/capacity", "value": -5},
+            ]
+        }
+    }
+
+    response = await test_client.patch("/events", json=patch_data)
+    assert response.status_code == 422
+
+    response = await test_client.get(
+        "/events", params={"filter_expression": f"event_id:eq:{event_id}"}
+    )
+    assert response.json()["items"][0]["event_name"] == valid_event_data.event_name
+
+
+@pytest.mark.asyncio
+async def test_batch_update_events_db_missing_id_rolls_back(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """Test that a missing id fails the whole batch and leaves other rows unchanged."""
+    response = await test_client.post("/events", json=valid_event_data.model_dump(mode="json"))
+    event_id = UUID(response.json()["event_id"])
+    missing_id = uuid4()
+
+    with pytest.raises(NotFoundError) as exc_info:
+        await events_db.batch_update_events_db(
+            {event_id: {"event_name": "Changed"}, missing_id: {"event_name": "Ghost"}}
+        )
+    assert str(missing_id) in str(exc_info.value)
+
+    response = await test_client.get(
+        "/events", params={"filter_expression": f"event_id:eq:{event_id}"}
+    )
+    assert response.json()["items"][0]["event_name"] == valid_event_data.event_name
+
+
 @pytest.mark.asyncio
 async def test_patch_event_invalid_field_path(
     test_client: AsyncClient, valid_event_data: EventCreate
@@ -500,3 +572,95 @@ async def test_delete_event_invalid_uuid(test_client: AsyncClient):
     """Test deleting with invalid UUID format returns 422."""
     response = await test_client.delete("/events/not-a-valid-uuid")
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_events_search_rejects_cursor(test_client: AsyncClient):
+    """Ranked search results page by offset; a cursor is a 400."""
+    response = await test_client.get("/events", params={"search": "jazz", "cursor": "abc"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor pagination is not available with search"
+
+
+@pytest.mark.asyncio
+async def test_list_events_search_too_long(test_client: AsyncClient):
+    response = await test_client.get("/events", params={"search": "x" * 201})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_pick_events_query_too_long(test_client: AsyncClient):
+    response = await test_client.get("/events:pick", params={"q": "x" * 101})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("params", "detail"),
+    [
+        ({"near": "north,west"}, "Invalid near: north,west"),
+        ({"bbox": "-71,43,-70,42"}, "Invalid bbox: south must not be above north"),
+        ({"radius_km": 5}, "radius_km requires near"),
+        (
+            {"near": "42.36,-71.06", "search": "jazz"},
+            "near cannot be combined with search, which orders by relevance; "
+            "use bbox to limit a search to an area",
+        ),
+        (
+            {"bbox": "-71.2,42.2,-70.9,42.5", "cursor": "abc"},
+            "Cursor pagination is not available with near or bbox",
+        ),
+    ],
+)
+async def test_list_events_invalid_area(
+    test_client: AsyncClient, params: dict[str, Any], detail: str
+):
+    response = await test_client.get("/events", params=params)
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("params", "detail"),
+    [
+        ({"order_by": "distance"}, "order_by=distance requires near"),
+        (
+            {"search": "jazz", "order_by": "price_field"},
+            "order_by cannot be combined with search, which orders by relevance",
+        ),
+        (
+            {"order_by": "-price_field", "cursor": "abc"},
+            "Cursor pagination is not available with this order_by",
+        ),
+    ],
+)
+async def test_list_events_invalid_order(
+    test_client: AsyncClient, params: dict[str, Any], detail: str
+):
+    response = await test_client.get("/events", params=params)
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", ["description", "-attendee_count"])
+async def test_list_events_order_by_not_allowed(test_client: AsyncClient, order_by: str):
+    response = await test_client.get("/events", params={"order_by": order_by})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_events_radius_must_be_positive(test_client: AsyncClient):
+    response = await test_client.get("/events", params={"near": "42,-71", "radius_km": 0})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [{"z": 2, "x": 4, "y": 0}, {"z": 0, "x": 0, "y": -1}, {"z": 99, "x": 0, "y": 0}],
+)
+async def test_map_tile_outside_the_grid(test_client: AsyncClient, params: dict[str, int]):
+    response = await test_client.get("/events/map-tiles", params=params)
+    assert response.status_code == 422
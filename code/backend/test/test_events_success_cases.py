@@ -6,24 +6,32 @@ Human code: 10%
 Framework-generated code: 0%
 """
 
+import json
 import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
+from urllib.parse import quote
 from uuid import UUID
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.db import attendees as attendees_db
 from app.db import categories as categories_db
 from app.db import db
+from app.db import event_map as event_map_db
 from app.db import events as events_db
 from app.db import users as users_db
+from app.db.attendees import metadata as attendees_metadata
 from app.db.categories import metadata as categories_metadata
+from app.db.event_map import metadata as event_map_metadata
 from app.db.events import metadata as events_metadata
 from app.db.users import metadata as users_metadata
 from app.main import event_manager_app
@@ -55,7 +63,9 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
 
     # Set test database config
     db.engine = engine
+    attendees_db.engine = engine
     events_db.engine = engine
+    event_map_db.engine = engine
     users_db.engine = engine
     categories_db.engine = engine
 
@@ -63,7 +73,9 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
 
     # Restore original engine
     db.engine = original_engine
+    attendees_db.engine = original_engine
     events_db.engine = original_engine
+    event_map_db.engine = original_engine
     users_db.engine = original_engine
     categories_db.engine = original_engine
 
@@ -73,6 +85,8 @@ async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
     """Reset the database before each test."""
     async with test_engine.begin() as conn:
         # Drop and create all tables in the correct order
+        await conn.run_sync(attendees_metadata.drop_all)
+        await conn.run_sync(event_map_metadata.drop_all)
         await conn.run_sync(events_metadata.drop_all)
         await conn.run_sync(categories_metadata.drop_all)
         await conn.run_sync(users_metadata.drop_all)
@@ -80,6 +94,8 @@ async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
         await conn.run_sync(users_metadata.create_all)
         await conn.run_sync(categories_metadata.create_all)
         await conn.run_sync(events_metadata.create_all)
+        await conn.run_sync(event_map_metadata.create_all)
+        await conn.run_sync(attendees_metadata.create_all)
     yield
 
 
@@ -181,6 +197,40 @@ async def test_create_event_with_required_fields(
     assert datetime.fromisoformat(data["updated_at"])
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_events(
+    test_client: AsyncClient, valid_event_data: EventCreate, test_user: UUID
+):
+    """Test bulk creating events with one invalid item and one unknown category."""
+    valid_item = valid_event_data.model_dump(mode="json")
+    invalid_item = {**valid_item, "event_name": "Bad Capacity", "capacity": -1}
+    unknown_category = {**valid_item, "category_id": "12345678-1234-4321-1234-123456789012"}
+
+    response = await test_client.post(
+        "/events:bulk",
+        json={
+            "items": [
+                {**valid_item, "event_name": "  Bulk One  "},
+                invalid_item,
+                unknown_category,
+                {**valid_item, "event_name": "Bulk Two"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    assert [r["status_code"] for r in data["results"]] == [201, 422, 404, 201]
+    assert data["results"][0]["item"]["event_name"] == "Bulk One"
+    assert data["results"][2]["detail"] == "No such category exists"
+    assert data["results"][3]["item"]["user_id"] == str(test_user)
+
+    response = await test_client.get("/events")
+    assert response.json()["total"] == 2
+
+
 @pytest.mark.asyncio
 async def test_list_events_empty(test_client: AsyncClient):
     """Test listing events when database is empty."""
@@ -194,6 +244,19 @@ async def test_list_events_empty(test_client: AsyncClient):
     assert data["limit"] == 100
 
 
+@pytest.mark.asyncio
+async def test_list_events_records_round_trips_without_transaction(test_client: AsyncClient):
+    """Listing events should cost its list and count queries only, with no BEGIN/COMMIT."""
+    labels = {"method": "GET", "handler": "/events"}
+    before = REGISTRY.get_sample_value("db_round_trips_per_request_sum", labels) or 0.0
+
+    response = await test_client.get("/events")
+    assert response.status_code == 200
+
+    after = REGISTRY.get_sample_value("db_round_trips_per_request_sum", labels)
+    assert after - before == 2
+
+
 @pytest.mark.asyncio
 async def test_list_events_with_data(
     test_client: AsyncClient, test_user: UUID, test_category: UUID
@@ -260,6 +323,109 @@ async def test_list_events_with_filter_eq(
     assert data["total"] == 1
 
 
+@pytest.mark.asyncio
+async def test_list_events_cursor_pagination(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """Test walking events page by page with next_cursor in start time order."""
+    now = datetime.now(UTC)
+
+    for day in (3, 1, 5, 2, 4):
+        event = EventCreate(
+            event_name=f"Day {day} Event",
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            user_id=test_user,
+            category_id=test_category,
+        )
+        await test_client.post("/events", json=event.model_dump(mode="json"))
+
+    names: list[str] = []
+    params: dict[str, Any] = {"limit": 2}
+    while True:
+        response = await test_client.get("/events", params=params)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 5
+        names.extend(item["event_name"] for item in data["items"])
+
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": data["next_cursor"]}
+
+    assert names == [f"Day {day} Event" for day in (1, 2, 3, 4, 5)]
+
+
+@pytest.mark.asyncio
+async def test_list_events_order_by(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """order_by sorts across pages; cursors follow it unless the sort key can be NULL."""
+    now = datetime.now(UTC)
+
+    for day in (3, 1, 5, 2, 4):
+        event = EventCreate(
+            event_name=f"Day {day} Event",
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            price_field=(6 - day) * 100,
+            user_id=test_user,
+            category_id=test_category,
+        )
+        await test_client.post("/events", json=event.model_dump(mode="json"))
+
+    names: list[str] = []
+    params: dict[str, Any] = {"limit": 2, "order_by": "-event_datetime"}
+    while True:
+        data = (await test_client.get("/events", params=params)).json()
+        names.extend(item["event_name"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {**params, "cursor": data["next_cursor"]}
+
+    assert names == [f"Day {day} Event" for day in (5, 4, 3, 2, 1)]
+
+    response = await test_client.get(
+        "/events", params={"limit": 2, "offset": 2, "order_by": "price_field"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["event_name"] for item in data["items"]] == ["Day 3 Event", "Day 2 Event"]
+    assert data["has_more"] is True
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_events_with_filter_in(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """Test fetching several events by id in one request with the in operator."""
+    now = datetime.now(UTC)
+
+    event_ids: list[str] = []
+    for day in (1, 2, 3):
+        event = EventCreate(
+            event_name=f"Day {day} Event",
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            user_id=test_user,
+            category_id=test_category,
+        )
+        response = await test_client.post("/events", json=event.model_dump(mode="json"))
+        event_ids.append(response.json()["event_id"])
+
+    response = await test_client.get(
+        "/events",
+        params={"filter_expression": f"event_id:in:{event_ids[0]},{event_ids[2]}"},
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total"] == 2
+    assert [item["event_name"] for item in data["items"]] == ["Day 1 Event", "Day 3 Event"]
+
+
 @pytest.mark.asyncio
 async def test_list_events_attendee_count_reflects_attendees(
     test_client: AsyncClient, test_user: UUID, test_category: UUID
@@ -547,6 +713,116 @@ async def test_patch_multiple_events(test_client: AsyncClient, valid_event_data:
     assert data[event2["event_id"]]["capacity"] == 250
 
 
+@pytest.mark.asyncio
+async def test_patch_event_operation_list(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """Test changing several fields of one event with a list of operations."""
+    response = await test_client.post("/events", json=valid_event_data.model_dump(mode="json"))
+    assert response.status_code == 201
+    event_id = response.json()["event_id"]
+
+    # Moving both times past the old end only validates when applied together
+    new_start = valid_event_data.event_endtime + timedelta(days=1)
+    new_end = new_start + timedelta(hours=3)
+    patch_data: dict[str, Any] = {
+        "patch": {
+            event_id: [
+                {"op": "replace", "path": "/event_name", "value": "Moved Event"},
+                {"op": "replace", "path": "/event_datetime", "value": new_start.isoformat()},
+                {"op": "replace", "path": "/event_endtime", "value": new_end.isoformat()},
+                {"op": "replace", "path": "/capacity", "value": 75},
+            ]
+        }
+    }
+
+    response = await test_client.patch("/events", json=patch_data)
+    assert response.status_code == 200
+
+    patched = response.json()[event_id]
+    assert patched["event_name"] == "Moved Event"
+    assert patched["capacity"] == 75
+    # SQLite drops the offset, so compare as UTC
+    assert datetime.fromisoformat(patched["event_datetime"]).replace(tzinfo=UTC) == new_start
+    assert datetime.fromisoformat(patched["event_endtime"]).replace(tzinfo=UTC) == new_end
+
+
+@pytest.mark.asyncio
+async def test_patch_multiple_events_different_fields(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """Test one batch patch changing different fields on different events."""
+    created = []
+    for name in ("Event 1", "Event 2", "Event 3"):
+        event_data = valid_event_data.model_copy()
+        event_data.event_name = name
+        response = await test_client.post("/events", json=event_data.model_dump(mode="json"))
+        assert response.status_code == 201
+        created.append(response.json())
+
+    patch_data: dict[str, Any] = {
+        "patch": {
+            created[0]["event_id"]: {"op": "replace", "path": "/capacity", "value": 10},
+            created[1]["event_id"]: {
+                "op": "replace",
+                "path": "/event_name",
+                "value": "Renamed",
+            },
+            created[2]["event_id"]: {"op": "replace", "path": "/capacity", "value": 30},
+        }
+    }
+
+    response = await test_client.patch("/events", json=patch_data)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data[created[0]["event_id"]]["capacity"] == 10
+    assert data[created[0]["event_id"]]["event_name"] == "Event 1"
+    assert data[created[1]["event_id"]]["event_name"] == "Renamed"
+    assert data[created[1]["event_id"]]["capacity"] == valid_event_data.capacity
+    assert data[created[2]["event_id"]]["capacity"] == 30
+
+
+@pytest.mark.asyncio
+async def test_patch_events_query_count_independent_of_batch_size(
+    test_client: AsyncClient, test_engine: AsyncEngine, valid_event_data: EventCreate
+):
+    """Test that patch validation uses the same number of queries for 1 or 5 events."""
+    event_ids = []
+    for index in range(5):
+        event_data = valid_event_data.model_copy()
+        event_data.event_name = f"Event {index}"
+        response = await test_client.post("/events", json=event_data.model_dump(mode="json"))
+        event_ids.append(response.json()["event_id"])
+
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    async def count_patch_queries(ids: list[str]) -> int:
+        patch_data = {
+            "patch": {
+                event_id: {"op": "replace", "path": "/category_id", "value": str(category)}
+                for event_id in ids
+            }
+        }
+        statements.clear()
+        response = await test_client.patch("/events", json=patch_data)
+        assert response.status_code == 200
+        return len(statements)
+
+    category = valid_event_data.category_id
+    sqlalchemy_event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        single = await count_patch_queries(event_ids[:1])
+        batch = await count_patch_queries(event_ids)
+    finally:
+        sqlalchemy_event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert batch == single
+
+
 @pytest.mark.asyncio
 async def test_delete_event_success(test_client: AsyncClient, valid_event_data: EventCreate):
     """Test successful event deletion."""
@@ -589,3 +865,280 @@ async def test_delete_event_returns_event_data(
     assert data["description"] == valid_event_data.description
     assert data["capacity"] == valid_event_data.capacity
     assert data["price_field"] == valid_event_data.price_field
+
+
+@pytest.mark.asyncio
+async def test_list_events_search_ranks_name_matches_first(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """search matches every word across name, description and location."""
+    now = datetime.now(UTC)
+    seeded = [
+        ("Harbor Cleanup", "Bring gloves; jazz trio after", "Boston"),
+        ("Jazz Night", "Live trio on the harbor", "Cambridge"),
+        ("Jazz Brunch", "Pancakes", "Somerville"),
+        ("Book Club", "Discussing 100% true stories", "Boston Public Library"),
+    ]
+    for day, (name, description, location) in enumerate(seeded, start=1):
+        event = EventCreate(
+            event_name=name,
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            event_location=location,
+            description=description,
+            user_id=test_user,
+            category_id=test_category,
+        )
+        await test_client.post("/events", json=event.model_dump(mode="json"))
+
+    async def search(term: str, **params: Any) -> dict[str, Any]:
+        response = await test_client.get("/events", params={"search": term, **params})
+        assert response.status_code == 200
+        return response.json()
+
+    data = await search("jazz harbor")
+    assert [item["event_name"] for item in data["items"]] == ["Jazz Night", "Harbor Cleanup"]
+    assert data["total"] == 2
+    assert data["next_cursor"] is None
+
+    assert [item["event_name"] for item in (await search("boston"))["items"]] == [
+        "Harbor Cleanup",
+        "Book Club",
+    ]
+    # LIKE wildcards in the term are matched literally
+    assert [item["event_name"] for item in (await search("100%"))["items"]] == ["Book Club"]
+
+    page = await search("jazz", limit=1, offset=1)
+    assert [item["event_name"] for item in page["items"]] == ["Jazz Brunch"]
+    assert page["has_more"] is True
+
+
+@pytest.mark.asyncio
+async def test_pick_events_matches_partial_names(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """The event picker matches partial names, prefix matches first."""
+    now = datetime.now(UTC)
+    for day, name in enumerate(["Late Jazz Jam", "Jazz Brunch", "Book Club"], start=1):
+        event = EventCreate(
+            event_name=name,
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            event_location="Boston",
+            user_id=test_user,
+            category_id=test_category,
+        )
+        await test_client.post("/events", json=event.model_dump(mode="json"))
+
+    response = await test_client.get("/events:pick", params={"q": "jazz"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["item"]["event_name"] for item in data["items"]] == [
+        "Jazz Brunch",
+        "Late Jazz Jam",
+    ]
+    assert data["items"][0]["score"] > data["items"][1]["score"]
+    assert data["budget_exceeded"] is False
+
+
+def _geo_location(address: str, latitude: float, longitude: float) -> str:
+    """Encode a location the way the frontend's locationCodec does."""
+    payload = {"v": 1, "address": address, "longitude": longitude, "latitude": latitude}
+    return "geo::" + quote(json.dumps(payload), safe="")
+
+
+@pytest.mark.asyncio
+async def test_list_events_search_matches_geo_location_address(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """search matches the address of a picked place, not its encoded payload."""
+    event = valid_event_data.model_copy(
+        update={"event_location": _geo_location("12 Harbor Street, Boston", 42.36, -71.06)}
+    )
+    created = (await test_client.post("/events", json=event.model_dump(mode="json"))).json()
+
+    async def search(term: str) -> list[str]:
+        response = await test_client.get("/events", params={"search": term})
+        assert response.status_code == 200
+        return [item["event_id"] for item in response.json()["items"]]
+
+    assert await search("harbor street") == [created["event_id"]]
+    assert await search("22address") == []
+
+
+@pytest.mark.asyncio
+async def test_list_events_near_orders_by_distance(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """near keeps events with coordinates, nearest first, and reports their distance."""
+    now = datetime.now(UTC)
+    seeded = [
+        ("Cambridge Jam", _geo_location("Cambridge", 42.3736, -71.1097)),
+        ("Boston Brunch", _geo_location("Boston", 42.3601, -71.0589)),
+        ("Providence Poetry", _geo_location("Providence", 41.824, -71.4128)),
+        ("Somewhere", "Somewhere without coordinates"),
+    ]
+    for day, (name, location) in enumerate(seeded, start=1):
+        event = EventCreate(
+            event_name=name,
+            event_datetime=now + timedelta(days=day),
+            event_endtime=now + timedelta(days=day, hours=2),
+            event_location=location,
+            user_id=test_user,
+            category_id=test_category,
+        )
+        response = await test_client.post("/events", json=event.model_dump(mode="json"))
+        assert response.status_code == 201
+
+    response = await test_client.get("/events", params={"near": "42.3601,-71.0589"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["event_name"] for item in data["items"]] == [
+        "Boston Brunch",
+        "Cambridge Jam",
+        "Providence Poetry",
+    ]
+    assert data["total"] == 3
+    assert data["next_cursor"] is None
+    distances = [item["distance_km"] for item in data["items"]]
+    assert distances[0] == pytest.approx(0)
+    assert distances[1] == pytest.approx(4.7, abs=0.5)
+    assert distances[2] == pytest.approx(65, abs=3)
+    assert data["items"][0]["latitude"] == 42.3601
+
+    response = await test_client.get(
+        "/events", params={"near": "42.3601,-71.0589", "radius_km": 10}
+    )
+    assert [item["event_name"] for item in response.json()["items"]] == [
+        "Boston Brunch",
+        "Cambridge Jam",
+    ]
+
+    response = await test_client.get("/events", params={"bbox": "-71.5,41.5,-71.08,42.5"})
+    data = response.json()
+    assert [item["event_name"] for item in data["items"]] == [
+        "Cambridge Jam",
+        "Providence Poetry",
+    ]
+    assert data["items"][0]["distance_km"] is None
+
+    response = await test_client.get(
+        "/events",
+        params={"near": "42.3601,-71.0589", "radius_km": 100, "order_by": "-event_datetime"},
+    )
+    assert [item["event_name"] for item in response.json()["items"]] == [
+        "Providence Poetry",
+        "Boston Brunch",
+        "Cambridge Jam",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_patch_event_location_updates_coordinates(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    event = valid_event_data.model_copy(
+        update={"event_location": _geo_location("Boston", 42.3601, -71.0589)}
+    )
+    created = (await test_client.post("/events", json=event.model_dump(mode="json"))).json()
+    assert (created["latitude"], created["longitude"]) == (42.3601, -71.0589)
+
+    async def patch_location(location: str) -> dict[str, Any]:
+        response = await test_client.patch(
+            "/events",
+            json={
+                "patch": {
+                    created["event_id"]: {
+                        "op": "replace",
+                        "path": "/event_location",
+                        "value": location,
+                    }
+                }
+            },
+        )
+        assert response.status_code == 200
+        return response.json()[created["event_id"]]
+
+    patched = await patch_location(_geo_location("Providence", 41.824, -71.4128))
+    assert (patched["latitude"], patched["longitude"]) == (41.824, -71.4128)
+
+    patched = await patch_location("Online")
+    assert (patched["latitude"], patched["longitude"]) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_backfill_event_coordinates(
+    test_client: AsyncClient, valid_event_data: EventCreate
+):
+    """Events stored before the location columns get them from their geo:: location."""
+    located = await events_db.create_event_db(
+        valid_event_data.model_copy(
+            update={"event_location": _geo_location("Boston", 42.3601, -71.0589)}
+        )
+    )
+    await events_db.create_event_db(
+        valid_event_data.model_copy(update={"event_location": "Online"})
+    )
+    async with db.engine.begin() as conn:
+        await conn.execute(
+            events_db.events.update().values(latitude=None, longitude=None, location_text=None)
+        )
+
+    assert await events_db.backfill_event_coordinates_db(batch_size=1) == 2
+    assert await events_db.backfill_event_coordinates_db() == 0
+
+    response = await test_client.get("/events", params={"near": "42.36,-71.06"})
+    assert [item["event_id"] for item in response.json()["items"]] == [str(located.event_id)]
+    response = await test_client.get("/events", params={"search": "boston"})
+    assert [item["event_id"] for item in response.json()["items"]] == [str(located.event_id)]
+
+
+@pytest.mark.asyncio
+async def test_map_tile_clusters_upcoming_events(
+    test_client: AsyncClient, test_user: UUID, test_category: UUID
+):
+    """Tiles serve per-cell counts of upcoming located events from the rollups."""
+    now = datetime.now(UTC)
+    seeded = [
+        # (location, starts in days)
+        (_geo_location("Boston", 42.3601, -71.0589), 1),
+        (_geo_location("Cambridge", 42.3736, -71.1097), 2),
+        (_geo_location("London", 51.5072, -0.1276), 3),
+        (_geo_location("Too far out", 42.3601, -71.0589), 400),
+        ("Nowhere in particular", 1),
+    ]
+    for location, days in seeded:
+        await events_db.create_event_db(
+            EventCreate(
+                event_name=f"Event in {days} days",
+                event_datetime=now + timedelta(days=days),
+                event_endtime=now + timedelta(days=days, hours=2),
+                event_location=location,
+                user_id=test_user,
+                category_id=test_category,
+            )
+        )
+
+    assert await event_map_db.refresh_event_map_db() is True
+    # Fresh rollups are not rebuilt again
+    assert await event_map_db.refresh_event_map_db(max_age_seconds=300) is False
+
+    response = await test_client.get("/events/map-tiles", params={"z": 0, "x": 0, "y": 0})
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"].startswith("private, max-age=")
+    clusters = response.json()["clusters"]
+    assert sorted(cluster["count"] for cluster in clusters) == [1, 2]
+    boston = next(cluster for cluster in clusters if cluster["count"] == 2)
+    assert boston["latitude"] == pytest.approx(42.36685)
+    west, south, east, north = boston["bbox"]
+    assert west <= -71.1097 and east >= -71.0589 and south <= 42.36 <= north
+
+    # At street level the two Boston events fall in different cells of their tile
+    response = await test_client.get("/events/map-tiles", params={"z": 10, "x": 309, "y": 378})
+    assert sorted(cluster["count"] for cluster in response.json()["clusters"]) == [1, 1]
+
+    # The cell's bbox lists its events
+    response = await test_client.get(
+        "/events", params={"bbox": ",".join(str(edge) for edge in boston["bbox"])}
+    )
+    assert response.json()["total"] == 3
@@ -0,0 +1,29 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+import pytest
+
+from app.db.events import events
+from app.db.filter_compiler import compile_list_query
+from app.db.filters import FilterOperation
+from app.models.exceptions import InvalidColumnError
+
+
+def test_compile_list_query_invalid_filter_column():
+    """Filtering on an unknown column raises InvalidColumnError."""
+    with pytest.raises(InvalidColumnError) as exc_info:
+        compile_list_query(
+            events, [FilterOperation("not_a_column", "eq", "x")], order_by=("event_id",)
+        )
+    assert "Invalid column name: not_a_column" in str(exc_info.value)
+
+
+def test_compile_list_query_invalid_order_column():
+    """Ordering by an unknown column raises InvalidColumnError."""
+    with pytest.raises(InvalidColumnError):
+        compile_list_query(events, None, order_by=("-not_a_column",))
@@ -0,0 +1,91 @@
+"""
+AI-generated code: 0%
+
+Human code: 100%
+
+Framework-generated code: 0%
+"""
+
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.events import events
+from app.db.filter_compiler import compile_list_query, compile_where
+from app.db.filters import FilterOperation
+from app.db.users import users
+
+
+def test_compile_list_query_reuses_statements_for_same_signature():
+    """Filters with the same fields and operators share one compiled statement."""
+    first, first_params = compile_list_query(
+        events, [FilterOperation("event_id", "eq", uuid4())], order_by=("event_id",)
+    )
+    second, second_params = compile_list_query(
+        events, [FilterOperation("event_id", "eq", uuid4())], order_by=("event_id",)
+    )
+
+    assert first is second
+    assert first_params["f0"] != second_params["f0"]
+
+
+def test_compile_list_query_differs_by_operator():
+    """A different operator on the same field produces a different statement."""
+    eq_statements, _ = compile_list_query(
+        events, [FilterOperation("event_name", "eq", "Party")], order_by=("event_id",)
+    )
+    like_statements, _ = compile_list_query(
+        events, [FilterOperation("event_name", "ilike", "Party%")], order_by=("event_id",)
+    )
+
+    assert eq_statements is not like_statements
+
+
+def test_compile_list_query_binds_values_as_parameters():
+    """Filter values never appear in the SQL text."""
+    statements, params = compile_list_query(
+        events,
+        [
+            FilterOperation("event_name", "ilike", "%secret%"),
+            FilterOperation("capacity", "gte", 10),
+        ],
+        order_by=("-created_at",),
+    )
+
+    sql = str(statements.query)
+    assert "secret" not in sql
+    assert "ORDER BY events.created_at DESC" in sql
+    assert params == {"f0": "%secret%", "f1": 10}
+
+
+def test_compile_where_without_filters():
+    """No filters compile to no WHERE clause."""
+    where_clause, params = compile_where(events, None)
+
+    assert where_clause is None
+    assert params == {}
+
+
+def test_compile_in_filter_binds_one_array_parameter():
+    """An in filter compiles to the same ANY statement whatever the number of values."""
+    small, small_params = compile_list_query(
+        events, [FilterOperation("event_id", "in", [uuid4()])], order_by=("event_id",)
+    )
+    large, large_params = compile_list_query(
+        events,
+        [FilterOperation("event_id", "in", [uuid4() for _ in range(50)])],
+        order_by=("event_id",),
+    )
+
+    assert small is large
+    assert len(large_params["f0"]) == 50
+    sql = str(small.query.compile(dialect=postgresql.dialect()))
+    assert "events.event_id = ANY" in sql
+
+
+def test_compile_like_on_citext_column_compares_as_text():
+    """like/ilike on the CITEXT email compile to (email::text) ILIKE for its trigram index."""
+    where_clause, _ = compile_where(users, [FilterOperation("email", "like", "ana%")])
+
+    sql = str(where_clause.compile(dialect=postgresql.dialect()))
+    assert "CAST(users.email AS TEXT) ILIKE" in sql
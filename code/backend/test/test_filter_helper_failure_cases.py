@@ -11,7 +11,7 @@ from uuid import UUID
 import pytest
 
 from app.models.exceptions import InvalidFilterFormatError
-from app.service.filter_helper import parse_filter
+from app.service.filter_helper import parse_bbox, parse_filter, parse_near
 
 
 def test_parse_filter_invalid_format():
@@ -51,3 +51,31 @@ def test_parse_filter_general_error():
     with pytest.raises(InvalidFilterFormatError) as exc_info:
         parse_filter("")
     assert "Invalid filter_expression format" in str(exc_info.value)
+
+
+def test_parse_filter_in_without_values():
+    """Test parsing an in filter with an empty value list."""
+    with pytest.raises(InvalidFilterFormatError) as exc_info:
+        parse_filter("event_id:in:,")
+    assert "requires at least one value" in str(exc_info.value)
+
+
+def test_parse_filter_in_invalid_uuid():
+    """Test parsing an in filter where one of the ids is not a UUID."""
+    with pytest.raises(InvalidFilterFormatError) as exc_info:
+        parse_filter("event_id:in:2db3d8ac-257c-4ff9-ad97-ba96bfbf9bc5,nope")
+    assert "Invalid UUID format" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("near", ["42.36", "42.36,-71.06,1", "north,west", "91,0", "0,nan"])
+def test_parse_near_invalid(near: str):
+    with pytest.raises(InvalidFilterFormatError) as exc_info:
+        parse_near(near)
+    assert "Invalid near" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("bbox", ["1,2,3", "-71,42,-70,x", "-71,43,-70,42", "-181,42,-70,43"])
+def test_parse_bbox_invalid(bbox: str):
+    with pytest.raises(InvalidFilterFormatError) as exc_info:
+        parse_bbox(bbox)
+    assert "Invalid bbox" in str(exc_info.value)
@@ -6,7 +6,10 @@ Human code: 100%
 Framework-generated code: 0%
 """
 
-from app.service.filter_helper import parse_filter
+from uuid import UUID
+
+from app.db.geo import BoundingBox, Near, decode_coordinates, decode_location_text
+from app.service.filter_helper import parse_bbox, parse_filter, parse_near
 
 
 def test_parse_filter_valid():
@@ -15,3 +18,48 @@ def test_parse_filter_valid():
     assert filter_op.field == "email"
     assert filter_op.op == "="
     assert filter_op.value == "test@example.com"
+
+
+def test_parse_filter_in_converts_each_uuid():
+    """Test parsing an in filter into a list of UUID values."""
+    first = "2db3d8ac-257c-4ff9-ad97-ba96bfbf9bc5"
+    second = "9b2f1d7e-4c7a-4f3e-8a51-0c6a3e2d1b90"
+    filter_op = parse_filter(f"event_id:in:{first}, {second},")
+    assert filter_op.op == "IN"
+    assert filter_op.value == [UUID(first), UUID(second)]
+
+
+def test_parse_near_and_bbox():
+    assert parse_near("42.36, -71.06", 5) == Near(
+        latitude=42.36, longitude=-71.06, radius_km=5
+    )
+    # West above east is a box crossing the antimeridian
+    assert parse_bbox("170,-20,-170,-10") == BoundingBox(
+        west=170, south=-20, east=-170, north=-10
+    )
+
+
+def test_decode_coordinates_from_geo_location():
+    """Coordinates are read from the frontend's geo:: payload, however often it was encoded."""
+    encoded = (
+        "geo::%7B%22v%22%3A1%2C%22address%22%3A%22Boston%22%2C"
+        "%22longitude%22%3A-71.06%2C%22latitude%22%3A42.36%7D"
+    )
+    assert decode_coordinates(encoded) == (42.36, -71.06)
+    assert decode_coordinates("geo%3A%3A" + encoded[5:].replace("%", "%25")) == (42.36, -71.06)
+    assert decode_coordinates('geo::{"latitude": "42.36", "longitude": "-71.06"}') == (
+        42.36,
+        -71.06,
+    )
+    assert decode_coordinates("Boston Public Library") is None
+    assert decode_coordinates('geo::{"latitude": 91, "longitude": 0}') is None
+    assert decode_coordinates("geo::not json") is None
+
+
+def test_decode_location_text_reads_the_geo_address():
+    """The searchable text of a geo:: location is its address; other locations are kept."""
+    encoded = "geo::%7B%22v%22%3A1%2C%22address%22%3A%22%2012%20Harbor%20St%20%22%7D"
+    assert decode_location_text(encoded) == "12 Harbor St"
+    assert decode_location_text("Boston Public Library") == "Boston Public Library"
+    assert decode_location_text("geo::not json") is None
+    assert decode_location_text(None) is None
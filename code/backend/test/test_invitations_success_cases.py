@@ -171,6 +171,28 @@ async def test_create_invitation_success(
     assert "updated_at" in data
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_invitations(
+    test_client: AsyncClient, test_user: UUID, test_event: UUID
+):
+    """Test bulk invitations get their own tokens and repeats in the batch conflict."""
+    item = {"event_id": str(test_event), "user_id": str(test_user)}
+
+    response = await test_client.post("/invitations:bulk", json={"items": [item, item]})
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 1
+    assert [r["status_code"] for r in data["results"]] == [201, 409]
+
+    created = data["results"][0]["item"]
+    assert created["invitation_link"].endswith(created["token"])
+
+    response = await test_client.get(f"/invitations/{created['token']}")
+    assert response.status_code == 200
+    assert response.json()["invitation_id"] == created["invitation_id"]
+
+
 @pytest.mark.asyncio
 async def test_create_invitation_with_default_expiration(
     test_client: AsyncClient, test_user: UUID, test_event: UUID
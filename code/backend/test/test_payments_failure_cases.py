@@ -9,6 +9,7 @@ Framework-generated code: 0%
 import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
+from datetime import UTC, date, datetime, timedelta
 from uuid import uuid4
 
 import pytest
@@ -17,10 +18,20 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.db import attendees as attendees_db
+from app.db import categories as categories_db
 from app.db import db
+from app.db import events as events_db
 from app.db import payments as payments_db
+from app.db import users as users_db
+from app.db.attendees import metadata as attendees_metadata
+from app.db.categories import metadata as categories_metadata
+from app.db.events import metadata as events_metadata
 from app.db.payments import metadata as payments_metadata
+from app.db.users import metadata as users_metadata
 from app.main import event_manager_app
+from app.models.events import EventCreate
+from app.models.users import UserCreate
 from app.service import stripe_service
 
 
@@ -62,6 +73,11 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     db.engine = engine
     db.metadata = payments_metadata
     payments_db.engine = engine
+    # Checkout holds a seat on the event, so the attendee tables are needed too
+    attendees_db.engine = engine
+    events_db.engine = engine
+    users_db.engine = engine
+    categories_db.engine = engine
 
     yield engine
 
@@ -69,17 +85,55 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     db.engine = original_engine
     db.metadata = original_metadata
     payments_db.engine = original_engine
+    attendees_db.engine = original_engine
+    events_db.engine = original_engine
+    users_db.engine = original_engine
+    categories_db.engine = original_engine
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
-    """Reset the payments table before each test."""
+    """Reset the payments and event tables before each test."""
     async with test_engine.begin() as conn:
-        await conn.run_sync(payments_metadata.drop_all)
-        await conn.run_sync(payments_metadata.create_all)
+        for metadata in (
+            payments_metadata,
+            attendees_metadata,
+            events_metadata,
+            categories_metadata,
+            users_metadata,
+        ):
+            await conn.run_sync(metadata.drop_all)
+            await conn.run_sync(metadata.create_all)
     yield
 
 
+async def _seed_event_and_user(capacity: int = 10) -> tuple[str, str]:
+    """Create an upcoming paid event and a user who can check out for it."""
+    user = await users_db.create_user_db(
+        UserCreate(
+            first_name="Pay",
+            last_name="Er",
+            email=f"payer-{uuid4()}@example.com",
+            date_of_birth=date(1990, 1, 1),
+        )
+    )
+    category_id = await categories_db.create_category_db(f"Paid {uuid4()}")
+    start = datetime.now(UTC) + timedelta(days=2)
+    event = await events_db.create_event_db(
+        EventCreate(
+            event_name="Paid Event",
+            event_datetime=start,
+            event_endtime=start + timedelta(hours=2),
+            event_location="Boston",
+            capacity=capacity,
+            price_field=25,
+            user_id=user.user_id,
+            category_id=category_id,
+        )
+    )
+    return str(event.event_id), str(user.user_id)
+
+
 @pytest_asyncio.fixture
 async def test_client(test_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client bound to the FastAPI app."""
@@ -239,9 +293,10 @@ async def test_create_checkout_session_invalid_request_400(
     )
 
     # 3) Make the request
+    event_id, user_id = await _seed_event_and_user()
     body = {
-        "event_id": str(uuid4()),
-        "user_id": str(uuid4()),
+        "event_id": event_id,
+        "user_id": user_id,
         "amount_usd": "10.00",
         "email": "payer@example.com",
     }
@@ -296,9 +351,10 @@ async def test_create_checkout_session_auth_error_500(
         fake_create_checkout_session,
     )
 
+    event_id, user_id = await _seed_event_and_user()
     body = {
-        "event_id": str(uuid4()),
-        "user_id": str(uuid4()),
+        "event_id": event_id,
+        "user_id": user_id,
         "amount_usd": "10.00",
         "email": "payer@example.com",
     }
@@ -348,9 +404,10 @@ async def test_create_checkout_session_generic_stripe_error_400(
         fake_create_checkout_session,
     )
 
+    event_id, user_id = await _seed_event_and_user()
     body = {
-        "event_id": str(uuid4()),
-        "user_id": str(uuid4()),
+        "event_id": event_id,
+        "user_id": user_id,
         "amount_usd": "10.00",
         "email": "payer@example.com",
     }
@@ -377,3 +434,42 @@ async def test_create_checkout_session_negative_amount_422(test_client: AsyncCli
 
     response = await test_client.post("/payments/checkout-session", json=body)
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_checkout_session_full_event_400(
+    test_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    A seat is held for every open checkout, so once they fill the event further
+    checkouts are refused before Stripe is called and their payment is canceled.
+    """
+
+    def fake_create_checkout_session(**kwargs):
+        return type("Session", (), {"id": f"cs_{uuid4()}", "url": "https://example.com"})
+
+    monkeypatch.setattr(
+        "app.service.stripe_service.create_checkout_session",
+        fake_create_checkout_session,
+    )
+
+    event_id, user_id = await _seed_event_and_user(capacity=1)
+    _, late_user_id = await _seed_event_and_user()
+
+    first = await test_client.post(
+        "/payments/checkout-session",
+        json={"event_id": event_id, "user_id": user_id, "amount_usd": "10.00"},
+    )
+    assert first.status_code == 200
+
+    resp = await test_client.post(
+        "/payments/checkout-session",
+        json={"event_id": event_id, "user_id": late_user_id, "amount_usd": "10.00"},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Event is full"
+
+    items, _ = await payments_db.get_payments_db(filters=None, offset=0, limit=10)
+    statuses = sorted(p.status.value for p in items)
+    assert statuses == ["canceled", "created"]
@@ -9,20 +9,34 @@ Framework-generated code: 0%
 import os
 import tempfile
 from collections.abc import AsyncGenerator, Generator
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.db import attendees as attendees_db
+from app.db import categories as categories_db
 from app.db import db
+from app.db import events as events_db
 from app.db import payments as payments_db
+from app.db import users as users_db
+from app.db.attendees import metadata as attendees_metadata
+from app.db.categories import metadata as categories_metadata
+from app.db.events import metadata as events_metadata
+from app.db.filters import FilterOperation
 from app.db.payments import metadata as payments_metadata
+from app.db.users import metadata as users_metadata
 from app.main import event_manager_app
+from app.models.attendees import AttendeeStatus
+from app.models.events import EventCreate
 from app.models.payments import PaymentCreate, PaymentStatus
+from app.models.users import UserCreate
 
 
 @pytest.fixture(scope="session")
@@ -68,6 +82,11 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     db.engine = engine
     db.metadata = payments_metadata
     payments_db.engine = engine
+    # Checkout holds a seat on the event, so the attendee tables are needed too
+    attendees_db.engine = engine
+    events_db.engine = engine
+    users_db.engine = engine
+    categories_db.engine = engine
 
     yield engine
 
@@ -75,17 +94,55 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     db.engine = original_engine
     db.metadata = original_metadata
     payments_db.engine = original_engine
+    attendees_db.engine = original_engine
+    events_db.engine = original_engine
+    users_db.engine = original_engine
+    categories_db.engine = original_engine
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
-    """Reset the payments table before each test."""
+    """Reset the payments and event tables before each test."""
     async with test_engine.begin() as conn:
-        await conn.run_sync(payments_metadata.drop_all)
-        await conn.run_sync(payments_metadata.create_all)
+        for metadata in (
+            payments_metadata,
+            attendees_metadata,
+            events_metadata,
+            categories_metadata,
+            users_metadata,
+        ):
+            await conn.run_sync(metadata.drop_all)
+            await conn.run_sync(metadata.create_all)
     yield
 
 
+async def _seed_event_and_user(capacity: int = 10) -> tuple[str, str]:
+    """Create an upcoming paid event and a user who can check out for it."""
+    user = await users_db.create_user_db(
+        UserCreate(
+            first_name="Pay",
+            last_name="Er",
+            email=f"payer-{uuid4()}@example.com",
+            date_of_birth=date(1990, 1, 1),
+        )
+    )
+    category_id = await categories_db.create_category_db(f"Paid {uuid4()}")
+    start = datetime.now(UTC) + timedelta(days=2)
+    event = await events_db.create_event_db(
+        EventCreate(
+            event_name="Paid Event",
+            event_datetime=start,
+            event_endtime=start + timedelta(hours=2),
+            event_location="Boston",
+            capacity=capacity,
+            price_field=25,
+            user_id=user.user_id,
+            category_id=category_id,
+        )
+    )
+    return str(event.event_id), str(user.user_id)
+
+
 @pytest_asyncio.fixture
 async def test_client(test_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
     """Create a test HTTP client bound to the FastAPI app."""
@@ -122,6 +179,8 @@ async def test_create_checkout_session_success(
         success_url: str,
         cancel_url: str,
         customer_email: str | None = None,
+        payment_id: str | None = None,
+        expires_at: int | None = None,
     ) -> DummySession:
         # We assert conversion roughly here too
         assert amount_cents == 2500  # 25.00 USD -> 2500 cents
@@ -143,9 +202,8 @@ async def test_create_checkout_session_success(
         fake_create_checkout_session,
     )
 
-    # --- Arrange: input payload (event_id and user_id can be any UUIDs here) ---
-    event_id = str(uuid4())
-    user_id = str(uuid4())
+    # --- Arrange: input payload for a real event, since checkout holds a seat ---
+    event_id, user_id = await _seed_event_and_user()
     body = {
         "event_id": event_id,
         "user_id": user_id,
@@ -236,3 +294,99 @@ async def test_webhook_checkout_session_completed_updates_status_succeeded(
     assert updated.payment_id == payment.payment_id
     assert updated.status is PaymentStatus.succeeded
     assert updated.stripe_payment_intent_id == "pi_123"
+
+
+def _fake_checkout(monkeypatch: pytest.MonkeyPatch, calls: list[dict]) -> None:
+    """Patch the Stripe helper to record its arguments and hand out session ids in order."""
+
+    def fake_create_checkout_session(**kwargs) -> DummySession:
+        calls.append(kwargs)
+        return DummySession(f"cs_test_{len(calls)}", "https://example.com/fake-checkout")
+
+    monkeypatch.setattr(
+        "app.service.stripe_service.create_checkout_session", fake_create_checkout_session
+    )
+
+
+def _fake_webhook(monkeypatch: pytest.MonkeyPatch, event_type: str, session_id: str) -> None:
+    def fake_construct_event(payload: bytes, sig_header: str | None, secret: str):
+        return {"type": event_type, "data": {"object": {"id": session_id}}}
+
+    monkeypatch.setattr(
+        "app.service.stripe_service.stripe.Webhook.construct_event", fake_construct_event
+    )
+
+
+async def _seats_taken(event_id: str) -> int:
+    events, _ = await events_db.get_events_db(
+        [FilterOperation("event_id", "eq", UUID(event_id))], limit=1
+    )
+    return events[0].attendee_count
+
+
+async def _checkout(test_client: AsyncClient, event_id: str, user_id: str):
+    return await test_client.post(
+        "/payments/checkout-session",
+        json={"event_id": event_id, "user_id": user_id, "amount_usd": "25.00"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_checkout_holds_seat_until_payment_completes(
+    test_client: AsyncClient, test_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+):
+    calls: list[dict] = []
+    _fake_checkout(monkeypatch, calls)
+    event_id, user_id = await _seed_event_and_user(capacity=1)
+
+    requested = datetime.now(UTC)
+    resp = await _checkout(test_client, event_id, user_id)
+    assert resp.status_code == 200
+    assert await _seats_taken(event_id) == 1
+    # Stripe needs the session to stay open at least 30 minutes; the hold outlasts it
+    assert calls[0]["expires_at"] >= (requested + timedelta(minutes=31)).timestamp()
+    async with test_engine.connect() as conn:
+        held_until = await conn.scalar(select(attendees_db.seat_holds.c.expires_at))
+    assert held_until.replace(tzinfo=UTC).timestamp() > calls[0]["expires_at"]
+
+    _fake_webhook(monkeypatch, "checkout.session.completed", "cs_test_1")
+    resp = await test_client.post(
+        "/payments/webhook", content=b"{}", headers={"stripe-signature": "t=1,v1=x"}
+    )
+    assert resp.status_code == 200
+
+    attendees, _ = await attendees_db.get_attendees_db(
+        [FilterOperation("event_id", "eq", UUID(event_id))]
+    )
+    assert [(str(a.user_id), a.status) for a in attendees] == [
+        (user_id, AttendeeStatus.RSVPED)
+    ]
+    # The held seat became the attendee's seat rather than a second one
+    assert await _seats_taken(event_id) == 1
+    assert await attendees_db.repair_attendee_counts_db() == {}
+
+
+@pytest.mark.asyncio
+async def test_expired_checkout_releases_its_seat(
+    test_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    _fake_checkout(monkeypatch, [])
+    event_id, user_id = await _seed_event_and_user(capacity=1)
+    _, other_user_id = await _seed_event_and_user()
+
+    await _checkout(test_client, event_id, user_id)
+    _fake_webhook(monkeypatch, "checkout.session.expired", "cs_test_1")
+    await test_client.post(
+        "/payments/webhook", content=b"{}", headers={"stripe-signature": "t=1,v1=x"}
+    )
+    assert await _seats_taken(event_id) == 0
+    payments, _ = await payments_db.get_payments_db(filters=None, offset=0, limit=10)
+    assert payments[0].status is PaymentStatus.canceled
+
+    # Holds whose webhook never arrives are released by the sweeper once they lapse
+    assert (await _checkout(test_client, event_id, other_user_id)).status_code == 200
+    assert await _seats_taken(event_id) == 1
+    assert await attendees_db.release_expired_holds_db(datetime.now(UTC)) == 0
+    later = datetime.now(UTC) + timedelta(days=1)
+    assert await attendees_db.release_expired_holds_db(later) == 1
+    assert await _seats_taken(event_id) == 0
@@ -8,17 +8,26 @@ Framework-generated code: 0%
 
 import os
 import tempfile
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from contextlib import asynccontextmanager
 from datetime import date
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.config import settings
+from app.db import attendees as attendees_db
 from app.db import db
+from app.db import picker as picker_db
 from app.db import users as users_db
+from app.db.attendees import metadata as attendees_metadata
+from app.db.events import metadata as events_metadata
 from app.db.users import metadata
 from app.main import event_manager_app
 from app.models.users import UserCreate
@@ -49,20 +58,27 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     # Set test database config
     db.engine = engine
     users_db.engine = engine
+    attendees_db.engine = engine
 
     yield engine
 
     # Restore original engine
     db.engine = original_engine
     users_db.engine = original_engine
+    attendees_db.engine = original_engine
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
     """Reset the database before each test."""
     async with test_engine.begin() as conn:
+        # Deleting a user also updates the counters of events they attended
+        await conn.run_sync(attendees_metadata.drop_all)
+        await conn.run_sync(events_metadata.drop_all)
         await conn.run_sync(metadata.drop_all)
         await conn.run_sync(metadata.create_all)
+        await conn.run_sync(events_metadata.create_all)
+        await conn.run_sync(attendees_metadata.create_all)
     yield
 
 
@@ -179,6 +195,13 @@ async def test_get_users_invalid_pagination(test_client: AsyncClient):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_get_users_invalid_count_mode(test_client: AsyncClient):
+    """Test getting users with an unknown count mode."""
+    response = await test_client.get("/users", params={"count": "sometimes"})
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_patch_user_nonexistent_id(test_client: AsyncClient):
     """Test patching a non-existent user."""
@@ -264,6 +287,64 @@ async def test_patch_user_duplicate_email(test_client: AsyncClient):
     assert response.status_code == 409
 
 
+@pytest.mark.asyncio
+async def test_patch_users_same_email_in_one_batch(test_client: AsyncClient):
+    """Test that two users in one patch cannot both take the same new email."""
+    user_ids = []
+    for index in (1, 2):
+        user_data = UserCreate(
+            first_name=f"User{index}",
+            last_name="Test",
+            email=f"user{index}@example.com",
+            date_of_birth=date(1990, 1, index),
+            color=None,
+        )
+        response = await test_client.post("/users", json=user_data.model_dump(mode="json"))
+        assert response.status_code == 201
+        user_ids.append(response.json()["user_id"])
+
+    patch_data = {
+        "patch": {
+            user_id: {"op": "replace", "path": "/email", "value": "shared@example.com"}
+            for user_id in user_ids
+        }
+    }
+
+    response = await test_client.patch("/users", json=patch_data)
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_duplicate_emails(test_client: AsyncClient):
+    """Test that bulk create rejects emails already taken or repeated in the batch."""
+    existing = UserCreate(
+        first_name="Existing",
+        last_name="User",
+        email="existing@example.com",
+        date_of_birth=date(1990, 1, 1),
+        color=None,
+    )
+    response = await test_client.post("/users", json=existing.model_dump(mode="json"))
+    assert response.status_code == 201
+
+    item = {"first_name": "New", "last_name": "User", "date_of_birth": "1992-02-02"}
+    response = await test_client.post(
+        "/users:bulk",
+        json={
+            "items": [
+                {**item, "email": "fresh@example.com"},
+                {**item, "email": "EXISTING@example.com"},
+                {**item, "email": "fresh@example.com"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["created"] == 1
+    assert [r["status_code"] for r in data["results"]] == [201, 409, 409]
+
+
 @pytest.mark.asyncio
 async def test_patch_user_invalid_date_format(
     test_client: AsyncClient, valid_user_data: UserCreate
@@ -340,3 +421,45 @@ async def test_delete_nonexistent_user(test_client: AsyncClient):
     response = await test_client.delete(f"/users/{fake_uuid}")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_get_me_404_without_a_linked_user(test_client: AsyncClient):
+    response = await test_client.get("/me")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No user is linked to this account"
+
+
+@pytest.mark.asyncio
+async def test_pick_users_requires_query(test_client: AsyncClient):
+    assert (await test_client.get("/users:pick")).status_code == 422
+    assert (await test_client.get("/users:pick", params={"q": ""})).status_code == 422
+    response = await test_client.get("/users:pick", params={"q": "   "})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_pick_users_limit_above_maximum(test_client: AsyncClient):
+    response = await test_client.get(
+        "/users:pick", params={"q": "ann", "limit": settings.PICKER_MAX_RESULTS + 1}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_pick_users_over_latency_budget_returns_nothing(test_client: AsyncClient):
+    """A lookup cancelled by statement_timeout comes back empty, flagged, not as a 500."""
+
+    class QueryCanceled(Exception):
+        sqlstate = "57014"
+
+    @asynccontextmanager
+    async def timed_out(bind: Any) -> AsyncIterator[None]:
+        raise DBAPIError("SELECT ...", {}, QueryCanceled())
+        yield
+
+    with patch.object(picker_db, "read_transaction", timed_out):
+        response = await test_client.get("/users:pick", params={"q": "ann"})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "budget_exceeded": True}
@@ -11,6 +11,7 @@ import tempfile
 from collections.abc import AsyncGenerator, Generator
 from datetime import date, datetime
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -19,11 +20,15 @@ from sqlalchemy import UUID
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import StaticPool
 
+from app.db import attendees as attendees_db
 from app.db import db
 from app.db import users as users_db
+from app.db.attendees import metadata as attendees_metadata
+from app.db.events import metadata as events_metadata
 from app.db.users import metadata
 from app.main import event_manager_app
-from app.models.users import UserCreate
+from app.models.users import UserCreate, UserRead
+from app.service import users as users_service
 
 
 @pytest.fixture(scope="session")
@@ -51,20 +56,27 @@ async def test_engine(test_db_file: str) -> AsyncGenerator[AsyncEngine, None]:
     # Set test database config
     db.engine = engine
     users_db.engine = engine
+    attendees_db.engine = engine
 
     yield engine
 
     # Restore original engine
     db.engine = original_engine
     users_db.engine = original_engine
+    attendees_db.engine = original_engine
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_test_db(test_engine: AsyncEngine) -> AsyncGenerator[None, None]:
     """Reset the database before each test."""
     async with test_engine.begin() as conn:
+        # Deleting a user also updates the counters of events they attended
+        await conn.run_sync(attendees_metadata.drop_all)
+        await conn.run_sync(events_metadata.drop_all)
         await conn.run_sync(metadata.drop_all)
         await conn.run_sync(metadata.create_all)
+        await conn.run_sync(events_metadata.create_all)
+        await conn.run_sync(attendees_metadata.create_all)
     yield
 
 
@@ -168,6 +180,48 @@ async def test_get_users_pagination(test_client: AsyncClient, valid_user_data: U
     assert data["limit"] == 2
 
 
+@pytest.mark.asyncio
+async def test_get_users_count_none(test_client: AsyncClient, valid_user_data: UserCreate):
+    """Test that count=none skips the total and reports has_more instead."""
+    for i in range(3):
+        user_data = valid_user_data.model_copy()
+        user_data.email = f"user{i}@example.com"
+        await test_client.post("/users", json=user_data.model_dump(mode="json"))
+
+    response = await test_client.get("/users", params={"limit": 2, "count": "none"})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["total"] is None
+    assert data["has_more"] is True
+
+    response = await test_client.get(
+        "/users", params={"limit": 2, "offset": 2, "count": "none"}
+    )
+    data = response.json()
+    assert len(data["items"]) == 1
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_users_count_estimate(test_client: AsyncClient, valid_user_data: UserCreate):
+    """Test that count=estimate returns a total for filtered listings."""
+    await test_client.post("/users", json=valid_user_data.model_dump(mode="json"))
+
+    response = await test_client.get(
+        "/users",
+        params={
+            "filter_expression": f"email:eq:{valid_user_data.email}",
+            "count": "estimate",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["has_more"] is False
+
+
 @pytest.mark.asyncio
 async def test_patch_user_single_field_first_name(
     test_client: AsyncClient, valid_user_data: UserCreate
@@ -297,3 +351,109 @@ async def test_delete_user(test_client: AsyncClient, valid_user_data: UserCreate
     response = await test_client.get("/users")
     assert response.status_code == 200
     assert len(response.json()["items"]) == 0
+
+
+async def _create_signed_in_user(test_client: AsyncClient) -> dict[str, Any]:
+    """Create the user whose email the test bearer token carries."""
+    response = await test_client.post(
+        "/users",
+        json={
+            "first_name": "Test",
+            "last_name": "User",
+            "email": "test@example.com",
+            "date_of_birth": "1990-01-01",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_get_me_resolves_signed_in_user_once(test_client: AsyncClient):
+    user = await _create_signed_in_user(test_client)
+
+    with patch.object(users_db, "get_users_db", wraps=users_db.get_users_db) as lookup:
+        first = await test_client.get("/me")
+        second = await test_client.get("/me")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["user_id"] == second.json()["user_id"] == user["user_id"]
+    assert lookup.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_me_reflects_patches_to_the_user(test_client: AsyncClient):
+    user = await _create_signed_in_user(test_client)
+    assert (await test_client.get("/me")).json()["color"] is None
+
+    response = await test_client.patch(
+        "/users",
+        json={
+            "patch": {user["user_id"]: {"op": "replace", "path": "/color", "value": "teal"}}
+        },
+    )
+    assert response.status_code == 200
+
+    assert (await test_client.get("/me")).json()["color"] == "teal"
+
+
+@pytest.mark.asyncio
+async def test_get_me_forgets_deleted_user(test_client: AsyncClient):
+    user = await _create_signed_in_user(test_client)
+    assert (await test_client.get("/me")).status_code == 200
+
+    response = await test_client.delete(f"/users/{user['user_id']}")
+    assert response.status_code == 200
+
+    assert (await test_client.get("/me")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_current_user_cache_drops_lookup_that_raced_an_update(
+    test_client: AsyncClient,
+):
+    await _create_signed_in_user(test_client)
+    stale = UserRead.model_validate((await test_client.get("/me")).json())
+    users_service.current_users.clear()
+
+    # A lookup that read the row before an update committed must not cache what it read
+    generation = users_service.current_users.generation
+    users_service.current_users.invalidate([stale.user_id])
+    users_service.current_users.put("test-user-id", stale, generation)
+
+    assert users_service.current_users.get("test-user-id") is None
+
+
+@pytest.mark.asyncio
+async def test_pick_users_matches_name_or_email_prefix_first(test_client: AsyncClient):
+    """The picker matches partial names and emails and ranks prefix matches first."""
+    people = [
+        ("Anna", "Karenina", "anna.k@example.com"),
+        ("Joanna", "Smith", "jsmith@example.com"),
+        ("Bob", "Stone", "annabel@example.org"),
+        ("Carl", "Jung", "carl@example.com"),
+    ]
+    for first_name, last_name, email in people:
+        response = await test_client.post(
+            "/users",
+            json={
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "date_of_birth": "1990-01-01",
+            },
+        )
+        assert response.status_code == 201
+
+    response = await test_client.get("/users:pick", params={"q": "anna"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["budget_exceeded"] is False
+    names = [item["item"]["first_name"] for item in data["items"]]
+    assert set(names[:2]) == {"Anna", "Bob"}
+    assert names[2:] == ["Joanna"]
+    scores = [item["score"] for item in data["items"]]
+    assert scores == sorted(scores, reverse=True)
+
+    response = await test_client.get("/users:pick", params={"q": "anna", "limit": 1})
+    assert len(response.json()["items"]) == 1
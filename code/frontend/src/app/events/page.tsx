@@ -11,7 +11,7 @@ import { ClientEvents } from "@/component/events/ClientEvents";
 
 export default async function EventsPage() {
   const [initialResult, categoriesResult] = await Promise.all([
-    getEvents({ limit: 6 }),
+    getEvents({ limit: 6, orderBy: "event_datetime" }),
     getCategories({ limit: 100 }),
   ]);
 
@@ -78,14 +78,12 @@ function UserProfile1() {
     if (uniqueEventIds.length === 0) {
       return [];
     }
-    const eve: EventResponse[] = [];
-    for (const eventId of uniqueEventIds) {
-      const eventResult = await getEvents({
-        filters: [`event_id:eq:${eventId}`],
-        limit: 1,
-      });
-      eve?.push(eventResult.items[0]);
-    }
+    // One request for all registered events instead of one per event id.
+    const eventResult = await getEvents({
+      filters: [`event_id:in:${uniqueEventIds.join(",")}`],
+      limit: uniqueEventIds.length,
+    });
+    const eve: EventResponse[] = eventResult.items;
     setRegisteredEvents(eve);
     return eve;
   }, [userId, setRegisteredEvents]);
@@ -1,6 +1,6 @@
 /*
 
- AI-generated code: 80% (tool: Codex - GPT-5, userLocation, locationError, locationStatus, geocodeStatus, geocodeError, points, selectedEventId, isMapReady, mapboxToken, viewState, hasAppliedUserLocation, hasCenteredOnEvents, mapRef, markerRegistryRef, markerHandlersRef, useEffect, load, renderStatusBadge, syncHandler, nextHandler  ) 
+ AI-generated code: 80% (tool: Codex - GPT-5, userLocation, locationError, locationStatus, geocodeStatus, geocodeError, points, closestEvents, selectedEventId, isMapReady, mapboxToken, viewState, hasAppliedUserLocation, hasCenteredOnEvents, mapRef, markerRegistryRef, markerHandlersRef, useEffect, load, renderStatusBadge, syncHandler, nextHandler  ) 
  
  Human code: 20% (functions: MapDiscoveryView, MapDiscoveryViewProps) 
 
@@ -19,6 +19,7 @@ import mapboxgl from "mapbox-gl";
 import type { EventResponse } from "@/types/eventTypes";
 import { getPublicMapboxToken } from "@/component/map/getPublicMapboxToken";
 import { decodeEventLocation } from "@/helpers/locationCodec";
+import { getEvents } from "@/services/events";
 
 type Coordinates = {
   longitude: number;
@@ -48,90 +49,6 @@ const MAX_DISTANCE_KM = 150;
 
 const geocodeCache = new Map<string, Coordinates>();
 
-type DistanceNode = {
-  event: EventPoint;
-  distance: number;
-};
-
-class MinDistanceHeap {
-  #heap: DistanceNode[];
-
-  constructor() {
-    this.#heap = [];
-  }
-
-  push(node: DistanceNode) {
-    this.#heap.push(node);
-    this.#siftUp(this.#heap.length - 1);
-  }
-
-  pop(): DistanceNode | undefined {
-    if (this.#heap.length === 0) {
-      return undefined;
-    }
-    const root = this.#heap[0];
-    const last = this.#heap.pop();
-    if (last && this.#heap.length > 0) {
-      this.#heap[0] = last;
-      this.#siftDown(0);
-    }
-    return root;
-  }
-
-  get size(): number {
-    return this.#heap.length;
-  }
-
-  #siftUp(index: number) {
-    let current = index;
-    while (current > 0) {
-      const parent = Math.floor((current - 1) / 2);
-      if (this.#heap[parent].distance <= this.#heap[current].distance) {
-        break;
-      }
-      this.#swap(parent, current);
-      current = parent;
-    }
-  }
-
-  #siftDown(index: number) {
-    let current = index;
-    const length = this.#heap.length;
-    while (true) {
-      const left = current * 2 + 1;
-      const right = left + 1;
-      let smallest = current;
-
-      if (
-        left < length &&
-        this.#heap[left].distance < this.#heap[smallest].distance
-      ) {
-        smallest = left;
-      }
-
-      if (
-        right < length &&
-        this.#heap[right].distance < this.#heap[smallest].distance
-      ) {
-        smallest = right;
-      }
-
-      if (smallest === current) {
-        break;
-      }
-
-      this.#swap(current, smallest);
-      current = smallest;
-    }
-  }
-
-  #swap(a: number, b: number) {
-    const temp = this.#heap[a];
-    this.#heap[a] = this.#heap[b];
-    this.#heap[b] = temp;
-  }
-}
-
 function formatDateTime(value: string | null | undefined): string {
   if (!value) {
     return "Time to be announced";
@@ -166,70 +83,32 @@ function toLngLat(coordinates: Coordinates): mapboxgl.LngLatLike {
   };
 }
 
-function haversineDistance(a: Coordinates, b: Coordinates): number {
-  const toRadians = (value: number) => (value * Math.PI) / 180;
-  const R = 6371; // km
-  const dLat = toRadians(b.latitude - a.latitude);
-  const dLon = toRadians(b.longitude - a.longitude);
-  const lat1 = toRadians(a.latitude);
-  const lat2 = toRadians(b.latitude);
-
-  const sinLat = Math.sin(dLat / 2);
-  const sinLon = Math.sin(dLon / 2);
-  const aCalc =
-    sinLat * sinLat + sinLon * sinLon * Math.cos(lat1) * Math.cos(lat2);
-  const c = 2 * Math.atan2(Math.sqrt(aCalc), Math.sqrt(1 - aCalc));
-  return R * c;
-}
-
-// Pick nearest events via a Dijkstra-style min-heap traversal so we avoid
-// sorting the entire collection when only the closest few are needed.
-function selectNearestEvents(
-  origin: Coordinates | null,
-  events: EventPoint[],
-  limit: number,
-): EventPoint[] {
-  if (!events.length) {
-    return [];
-  }
-
-  if (!origin) {
-    return events.slice(0, limit).map((event) => ({
-      ...event,
-      distanceKm: event.distanceKm ?? null,
-    }));
-  }
-
-  const heap = new MinDistanceHeap();
-  for (const event of events) {
-    const distance = haversineDistance(origin, event.coordinates);
-    heap.push({ event, distance });
-  }
-
+// The server returns events nearest first with their distance; keep the nearest
+// one even when it is far away, and the rest only within MAX_DISTANCE_KM.
+function toNearbyPoints(events: EventResponse[]): EventPoint[] {
   const result: EventPoint[] = [];
-  while (heap.size > 0 && result.length < limit) {
-    const next = heap.pop();
-    if (!next) {
-      break;
-    }
-
-    if (next.distance > MAX_DISTANCE_KM && result.length > 0) {
+  for (const event of events) {
+    if (event.latitude == null || event.longitude == null) {
       continue;
     }
-
+    const distanceKm = event.distance_km ?? null;
+    if (
+      result.length > 0 &&
+      distanceKm != null &&
+      distanceKm > MAX_DISTANCE_KM
+    ) {
+      break;
+    }
     result.push({
-      ...next.event,
-      distanceKm: next.distance,
-    });
-  }
-
-  if (!result.length) {
-    return events.slice(0, limit).map((event) => ({
       ...event,
-      distanceKm: null,
-    }));
+      coordinates: { latitude: event.latitude, longitude: event.longitude },
+      distanceKm,
+      locationLabel:
+        decodeEventLocation(event.event_location)?.address ??
+        event.event_location ??
+        "Location to be announced",
+    });
   }
-
   return result;
 }
 
@@ -280,6 +159,9 @@ export function MapDiscoveryView({ events }: MapDiscoveryViewProps) {
   const [geocodeError, setGeocodeError] = useState<string | null>(null);
 
   const [points, setPoints] = useState<EventPoint[]>([]);
+  const [closestEvents, setClosestEvents] = useState<EventResponse[] | null>(
+    null,
+  );
   const [selectedEventId, setSelectedEventId] = useState<string | null>(null);
   const [isMapReady, setIsMapReady] = useState(false);
 
@@ -449,9 +331,39 @@ export function MapDiscoveryView({ events }: MapDiscoveryViewProps) {
     };
   }, [events, mapboxToken]);
 
+  useEffect(() => {
+    if (!userLocation) {
+      return;
+    }
+
+    let cancelled = false;
+    getEvents({ near: userLocation, limit: NEARBY_LIMIT })
+      .then((response) => {
+        if (!cancelled) {
+          setClosestEvents(response.items);
+        }
+      })
+      .catch(() => {
+        // Fall back to the events passed in, unordered
+        if (!cancelled) {
+          setClosestEvents(null);
+        }
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [userLocation]);
+
   const nearbyPoints = useMemo(() => {
-    return selectNearestEvents(userLocation, points, NEARBY_LIMIT);
-  }, [points, userLocation]);
+    if (closestEvents) {
+      const nearest = toNearbyPoints(closestEvents);
+      if (nearest.length) {
+        return nearest;
+      }
+    }
+    return points.slice(0, NEARBY_LIMIT);
+  }, [closestEvents, points]);
 
   useEffect(() => {
     if (!nearbyPoints.length) {
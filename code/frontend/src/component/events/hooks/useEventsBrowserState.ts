@@ -1,6 +1,6 @@
 /*
 
- AI-generated code: 100% (tool: Codex - GPT-5, modified and adapted, functions: sortEventsByDate, PaginationState, EventsBrowserState, useEventsBrowserState, REMOTE_SEARCH_PAGE_SIZE) 
+ AI-generated code: 100% (tool: Codex - GPT-5, modified and adapted, functions: PaginationState, EventsBrowserState, useEventsBrowserState, REMOTE_SEARCH_PAGE_SIZE) 
 
  Human code: 0% 
  
@@ -11,10 +11,12 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 
 import { EventListResponse, EventResponse } from "@/types/eventTypes";
-import { getEvents } from "@/services/events";
+import { EventOrder, getEvents } from "@/services/events";
 import { decodeEventLocation } from "@/helpers/locationCodec";
 
 const REMOTE_SEARCH_PAGE_SIZE = 9;
+// The backend sorts before paging, so every page continues the previous one
+const BROWSE_ORDER: EventOrder = "event_datetime";
 const ALL_CATEGORY_KEY = "__all__";
 
 function cacheKeyFor(categoryId: string | null, pageIndex: number): string {
@@ -25,25 +27,6 @@ function buildCategoryFilters(categoryId: string | null): string[] {
   return categoryId ? [`category_id:eq:${categoryId}`] : [];
 }
 
-function sortEventsByDate(events: EventResponse[]): EventResponse[] {
-  return [...events].sort((a, b) => {
-    const startA = new Date(a.event_datetime).getTime();
-    const startB = new Date(b.event_datetime).getTime();
-
-    if (Number.isNaN(startA) && Number.isNaN(startB)) {
-      return 0;
-    }
-    if (Number.isNaN(startA)) {
-      return 1;
-    }
-    if (Number.isNaN(startB)) {
-      return -1;
-    }
-
-    return startA - startB;
-  });
-}
-
 export type PaginationState = {
   show: boolean;
   rangeStart: number;
@@ -82,26 +65,18 @@ export type EventsBrowserState = {
 export function useEventsBrowserState(
   initialResult: EventListResponse,
 ): EventsBrowserState {
-  const sortedInitialResult = useMemo(
-    () => ({
-      ...initialResult,
-      items: sortEventsByDate(initialResult.items),
-    }),
-    [initialResult],
-  );
-
-  const initialPageSize = sortedInitialResult.limit ?? 5;
+  const initialPageSize = initialResult.limit ?? 5;
   const initialPageIndex = Math.floor(
-    sortedInitialResult.offset / Math.max(initialPageSize, 1),
+    initialResult.offset / Math.max(initialPageSize, 1),
   );
 
   const initialCacheKey = cacheKeyFor(null, initialPageIndex);
   const baseCacheRef = useRef<Map<string, EventListResponse>>(
-    new Map([[initialCacheKey, sortedInitialResult]]),
+    new Map([[initialCacheKey, initialResult]]),
   );
   const baseControllerRef = useRef<AbortController | null>(null);
 
-  const [baseResult, setBaseResult] = useState(sortedInitialResult);
+  const [baseResult, setBaseResult] = useState(initialResult);
   const [pageIndex, setPageIndex] = useState(initialPageIndex);
   const [selectedCategoryId, setSelectedCategoryId] = useState<string | null>(
     null,
@@ -114,8 +89,8 @@ export function useEventsBrowserState(
 
   useEffect(() => {
     const resetKey = cacheKeyFor(null, initialPageIndex);
-    baseCacheRef.current = new Map([[resetKey, sortedInitialResult]]);
-    setBaseResult(sortedInitialResult);
+    baseCacheRef.current = new Map([[resetKey, initialResult]]);
+    setBaseResult(initialResult);
     setSelectedCategoryId(null);
     setSelectedMinPrice(null);
     setSelectedMaxPrice(null);
@@ -123,7 +98,7 @@ export function useEventsBrowserState(
     setBaseError(null);
     setIsBaseLoading(false);
     setPendingBaseIndex(null);
-  }, [initialPageIndex, sortedInitialResult]);
+  }, [initialPageIndex, initialResult]);
 
   useEffect(
     () => () => {
@@ -222,18 +197,9 @@ export function useEventsBrowserState(
 
     async function fetchRemoteEvents() {
       try {
-        const sanitizedFilterTerm = trimmedQuery.replace(/:/g, " ").trim();
-        const escapedFilterTerm = sanitizedFilterTerm.replace(
-          /[%_\\]/g,
-          (char) => `\\${char}`,
-        );
-        const ilikeValue = `%${escapedFilterTerm}%`;
-        const filters = [
-          `event_name:ilike:${ilikeValue}`,
-          ...buildCategoryFilters(selectedCategoryId),
-        ];
         const result = await getEvents({
-          filters,
+          filters: buildCategoryFilters(selectedCategoryId),
+          search: trimmedQuery,
           offset: remoteOffset,
           limit: REMOTE_SEARCH_PAGE_SIZE,
         });
@@ -242,10 +208,8 @@ export function useEventsBrowserState(
           return;
         }
 
-        setRemoteResult({
-          ...result,
-          items: sortEventsByDate(result.items),
-        });
+        // Search results arrive best match first
+        setRemoteResult(result);
       } catch (error) {
         if (!isMounted || didCancel) {
           return;
@@ -312,19 +276,15 @@ export function useEventsBrowserState(
           offset: nextIndex * basePageSize,
           limit: basePageSize,
           filters: buildCategoryFilters(targetCategoryId),
+          orderBy: BROWSE_ORDER,
         });
 
         if (baseControllerRef.current !== controller) {
           return;
         }
 
-        const sortedResult = {
-          ...result,
-          items: sortEventsByDate(result.items),
-        };
-
-        baseCacheRef.current.set(cacheKey, sortedResult);
-        setBaseResult(sortedResult);
+        baseCacheRef.current.set(cacheKey, result);
+        setBaseResult(result);
         setPageIndex(nextIndex);
         setPendingBaseIndex(null);
       } catch (error) {
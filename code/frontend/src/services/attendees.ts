@@ -29,7 +29,10 @@ type AttendeePatchOperation = {
   value: AttendeeStatus;
 };
 
-export type AttendeePatchRequest = Record<string, AttendeePatchOperation>;
+export type AttendeePatchRequest = Record<
+  string,
+  AttendeePatchOperation | AttendeePatchOperation[]
+>;
 
 export async function createAttendee(
   payload: AttendeeCreatePayload,
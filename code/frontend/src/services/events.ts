@@ -19,6 +19,8 @@ import {
   EventListResponse,
   EventSchema,
   EventListSchema,
+  MapTileResponse,
+  MapTileSchema,
 } from "../types/eventTypes";
 
 export async function createEvent(
@@ -57,22 +59,74 @@ export async function createEvent(
   return EventSchema.parse(data);
 }
 
+type GeoPoint = {
+  latitude: number;
+  longitude: number;
+};
+
+// Sort orders GET /events accepts; a leading "-" sorts descending
+export type EventOrder =
+  | "event_datetime"
+  | "-event_datetime"
+  | "price_field"
+  | "-price_field"
+  | "created_at"
+  | "-created_at"
+  | "distance";
+
 type GetEventsParams = {
   filters?: string[];
+  search?: string;
+  orderBy?: EventOrder;
+  // Events nearest this point first, each with distance_km
+  near?: GeoPoint;
+  radiusKm?: number;
+  // [west, south, east, north] in degrees
+  bbox?: [number, number, number, number];
   offset?: number;
   limit?: number;
+  cursor?: string;
 };
 
 export async function getEvents(
   params?: GetEventsParams,
 ): Promise<EventListResponse> {
-  const { filters, offset, limit } = params ?? {};
+  const {
+    filters,
+    search,
+    orderBy,
+    near,
+    radiusKm,
+    bbox,
+    offset,
+    limit,
+    cursor,
+  } = params ?? {};
   const url = new URL("/events", API_BASE_URL);
 
   for (const filter of filters ?? []) {
     url.searchParams.append("filter_expression", filter);
   }
 
+  if (search) {
+    url.searchParams.append("search", search);
+  }
+
+  if (orderBy) {
+    url.searchParams.append("order_by", orderBy);
+  }
+
+  if (near) {
+    url.searchParams.append("near", `${near.latitude},${near.longitude}`);
+    if (radiusKm !== undefined) {
+      url.searchParams.append("radius_km", radiusKm.toString());
+    }
+  }
+
+  if (bbox) {
+    url.searchParams.append("bbox", bbox.join(","));
+  }
+
   if (offset !== undefined) {
     url.searchParams.append("offset", offset.toString());
   }
@@ -81,6 +135,10 @@ export async function getEvents(
     url.searchParams.append("limit", limit.toString());
   }
 
+  if (cursor !== undefined) {
+    url.searchParams.append("cursor", cursor);
+  }
+
   const { getToken } = await auth();
   const token = await getToken();
 
@@ -97,3 +155,30 @@ export async function getEvents(
   const data = await response.json();
   return EventListSchema.parse(data);
 }
+
+export async function getMapTile(
+  z: number,
+  x: number,
+  y: number,
+): Promise<MapTileResponse> {
+  const url = new URL("/events/map-tiles", API_BASE_URL);
+  url.searchParams.append("z", z.toString());
+  url.searchParams.append("x", x.toString());
+  url.searchParams.append("y", y.toString());
+
+  const { getToken } = await auth();
+  const token = await getToken();
+
+  const response = await fetch(url.toString(), {
+    method: "GET",
+    headers: {
+      "Content-Type": "application/json",
+      Authorization: `Bearer ${token}`,
+    },
+  });
+  if (!response.ok) {
+    throw new Error(`Request failed with status ${response.status}`);
+  }
+  const data = await response.json();
+  return MapTileSchema.parse(data);
+}
@@ -12,6 +12,7 @@
 
 import { getAttendees } from "./attendees";
 import { getEvents } from "./events";
+import type { EventResponse } from "@/types/eventTypes";
 import type { InvitationSummary } from "@/types/invitationTypes";
 import { decodeEventLocation } from "@/helpers/locationCodec";
 
@@ -59,20 +60,16 @@ export async function fetchPendingInvitations(
     }
 
     const eventIds = Array.from(new Set(pending.map((item) => item.event_id)));
-    const events = await Promise.all(
-      eventIds.map(async (eventId) => {
-        try {
-          const result = await getEvents({
-            filters: [`event_id:eq:${eventId}`],
-            limit: 1,
-          });
-          return result.items[0] ?? null;
-        } catch (error) {
-          console.error("Failed to load event for invitation", error);
-          return null;
-        }
-      }),
-    );
+    let events: EventResponse[] = [];
+    try {
+      const result = await getEvents({
+        filters: [`event_id:in:${eventIds.join(",")}`],
+        limit: eventIds.length,
+      });
+      events = result.items;
+    } catch (error) {
+      console.error("Failed to load events for invitations", error);
+    }
 
     const eventMap = new Map(
       events
@@ -12,6 +12,7 @@ import { z } from "zod";
 import { API_BASE_URL } from "./config";
 import {
   UserResponse,
+  UserSchema,
   UserListSchema,
   UserListResponse,
   GetUsersParams,
@@ -51,6 +52,27 @@ export async function getUser(id: string): Promise<UserResponse> {
   return user;
 }
 
+export async function getMe(): Promise<UserResponse> {
+  const url = new URL("/me", API_BASE_URL);
+
+  const { getToken } = await auth();
+  const token = await getToken();
+
+  const response = await fetch(url.toString(), {
+    method: "GET",
+    headers: {
+      "Content-Type": "application/json",
+      Authorization: `Bearer ${token}`,
+    },
+  });
+
+  if (!response.ok) {
+    throw new Error(`Request failed with status ${response.status}`);
+  }
+
+  return UserSchema.parse(await response.json());
+}
+
 export async function getUsers(
   params?: GetUsersParams,
 ): Promise<UserListResponse> {
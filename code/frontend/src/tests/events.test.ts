@@ -8,7 +8,12 @@ Framework-generated code: 0%
 
 */
 
-import { getEvents, createEvent, EventCreatePayload } from "@/services/events";
+import {
+  getEvents,
+  getMapTile,
+  createEvent,
+  EventCreatePayload,
+} from "@/services/events";
 import { API_BASE_URL } from "@/services/config";
 import { auth } from "@clerk/nextjs/server";
 
@@ -67,6 +72,98 @@ test("getEvents builds query string correctly and parses response", async () =>
   mute.mockRestore();
 });
 
+test("getEvents sends search as its own parameter", async () => {
+  (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+    .fn()
+    .mockResolvedValue({
+      ok: true,
+      status: 200,
+      json: jest
+        .fn()
+        .mockResolvedValue({ items: [], total: 0, offset: 0, limit: 10 }),
+    } as unknown as Response);
+
+  await getEvents({ search: "jazz brunch", limit: 10 });
+
+  expect(fetch).toHaveBeenCalledWith(
+    new URL("/events?search=jazz+brunch&limit=10", API_BASE_URL).toString(),
+    expect.any(Object),
+  );
+});
+
+test("getEvents sends near, radius and bounding box", async () => {
+  (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+    .fn()
+    .mockResolvedValue({
+      ok: true,
+      status: 200,
+      json: jest
+        .fn()
+        .mockResolvedValue({ items: [], total: 0, offset: 0, limit: 12 }),
+    } as unknown as Response);
+
+  await getEvents({
+    near: { latitude: 42.36, longitude: -71.06 },
+    radiusKm: 25,
+    bbox: [-71.2, 42.2, -70.9, 42.5],
+    limit: 12,
+  });
+
+  const url = new URL((fetch as jest.Mock).mock.calls[0][0]);
+  expect(url.searchParams.get("near")).toBe("42.36,-71.06");
+  expect(url.searchParams.get("radius_km")).toBe("25");
+  expect(url.searchParams.get("bbox")).toBe("-71.2,42.2,-70.9,42.5");
+  expect(url.searchParams.get("limit")).toBe("12");
+});
+
+test("getEvents sends orderBy as order_by", async () => {
+  (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+    .fn()
+    .mockResolvedValue({
+      ok: true,
+      status: 200,
+      json: jest
+        .fn()
+        .mockResolvedValue({ items: [], total: 0, offset: 0, limit: 10 }),
+    } as unknown as Response);
+
+  await getEvents({ orderBy: "-created_at", limit: 10 });
+
+  const url = new URL((fetch as jest.Mock).mock.calls[0][0]);
+  expect(url.searchParams.get("order_by")).toBe("-created_at");
+});
+
+test("getMapTile requests one tile and parses its clusters", async () => {
+  (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+    .fn()
+    .mockResolvedValue({
+      ok: true,
+      status: 200,
+      json: jest.fn().mockResolvedValue({
+        z: 10,
+        x: 309,
+        y: 378,
+        clusters: [
+          {
+            latitude: 42.36,
+            longitude: -71.06,
+            count: 3,
+            bbox: [-71.1, 42.33, -71.02, 42.39],
+          },
+        ],
+      }),
+    } as unknown as Response);
+
+  const tile = await getMapTile(10, 309, 378);
+
+  const url = new URL((fetch as jest.Mock).mock.calls[0][0]);
+  expect(url.pathname).toBe("/events/map-tiles");
+  expect(url.searchParams.get("z")).toBe("10");
+  expect(url.searchParams.get("x")).toBe("309");
+  expect(url.searchParams.get("y")).toBe("378");
+  expect(tile.clusters[0].count).toBe(3);
+});
+
 test("createEvent posts payload and returns parsed event", async () => {
   const payload = {
     event_name: "Show",
@@ -69,61 +69,51 @@ describe("fetchPendingInvitations", () => {
       longitude: 2,
     });
 
-    mockGetEvents.mockImplementation(async ({ filters }) => {
-      const filter = filters?.[0] ?? "";
-      if (filter.includes("future-event")) {
-        return {
-          items: [
-            {
-              event_id: "future-event",
-              event_name: "Future",
-              event_datetime: "2025-01-02T10:00:00Z",
-              event_endtime: "2025-01-02T12:00:00Z",
-              event_location: encodedLocation,
-              description: null,
-              picture_url: null,
-              capacity: null,
-              price_field: 0,
-              user_id: "host",
-              category_id: "cat",
-              created_at: "2024-12-01T00:00:00Z",
-              updated_at: "2024-12-01T00:00:00Z",
-            },
-          ],
-          total: 1,
-          offset: 0,
-          limit: 1,
-        };
-      }
-      if (filter.includes("past-event")) {
-        return {
-          items: [
-            {
-              event_id: "past-event",
-              event_name: "Past",
-              event_datetime: "2024-12-01T10:00:00Z",
-              event_endtime: "2024-12-01T12:00:00Z",
-              event_location: "raw location",
-              description: null,
-              picture_url: null,
-              capacity: null,
-              price_field: 0,
-              user_id: "host",
-              category_id: "cat",
-              created_at: "2024-10-01T00:00:00Z",
-              updated_at: "2024-10-01T00:00:00Z",
-            },
-          ],
-          total: 1,
-          offset: 0,
-          limit: 1,
-        };
-      }
-      return { items: [], total: 0, offset: 0, limit: 1 };
+    mockGetEvents.mockResolvedValueOnce({
+      items: [
+        {
+          event_id: "future-event",
+          event_name: "Future",
+          event_datetime: "2025-01-02T10:00:00Z",
+          event_endtime: "2025-01-02T12:00:00Z",
+          event_location: encodedLocation,
+          description: null,
+          picture_url: null,
+          capacity: null,
+          price_field: 0,
+          user_id: "host",
+          category_id: "cat",
+          created_at: "2024-12-01T00:00:00Z",
+          updated_at: "2024-12-01T00:00:00Z",
+        },
+        {
+          event_id: "past-event",
+          event_name: "Past",
+          event_datetime: "2024-12-01T10:00:00Z",
+          event_endtime: "2024-12-01T12:00:00Z",
+          event_location: "raw location",
+          description: null,
+          picture_url: null,
+          capacity: null,
+          price_field: 0,
+          user_id: "host",
+          category_id: "cat",
+          created_at: "2024-10-01T00:00:00Z",
+          updated_at: "2024-10-01T00:00:00Z",
+        },
+      ],
+      total: 2,
+      offset: 0,
+      limit: 2,
     });
 
     const result = await fetchPendingInvitations("user-1");
 
+    expect(mockGetEvents).toHaveBeenCalledTimes(1);
+    expect(mockGetEvents).toHaveBeenCalledWith({
+      filters: ["event_id:in:future-event,past-event"],
+      limit: 2,
+    });
     expect(result).toHaveLength(1);
     expect(result[0]?.eventId).toBe("future-event");
     expect(result[0]?.eventLocation).toBe("123 Main St");
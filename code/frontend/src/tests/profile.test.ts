@@ -145,7 +145,7 @@ describe("Profile dropdown event selector", () => {
       expect(eventsSvc.getEvents).toHaveBeenLastCalledWith(
         expect.objectContaining({
           filters: expect.arrayContaining([
-            expect.stringContaining("event_id:eq:"),
+            "event_id:in:00000000-0000-0000-0000-000000000002",
           ]),
           limit: 1,
         }),
@@ -82,10 +82,10 @@ const base: EventListResponse = {
   limit: 5,
 };
 
-test("sorts base items and toggles remote search when no local matches", async () => {
+test("keeps the server order and toggles remote search when no local matches", async () => {
   const { result } = renderHook(() => useEventsBrowserState(base));
 
-  expect(result.current.eventsToRender[0].event_name).toBe("B new");
+  expect(result.current.eventsToRender[0].event_name).toBe("A old");
 
   act(() => result.current.setQuery("remote"));
   expect(result.current.shouldFetchRemoteSearch).toBe(true);
@@ -94,6 +94,9 @@ test("sorts base items and toggles remote search when no local matches", async (
     expect(result.current.isRemoteLoading).toBe(false);
     expect(result.current.eventsToRender[0].event_name).toBe("Remote Match");
   });
+  expect(getEvents).toHaveBeenCalledWith(
+    expect.objectContaining({ search: "remote" }),
+  );
 });
 
 test("filters events when selecting a category", async () => {
@@ -106,6 +109,7 @@ test("filters events when selecting a category", async () => {
       filters: ["category_id:eq:category-123"],
       offset: 0,
       limit: base.limit,
+      orderBy: "event_datetime",
     });
   });
 
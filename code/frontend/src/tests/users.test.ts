@@ -8,7 +8,7 @@ Framework-generated code: 0%
 
 */
 
-import { getUser } from "@/services/users";
+import { getMe, getUser } from "@/services/users";
 import { API_BASE_URL } from "@/services/config";
 import { getUsers } from "@/services/users";
 import { auth } from "@clerk/nextjs/server";
@@ -80,6 +80,48 @@ describe("users.getUser", () => {
   });
 });
 
+describe("users.getMe", () => {
+  beforeEach(() => {
+    jest.restoreAllMocks();
+    mockAuth.mockResolvedValue({
+      getToken: jest.fn().mockResolvedValue("test-token"),
+    } as never);
+  });
+
+  test("returns the signed-in user", async () => {
+    (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+      .fn()
+      .mockResolvedValue({
+        ok: true,
+        json: () =>
+          Promise.resolve({
+            user_id: "00000000-0000-0000-0000-000000000000",
+            first_name: "Ada",
+            last_name: "Lovelace",
+            email: "ada@example.com",
+            date_of_birth: "1815-12-10",
+            color: null,
+            created_at: "2025-01-01T00:00:00Z",
+            updated_at: "2025-01-01T00:00:00Z",
+          }),
+      });
+
+    const res = await getMe();
+    expect(res.email).toBe("ada@example.com");
+    expect(fetch).toHaveBeenCalledWith(
+      new URL("/me", API_BASE_URL).toString(),
+      expect.any(Object),
+    );
+  });
+
+  test("throws when the account has no user", async () => {
+    (globalThis as unknown as { fetch: jest.Mock }).fetch = jest
+      .fn()
+      .mockResolvedValue({ ok: false, status: 404 });
+    await expect(getMe()).rejects.toThrow("Request failed with status 404");
+  });
+});
+
 describe("users.getUsers", () => {
   beforeEach(() => {
     jest.restoreAllMocks();
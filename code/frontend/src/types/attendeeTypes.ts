@@ -14,14 +14,21 @@ export const AttendeeSchema = z.object({
   attendee_id: z.uuid(),
   event_id: z.uuid(),
   user_id: z.uuid(),
-  status: z.enum(["RSVPed", "Maybe", "Not Going"]).nullable(),
+  status: z.enum(["RSVPed", "Maybe", "Not Going", "Waitlisted"]).nullable(),
   created_at: z.string(),
   updated_at: z.string(),
+  waitlist_position: z.number().int().positive().nullable().optional(),
 });
 
 export type AttendeeResponse = z.infer<typeof AttendeeSchema>;
 
-export const AttendeeStatusSchema = z.enum(["RSVPed", "Maybe", "Not Going"]);
+// "Waitlisted" is assigned by the server when an event is full; it is never requested
+export const AttendeeStatusSchema = z.enum([
+  "RSVPed",
+  "Maybe",
+  "Not Going",
+  "Waitlisted",
+]);
 export type AttendeeStatus = z.infer<typeof AttendeeStatusSchema>;
 
 export const AttendeeListSchema = z.object({
@@ -24,6 +24,9 @@ export const EventSchema = z.object({
   created_at: z.string().optional(),
   updated_at: z.string().optional(),
   attendee_count: z.number().int().nonnegative().optional(),
+  latitude: z.number().nullable().optional(),
+  longitude: z.number().nullable().optional(),
+  distance_km: z.number().nullable().optional(),
 });
 
 export type EventResponse = z.infer<typeof EventSchema>;
@@ -33,10 +36,29 @@ export const EventListSchema = z.object({
   total: z.number().int().nonnegative(),
   offset: z.number().int().nonnegative(),
   limit: z.number().int().positive(),
+  next_cursor: z.string().nullable().optional(),
 });
 
 export type EventListResponse = z.infer<typeof EventListSchema>;
 
+export const MapClusterSchema = z.object({
+  latitude: z.number(),
+  longitude: z.number(),
+  count: z.number().int().positive(),
+  // [west, south, east, north] of the cluster's cell, for getEvents({ bbox })
+  bbox: z.tuple([z.number(), z.number(), z.number(), z.number()]),
+});
+
+export const MapTileSchema = z.object({
+  z: z.number().int().nonnegative(),
+  x: z.number().int().nonnegative(),
+  y: z.number().int().nonnegative(),
+  clusters: z.array(MapClusterSchema),
+});
+
+export type MapCluster = z.infer<typeof MapClusterSchema>;
+export type MapTileResponse = z.infer<typeof MapTileSchema>;
+
 export const EventCreatePayloadSchema = z.object({
   event_name: z.string().min(1),
   event_datetime: z.string().min(1),
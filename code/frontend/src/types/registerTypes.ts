@@ -64,12 +64,14 @@ const SUCCESS_MESSAGE_BY_STATUS: Record<AttendeeStatus, string> = {
   RSVPed: "You're all set—see you there!",
   Maybe: "We'll keep a seat warm if you can make it.",
   "Not Going": "Thanks for letting us know.",
+  Waitlisted: "The event is full, so you're on the waitlist. We'll save you a seat if one opens up.",
 };
 
 const STATUS_LABEL_MAP: Record<AttendeeStatus, string> = {
   RSVPed: "Going",
   Maybe: "Maybe",
   "Not Going": "Not going",
+  Waitlisted: "Waitlisted",
 };
 
 const REGISTRATION_CLOSED_MESSAGE =
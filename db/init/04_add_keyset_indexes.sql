@@ -0,0 +1,6 @@
+-- ============================================================================
+-- KEYSET PAGINATION INDEXES
+-- ============================================================================
+
+-- Events pages are ordered by (event_datetime, event_id); cursor pages seek on it
+CREATE INDEX idx_events_datetime_id ON Events(event_datetime, event_id);
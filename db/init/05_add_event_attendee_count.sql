@@ -0,0 +1,19 @@
+-- ============================================================================
+-- DENORMALIZED ATTENDEE COUNT
+-- ============================================================================
+
+-- Number of EventAttendees rows per event, kept in step by the backend's attendee
+-- writes so listing events and checking capacity need no COUNT(*)
+ALTER TABLE Events ADD COLUMN IF NOT EXISTS attendee_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE Events e
+SET attendee_count = c.attendee_count
+FROM (
+    SELECT event_id, COUNT(*) AS attendee_count
+    FROM EventAttendees
+    GROUP BY event_id
+) c
+WHERE c.event_id = e.event_id;
+
+ALTER TABLE Events
+    ADD CONSTRAINT chk_events_attendee_count_nonnegative CHECK (attendee_count >= 0);
@@ -0,0 +1,22 @@
+-- ============================================================================
+-- WAITLIST
+-- ============================================================================
+
+-- RSVPs to a full event are stored as Waitlisted and promoted to RSVPed, oldest
+-- first, when a seat frees up. Statements run one by one (autocommit), so the new
+-- enum value is committed before the index below refers to it
+ALTER TYPE attendee_status ADD VALUE IF NOT EXISTS 'Waitlisted';
+
+-- Promotion reads an event's waitlist in (created_at, attendee_id) order
+CREATE INDEX IF NOT EXISTS idx_eventattendees_waitlist
+    ON EventAttendees(event_id, created_at, attendee_id)
+    WHERE status = 'Waitlisted';
+
+-- attendee_count now counts seats: Not Going and Waitlisted attendees hold none
+UPDATE Events e
+SET attendee_count = (
+    SELECT COUNT(*)
+    FROM EventAttendees a
+    WHERE a.event_id = e.event_id
+      AND (a.status IS NULL OR a.status NOT IN ('Not Going', 'Waitlisted'))
+);
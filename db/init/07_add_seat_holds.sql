@@ -0,0 +1,22 @@
+-- ============================================================================
+-- SEAT HOLDS
+-- ============================================================================
+
+-- A seat reserved for an open Stripe checkout, keyed by its payment. Holds count
+-- towards Events.attendee_count until the payment completes (the hold becomes an
+-- attendee) or the session expires (the seat is released)
+CREATE TABLE IF NOT EXISTS SeatHolds (
+    payment_id UUID PRIMARY KEY REFERENCES Payments(payment_id) ON DELETE CASCADE,
+    event_id UUID NOT NULL REFERENCES Events(event_id) ON DELETE CASCADE,
+    user_id UUID NOT NULL REFERENCES Users(user_id) ON DELETE CASCADE,
+    expires_at TIMESTAMPTZ NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One open hold per user and event; a new checkout takes the existing hold over
+CREATE UNIQUE INDEX IF NOT EXISTS idx_seat_holds_event_user_unique
+    ON SeatHolds(event_id, user_id);
+
+-- The expiry sweeper range-scans this index from the oldest hold, so its cost follows
+-- the number of expired holds rather than the size of the table
+CREATE INDEX IF NOT EXISTS idx_seat_holds_expires_at ON SeatHolds(expires_at);
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- FULL-TEXT EVENT SEARCH
+-- ============================================================================
+
+-- Weighted document over the searchable event fields: name matches rank above
+-- description matches, which rank above location matches. Postgres keeps the
+-- generated column up to date on every insert and update.
+ALTER TABLE Events ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(event_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(event_location, '')), 'C')
+    ) STORED;
+
+-- Serves GET /events?search=... (search_vector @@ websearch_to_tsquery(...))
+CREATE INDEX IF NOT EXISTS idx_events_search ON Events USING GIN (search_vector);
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- TRIGRAM INDEXES FOR FUZZY AND PREFIX SEARCH
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Serve the people picker (GET /users:pick) and like/ilike filters on names.
+-- The picker matches the full name and the email; the expressions must stay
+-- identical to USER_PICKER_EXPRESSIONS in app/db/users.py.
+CREATE INDEX IF NOT EXISTS idx_users_first_name_trgm
+    ON Users USING GIN (first_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_last_name_trgm
+    ON Users USING GIN (last_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_full_name_trgm
+    ON Users USING GIN ((first_name || ' ' || last_name) gin_trgm_ops);
+-- email is CITEXT, which has no trigram operator class; like/ilike filters on
+-- email are compiled as (email::text) ILIKE ... so they can use this index.
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm
+    ON Users USING GIN ((email::text) gin_trgm_ops);
+
+-- Serves the event picker (GET /events:pick) and like/ilike filters on event_name
+CREATE INDEX IF NOT EXISTS idx_events_event_name_trgm
+    ON Events USING GIN (event_name gin_trgm_ops);
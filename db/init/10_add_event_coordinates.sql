@@ -0,0 +1,19 @@
+-- ============================================================================
+-- EVENT COORDINATES
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+
+-- Copied from the geo:: payload of event_location by the event writes. Rows
+-- stored before this migration are filled by `python -m app.jobs.event_coordinates`.
+ALTER TABLE Events ADD COLUMN IF NOT EXISTS latitude DOUBLE PRECISION;
+ALTER TABLE Events ADD COLUMN IF NOT EXISTS longitude DOUBLE PRECISION;
+
+-- Serves GET /events?near=...: earth_box(...) @> ll_to_earth(...) for radius_km
+-- and ll_to_earth(...) <-> ll_to_earth(...) for nearest-first ordering
+CREATE INDEX IF NOT EXISTS idx_events_earth
+    ON Events USING GIST (ll_to_earth(latitude, longitude));
+
+-- Serves GET /events?bbox=...
+CREATE INDEX IF NOT EXISTS idx_events_lat_lon ON Events(latitude, longitude);
@@ -0,0 +1,22 @@
+-- ============================================================================
+-- EVENT MAP ROLLUPS
+-- ============================================================================
+
+-- Upcoming events per Web Mercator cell and zoom level, rebuilt every
+-- MAP_ROLLUP_REFRESH_SECONDS by the API (app.db.event_map). The primary key
+-- serves GET /events/map-tiles, which reads one zoom and a range of cells.
+CREATE TABLE IF NOT EXISTS event_map_cells (
+    zoom SMALLINT NOT NULL,
+    cell_x INT NOT NULL,
+    cell_y INT NOT NULL,
+    event_count INT NOT NULL,
+    latitude DOUBLE PRECISION NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (zoom, cell_x, cell_y)
+);
+
+-- The rebuild reads upcoming events with coordinates
+CREATE INDEX IF NOT EXISTS idx_events_upcoming_located
+    ON Events(event_endtime, event_datetime)
+    WHERE latitude IS NOT NULL;
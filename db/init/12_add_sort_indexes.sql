@@ -0,0 +1,22 @@
+-- ============================================================================
+-- SORT INDEXES
+-- ============================================================================
+
+-- One index per GET /events order_by (app.db.events.EVENT_SORTS), each ending in
+-- event_id like the sort key so a page is read in index order without a sort.
+-- Descending orders scan them backwards. event_datetime uses idx_events_datetime_id.
+CREATE INDEX IF NOT EXISTS idx_events_price_id ON Events(price_field, event_id);
+CREATE INDEX IF NOT EXISTS idx_events_created_at_id ON Events(created_at, event_id);
+-- Its backward scan serves created_at DESC, which is all the old index did
+DROP INDEX IF EXISTS idx_events_created_at;
+
+-- attendee_count is not sortable: it changes on every RSVP, and an index on it
+-- would stop those updates from being heap-only, so each seat claim would write
+-- every index on Events.
+
+-- The events browser lists one category at a time in date order. The tie-breaker
+-- lets that page come straight from the index, which the old
+-- (category_id, event_datetime DESC) index could not do.
+CREATE INDEX IF NOT EXISTS idx_events_category_datetime_id
+    ON Events(category_id, event_datetime, event_id);
+DROP INDEX IF EXISTS idx_events_category_datetime;
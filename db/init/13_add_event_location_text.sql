@@ -0,0 +1,27 @@
+-- ============================================================================
+-- SEARCHABLE EVENT LOCATION
+-- ============================================================================
+
+-- Picked places are stored in event_location as geo:: plus URL-encoded JSON,
+-- which the text parser splits into tokens such as "7b" and "22address". The
+-- event writes keep the readable address here instead (app.db.geo), and the
+-- search document indexes it in place of event_location.
+ALTER TABLE Events ADD COLUMN IF NOT EXISTS location_text TEXT;
+
+-- Plain locations are searchable as written. Encoded ones are filled by
+-- `python -m app.jobs.event_coordinates`.
+UPDATE Events
+SET location_text = event_location
+WHERE location_text IS NULL AND event_location NOT LIKE 'geo%';
+
+-- Same weights as db/init/08, with the location taken from location_text
+DROP INDEX IF EXISTS idx_events_search;
+ALTER TABLE Events DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE Events ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(event_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(location_text, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_events_search ON Events USING GIN (search_vector);